@@ -13,17 +13,20 @@
 """
 Embedded network and simulation test generator program for Tornado CNN
 """
+import copy
 import logging
 from argparse import Namespace
 from pathlib import Path
 import sys
 from pydoc import locate
+from typing import Any, Dict, Tuple
 
 import numpy as np
 
 import rich.console
 
 from . import checkpoint, commandline, console, onnxcp, op, rtlsim, sampledata, sampleweight, state
+from . import stats
 from . import tornadocnn as tc
 from . import yamlcfg
 from .eprint import eprint, nprint, wprint
@@ -37,6 +40,110 @@ from cfsai_backend_izer.exceptions import IzerError
 
 logger = logging.getLogger(__name__)
 
+# Loaded checkpoints, keyed by `checkpoint_key()`. Callers that generate many variants of the
+# same network in one process (such as `explore`) fill this cache to avoid reloading the model.
+checkpoint_cache: Dict[Tuple, Tuple] = {}
+
+
+def checkpoint_key(args: CNNGeneratorArgs, cfg: Dict[str, Any], params: Dict[str, Any]) -> Tuple:
+    """
+    Return the key for `checkpoint_cache` from all arguments that affect checkpoint loading.
+    """
+    return (
+        args.checkpoint_file,
+        cfg['arch'],
+        repr(args.no_bias),
+        repr(args.skip_checkpoint_layers),
+        repr([params[k] for k in ('quantization', 'bias_quantization', 'output_shift',
+                                  'kernel_size', 'operator', 'conv_groups', 'bypass',
+                                  'weight_source')]),
+    )
+
+
+def load_checkpoint(
+        args: CNNGeneratorArgs,
+        cfg: Dict[str, Any],
+        params: Dict[str, Any],
+        cache: bool = False,
+) -> Tuple:
+    """
+    Load weights and biases from the ONNX or PyTorch checkpoint file, or use the entry in
+    `checkpoint_cache`. When `cache` is set, a newly loaded checkpoint is added to the cache.
+    The loaders update `params['quantization']` and `params['output_shift']` in place, so the
+    cache keeps these as well.
+    """
+    key = checkpoint_key(args, cfg, params)
+    cached = checkpoint_cache.get(key)
+    if cached is not None:
+        quantization, output_shift, layers, weights, bias, \
+            input_channels, output_channels, final_scale = copy.deepcopy(cached)
+        params['quantization'][:] = quantization
+        params['output_shift'][:] = output_shift
+        return layers, weights, bias, params['output_shift'], \
+            input_channels, output_channels, final_scale
+
+    assert args.checkpoint_file is not None
+    fext = args.checkpoint_file.rsplit(sep='.', maxsplit=1)[1].lower()
+    if fext == 'onnx':
+        # ONNX file selected
+        layers, weights, bias, output_shift, \
+            input_channels, output_channels = \
+            onnxcp.load(
+                args.checkpoint_file,
+                cfg['arch'],
+                params['quantization'],
+                params['bias_quantization'],
+                params['output_shift'],
+                params['kernel_size'],
+                params['operator'],
+                args.display_checkpoint,
+                args.no_bias,
+            )
+        final_scale = None
+    else:
+        # PyTorch checkpoint file selected
+        layers, weights, bias, output_shift, \
+            input_channels, output_channels, final_scale = \
+            checkpoint.load(
+                args.checkpoint_file,
+                cfg['arch'],
+                params['quantization'],
+                params['bias_quantization'],
+                params['output_shift'],
+                params['kernel_size'],
+                params['operator'],
+                args.display_checkpoint,
+                args.no_bias,
+                params['conv_groups'],
+                params['bypass'],
+                params['weight_source'],
+                args.skip_checkpoint_layers,
+            )
+
+    if cache:
+        checkpoint_cache[key] = copy.deepcopy((
+            params['quantization'], output_shift, layers, weights, bias,
+            input_channels, output_channels, final_scale,
+        ))
+    return layers, weights, bias, output_shift, input_channels, output_channels, final_scale
+
+
+def preload_checkpoint(
+        args: CNNGeneratorArgs,
+) -> None:
+    """
+    Load the checkpoint for `args` into `checkpoint_cache`, so that generating many variants
+    of the network or simulating many samples loads the model only once.
+    """
+    if not args.checkpoint_file:
+        return
+    tc.dev = tc.get_device(args.device)
+    commandline.set_state(Namespace(**asdict(args)))
+    cfg, _, params = yamlcfg.parse(args.config_file, args.skip_yaml_layers, args.yamllint)
+    if cfg['arch'] != 'test' and checkpoint_key(args, cfg, params) not in checkpoint_cache:
+        load_checkpoint(args, cfg, params, cache=True)
+
+
 def codegen(args: CNNGeneratorArgs):
     """
     Izer codegen
@@ -69,6 +176,7 @@ def codegen(args: CNNGeneratorArgs):
 
     # Change global state based on command line
     commandline.set_state(Namespace(**asdict(args)))
+    stats.reset()
 
     # Load configuration file
     cfg, cfg_layers, params = yamlcfg.parse(args.config_file, args.skip_yaml_layers, args.yamllint)
@@ -81,41 +189,8 @@ def codegen(args: CNNGeneratorArgs):
         if not args.checkpoint_file:
             raise IzerError('Model file passed to synthesis tool')
             #eprint('--checkpoint-file is a required argument.')
-        fext = args.checkpoint_file.rsplit(sep='.', maxsplit=1)[1].lower()
-        if fext == 'onnx':
-            # ONNX file selected
-            layers, weights, bias, output_shift, \
-                input_channels, output_channels = \
-                onnxcp.load(
-                    args.checkpoint_file,
-                    cfg['arch'],
-                    params['quantization'],
-                    params['bias_quantization'],
-                    params['output_shift'],
-                    params['kernel_size'],
-                    params['operator'],
-                    args.display_checkpoint,
-                    args.no_bias,
-                )
-        else:
-            # PyTorch checkpoint file selected
-            layers, weights, bias, output_shift, \
-                input_channels, output_channels, final_scale = \
-                checkpoint.load(
-                    args.checkpoint_file,
-                    cfg['arch'],
-                    params['quantization'],
-                    params['bias_quantization'],
-                    params['output_shift'],
-                    params['kernel_size'],
-                    params['operator'],
-                    args.display_checkpoint,
-                    args.no_bias,
-                    params['conv_groups'],
-                    params['bypass'],
-                    params['weight_source'],
-                    args.skip_checkpoint_layers,
-                )
+        layers, weights, bias, output_shift, \
+            input_channels, output_channels, final_scale = load_checkpoint(args, cfg, params)
     else:  # Get some hard-coded sample weights
         layers, weights, output_shift, \
             input_channels, output_channels = \
@@ -85,6 +85,8 @@ class CNNGeneratorArgs:
     sample_input: Optional[str] = None
     result_filename: Optional[str] = None
     result_numpy: Optional[str] = None
+    range_stats: Optional[str] = None
+    range_stats_append: bool = False
     
     # Streaming and FIFOs
     fifo: bool = False
@@ -404,6 +406,8 @@ class CNNGeneratorArgs:
             'sample_input': 'sample_input',
             'result_filename': 'result_filename',
             'result_numpy': 'result_numpy',
+            'range_stats': 'range_stats',
+            'range_stats_append': 'range_stats_append',
             'fifo': 'fifo',
             'fast_fifo': 'fast_fifo',
             'fast_fifo_quad': 'fast_fifo_quad',
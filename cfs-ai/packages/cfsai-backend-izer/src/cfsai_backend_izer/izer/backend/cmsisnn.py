@@ -20,7 +20,7 @@ from typing import Any, List
 
 import numpy as np
 
-from cfsai_backend_izer.izer import assets, op, state, stats, toplevel
+from cfsai_backend_izer.izer import assets, op, rangestats, state, stats, toplevel
 from cfsai_backend_izer.izer import tornadocnn as tc
 from cfsai_backend_izer.izer.eprint import eprint, wprint
 from cfsai_backend_izer.izer.simulate import (conv1d_layer, conv2d_layer, convtranspose2d_layer, eltwise_layer,
@@ -643,5 +643,9 @@ class Backend(backend.Backend):
         assets.copy('assets', 'cmsis-nn', base_directory, test_name)
 
         logger.debug(stats.summary())
+        if state.range_stats is not None and not rangestats.hold:
+            rangestats.save(state.range_stats, append=state.range_stats_append)
+            logger.debug(rangestats.summary())
+            rangestats.reset()
 
         return test_name
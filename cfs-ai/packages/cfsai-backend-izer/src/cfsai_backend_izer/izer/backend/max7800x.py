@@ -15,16 +15,17 @@ Backend for MAX7800X embedded code generation and RTL simulations
 """
 import copy
 import hashlib
+import io
 import logging
 import os
 import sys
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 import numpy as np
 
 from cfsai_backend_izer.izer import (apbaccess, assets, compute, console, datamem, kbias, kdedup, kernels, latency,
-                  load, op, rtlsim, state, stats)
+                  load, op, rangestats, rtlsim, state, stats)
 from cfsai_backend_izer.izer import tornadocnn as tc
 from cfsai_backend_izer.izer.eprint import eprint, nprint, wprint
 from cfsai_backend_izer.izer.names import layer_pfx, layer_str
@@ -441,6 +442,7 @@ class Backend(backend.Backend):
 
         # Check that input channels are in separate memory instances if CHW (big) data format is
         # used, and calculate input and output expansion
+        dmem_used = 0
         for ll in range(first_layer_used, layers):
             if quantization[ll] == 1 and binary_quantization:
                 raise IzerError(f'{layer_pfx(ll)}Cannot combine binary quantization with '
@@ -622,6 +624,10 @@ class Backend(backend.Backend):
                        f'with output offset 0x{out_offset[ll]:04x} and expansion '
                        f'{out_expand[ll]}x '
                        f'exceeds data memory instance size of {tc.dev.INSTANCE_WIDTH*16}.')
+            if not streaming[ll] or ll == terminating_layer:
+                dmem_used = max(dmem_used, out_size + out_offset[ll])
+            if not streaming[ll]:
+                dmem_used = max(dmem_used, in_size + in_offset[ll])
 
             if hw_operator[ll] == op.NONE:
                 if activation[ll] is not None:
@@ -802,6 +808,7 @@ class Backend(backend.Backend):
             if output_width[ll] != 8 and hw_operator[ll] == op.NONE:
                 raise IzerError(f'{layer_pfx(ll)}'
                        'The passthrough operator requires an output width of 8.')
+        stats.resourcedict['dmem_used'] = dmem_used
 
         # Deduplicate kernels
         # Do this here since by now all modifications to the kernels have happened
@@ -828,6 +835,21 @@ class Backend(backend.Backend):
         state.weights = hw_kernel
         state.bias = bias
 
+        # Precompute the nonzero kernel masks once so the simulator can skip pruned kernels
+        kernel_masks: List[Optional[np.ndarray]] = [None] * layers
+        for ll in range(first_layer_used, layers):
+            if operator[ll] in [op.CONV2D, op.LINEAR, op.CONVTRANSPOSE2D] and not bypass[ll] \
+               and kernel[kernel_ptrs[ll]] is not None:
+                kernel_masks[ll] = compute.kernel_mask(
+                    kernel[kernel_ptrs[ll]].reshape(
+                        output_chan[ll],
+                        -1,
+                        kernel_size[ll][0],
+                        kernel_size[ll][1],
+                    )
+                )
+        state.kernel_masks = kernel_masks
+
         # Create comment of the form "k1_b0-1x32x32b_2x2s2p14-..."
         test_name = prefix
         if not embedded_code:
@@ -855,14 +877,27 @@ class Backend(backend.Backend):
             test_name = test_name[:cutoff] + '-' + h
         #print(f'{test_name}...')
 
-        try:
-            target_dir = os.path.join(base_directory, test_name)
-            os.makedirs(target_dir, exist_ok=False)
-        except OSError:
-            if not overwrite:
-                raise IzerError(f'The target folder {target_dir}, exists. Use --overwrite to proceed.')
-            else:
-                logger.debug(f'--overwrite specified, writing to, {target_dir}, even though it exists.')
+        def output_file(name: str, mode: str = 'w'):
+            """
+            Open the generated file `name` in the target folder, or an in-memory file when only
+            the statistics are collected.
+            """
+            if state.stats_only:
+                return io.BytesIO() if 'b' in mode else io.StringIO()
+            if 'b' in mode:
+                return open(os.path.join(base_directory, test_name, name), mode=mode)
+            return open(os.path.join(base_directory, test_name, name), mode=mode,
+                        encoding='utf-8')
+
+        if not state.stats_only:
+            try:
+                target_dir = os.path.join(base_directory, test_name)
+                os.makedirs(target_dir, exist_ok=False)
+            except OSError:
+                if not overwrite:
+                    raise IzerError(f'The target folder {target_dir}, exists. Use --overwrite to proceed.')
+                else:
+                    logger.debug(f'--overwrite specified, writing to, {target_dir}, even though it exists.')
 
         ## Redirect stdout?
         #if log:
@@ -881,32 +916,17 @@ class Backend(backend.Backend):
         else:
             filename = c_filename + ('_riscv' if riscv else '') + '.c'
         if not block_mode and (embedded_code or compact_data):
-            sampledata_header = \
-                open(
-                    os.path.join(base_directory, test_name, state.sample_filename),
-                    mode='w',
-                    encoding='utf-8',
-                )
+            sampledata_header = output_file(state.sample_filename)
             sampledata_header.write('// This file was @generated automatically\n\n')
             if state.generate_kat and state.result_filename is not None:
-                sampleoutput_header = \
-                    open(
-                        os.path.join(base_directory, test_name, state.result_filename),
-                        mode='w',
-                        encoding='utf-8',
-                    )
+                sampleoutput_header = output_file(state.result_filename)
                 sampleoutput_header.write('// This file was @generated automatically\n\n')
             else:
                 sampleoutput_header = None
         else:
             sampledata_header = sampleoutput_header = None
         if not block_mode and not state.rtl_preload_weights:
-            weight_header = \
-                open(
-                    os.path.join(base_directory, test_name, weight_filename),
-                    mode='w',
-                    encoding='utf-8',
-                )
+            weight_header = output_file(weight_filename)
             weight_header.write('// This file was @generated automatically\n\n')
         else:
             weight_header = None
@@ -1028,11 +1048,7 @@ class Backend(backend.Backend):
 
         # Create ARM code wrapper if needed
         if riscv and not block_mode:
-            with open(
-                os.path.join(base_directory, test_name, c_filename + '.c'),
-                mode='w',
-                encoding='utf-8',
-            ) as f:
+            with output_file(c_filename + '.c') as f:
                 apb = apbaccess.apbwriter(
                     f,
                     master=False,
@@ -1052,45 +1068,38 @@ class Backend(backend.Backend):
                 apb.main()
 
         if input_csv is not None:
-            csv = os.path.join(base_directory, test_name, input_csv)
+            csv = os.devnull if state.stats_only \
+                else os.path.join(base_directory, test_name, input_csv)
         else:
             csv = None
 
         if embedded_code and api_filename.lower() != 'none':
-            apifile = open(
-                os.path.join(base_directory, test_name, api_filename),
-                mode='w',
-                encoding='utf-8',
-            )
+            apifile = output_file(api_filename)
         else:
             apifile = None
 
         passfile = None
         if state.generate_kat and log_intermediate:
-            memfile2 = open(os.path.join(base_directory, test_name,
-                            f'{output_filename}.csv'),
-                            mode='w', encoding='utf-8')
+            memfile2 = output_file(f'{output_filename}.csv')
             if state.output_pass_filename is not None:
-                passfile = open(os.path.join(base_directory, test_name,
-                                f'{state.output_pass_filename}.csv'),
-                                mode='w', encoding='utf-8')
-            datafile = open(os.path.join(base_directory, test_name,
-                            f'{state.output_data_filename}.npy'),
-                            mode='wb')
-            weightsfile = open(os.path.join(base_directory, test_name,
-                               f'{state.output_weights_filename}.npy'),
-                               mode='wb')
-            biasfile = open(os.path.join(base_directory, test_name,
-                            f'{state.output_bias_filename}.npy'),
-                            mode='wb')
+                passfile = output_file(f'{state.output_pass_filename}.csv')
+            datafile = output_file(f'{state.output_data_filename}.npy', mode='wb')
+            weightsfile = output_file(f'{state.output_weights_filename}.npy', mode='wb')
+            biasfile = output_file(f'{state.output_bias_filename}.npy', mode='wb')
         else:
             memfile2 = None
             datafile = None
             weightsfile = None
             biasfile = None
 
-        with open(os.path.join(base_directory, test_name, filename), mode='w',
-                  encoding='utf-8') as memfile:
+        def accesses_since(before: Tuple[int, ...]) -> Tuple[int, ...]:
+            """
+            Return the APB accesses counted since `before` from `apb.get_access_count()`.
+            """
+            return tuple(n - b for n, b in zip(apb.get_access_count(), before))
+
+        input_access: Tuple[int, ...] = (0,) * 6
+        with output_file(filename) as memfile:
             apb = apbaccess.apbwriter(
                 memfile,
                 verify_writes=verify_writes,
@@ -1186,6 +1195,7 @@ class Backend(backend.Backend):
 
             if embedded_code or compact_data or input_csv:
                 # Pre-define data memory loader. Inline later when generating RTL sim.
+                before = apb.get_access_count()
                 load.load(
                     True,
                     apb,
@@ -1201,6 +1211,7 @@ class Backend(backend.Backend):
                     hw_padding[start_layer],
                     csv_file=csv,
                 )
+                input_access = accesses_since(before)
             if not block_mode and (embedded_code or compact_weights):
                 # Pre-define the kernels and bias values
                 hw_kern_offs, hw_kern_len, hw_kern_count, hw_kern_ochan = kernels.load(
@@ -2645,6 +2656,7 @@ class Backend(backend.Backend):
                     if not embedded_code:
                         apb.output('\n  load_input(); // Load data input\n\n')
                 else:
+                    before = apb.get_access_count()
                     load.load(
                         embedded_code,
                         apb,
@@ -2661,6 +2673,7 @@ class Backend(backend.Backend):
                         hw_padding[start_layer],
                         csv_file=csv,
                     )
+                    input_access = accesses_since(before)
 
             if verbose:
                 print('\nGlobal registers:')
@@ -2825,6 +2838,7 @@ class Backend(backend.Backend):
                     if not embedded_code:
                         apb.output('\n  load_input(); // Load data input\n\n')
                 else:
+                    before = apb.get_access_count()
                     load.load(
                         False,
                         apb,
@@ -2841,6 +2855,7 @@ class Backend(backend.Backend):
                         hw_padding[start_layer],
                         csv_file=csv,
                     )
+                    input_access = accesses_since(before)
 
             apb.function_footer()
             # End of input
@@ -2849,6 +2864,106 @@ class Backend(backend.Backend):
 
         in_map = apb.get_mem()
         latency_data: List[Tuple[int, str, str]] = [(1, 'Startup', '')]
+        layer_cycles: List[int] = [0] * layers
+        unload_access: List[Tuple[int, ...]] = [(0,) * 6] * layers
+
+        # Estimate the latency of each layer in the order the layers are simulated
+        if tc.dev.SUPPORT_LATENCY_CALC:
+            ll = start_layer
+            while ll < layers:
+                if not flatten[ll]:
+                    hw_in_dim = hw_input_dim[ll]
+                    hw_in_chan = input_chan[ll]
+                    hw_out_chan = kern_count[ll] // in_expand[ll]
+                    hw_out_dim = hw_output_dim[ll]
+                else:
+                    hw_in_dim = (hw_input_dim[ll][0] * pool[ll][0],
+                                 hw_input_dim[ll][1] * pool[ll][1])
+                    hw_in_chan = input_chan[ll]
+                    hw_out_chan = kern_count[ll] \
+                        // (in_expand[ll] * hw_pooled_dim[ll][0] * hw_pooled_dim[ll][1])
+                    hw_out_dim = (hw_output_dim[ll][0] * hw_pooled_dim[ll][0],
+                                  hw_output_dim[ll][1] * hw_pooled_dim[ll][1])
+                if tc.dev.REQUIRE_2X_MP_PASSTHROUGH and hw_operator[ll] == op.NONE \
+                   and out_expand[ll] > 1 and (pool[ll][0] > 1 or pool[ll][1] > 1):
+                    multipass = 2 * in_expand[ll] - 1
+                else:
+                    multipass = in_expand[ll]
+                layer_lat, layer_comment = latency.calculate(
+                    input_chan=hw_in_chan,
+                    input_dim=hw_in_dim,
+                    pool=pool[ll],
+                    pool_stride=pool_stride[ll],
+                    pooled_dim=hw_pooled_dim[ll] if operator[ll] != op.CONVTRANSPOSE2D
+                    else (hw_pooled_dim[ll][0] * stride[ll][0],
+                          hw_pooled_dim[ll][1] * stride[ll][1]),
+                    multipass=multipass,
+                    output_chan=hw_out_chan if hw_operator[ll] != op.NONE else output_chan[ll],
+                    output_dim=hw_out_dim,
+                    kernel_size=hw_kernel_size[ll],
+                    padding=hw_padding[ll],
+                    num_elements=operands[ll],
+                    pool_first=pool_first[ll],
+                    passthrough=hw_operator[ll] == op.NONE,
+                    pass_out_chan=timeslots[ll],
+                    flatten=hw_flatten[ll],
+                    streaming=streaming[ll],
+                    kern_offs=kern_offs[ll],
+                )
+                if streaming[ll]:
+                    layer_lat *= -1
+                latency_data.append((layer_lat, f'Layer {layer_str(ll)}', layer_comment))
+                layer_cycles[ll] = layer_lat
+
+                if simulated_sequence[ll] is not None:
+                    if simulated_sequence[ll] == -1:
+                        break
+                    ll = simulated_sequence[ll]
+                else:
+                    if next_sequence[ll] == -1:
+                        break
+                    ll = next_sequence[ll]
+
+        def estimate_network_latency() -> None:
+            """
+            Estimate the end-to-end network latency from the layer cycles, the kernel and bias
+            sizes and the APB accesses counted so far, and record it in the statistics. Output
+            layers whose unload was not generated read each output word once.
+            """
+            weight_bytes = [0] * layers
+            bias_bytes = [0] * layers
+            for ll in range(first_layer_used, layers):
+                # Deduplicated kernels and biases are loaded once
+                if hw_kernel[kernel_ptrs[ll]] is not None \
+                   and kernel_ptrs[ll] not in kernel_ptrs[:ll]:
+                    weight_bytes[ll] = hw_kernel[kernel_ptrs[ll]].size * abs(quantization[ll]) // 8
+                if bias[bias_ptrs[ll]] is not None and bias_ptrs[ll] not in bias_ptrs[:ll]:
+                    bias_bytes[ll] = len(bias[bias_ptrs[ll]])
+                if (output_layer[ll] or ll == terminating_layer) and not any(unload_access[ll]):
+                    unload_access[ll] = ((output_chan[ll] * output_dim[ll][0] * output_dim[ll][1]
+                                          * output_width[ll] // 8 + 3) // 4, 0, 0, 0, 0, 0)
+            network_latency = latency.network_estimate(
+                layer_cycles,
+                weight_bytes,
+                bias_bytes,
+                input_access,
+                unload_access,
+                fifo=fifo,
+                fast_fifo=fast_fifo,
+                riscv=riscv,
+                start_layer=start_layer,
+            )
+            stats.resourcedict['inference_ns'] = network_latency['inference_ns']
+            stats.resourcedict['total_ns'] = network_latency['total_ns']
+            logger.debug(latency.summary(network_latency))
+
+        if state.stats_only:
+            # Only the resource and latency statistics were requested, skip the simulation
+            if tc.dev.SUPPORT_LATENCY_CALC:
+                stats.resourcedict['latency'] = sum(abs(x) for x, _, _ in latency_data)
+                estimate_network_latency()
+            stats.summary(factor=repeat_layers, group_bias_max=group_bias_max)
+            return test_name
 
         if verbose:
             print('')
@@ -2897,50 +3012,6 @@ class Backend(backend.Backend):
         while ll < layers:
             #progress.update(task, completed=ll)
 
-            if verbose and tc.dev.SUPPORT_LATENCY_CALC:
-                if not flatten[ll]:
-                    hw_in_dim = hw_input_dim[ll]
-                    hw_in_chan = input_chan[ll]
-                    hw_out_chan = kern_count[ll] // in_expand[ll]
-                    hw_out_dim = hw_output_dim[ll]
-                else:
-                    hw_in_dim = (hw_input_dim[ll][0] * pool[ll][0],
-                                 hw_input_dim[ll][1] * pool[ll][1])
-                    hw_in_chan = input_chan[ll]
-                    hw_out_chan = kern_count[ll] \
-                        // (in_expand[ll] * hw_pooled_dim[ll][0] * hw_pooled_dim[ll][1])
-                    hw_out_dim = (hw_output_dim[ll][0] * hw_pooled_dim[ll][0],
-                                  hw_output_dim[ll][1] * hw_pooled_dim[ll][1])
-                if tc.dev.REQUIRE_2X_MP_PASSTHROUGH and hw_operator[ll] == op.NONE \
-                   and out_expand[ll] > 1 and (pool[ll][0] > 1 or pool[ll][1] > 1):
-                    multipass = 2 * in_expand[ll] - 1
-                else:
-                    multipass = in_expand[ll]
-                layer_lat, layer_comment = latency.calculate(
-                    input_chan=hw_in_chan,
-                    input_dim=hw_in_dim,
-                    pool=pool[ll],
-                    pool_stride=pool_stride[ll],
-                    pooled_dim=hw_pooled_dim[ll] if operator[ll] != op.CONVTRANSPOSE2D
-                    else (hw_pooled_dim[ll][0] * stride[ll][0],
-                          hw_pooled_dim[ll][1] * stride[ll][1]),
-                    multipass=multipass,
-                    output_chan=hw_out_chan if hw_operator[ll] != op.NONE else output_chan[ll],
-                    output_dim=hw_out_dim,
-                    kernel_size=hw_kernel_size[ll],
-                    padding=hw_padding[ll],
-                    num_elements=operands[ll],
-                    pool_first=pool_first[ll],
-                    passthrough=hw_operator[ll] == op.NONE,
-                    pass_out_chan=timeslots[ll],
-                    flatten=hw_flatten[ll],
-                    streaming=streaming[ll],
-                    kern_offs=kern_offs[ll],
-                )
-                if streaming[ll]:
-                    layer_lat *= -1
-                latency_data.append((layer_lat, f'Layer {layer_str(ll)}', layer_comment))
-
             compute.debug_open(ll, base_directory, test_name, log_filename)
 
             # Concatenate input data if needed
@@ -3121,6 +3192,7 @@ class Backend(backend.Backend):
                     groups=conv_groups[ll],
                     bypass=bypass[ll],
                     datafile=datafile,
+                    mask=kernel_masks[ll],
                 )
             elif operator[ll] == op.CONVTRANSPOSE2D:
                 if not bypass[ll]:
@@ -3155,6 +3227,7 @@ class Backend(backend.Backend):
                     groups=conv_groups[ll],
                     bypass=bypass[ll],
                     datafile=datafile,
+                    mask=kernel_masks[ll],
                 )
             elif operator[ll] == op.CONV1D:
                 if not bypass[ll]:
@@ -3310,6 +3383,7 @@ class Backend(backend.Backend):
                             write_gap=write_gap[ll],
                             rollover=rollover[ll + 1] if ll < layers - 1 else None,
                         )
+                    before = apb.get_access_count()
                     apb.verify_unload(
                         ll,
                         in_map,
@@ -3327,6 +3401,8 @@ class Backend(backend.Backend):
                         unload_layer=output_layer[ll],
                         streaming=streaming[ll],
                     )
+                    if output_layer[ll] or ll == terminating_layer:
+                        unload_access[ll] = accesses_since(before)
                     if debug_snoop:
                         apb.verify_ctl(group, tc.dev.REG_SNP1_ACC, None, snoop[24],
                                        comment=' // Verify snoop 1 data accumulator')
@@ -3485,6 +3561,7 @@ class Backend(backend.Backend):
                     print(f'{layer_name:9}{layer_lat_str}')
                     if state.debug_latency and layer_comment != '':
                         print(f'\n{layer_comment}')
+            stats.resourcedict['latency'] = total
             total_str = f'{total:22,} cycles'
             if lat_unknown:
                 total_str += ' (est)'
@@ -3492,6 +3569,8 @@ class Backend(backend.Backend):
                 print('                 ==========\n'
                       f'Total{total_str}\n')
 
+            estimate_network_latency()
+
             if not (embedded_code or block_mode or any(streaming)):
                 rtlsim.write_latency(
                     test_name,
@@ -3638,6 +3717,13 @@ class Backend(backend.Backend):
             assets.from_template(str(ASSET_PREFIX / 'assets'), 'device-ai' + str(device), base_directory,
                                  test_name, board_name)
 
+        if logger.isEnabledFor(logging.DEBUG):
+            for msg in stats.mismatches(stats.estimate()):
+                logger.debug(msg)
         logger.debug(stats.summary(factor=repeat_layers, group_bias_max=group_bias_max))
+        if state.range_stats is not None and not rangestats.hold:
+            rangestats.save(state.range_stats, append=state.range_stats_append)
+            logger.debug(rangestats.summary())
+            rangestats.reset()
 
         return test_name
@@ -189,6 +189,12 @@ def get_parser() -> argparse.Namespace:
                             "'None' to inline code)")
     group.add_argument('--sample-numpy-filename', dest='result_numpy', metavar='S',
                        help="save sample result as NumPy file (default: disabled)")
+    group.add_argument('--range-stats', metavar='S', default=None,
+                       help="collect activation range and saturation statistics into this "
+                            "NumPy file (default: disabled)")
+    group.add_argument('--range-stats-append', action='store_true', default=False,
+                       help="merge the range statistics into an existing file rather than "
+                            "replacing it (default: false)")
 
     # Streaming and FIFOs
     group = parser.add_argument_group('Streaming and FIFOs')
@@ -689,6 +695,8 @@ def set_state(args: argparse.Namespace) -> None:
     state.reshape_inputs = args.reshape_inputs
     state.result_filename = args.result_filename
     state.result_numpy = args.result_numpy
+    state.range_stats = args.range_stats
+    state.range_stats_append = args.range_stats_append
     state.result_output = args.result_output
     state.riscv = args.riscv
     state.riscv_cache = args.riscv_cache
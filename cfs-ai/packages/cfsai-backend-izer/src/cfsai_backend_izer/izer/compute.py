@@ -25,6 +25,9 @@ from . import op, state, stats
 from .eprint import eprint
 from cfsai_backend_izer.exceptions import IzerError
 
+# Contract per input channel only when at most this fraction of the kernels is nonzero
+SPARSE_KERNEL_DENSITY = 0.5
+
 
 def debug_open(
         layer: int,
@@ -66,6 +69,16 @@ def debug_close() -> None:
     state.debug_log = None
 
 
+def kernel_mask(
+        weight,
+) -> np.ndarray:
+    """
+    Return a boolean (out, in) mask of the kernels in `weight` that have at least one
+    nonzero element. `weight` is ordered (C_out, C_in, H, W) or (C_out, C_in, L).
+    """
+    return np.any(weight.reshape(weight.shape[0], weight.shape[1], -1) != 0, axis=2)
+
+
 def conv2d(
         data,
         weight,
@@ -79,16 +92,25 @@ def conv2d(
         fractional_stride,
         output_pad,
         groups=1,
+        mask=None,
 ) -> ArrayLike:
     """
     Compute a 2D convolution.
 
+    When a kernel `mask` (see `kernel_mask()`) is given, input channels without any nonzero
+    kernel are skipped and, if the remaining kernels are sparse enough, each input channel is
+    contracted only with the output channels that have a nonzero kernel for it.
+
     Note that all PyTorch numbers are ordered (C, H, W)
     """
     assert data.shape == tuple(input_size)
     in_channels = input_size[0]
     out_channels = output_size[0]
 
+    if mask is not None and mask.all():
+        # Nothing is pruned, use the dense contraction
+        mask = None
+
     # Stretch data for fractionally-strided convolution
     if fractional_stride[0] > 1 or fractional_stride[1] > 1:
         ndata = np.zeros((data.shape[0],
@@ -131,7 +153,31 @@ def conv2d(
                 nweight[i, i * (in_channels // groups) + j, :, :] = weight[i, j, :, :]
         weight = nweight
 
-    output = np.tensordot(view, weight, axes=((2, 3, 4), (1, 2, 3))).transpose(2, 0, 1)
+        if mask is not None:
+            nmask = np.zeros((mask.shape[0], in_channels), dtype=bool)
+            for i in range(mask.shape[0]):
+                nmask[i, i * (in_channels // groups):(i + 1) * (in_channels // groups)] = mask[i]
+            mask = nmask
+
+    if mask is not None and not mask.any(axis=0).all():
+        # Drop the input channels whose kernels are all zero
+        active = np.flatnonzero(mask.any(axis=0))
+        view = view[:, :, active]
+        weight = weight[:, active]
+        mask = mask[:, active]
+
+    if mask is not None and mask.sum() <= SPARSE_KERNEL_DENSITY * mask.size:
+        # Contract one input channel at a time, over the output channels using it
+        k = weight.shape[2] * weight.shape[3]
+        cols = view.transpose(2, 3, 4, 0, 1).reshape(view.shape[2], k, h * w)
+        kernels = weight.reshape(weight.shape[0], weight.shape[1], k)
+        output = np.zeros((out_channels, h * w), dtype=np.result_type(view, weight))
+        for i in range(mask.shape[1]):
+            outs = np.flatnonzero(mask[:, i])
+            output[outs] += kernels[outs, i] @ cols[i]
+        output = output.reshape(out_channels, h, w)
+    else:
+        output = np.tensordot(view, weight, axes=((2, 3, 4), (1, 2, 3))).transpose(2, 0, 1)
 
     # Apply bias
     if bias is not None:
@@ -157,6 +203,7 @@ def convtranspose2d(
         fractional_stride,
         output_pad,
         groups=1,
+        mask=None,
 ) -> ArrayLike:
     """
     Compute a transposed 2D convolution.
@@ -178,6 +225,7 @@ def convtranspose2d(
         fractional_stride,
         output_pad,
         groups,
+        mask,
     )
 
 
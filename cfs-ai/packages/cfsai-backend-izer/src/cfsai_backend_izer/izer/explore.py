@@ -0,0 +1,241 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Design-space exploration over generator arguments and YAML layer settings
+"""
+import argparse
+import contextlib
+import dataclasses
+import io
+import itertools
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from cfsai_backend_izer.exceptions import IzerError
+
+from . import checkpoint_cache, codegen, preload_checkpoint, state, stats
+from .args_dataclass import CNNGeneratorArgs
+
+# Results are ranked by these metrics, lower is better
+METRICS = ('cycles', 'kmem_used', 'dmem_used')
+
+
+def variants(
+        grid: Dict[str, List[Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Return all combinations of the values in `grid`. Keys are either `CNNGeneratorArgs`
+    field names (for example, `fifo` or `mlator`), or `layers.<index>.<key>` to override a
+    setting of one layer in the YAML configuration file (for example, `layers.0.processors`).
+    """
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def _apply(
+        args: CNNGeneratorArgs,
+        overrides: Dict[str, Any],
+        directory: str,
+) -> CNNGeneratorArgs:
+    """
+    Return a copy of `args` with `overrides` applied. YAML overrides are written to a copy of
+    the network configuration file in `directory`.
+    """
+    arg_overrides = {}
+    layer_overrides: List[Tuple[int, str, Any]] = []
+    for key, val in overrides.items():
+        if key.startswith('layers.'):
+            _, ll, name = key.split('.', 2)
+            layer_overrides.append((int(ll), name, val))
+        elif key in {f.name for f in dataclasses.fields(CNNGeneratorArgs)}:
+            arg_overrides[key] = val
+        else:
+            raise IzerError(f'Unknown exploration parameter `{key}`.')
+
+    config_file = args.config_file
+    if layer_overrides:
+        with open(args.config_file, mode='r', encoding='utf-8') as f:
+            cfg = yaml.safe_load(f)
+        for ll, name, val in layer_overrides:
+            if ll >= len(cfg['layers']):
+                raise IzerError(f'Exploration parameter `layers.{ll}.{name}` exceeds the '
+                                f'number of layers ({len(cfg["layers"])}).')
+            if val is None:
+                cfg['layers'][ll].pop(name, None)
+            else:
+                cfg['layers'][ll][name] = val
+        config_file = os.path.join(directory, 'network.yaml')
+        with open(config_file, mode='w', encoding='utf-8') as f:
+            yaml.safe_dump(cfg, f, sort_keys=False)
+
+    return dataclasses.replace(
+        args,
+        config_file=config_file,
+        test_dir=os.path.join(directory, 'out'),
+        overwrite=True,
+        range_stats=None,
+        autogen='None',
+        display_checkpoint=False,
+        **arg_overrides,
+    )
+
+
+def evaluate(
+        args: CNNGeneratorArgs,
+        overrides: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Run the generator for `args` with `overrides` applied up to the memory allocation and
+    latency estimate, and return the estimated total latency in cycles, the estimated
+    inference time in ns and the weight, bias and data memory usage. The network is not
+    simulated and no files are generated. A variant that fails for any reason returns its
+    error message in `error`.
+    """
+    rv: Dict[str, Any] = {'variant': overrides, 'error': None}
+    saved_stats_only = state.stats_only
+    state.stats_only = True
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            vargs = _apply(args, overrides, directory)
+            with contextlib.redirect_stdout(io.StringIO()):
+                codegen(vargs)
+    except Exception as err:  # pylint: disable=broad-except
+        rv['error'] = str(err) or err.__class__.__name__
+        return rv
+    finally:
+        state.stats_only = saved_stats_only
+
+    rv['cycles'] = stats.resourcedict['latency']
+    rv['inference_ns'] = stats.resourcedict['inference_ns']
+    rv['kmem_used'] = stats.resourcedict['kmem_used']
+    rv['bmem_used'] = stats.resourcedict['bmem_used']
+    rv['dmem_used'] = stats.resourcedict['dmem_used']
+    return rv
+
+
+def _init_worker(
+        cache: Dict[Tuple, Tuple],
+) -> None:
+    """
+    Process pool initializer that shares the checkpoint loaded by the parent.
+    """
+    checkpoint_cache.update(cache)
+
+
+def explore(
+        args: CNNGeneratorArgs,
+        grid: Dict[str, List[Any]],
+        jobs: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate all variants of `args` described by `grid` (see `variants()`) using `jobs`
+    worker processes (default: one per CPU), and return one result per variant with the
+    non-dominated results flagged as `pareto`. The checkpoint is loaded once and shared with
+    all workers.
+    """
+    preload_checkpoint(args)
+    todo = variants(grid)
+
+    if jobs == 1 or len(todo) <= 1:
+        results = [evaluate(args, v) for v in todo]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(dict(checkpoint_cache),),
+        ) as executor:
+            results = list(executor.map(evaluate, [args] * len(todo), todo))
+
+    mark_pareto(results)
+    return results
+
+
+def mark_pareto(
+        results: List[Dict[str, Any]],
+) -> None:
+    """
+    Set `pareto` for each successful result that no other result beats in one of the
+    `METRICS` without being worse in another.
+    """
+    ok = [r for r in results if r['error'] is None]
+    for r in results:
+        r['pareto'] = r['error'] is None and not any(
+            all(o[m] <= r[m] for m in METRICS) and any(o[m] < r[m] for m in METRICS)
+            for o in ok
+        )
+
+
+def summary(
+        results: List[Dict[str, Any]],
+        pareto_only: bool = True,
+) -> str:
+    """
+    Return a table of `results` sorted by latency, optionally limited to the Pareto front.
+    """
+    rv = f'{"Cycles":>14} {"Inference us":>14} {"Weight mem":>12} {"Bias mem":>10} ' \
+         f'{"Data mem":>10}    Variant\n'
+    for r in sorted((r for r in results if r['error'] is None),
+                    key=lambda r: tuple(r[m] for m in METRICS)):
+        if pareto_only and not r['pareto']:
+            continue
+        variant = ', '.join(f'{k}={v}' for k, v in r['variant'].items())
+        rv += f'{r["cycles"]:14,} {r["inference_ns"] / 1000:14,.1f} {r["kmem_used"]:12,} ' \
+              f'{r["bmem_used"]:10,} {r["dmem_used"]:10,}{"  * " if r["pareto"] else "    "}{variant}\n'
+
+    failed = [r for r in results if r['error'] is not None]
+    if failed:
+        rv += f'\n{len(failed)} variant(s) failed:\n'
+        for r in failed:
+            variant = ', '.join(f'{k}={v}' for k, v in r['variant'].items())
+            rv += f'  {variant}: {r["error"]}\n'
+    return rv
+
+
+def main() -> None:
+    """
+    Command line wrapper
+    """
+    parser = argparse.ArgumentParser(
+        description='Explore generator settings and print the Pareto front of latency, '
+                    'weight memory and data memory')
+    parser.add_argument('--device', required=True, metavar='S',
+                        help="device (for example, MAX78002)")
+    parser.add_argument('--config-file', required=True, metavar='S',
+                        help="YAML configuration file containing layer configuration")
+    parser.add_argument('--checkpoint-file', metavar='S',
+                        help="checkpoint file containing quantized weights")
+    parser.add_argument('--grid', required=True, metavar='S',
+                        help="YAML file mapping each parameter to a list of values")
+    parser.add_argument('--jobs', type=int, metavar='N',
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument('--all', action='store_true', default=False,
+                        help="show all variants, not just the Pareto front")
+    cmd = parser.parse_args()
+
+    with open(cmd.grid, mode='r', encoding='utf-8') as f:
+        grid = yaml.safe_load(f)
+
+    args = CNNGeneratorArgs(
+        device=cmd.device,
+        config_file=cmd.config_file,
+        checkpoint_file=cmd.checkpoint_file,
+    )
+    print(summary(explore(args, grid, cmd.jobs), pareto_only=not cmd.all), end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -13,9 +13,12 @@
 """
 Latency calculations
 """
-from typing import Tuple
+from typing import Any, Dict, List, Tuple
 
 from cfsai_backend_izer.izer import tornadocnn as tc
+from cfsai_backend_izer.izer.names import layer_pfx
+from cfsai_backend_izer.izer.rtlsim import (ARM_APB_ACCESS, NS_PER_CNN_CYCLE, RISCV_APB_ACCESS,
+                                            RISCV_FASTFIFO_ACCESS)
 
 
 def calculate(
@@ -157,3 +160,98 @@ def calculate(
         s += f'Layer Subtotal{total:13} (streaming estimate)\n'
 
     return total, s
+
+
+def access_ns(
+        access: Tuple[int, ...],
+        riscv: bool = False,
+) -> int:
+    """
+    Return the time in ns of the APB accesses `access`, a tuple of reads, writes, FIFO reads,
+    FIFO writes, Fast FIFO reads and Fast FIFO writes as returned by `APB.get_access_count()`.
+    The access costs are the ones used by `rtlsim.calculate_timeout()`.
+    """
+    reads, writes, fifo_reads, fifo_writes, fastfifo_reads, fastfifo_writes = access
+    apb_access = RISCV_APB_ACCESS if riscv else ARM_APB_ACCESS
+    return (reads + writes + fifo_reads + fifo_writes) * apb_access \
+        + (fastfifo_reads + fastfifo_writes) * RISCV_FASTFIFO_ACCESS
+
+
+def network_estimate(
+        layer_cycles: List[int],
+        weight_bytes: List[int],
+        bias_bytes: List[int],
+        input_access: Tuple[int, ...],
+        unload_access: List[Tuple[int, ...]],
+        fifo: bool = False,
+        fast_fifo: bool = False,
+        riscv: bool = False,
+        start_layer: int = 0,
+) -> Dict[str, Any]:
+    """
+    Estimate the end-to-end latency in ns for a network, combining the per-layer accelerator
+    cycles from `calculate()` with the APB accesses counted while generating the input
+    loader (`input_access`) and the output unload of each layer (`unload_access`), see
+    `access_ns()`. All lists are indexed by layer. Input data is loaded before `start_layer`,
+    through the (fast) FIFO when `fifo` or `fast_fifo` is set. When using a FIFO, loading
+    overlaps with the first layer. Weights and biases are written once, one 32-bit word per
+    APB access, so `inference_ns` excludes them.
+    Negative cycle counts (streaming estimates) are counted by their magnitude.
+    """
+    apb_access = RISCV_APB_ACCESS if riscv else ARM_APB_ACCESS
+
+    layers: List[Dict[str, int]] = []
+    for ll, cycles in enumerate(layer_cycles):
+        layers.append({
+            'cycles': abs(cycles),
+            'compute_ns': abs(cycles) * NS_PER_CNN_CYCLE,
+            'weight_load_ns': (weight_bytes[ll] + bias_bytes[ll] + 3) // 4 * apb_access,
+            'input_load_ns': access_ns(input_access, riscv) if ll == start_layer else 0,
+            'unload_ns': access_ns(unload_access[ll], riscv),
+        })
+
+    rv: Dict[str, Any] = {
+        key: sum(e[key] for e in layers)
+        for key in ('cycles', 'compute_ns', 'weight_load_ns', 'input_load_ns', 'unload_ns')
+    }
+    if (fifo or fast_fifo) and start_layer < len(layers):
+        # The first layer processes data while it is being pushed into the FIFO
+        first = layers[start_layer]['compute_ns']
+        rv['inference_ns'] = max(rv['input_load_ns'], first) + rv['compute_ns'] - first \
+            + rv['unload_ns']
+    else:
+        rv['inference_ns'] = rv['input_load_ns'] + rv['compute_ns'] + rv['unload_ns']
+    rv['total_ns'] = rv['inference_ns'] + rv['weight_load_ns']
+    rv['fifo'] = fifo or fast_fifo
+    rv['estimated'] = any(cycles <= 0 for cycles in layer_cycles)
+    rv['start_layer'] = start_layer
+    rv['layers'] = layers
+    return rv
+
+
+def summary(
+        estimate: Dict[str, Any],
+        spaces: int = 0,
+) -> str:
+    """
+    Return the breakdown from `network_estimate()` as text.
+    """
+    sp = ' ' * spaces
+    est = ' (est)' if estimate['estimated'] else ''
+    rv = f'{sp}ESTIMATED NETWORK LATENCY\n' \
+         f'{sp}Weight load:  {estimate["weight_load_ns"] / 1000:12,.1f} us\n' \
+         f'{sp}Input load:   {estimate["input_load_ns"] / 1000:12,.1f} us' \
+         f'{" (FIFO)" if estimate["fifo"] else ""}\n' \
+         f'{sp}Compute:      {estimate["compute_ns"] / 1000:12,.1f} us' \
+         f' ({estimate["cycles"]:,} cycles){est}\n' \
+         f'{sp}Unload:       {estimate["unload_ns"] / 1000:12,.1f} us\n' \
+         f'{sp}Inference:    {estimate["inference_ns"] / 1000:12,.1f} us\n' \
+         f'{sp}Total:        {estimate["total_ns"] / 1000:12,.1f} us\n'
+    for ll in range(estimate['start_layer'], len(estimate['layers'])):
+        e = estimate['layers'][ll]
+        rv += f'{sp}  {layer_pfx(ll)}{e["cycles"]:,} cycles, ' \
+              f'compute {e["compute_ns"] / 1000:,.1f} us, ' \
+              f'weights {e["weight_load_ns"] / 1000:,.1f} us, ' \
+              f'input {e["input_load_ns"] / 1000:,.1f} us, ' \
+              f'unload {e["unload_ns"] / 1000:,.1f} us\n'
+    return rv
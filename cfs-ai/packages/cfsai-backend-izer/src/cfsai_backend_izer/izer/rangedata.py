@@ -0,0 +1,117 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Stream a data set of sample inputs through the simulator to collect activation range statistics
+"""
+import argparse
+import contextlib
+import dataclasses
+import io
+import os
+import tempfile
+from typing import Optional
+
+import numpy as np
+
+from cfsai_backend_izer.exceptions import IzerError
+
+from . import codegen, preload_checkpoint, rangestats
+from .args_dataclass import CNNGeneratorArgs
+
+
+def collect_dataset(
+        args: CNNGeneratorArgs,
+        dataset_file: str,
+        limit: Optional[int] = None,
+        append: bool = False,
+) -> int:
+    """
+    Run the simulator for `args` once per sample in the NumPy file `dataset_file`, an array
+    of (N, C, ...) samples, and write the activation range statistics of all samples to
+    `args.range_stats`. The file is memory-mapped, so only one sample is loaded at a time,
+    and the statistics are accumulated in memory and saved once. An existing statistics file
+    is replaced unless `append` is set. At most `limit` samples are used. Returns the number
+    of samples that were simulated.
+    """
+    if args.range_stats is None:
+        raise IzerError('Collecting range statistics for a data set requires `range_stats`.')
+    data = np.load(dataset_file, mmap_mode='r')
+    if data.ndim < 2:
+        raise IzerError(f'The data set {dataset_file} must be an array of samples, but has '
+                        f'shape {data.shape}.')
+    if not np.issubdtype(data.dtype, np.integer):
+        raise IzerError(f'The data set {dataset_file} is of type {data.dtype}, rather than '
+                        'an integer type.')
+    samples = data.shape[0] if limit is None else min(limit, data.shape[0])
+
+    preload_checkpoint(args)
+    rangestats.reset()
+    # The backends keep the statistics of each run in memory, they are saved once below
+    rangestats.hold = True
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            sample_file = os.path.join(directory, 'sample.npy')
+            sargs = dataclasses.replace(
+                args,
+                sample_input=sample_file,
+                test_dir=os.path.join(directory, 'out'),
+                overwrite=True,
+                autogen='None',
+                display_checkpoint=False,
+            )
+            for i in range(samples):
+                np.save(sample_file, np.asarray(data[i], dtype=np.int64), allow_pickle=False)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    codegen(sargs)
+    finally:
+        rangestats.hold = False
+    rangestats.save(args.range_stats, append=append)
+    return samples
+
+
+def main() -> None:
+    """
+    Command line wrapper
+    """
+    parser = argparse.ArgumentParser(
+        description='Simulate each sample of a data set and accumulate the activation range '
+                    'and saturation statistics')
+    parser.add_argument('--device', required=True, metavar='S',
+                        help="device (for example, MAX78002)")
+    parser.add_argument('--config-file', required=True, metavar='S',
+                        help="YAML configuration file containing layer configuration")
+    parser.add_argument('--checkpoint-file', metavar='S',
+                        help="checkpoint file containing quantized weights")
+    parser.add_argument('--dataset', required=True, metavar='S',
+                        help="NumPy file containing an array of int64 sample inputs")
+    parser.add_argument('--range-stats', required=True, metavar='S',
+                        help="NumPy file to write the statistics to")
+    parser.add_argument('--append', action='store_true', default=False,
+                        help="merge into an existing statistics file rather than replacing it")
+    parser.add_argument('--limit', type=int, metavar='N',
+                        help="number of samples to use (default: all)")
+    cmd = parser.parse_args()
+
+    args = CNNGeneratorArgs(
+        device=cmd.device,
+        config_file=cmd.config_file,
+        checkpoint_file=cmd.checkpoint_file,
+        range_stats=cmd.range_stats,
+    )
+    samples = collect_dataset(args, cmd.dataset, cmd.limit, cmd.append)
+    print(f'Simulated {samples:,} samples.')
+    print(rangestats.summary(), end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Streaming activation range and saturation statistics for the pure Python computation modules
+"""
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+from cfsai_backend_izer.exceptions import IzerError
+
+from .names import layer_pfx
+
+# Histogram bins hold the bit length of the magnitude of each pre-clip value (0 to 63 bits)
+HIST_BINS = 64
+
+# Per-layer accumulators. All per-channel arrays are indexed by output channel.
+rangedict: Dict[int, Dict[str, np.ndarray]] = {}
+
+# While set, the backends neither save nor discard the statistics at the end of a simulator
+# run, so that a caller can accumulate many runs in memory and save them once
+hold: bool = False
+
+
+def reset() -> None:
+    """
+    Discard all accumulated statistics.
+    """
+    rangedict.clear()
+
+
+def collect(
+        layer: int,
+        data,
+        bits: int,
+        output_shift: int = 0,
+        batch: bool = False,
+) -> None:
+    """
+    Accumulate the pre-clip output `data` of `layer` that is about to be clipped to `bits`.
+    `data` is channel-first, (C, ...) for one sample or, when `batch` is set, (N, C, ...) for
+    a batch of samples.
+    """
+    data = np.asarray(data, dtype=np.int64)
+    if batch:
+        data = np.moveaxis(data, 1, 0)
+    elif data.ndim == 1:
+        data = data[:, np.newaxis]
+    channels = data.shape[0]
+    data = data.reshape(channels, -1)
+
+    acc = rangedict.get(layer)
+    if acc is not None and acc['min'].shape[0] != channels:
+        raise IzerError(f'{layer_pfx(layer)}Range statistics for {channels} channels do not '
+                        f'match the {acc["min"].shape[0]} channels collected so far.')
+    if acc is None:
+        acc = {
+            'bits': np.array(bits, dtype=np.int64),
+            'output_shift': np.array(output_shift, dtype=np.int64),
+            'count': np.zeros(channels, dtype=np.int64),
+            'min': np.full(channels, np.iinfo(np.int64).max, dtype=np.int64),
+            'max': np.full(channels, np.iinfo(np.int64).min, dtype=np.int64),
+            'sum': np.zeros(channels, dtype=np.float64),
+            'clip_low': np.zeros(channels, dtype=np.int64),
+            'clip_high': np.zeros(channels, dtype=np.int64),
+            'hist': np.zeros((channels, HIST_BINS), dtype=np.int64),
+        }
+        rangedict[layer] = acc
+
+    if data.shape[1] == 0:
+        return
+
+    low = -(2**(bits-1))
+    high = 2**(bits-1) - 1
+
+    acc['count'] += data.shape[1]
+    np.minimum(acc['min'], data.min(axis=1), out=acc['min'])
+    np.maximum(acc['max'], data.max(axis=1), out=acc['max'])
+    acc['sum'] += data.sum(axis=1, dtype=np.float64)
+    acc['clip_low'] += np.count_nonzero(data < low, axis=1)
+    acc['clip_high'] += np.count_nonzero(data > high, axis=1)
+
+    # The binary exponent of a float is the bit length of the integer magnitude
+    bitlen = np.frexp(np.abs(data).astype(np.float64))[1].clip(0, HIST_BINS - 1)
+    bitlen += np.arange(channels, dtype=bitlen.dtype)[:, np.newaxis] * HIST_BINS
+    acc['hist'] += np.bincount(bitlen.ravel(), minlength=channels * HIST_BINS) \
+        .reshape(channels, HIST_BINS)
+
+
+def clipped(
+        layer: int,
+) -> int:
+    """
+    Return the number of values of `layer` that were clipped so far.
+    """
+    acc = rangedict[layer]
+    return int(acc['clip_low'].sum() + acc['clip_high'].sum())
+
+
+def suggest_shift(
+        layer: int,
+        max_clip_fraction: float = 1e-4,
+) -> int:
+    """
+    Return the largest `output_shift` for `layer` that keeps the fraction of clipped values at
+    or below `max_clip_fraction`. Shifting by one doubles each value, so a value with a
+    magnitude of `b` bits is estimated to saturate once `b + delta > bits - 1`.
+    """
+    acc = rangedict[layer]
+    hist = acc['hist'].sum(axis=0)
+    total = int(acc['count'].sum())
+    bits = int(acc['bits'])
+    # above[b] is the number of values whose magnitude needs more than b bits
+    above = np.concatenate((np.cumsum(hist[::-1])[::-1][1:], [0]))
+
+    delta = -(HIST_BINS - 1)
+    for d in range(bits - 1, -HIST_BINS, -1):
+        limit = bits - 1 - d
+        n = int(above[limit]) if 0 <= limit < HIST_BINS else (total if limit < 0 else 0)
+        if n <= max_clip_fraction * total:
+            delta = d
+            break
+    return int(acc['output_shift']) + delta
+
+
+def summary(
+        spaces: int = 0,
+        max_clip_fraction: float = 1e-4,
+) -> str:
+    """
+    Return a saturation and range summary for all layers with accumulated statistics.
+    """
+    sp = ' ' * spaces
+    rv = sp + "ACTIVATION RANGE AND SATURATION\n"
+    for ll in sorted(rangedict):
+        acc = rangedict[ll]
+        total = int(acc['count'].sum())
+        n = clipped(ll)
+        rv += f'{sp}  {layer_pfx(ll)}{total:,} values, ' \
+              f'range [{int(acc["min"].min())}, {int(acc["max"].max())}], ' \
+              f'{n:,} clipped ({n * 100.0 / max(total, 1):.3f}%), ' \
+              f'output_shift {int(acc["output_shift"])} ' \
+              f'(suggested {suggest_shift(ll, max_clip_fraction)})\n'
+    return rv
+
+
+def save(
+        filename: str,
+        append: bool = False,
+) -> None:
+    """
+    Write the accumulated statistics to the NumPy archive `filename`, replacing an existing
+    file. When `append` is set and the file already exists, its statistics are merged first
+    so that a dataset can be processed one simulator run at a time.
+    """
+    if append and os.path.exists(filename):
+        load(filename)
+
+    arrays = {}
+    for ll, acc in rangedict.items():
+        for key, val in acc.items():
+            arrays[f'L{ll}_{key}'] = val
+    with open(filename, mode='wb') as f:
+        np.savez_compressed(f, **arrays)
+
+
+def load(
+        filename: str,
+) -> None:
+    """
+    Merge the statistics stored in the NumPy archive `filename` into the accumulators. The
+    archive must have been collected for the same network.
+    """
+    stored: Dict[int, Dict[str, np.ndarray]] = {}
+    with np.load(filename) as f:
+        for name in f.files:
+            pfx, key = name.split('_', 1)
+            stored.setdefault(int(pfx[1:]), {})[key] = f[name]
+
+    for ll, other in stored.items():
+        acc: Optional[Dict[str, np.ndarray]] = rangedict.get(ll)
+        if acc is None:
+            rangedict[ll] = other
+            continue
+        if acc['min'].shape != other['min'].shape:
+            raise IzerError(f'{layer_pfx(ll)}The range statistics in {filename} have '
+                            f'{other["min"].shape[0]} channels, but {acc["min"].shape[0]} '
+                            'channels were collected. Use a new file for a changed network.')
+        for key in ('count', 'sum', 'clip_low', 'clip_high', 'hist'):
+            acc[key] = acc[key] + other[key]
+        acc['min'] = np.minimum(acc['min'], other['min'])
+        acc['max'] = np.maximum(acc['max'], other['max'])
@@ -17,7 +17,7 @@ import os
 
 import numpy as np
 
-from . import op, state, stats
+from . import op, rangestats, state, stats
 from . import tornadocnn as tc
 from .compute import conv1d, conv2d, convtranspose2d, eltwise, linear, pool1d, pool2d
 from .names import layer_str
@@ -116,9 +116,11 @@ def conv2d_layer(
         groups=1,
         bypass=False,
         datafile=None,
+        mask=None,
 ):
     """
     Perform 2D convolution for one layer.
+    `mask` is the optional nonzero kernel mask from `compute.kernel_mask()`.
     """
     verbose_data = state.verbose_all or state.output_layer[layer]
 
@@ -166,6 +168,7 @@ def conv2d_layer(
         fractional_stride=[1, 1],
         output_pad=[0, 0],
         groups=groups,
+        mask=mask,
     )
 
     if datafile is not None:
@@ -185,10 +188,18 @@ def conv2d_layer(
         (input_size[0] // groups) * kernel_size[0] * kernel_size[1] * out_size[0]
         * out_size[1] * out_size[2],
     )
+    stats.account(
+        layer,
+        "true_macc",
+        (int(mask.sum()) if mask is not None else (input_size[0] // groups) * out_size[0])
+        * kernel_size[0] * kernel_size[1] * out_size[1] * out_size[2],
+    )
 
     if output_width != 32:
-        out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64). \
-            clip(-(2**(bits-1)), 2**(bits-1)-1)
+        out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64)
+        if state.range_stats is not None:
+            rangestats.collect(layer, out_buf, bits, output_shift)
+        out_buf = out_buf.clip(-(2**(bits-1)), 2**(bits-1)-1)
 
         if state.verbose and verbose_data:
             print(f"{out_size[0]}x{out_size[1]}x{out_size[2]} OUTPUT "
@@ -246,9 +257,11 @@ def convtranspose2d_layer(
         groups=1,
         bypass=False,
         datafile=None,
+        mask=None,
 ):
     """
     Perform a fractionally strided 2D convolution for one layer.
+    `mask` is the optional nonzero kernel mask from `compute.kernel_mask()`.
     """
     verbose_data = state.verbose_all or state.output_layer[layer]
 
@@ -299,6 +312,7 @@ def convtranspose2d_layer(
         fractional_stride=fractional_stride,
         output_pad=output_padding,
         groups=groups,
+        mask=mask,
     )
 
     if datafile is not None:
@@ -318,10 +332,18 @@ def convtranspose2d_layer(
         (input_size[0] // groups) * kernel_size[0] * kernel_size[1] * out_size[0]
         * out_size[1] * out_size[2],
     )
+    stats.account(
+        layer,
+        "true_macc",
+        (int(mask.sum()) if mask is not None else (input_size[0] // groups) * out_size[0])
+        * kernel_size[0] * kernel_size[1] * out_size[1] * out_size[2],
+    )
 
     if output_width != 32:
-        out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64). \
-            clip(-(2**(bits-1)), 2**(bits-1)-1)
+        out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64)
+        if state.range_stats is not None:
+            rangestats.collect(layer, out_buf, bits, output_shift)
+        out_buf = out_buf.clip(-(2**(bits-1)), 2**(bits-1)-1)
 
         if state.verbose and verbose_data:
             print(f"{out_size[0]}x{out_size[1]}x{out_size[2]} OUTPUT "
@@ -432,8 +454,10 @@ def conv1d_layer(
     )
 
     if output_width != 32:
-        out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64). \
-            clip(-(2**(bits-1)), 2**(bits-1)-1)
+        out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64)
+        if state.range_stats is not None:
+            rangestats.collect(layer, out_buf, bits, output_shift)
+        out_buf = out_buf.clip(-(2**(bits-1)), 2**(bits-1)-1)
 
         if state.verbose and verbose_data:
             print(f"{out_size[0]}x{out_size[1]} OUTPUT "
@@ -506,8 +530,10 @@ def linear_layer(
         in_features=in_features,
         out_features=out_features,
     )
-    out_buf = np.floor(0.5 + out_buf / 128).astype(np.int64). \
-        clip(-(2**(bits-1)), 2**(bits-1)-1)
+    out_buf = np.floor(0.5 + out_buf / 128).astype(np.int64)
+    if state.range_stats is not None:
+        rangestats.collect(layer, out_buf, bits)
+    out_buf = out_buf.clip(-(2**(bits-1)), 2**(bits-1)-1)
 
     if state.verbose and verbose_data:
         print(f"OUTPUT (size {out_features}):")
@@ -615,10 +641,12 @@ def eltwise_layer(
 
     if output_width != 32:
         if operator == op.ELTWISE_MUL:
-            out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64). \
-                clip(-(2**(bits-1)), 2**(bits-1)-1)
-        else:
-            np.clip(out_buf, -(2**(bits-1)), 2**(bits-1)-1, out_buf)
+            out_buf = np.floor(0.5 + out_buf / (128 / 2.0**output_shift)).astype(np.int64)
+        # An in-flight operation feeds the layer's convolution, whose output is collected
+        if state.range_stats is not None and state.operator[layer] == op.NONE:
+            rangestats.collect(layer, out_buf, bits,
+                               output_shift if operator == op.ELTWISE_MUL else 0)
+        np.clip(out_buf, -(2**(bits-1)), 2**(bits-1)-1, out_buf)
 
         if state.verbose and verbose_data:
             print(f"{input_size[0]}x{input_size[1]}x{input_size[2]} OUTPUT:")
@@ -106,6 +106,7 @@ input_pix_clk: int = 0
 input_skip: List[int] = []
 input_sync: bool = False
 kernel_format: str = ''
+kernel_masks: List[Any] = []
 kernel_size: List[List[int]] = []
 layer_name: List[Optional[int]] = []
 layers: int = 0
@@ -167,6 +168,8 @@ pretend_zero_sram: bool = False
 prev_sequence: List[int] = []
 processor_map: List[int] = []
 quantization: List[int] = []
+range_stats: Optional[str] = None
+range_stats_append: bool = False
 read_ahead: List[bool] = []
 repeat_layers: int = 1
 reshape_inputs: bool = False
@@ -193,6 +196,7 @@ snoop: List[int] = []
 softmax: bool = False
 split: int = 1
 start_layer: int = 0
+stats_only: bool = False
 stopstart: bool = False
 stream_start: List[int] = []
 streaming: List[bool] = []
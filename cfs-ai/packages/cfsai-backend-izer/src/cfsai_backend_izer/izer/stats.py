@@ -15,9 +15,9 @@ Statistics for the pure Python computation modules
 """
 import operator
 from functools import reduce
-from typing import Optional
+from typing import Dict, List, Optional
 
-from . import state
+from . import op, state
 from . import tornadocnn as tc
 from .names import layer_pfx
 
@@ -31,7 +31,7 @@ statsdict = {
     # exp: [0],  # Exponentiations (SoftMax)
     "sw_macc": [0],  # Software multiply-accumulates (FC)
     "sw_comp": [0],  # Software comparisons (ReLU)
-    "true_macc": [0],  # Actual MAC ops, ignoring padding
+    "true_macc": [0],  # MAC ops of the kernels that are not all zero, ignoring padding
     "true_sw_macc": [0],
 }
 
@@ -39,9 +39,23 @@ resourcedict = {
     "kmem_used": 0,  # Used kernel memory
     "bmem_used": 0,  # Used bias memory
     "input_size": 0,  # Sample input size
+    "dmem_used": 0,  # Highest used data memory address within an instance
+    "latency": 0,  # Estimated total latency in cycles
+    "inference_ns": 0,  # Estimated inference time including input load and unload
+    "total_ns": 0,  # Estimated inference time including weight and bias load
 }
 
 
+def reset() -> None:
+    """
+    Clear all op counts and resource statistics.
+    """
+    for key in statsdict:
+        statsdict[key] = [0]
+    for key in resourcedict:
+        resourcedict[key] = 0
+
+
 def get(layer, operation: str) -> int:
     """
     Return the stats of `operation` for a `layer`.
@@ -92,6 +106,97 @@ def account(
     statsdict[operation][layer] += val
 
 
+def estimate() -> Dict[str, List[int]]:
+    """
+    Return per-layer op counts for the network described by `state`, derived analytically from
+    the layer parameters without running the simulator. The keys match `statsdict`, except for
+    the true MAC counts that depend on the weights.
+    """
+    # Cache variables locally
+    activation = state.activation
+    conv_groups = state.conv_groups
+    eltwise = state.eltwise
+    flatten = state.flatten
+    input_chan = state.input_channels
+    input_crop = state.input_crop
+    input_dim = state.input_dim
+    kernel_size = state.kernel_size
+    layers = state.layers
+    operands = state.operands
+    operator = state.operator
+    output_chan = state.output_channels
+    output_dim = state.output_dim
+    pool = state.pool
+    pool_average = state.pool_average
+    pool_first = state.pool_first
+    pooled_dim = state.pooled_dim
+
+    rv: Dict[str, List[int]] = {
+        key: [0] * layers for key in statsdict
+        if not key.startswith('true_')
+    }
+
+    for ll in range(state.start_layer, layers):
+        in_chan = input_chan[ll]
+        pooled_size = in_chan * pooled_dim[ll][0] * pooled_dim[ll][1]
+
+        # In-flight element-wise operations, before or after pooling
+        if operands[ll] > 1:
+            if pool_first[ll]:
+                size = pooled_size
+            else:
+                size = in_chan * (input_dim[ll][0] + input_crop[ll][0] + input_crop[ll][1]) \
+                    * input_dim[ll][1]
+            if eltwise[ll] in [op.ELTWISE_ADD, op.ELTWISE_SUB]:
+                rv["add"][ll] += (operands[ll] - 1) * size
+            elif eltwise[ll] == op.ELTWISE_MUL:
+                rv["mul"][ll] += (operands[ll] - 1) * size
+            elif eltwise[ll] in [op.ELTWISE_OR, op.ELTWISE_XOR]:
+                rv["bitwise"][ll] += (operands[ll] - 1) * size
+
+        # In-flight pooling
+        if pool[ll][0] > 1 or pool[ll][1] > 1:
+            if operator[ll] == op.CONV1D:
+                st = pool[ll][0] * in_chan * pooled_dim[ll][0]
+            else:
+                st = pool[ll][0] * pool[ll][1] * pooled_size \
+                    * (operands[ll] if pool_first[ll] else 1)
+            rv["add" if pool_average[ll] else "comp"][ll] += st
+
+        # Convolution or passthrough
+        if operator[ll] == op.NONE:
+            continue
+        if operator[ll] == op.CONV1D:
+            out_size = output_chan[ll] * output_dim[ll][0]
+            rv["macc"][ll] += (in_chan // conv_groups[ll]) * kernel_size[ll][0] * out_size
+        else:
+            if flatten[ll]:
+                in_chan *= pooled_dim[ll][0] * pooled_dim[ll][1]
+            out_size = output_chan[ll] * output_dim[ll][0] * output_dim[ll][1]
+            rv["macc"][ll] += (in_chan // conv_groups[ll]) \
+                * kernel_size[ll][0] * kernel_size[ll][1] * out_size
+        if activation[ll] is not None:
+            rv["comp"][ll] += out_size
+
+    return rv
+
+
+def mismatches(
+        estimated: Dict[str, List[int]],
+) -> List[str]:
+    """
+    Compare `estimated` op counts from `estimate()` to the ops accounted in the simulator
+    and return a description of each difference.
+    """
+    rv = []
+    for key, vals in estimated.items():
+        for ll in range(state.start_layer, len(vals)):
+            if vals[ll] != get(ll, key):
+                rv.append(f'{layer_pfx(ll)}Estimated {key} {vals[ll]:,} does not match '
+                          f'simulated {get(ll, key):,}')
+    return rv
+
+
 def summary(
         factor: int = 1,
         spaces: int = 0,
@@ -23,8 +23,10 @@ from pydantic import TypeAdapter
 from cfsai_backend_tflm.exceptions import CfsaiTflmError
 from cfsai_backend_tflm.extensions import CfsaiTflmExtensions
 from cfsai_tflite import TfliteInfo
+from cfsai_tflite.cache import ParseCache
 from cfsai_types.config.verified import VerifiedBackendConfig
 from cfsai_types.logging import EventType, log_event, setup_logger
+from cfsai_types.worker import load_config, serve
 
 timestamp = time.ctime()
 
@@ -303,7 +305,7 @@ def _build(cfgs: VerifiedBackendConfig) -> None:
         # config is good, start work
         build_dir.mkdir(exist_ok=True, parents=True)
 
-        info = TfliteInfo(model_file)
+        info = TfliteInfo(model_file, cache=ParseCache.default())
         
 
         # Use overridden symbol if defined, otherwise fall back to name
@@ -371,20 +373,36 @@ def _build(cfgs: VerifiedBackendConfig) -> None:
     _generate_top_level_header(used_symbols, build_dir)
     log_event(logger, EventType.FILE, report_dir / 'adi_tflm.hpp')
 
+def _handle_request(params: dict) -> None:
+    """Build API implementation for one worker request."""
+    _build(VerifiedBackendConfig(**load_config(params)))
+
 if __name__ == "__main__":
     """
     If invoked directly, read VerfiedBackendConfig from a file
     and execute that.
     """
     parser = argparse.ArgumentParser()
-    parser.add_argument('--file', required=True, help='Config file')
+    parser.add_argument('--file', help='Config file')
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Serve JSON-RPC requests from stdin until it closes'
+    )
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     args = parser.parse_args()
+    if not args.serve and not args.file:
+        parser.error('--file is required unless --serve is given')
 
     setup_logger(debug_level=args.verbose)
 
     logger.debug(f"Invoking tflm with: \n{args}")
 
+    if args.serve:
+        ParseCache.share_in_memory()
+        serve(_handle_request)
+        sys.exit(0)
+
     try:
         # Read JSON and parse into Pydantic model
         with open(args.file) as f:
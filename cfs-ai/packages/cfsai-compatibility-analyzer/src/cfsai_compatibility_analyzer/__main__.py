@@ -15,8 +15,10 @@ import logging
 import sys
 
 from cfsai_compatibility_analyzer import CompatibilityAnalyzer
+from cfsai_tflite.cache import ParseCache
 from cfsai_types.hardware_profile import HardwareProfile
 from cfsai_types.logging import setup_logger
+from cfsai_types.worker import load_config, serve
 
 logger = logging.getLogger("cfsai_compatibility_analyzer")
 
@@ -25,14 +27,16 @@ def _run_compat(
     model_path: str, 
     profile: HardwareProfile, 
     json_file: str,
-    dataset_path: str | None = None
+    dataset_path: str | None = None,
+    fail_fast: bool = False
 ) -> None:
     """Run compatibility analyzer."""
     analyzer = CompatibilityAnalyzer()
     compatibility_report = analyzer.analyze_model(
         model_path,
         profile,
-        dataset_path=dataset_path
+        dataset_path=dataset_path,
+        fail_fast=fail_fast
     )
 
     if json_file:
@@ -44,32 +48,136 @@ def _run_compat(
         sys.exit(10)
 
 
+def _load_profiles(config: dict | list) -> list[HardwareProfile]:
+    """Read the hardware profiles of a config holding one or a list of them."""
+    if isinstance(config, list):
+        return [HardwareProfile(**profile) for profile in config]
+    return [HardwareProfile(**config)]
+
+
+def _run_matrix(
+    model_paths: list[str],
+    profiles: list[HardwareProfile],
+    json_file: str | None,
+    csv_file: str | None,
+    dataset_path: str | None = None,
+    jobs: int | None = None
+) -> None:
+    """Run compatibility analyzer for every model on every target."""
+    matrix = CompatibilityAnalyzer().analyze_matrix(
+        model_paths, profiles, dataset_path=dataset_path, jobs=jobs
+    )
+
+    if json_file:
+        matrix.save_as_json(json_file)
+    if csv_file:
+        matrix.save_as_csv(csv_file)
+    matrix.print_matrix()
+
+
+def _handle_request(params: dict) -> None:
+    """Run compatibility analyzer for one worker request."""
+    if params.get('matrix'):
+        models = params['model']
+        _run_matrix(
+            [models] if isinstance(models, str) else models,
+            _load_profiles(load_config(params)),
+            params.get('json_file'),
+            params.get('csv_file'),
+            params.get('dataset'),
+            params.get('jobs')
+        )
+        return
+
+    profile = HardwareProfile(**load_config(params))
+    _run_compat(
+        params['model'],
+        profile,
+        params.get('json_file'),
+        params.get('dataset'),
+        params.get('fail_fast', False)
+    )
+
+
 if __name__ == "__main__":
     """
     If invoked directly, construct input from params.
     """
     parser = argparse.ArgumentParser()
-    parser.add_argument('--file', required=True, help='Config file')
-    parser.add_argument('--model', required=True, help='Model file')
+    parser.add_argument(
+        '--file', nargs='+', help='Config file, or several with --matrix'
+    )
+    parser.add_argument(
+        '--model', nargs='+', help='Model file, or several with --matrix'
+    )
     parser.add_argument('--dataset', help='Dataset file (optional)')
     parser.add_argument('--json-file', help='Output json file')
+    parser.add_argument(
+        '--matrix',
+        action='store_true',
+        help='Check every model against every hardware profile of the config '
+        'files in parallel'
+    )
+    parser.add_argument('--csv-file', help='Output csv file (with --matrix)')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        help='Worker processes for --matrix (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first critical issue with a partial report'
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Serve JSON-RPC requests from stdin until it closes'
+    )
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     args = parser.parse_args()
+    if not args.serve and not (args.file and args.model):
+        parser.error('--file and --model are required unless --serve is given')
+    if not args.serve and not args.matrix and (
+        len(args.file) > 1 or len(args.model) > 1
+    ):
+        parser.error('Several --file or --model values require --matrix')
 
     setup_logger(debug_level=args.verbose)
 
     logger.debug(f"Invoking compatibility analyzer with: \n{args}")
 
+    if args.serve:
+        ParseCache.share_in_memory()
+        serve(_handle_request)
+        sys.exit(0)
+
     try:
+        if args.matrix:
+            profiles = []
+            for config_file in args.file:
+                with open(config_file) as f:
+                    profiles.extend(_load_profiles(json.load(f)))
+            _run_matrix(
+                args.model,
+                profiles,
+                args.json_file,
+                args.csv_file,
+                args.dataset,
+                args.jobs
+            )
+            sys.exit(0)
+
         # Read JSON and parse into Pydantic model
-        with open(args.file) as f:
+        with open(args.file[0]) as f:
             data = json.load(f)
             profile = HardwareProfile(**data)
             _run_compat(
-                args.model,
+                args.model[0],
                 profile,
                 args.json_file,
-                args.dataset
+                args.dataset,
+                args.fail_fast
             )
     except Exception as e:
         logger.error(f'{e.__class__.__name__}{e}')
@@ -19,14 +19,26 @@ memory constraints, and data type compatibility.
 """
 
 import logging
+import math
+import os
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional, Union
 
-from cfsai_model_parser import TFLiteParser
+from cfsai_model_parser import TFLiteParser, parse_models
 from cfsai_model_parser.schemas import LayerDetail, ModelDetails
 
+from cfsai_compatibility_analyzer.dataset import (
+    DATASET_DTYPES,
+    DatasetStatistics,
+    dataset_statistics,
+    dequantize,
+    quantized_range_use,
+    sample_bytes,
+    sample_shape,
+)
 from cfsai_compatibility_analyzer.exceptions import (
     CompatibilityAnalysisError,
     InvalidHardwareMetadataError,
@@ -34,7 +46,12 @@ from cfsai_compatibility_analyzer.exceptions import (
 )
 from cfsai_compatibility_analyzer.schemas import (
     COMPAT_REPORT_VERSION,
+    CompatibilityMatrix,
     CompatibilityReport,
+    DatasetIssue,
+    DatasetSummary,
+    MatrixCell,
+    MatrixStatus,
     MemoryIssue,
     MemoryRecommendation,
     ModelSummary,
@@ -42,6 +59,7 @@ from cfsai_compatibility_analyzer.schemas import (
     OptimizationOpportunity,
     UnsupportedTypeIssue,
 )
+from cfsai_tflite.cache import ParseCache
 from cfsai_types.hardware_profile import HardwareProfile
 from cfsai_types.report import ReportInfo, ReportType
 
@@ -68,6 +86,7 @@ FALLBACK_COMPRESSION_EFFECTIVENESS = 0.8  # 80% conservative default
 MIN_SAVINGS_THRESHOLD_KB = 1.0         # Minimum meaningful savings in KB
 MIN_SAVINGS_THRESHOLD_PERCENT = 0.10   # Minimum meaningful savings as % of layer
 HIGH_PRIORITY_LAYER_SIZE_KB = 100      # Size threshold for high priority optimization
+MIN_QUANTIZED_RANGE_USE = 1 / 16       # Dataset span of a quantized input (4 bits)
 
 @dataclass(frozen=True)
 class AnalysisMetrics:
@@ -78,6 +97,25 @@ class AnalysisMetrics:
     data_type_issues: int
     analysis_duration_ms: float
 
+
+@dataclass
+class LayerScan:
+    """
+    Layer findings collected in one traversal of a model's layers.
+
+    Attributes:
+        operator_issues: Unsupported operators and the layers using them
+        type_issues: Unsupported data types and the layers using them
+        optimization_opportunities: Quantization opportunities of all layers
+        processed_layers: Number of layers scanned
+    """
+    operator_issues: list[OperatorIssue] = field(default_factory=list)
+    type_issues: list[UnsupportedTypeIssue] = field(default_factory=list)
+    optimization_opportunities: list[OptimizationOpportunity] = field(
+        default_factory=list
+    )
+    processed_layers: int = 0
+
 class CompatibilityAnalyzer:
     """
     Comprehensive hardware compatibility analyzer for AI model deployment.
@@ -104,7 +142,8 @@ class CompatibilityAnalyzer:
         self,
         model_path: Union[str, Path],
         hw_metadata: HardwareProfile,
-        dataset_path: Optional[Union[str, Path]] = None
+        dataset_path: Optional[Union[str, Path]] = None,
+        fail_fast: bool = False
     ) -> CompatibilityReport:
         """
         Perform comprehensive compatibility analysis on a TensorFlow Lite model.
@@ -114,9 +153,12 @@ class CompatibilityAnalyzer:
             hw_metadata: HardwareProfile instance containing hardware constraints
                 including flash_size, ram_size, supported_ops, and supported_data_types
             dataset_path: Optional path to dataset file for memory analysis
+            fail_fast: Check the cheapest critical conditions first, and return
+                a partial report without the full analysis if one is found
 
         Returns:
-            CompatibilityReport containing detailed analysis results
+            CompatibilityReport containing detailed analysis results, marked
+            partial if fail_fast stopped at a critical issue
 
         Raises:
             ModelParsingError: If model parsing fails
@@ -128,29 +170,60 @@ class CompatibilityAnalyzer:
                 "Model path cannot be empty",
                 error_code="EMPTY_MODEL_PATH"
             )
-            
+        self._validate_hardware_metadata(hw_metadata)
+
+        self.logger.debug(f"Starting compatibility analysis for: {model_path}")
+        if fail_fast:
+            partial_report = self._find_critical_issues_fast(
+                model_path, hw_metadata, dataset_path
+            )
+            if partial_report is not None:
+                return partial_report
+
+        parsed_model = self._parse_model_safely(model_path)
+        return self.analyze_parsed_model(
+            parsed_model, hw_metadata, model_path, dataset_path
+        )
+
+    def analyze_parsed_model(
+        self,
+        parsed_model: ModelDetails,
+        hw_metadata: HardwareProfile,
+        model_path: Union[str, Path],
+        dataset_path: Optional[Union[str, Path]] = None,
+        layer_scan: Optional[LayerScan] = None,
+        dataset_stats: Optional[DatasetStatistics] = None
+    ) -> CompatibilityReport:
+        """
+        Perform compatibility analysis on an already parsed model.
+
+        Lets callers that also run other analyses parse the model once.
+
+        Args:
+            parsed_model: Model details from the parser
+            hw_metadata: HardwareProfile instance containing hardware constraints
+            model_path: Path to the model file, for the report
+            dataset_path: Optional path to dataset file for memory analysis
+            layer_scan: Findings of a completed traversal of the model's layers
+                with `scan_layer`. The layers are scanned here if not given.
+            dataset_stats: Statistics of the dataset for this model from
+                `_dataset_statistics`. The dataset is read here if not given.
+
+        Returns:
+            CompatibilityReport containing detailed analysis results
+
+        Raises:
+            ModelParsingError: If the parsed model is incomplete
+            CompatibilityAnalysisError: If analysis encounters an error
+            InvalidHardwareMetadataError: If hardware metadata is invalid
+        """
         analysis_start_time = time.time()
         
         try:
-            # Validation of hardware profile done with pydantic class
-            # So we just need to validate that an instance is provided
-            if not hw_metadata:
-                raise InvalidHardwareMetadataError(
-                    "Hardware metadata cannot be empty",
-                    error_code="EMPTY_METADATA"
-                )
-            
-            # Store hardware metadata for analysis phases
-            self.hw_metadata = hw_metadata
-            self.supported_operations = getattr(hw_metadata, "supported_ops", [])
-            self.supported_data_types = getattr(hw_metadata, "supported_data_types", [])
-            
-            # Normalize data types to uppercase for case-insensitive comparison
-            self.normalized_supported_data_types = [
-                dtype.upper() for dtype in self.supported_data_types
-            ]
+            self._validate_hardware_metadata(hw_metadata)
+            if layer_scan is None:
+                self.start_layer_scan(hw_metadata)
 
-            self.logger.debug(f"Starting compatibility analysis for: {model_path}")
             # Save path for report
             self._model_path = Path(model_path)
 
@@ -160,12 +233,18 @@ class CompatibilityAnalyzer:
                 dataset_size_kb = self._calculate_dataset_size(dataset_path)
                 self.logger.debug(f"Dataset size: {dataset_size_kb:.2f} KB")
 
-            # Parse model with validation
-            parsed_model = self._parse_model_safely(model_path)
             self._validate_parsed_model(parsed_model)
 
             # Perform comprehensive analysis
-            analysis_results = self._perform_analyses(parsed_model, dataset_size_kb)
+            analysis_results = self._perform_analyses(
+                parsed_model, dataset_size_kb, layer_scan
+            )
+            if dataset_path:
+                dataset_issues, dataset_summary = self._validate_dataset(
+                    dataset_path, parsed_model, dataset_stats
+                )
+                analysis_results['dataset_issues'] = dataset_issues
+                analysis_results['dataset_summary'] = dataset_summary
             
             # Build structured report
             compatibility_report = self._build_compatibility_report(analysis_results)
@@ -197,10 +276,195 @@ class CompatibilityAnalyzer:
                 details={"duration_ms": error_duration_ms}
             ) from e
 
+    def analyze_matrix(
+        self,
+        model_paths: list[Union[str, Path]],
+        hardware_profiles: list[HardwareProfile],
+        dataset_path: Optional[Union[str, Path]] = None,
+        jobs: Optional[int] = None
+    ) -> CompatibilityMatrix:
+        """
+        Check every model against every hardware target.
+
+        Each model is parsed and its dataset statistics are computed once,
+        then the models are evaluated against all targets in parallel worker
+        processes, one task per model. With fewer models than workers, the
+        targets of each model are split into chunks so every worker has a
+        task. Failures are isolated per cell: a model that cannot be parsed
+        or a profile that cannot be analyzed gives error cells instead of
+        stopping the matrix.
+
+        Args:
+            model_paths: Paths to the model files to analyze
+            hardware_profiles: HardwareProfile of each target
+            dataset_path: Optional path to dataset file for memory analysis
+            jobs: Number of worker processes (default: one per CPU), 1 runs
+                everything in this process
+
+        Returns:
+            CompatibilityMatrix with one cell per model and target
+        """
+        models = list(dict.fromkeys(str(model_path) for model_path in model_paths))
+        targets: list[str] = []
+        for profile_idx, profile in enumerate(hardware_profiles):
+            target = profile.target_name(profile_idx)
+            # Profiles of the same target are told apart by position
+            targets.append(
+                f"{target} ({profile_idx})" if target in targets else target
+            )
+
+        parse_results = {
+            result.model_path: result
+            for result in parse_models(models, jobs=jobs, cache=ParseCache.default())
+        }
+
+        cells: dict[tuple[str, str], MatrixCell] = {}
+        evaluated_models = []
+        for model in models:
+            result = parse_results[model]
+            model_details, error = result.model_details, result.error
+            dataset_stats = None
+            if model_details is not None and dataset_path:
+                try:
+                    dataset_stats = self._dataset_statistics(
+                        dataset_path, model_details
+                    )
+                except CompatibilityAnalysisError as e:
+                    model_details, error = None, str(e)
+            if model_details is None:
+                for target in targets:
+                    cells[(model, target)] = MatrixCell(
+                        model=model,
+                        target=target,
+                        status=MatrixStatus.error,
+                        dominating_issue=error
+                    )
+                continue
+
+            evaluated_models.append((model, model_details, dataset_stats))
+
+        # The model details are sent to a worker once per chunk of targets,
+        # so targets are only split to keep otherwise idle workers busy
+        chunk_size = max(len(targets), 1)
+        if evaluated_models and jobs != 1:
+            workers = jobs or os.cpu_count() or 1
+            chunks = math.ceil(workers / len(evaluated_models))
+            chunk_size = max(math.ceil(len(targets) / chunks), 1)
+        tasks = [
+            (
+                model_details, model,
+                targets[start:start + chunk_size],
+                hardware_profiles[start:start + chunk_size],
+                dataset_path, dataset_stats
+            )
+            for model, model_details, dataset_stats in evaluated_models
+            for start in range(0, len(targets), chunk_size)
+        ]
+
+        self.logger.debug(
+            f"Evaluating {len(evaluated_models)} models against {len(targets)} "
+            f"targets in {len(tasks)} tasks with {jobs or 'one per CPU'} job(s)"
+        )
+        if jobs == 1 or len(tasks) <= 1:
+            evaluated = [_matrix_row(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                evaluated = list(
+                    executor.map(_matrix_row, *zip(*tasks, strict=True))
+                )
+        for row in evaluated:
+            for cell in row:
+                cells[(cell.model, cell.target)] = cell
+
+        return CompatibilityMatrix(
+            models=models,
+            targets=targets,
+            cells=[cells[(model, target)] for model in models for target in targets]
+        )
+
+    def _validate_hardware_metadata(self, hw_metadata: HardwareProfile) -> None:
+        """Validate a hardware profile instance is provided."""
+        # Validation of hardware profile done with pydantic class
+        # So we just need to validate that an instance is provided
+        if not hw_metadata:
+            raise InvalidHardwareMetadataError(
+                "Hardware metadata cannot be empty",
+                error_code="EMPTY_METADATA"
+            )
+
+    def start_layer_scan(self, hw_metadata: HardwareProfile) -> LayerScan:
+        """
+        Prepare a traversal of a model's layers against a hardware profile.
+
+        Args:
+            hw_metadata: HardwareProfile instance containing hardware constraints
+
+        Returns:
+            Empty LayerScan to pass to `scan_layer` for each layer
+        """
+        # Store hardware metadata for analysis phases
+        self.hw_metadata = hw_metadata
+        self.supported_operations = getattr(hw_metadata, "supported_ops", [])
+        self.supported_data_types = getattr(hw_metadata, "supported_data_types", [])
+
+        # Normalize for case-insensitive comparison
+        self.normalized_supported_ops = {
+            op.upper() for op in self.supported_operations
+        }
+        self.normalized_supported_data_types = [
+            dtype.upper() for dtype in self.supported_data_types
+        ]
+        return LayerScan()
+
+    def scan_layer(
+        self,
+        layer: LayerDetail,
+        parsed_model: ModelDetails,
+        layer_scan: LayerScan
+    ) -> None:
+        """
+        Check one layer's operator, data types and quantization opportunity.
+
+        Args:
+            layer: Layer to check, in execution order
+            parsed_model: Parsed model containing the layer
+            layer_scan: Findings so far, from `start_layer_scan`
+        """
+        # Validate layer object has required attributes
+        if not hasattr(layer, 'name') or not hasattr(layer, 'index'):
+            self.logger.warning(f"Skipping layer with missing attributes: {layer}")
+            layer_scan.processed_layers += 1
+            return
+
+        layer_index = getattr(layer, 'index', layer_scan.processed_layers)
+        layer_scan.processed_layers += 1
+
+        # Data types are shared by the type and quantization checks
+        try:
+            layer_data_types = self._get_layer_data_types(layer)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to get data types for layer {layer_index}: {e}"
+            )
+            layer_data_types = []
+
+        self._check_layer_operator(
+            getattr(layer, 'name', 'UNKNOWN'), layer_index, layer_scan.operator_issues
+        )
+        self._check_layer_data_types(
+            layer, layer_index, layer_data_types, parsed_model,
+            layer_scan.type_issues
+        )
+        opportunity = self._layer_optimization_opportunity(
+            layer, layer_index, layer_data_types
+        )
+        if opportunity:
+            layer_scan.optimization_opportunities.append(opportunity)
+
     def _parse_model_safely(self, model_path: Path) -> ModelDetails:
         """Parse model with comprehensive error handling."""
         try:
-            parser = TFLiteParser()
+            parser = TFLiteParser(cache=ParseCache.default())
             return parser.parse_model(str(model_path))
         except Exception as e:
             raise ModelParsingError(
@@ -209,6 +473,76 @@ class CompatibilityAnalyzer:
                 details={"model_path": str(model_path), "parser_error": str(e)}
             ) from e
 
+    def _find_critical_issues_fast(
+        self,
+        model_path: Union[str, Path],
+        hw_metadata: HardwareProfile,
+        dataset_path: Optional[Union[str, Path]] = None
+    ) -> Optional[CompatibilityReport]:
+        """
+        Look for critical issues without the full model analysis.
+
+        Checks the cheapest critical conditions in order: the model file and
+        dataset overflowing both flash and RAM, which holds whatever the
+        runtime RAM turns out to be, then operators missing from
+        supported_ops, read directly from the FlatBuffer.
+
+        Args:
+            model_path: Path to the model file to analyze
+            hw_metadata: HardwareProfile instance containing hardware constraints
+            dataset_path: Optional path to dataset file for memory analysis
+
+        Returns:
+            Partial CompatibilityReport with the first critical issues found,
+            or None if there are none and the full analysis is needed
+
+        Raises:
+            ModelParsingError: If the model file cannot be read
+            CompatibilityAnalysisError: If the dataset cannot be read
+        """
+        self.start_layer_scan(hw_metadata)
+        self._model_path = Path(model_path)
+
+        dataset_size_kb = 0.0
+        if dataset_path:
+            dataset_size_kb = self._calculate_dataset_size(dataset_path)
+
+        try:
+            model_size_kb = self._model_path.stat().st_size / 1024
+            memory_issues: list[MemoryIssue] = []
+            self._check_file_size_overflow(
+                model_size_kb, dataset_size_kb, memory_issues
+            )
+            if memory_issues:
+                self.logger.debug("Fail-fast: model file does not fit the target")
+                return self._build_compatibility_report(
+                    {'memory_issues': memory_issues}, partial=True
+                )
+
+            operator_issues: list[OperatorIssue] = []
+            if self.normalized_supported_ops:
+                parser = TFLiteParser(cache=ParseCache.default())
+                operator_names = parser.operator_names(str(model_path))
+                for layer_index, operator_name in enumerate(operator_names):
+                    self._check_layer_operator(
+                        operator_name, layer_index, operator_issues
+                    )
+        except CompatibilityAnalysisError:
+            raise
+        except Exception as e:
+            raise ModelParsingError(
+                f"Failed to parse model '{model_path}': {e}",
+                error_code="MODEL_PARSE_FAILED",
+                details={"model_path": str(model_path), "parser_error": str(e)}
+            ) from e
+
+        if operator_issues:
+            self.logger.debug("Fail-fast: model uses unsupported operators")
+            return self._build_compatibility_report(
+                {'operator_issues': operator_issues}, partial=True
+            )
+        return None
+
     def _validate_parsed_model(self, parsed_model: ModelDetails) -> None:
         """Validate parsed model has required attributes."""
         required_attributes = \
@@ -285,17 +619,189 @@ class CompatibilityAnalyzer:
                 details={"dataset_path": str(dataset_path)}
             ) from e
 
+    def _validate_dataset(
+        self,
+        dataset_path: Union[str, Path],
+        parsed_model: ModelDetails,
+        statistics: Optional[DatasetStatistics] = None
+    ) -> tuple[list[DatasetIssue], Optional[DatasetSummary]]:
+        """
+        Check the dataset against the model inputs without loading it.
+
+        The dataset must be a whole number of samples of the model inputs.
+        For a model with one input, per-channel statistics are streamed from
+        the memory-mapped file, and a quantized input's dataset is checked to
+        span enough of the input type's range.
+
+        Args:
+            dataset_path: Path to binary dataset file (.bin)
+            parsed_model: Model details from the parser
+            statistics: Statistics of the dataset from `_dataset_statistics`,
+                computed here if not given
+
+        Returns:
+            Tuple of the dataset issues found and the dataset statistics,
+            None for models with several inputs or inputs of other types
+
+        Raises:
+            CompatibilityAnalysisError: If the dataset cannot be read
+        """
+        input_details = parsed_model.input_details
+        unsupported = [
+            detail.dtype for detail in input_details
+            if detail.dtype not in DATASET_DTYPES
+        ]
+        if not input_details or unsupported:
+            self.logger.debug(
+                f"Dataset not validated, input types: {unsupported or 'none'}"
+            )
+            return [], None
+
+        dataset_issues: list[DatasetIssue] = []
+        try:
+            size_bytes = Path(dataset_path).stat().st_size
+            sample_size = sample_bytes(input_details)
+            if sample_size and size_bytes % sample_size:
+                inputs = ", ".join(
+                    f"{sample_shape(detail)} {detail.dtype}"
+                    for detail in input_details
+                )
+                dataset_issues.append(DatasetIssue(
+                    type="sample_size_mismatch",
+                    detailed_info=(
+                        f"Dataset of {size_bytes} bytes is not a whole number "
+                        f"of {sample_size}-byte samples of the model input "
+                        f"({inputs})"
+                    ),
+                    severity="critical"
+                ))
+
+        except Exception as e:
+            raise CompatibilityAnalysisError(
+                f"Failed to read dataset: {e}",
+                error_code="DATASET_READ_ERROR",
+                details={"dataset_path": str(dataset_path)}
+            ) from e
+
+        if len(input_details) > 1:
+            self.logger.debug("Dataset statistics need a single model input")
+            return dataset_issues, None
+
+        input_detail = input_details[0]
+        if statistics is None:
+            statistics = self._dataset_statistics(dataset_path, parsed_model)
+
+        if statistics.non_finite_count:
+            dataset_issues.append(DatasetIssue(
+                type="non_finite_values",
+                detailed_info=(
+                    f"Dataset has {statistics.non_finite_count} NaN or "
+                    f"infinite values"
+                ),
+                severity="warning"
+            ))
+
+        is_quantized = (
+            input_detail.scale and DATASET_DTYPES[input_detail.dtype].kind in 'iu'
+        )
+        if is_quantized and statistics.sample_count:
+            range_use = quantized_range_use(statistics, input_detail)
+            narrow = [
+                channel for channel, use in enumerate(range_use)
+                if use < MIN_QUANTIZED_RANGE_USE
+            ]
+            if narrow:
+                real_ranges = ", ".join(
+                    "[{:.4g}, {:.4g}]".format(*(
+                        dequantize(value, channel, input_detail)
+                        for value in (statistics.channel_min[channel],
+                                      statistics.channel_max[channel])
+                    ))
+                    for channel in narrow[:3]
+                )
+                dataset_issues.append(DatasetIssue(
+                    type="quantization_range_mismatch",
+                    detailed_info=(
+                        f"Dataset spans only "
+                        f"{min(range_use[channel] for channel in narrow):.1%} "
+                        f"of the {input_detail.dtype} input range in "
+                        f"{len(narrow)} channel(s), real values {real_ranges}. "
+                        f"It may be quantized with other parameters than the "
+                        f"model input (scale {input_detail.scale[0]:.4g}, "
+                        f"zero point {input_detail.zero_point[0]})"
+                    ),
+                    channels=narrow,
+                    severity="warning"
+                ))
+
+        def finite_or_none(values: list[float]) -> list[Optional[float]]:
+            return [value if math.isfinite(value) else None for value in values]
+
+        dataset_summary = DatasetSummary(
+            sample_count=statistics.sample_count,
+            sample_shape=sample_shape(input_detail),
+            dtype=input_detail.dtype,
+            channel_min=finite_or_none(statistics.channel_min),
+            channel_max=finite_or_none(statistics.channel_max),
+            channel_mean=finite_or_none(statistics.channel_mean)
+        )
+        self.logger.debug(
+            f"Dataset has {statistics.sample_count} samples, "
+            f"{len(dataset_issues)} issue(s)"
+        )
+        return dataset_issues, dataset_summary
+
+    def _dataset_statistics(
+        self,
+        dataset_path: Union[str, Path],
+        parsed_model: ModelDetails
+    ) -> Optional[DatasetStatistics]:
+        """
+        Compute the per-channel statistics of a dataset for a model.
+
+        The statistics only depend on the model input, so they are shared by
+        the analyses of the model on every target.
+
+        Args:
+            dataset_path: Path to binary dataset file (.bin)
+            parsed_model: Model details from the parser
+
+        Returns:
+            DatasetStatistics of the dataset, None for models with several
+            inputs or inputs of other types
+
+        Raises:
+            CompatibilityAnalysisError: If the dataset cannot be read
+        """
+        input_details = parsed_model.input_details
+        if len(input_details) != 1 or input_details[0].dtype not in DATASET_DTYPES:
+            return None
+        try:
+            return dataset_statistics(dataset_path, input_details[0])
+        except Exception as e:
+            raise CompatibilityAnalysisError(
+                f"Failed to read dataset: {e}",
+                error_code="DATASET_READ_ERROR",
+                details={"dataset_path": str(dataset_path)}
+            ) from e
+
     def _perform_analyses(
         self,
         parsed_model: ModelDetails,
-        dataset_size_kb: float = 0.0
+        dataset_size_kb: float = 0.0,
+        layer_scan: Optional[LayerScan] = None
     ) -> dict[str, Any]:
         """
         Perform all compatibility analyses and return results.
 
+        Operator, data type and quantization checks share one traversal of
+        the layers.
+
         Args:
             parsed_model: Parsed model object
             dataset_size_kb: Dataset size in KB (optional)
+            layer_scan: Findings of a completed traversal of the layers, if the
+                caller already scanned them
 
         Returns:
             Dictionary containing analysis results
@@ -306,21 +812,28 @@ class CompatibilityAnalyzer:
         results = {}
 
         try:
-            self.logger.debug("Analyzing operator compatibility")
-            results['operator_issues'] = self._analyze_operators(
-                parsed_model.layer_details)
+            if layer_scan is None:
+                self.logger.debug("Analyzing operator and data type compatibility")
+                layer_scan = LayerScan()
+                for layer in parsed_model.layer_details:
+                    self.scan_layer(layer, parsed_model, layer_scan)
+            self.logger.debug(
+                f"Scanned {layer_scan.processed_layers} layers, found "
+                f"{len(layer_scan.operator_issues)} operator issues and "
+                f"{len(layer_scan.type_issues)} type issues"
+            )
+            results['operator_issues'] = layer_scan.operator_issues or None
 
             self.logger.debug("Analyzing memory compatibility")
             results['memory_issues'] = self._analyze_memory(
                 parsed_model,
-                dataset_size_kb
+                dataset_size_kb,
+                self._rank_optimization_opportunities(
+                    layer_scan.optimization_opportunities
+                )
             )
 
-            self.logger.debug("Analyzing data type compatibility")
-            results['type_issues'] = self._analyze_data_types(
-                parsed_model.layer_details,
-                parsed_model
-            )
+            results['type_issues'] = layer_scan.type_issues or None
 
         except Exception as e:
             raise CompatibilityAnalysisError(
@@ -330,89 +843,51 @@ class CompatibilityAnalyzer:
 
         return results
 
-    def _analyze_operators(self, layer_details: list[LayerDetail]) -> \
-        Optional[list[OperatorIssue]]:
+    def _check_layer_operator(
+        self,
+        operator_name: str,
+        layer_index: int,
+        issues: list[OperatorIssue]
+    ) -> None:
         """
-        Analyze operator compatibility against hardware support.
-        
+        Record a layer whose operator the hardware does not support.
+
         Args:
-            layer_details: List of layer detail objects to analyze
-            
-        Returns:
-            List of operator compatibility issues, or None if no issues found
-            
-        Raises:
-            CompatibilityAnalysisError: If analysis encounters unexpected errors
+            operator_name: Operator of the layer
+            layer_index: Index of the layer
+            issues: Operator issues found so far, updated in place
         """
-        if not layer_details:
-            self.logger.debug("No layer details provided for operator analysis")
-            return None
-        
-        issues = []
-        processed_layers = 0
-        
-        try:
-            # Normalize supported operations for case-insensitive comparison
-            normalized_supported_ops = {op.upper() for op in self.supported_operations}
-            
-            for layer in layer_details:
-                # Validate layer object has required attributes
-                if not hasattr(layer, 'name') or not hasattr(layer, 'index'):
-                    self.logger.warning(
-                        f"Skipping layer with missing attributes: {layer}"
-                    )
-                    continue
-                
-                layer_name = getattr(layer, 'name', 'UNKNOWN').upper()
-                layer_index = getattr(layer, 'index', processed_layers)
-                processed_layers += 1
-               
-                # If we have a list of supported data types, verify that only those
-                # listed are used by the model. Empty list means all are supported.
-                if normalized_supported_ops \
-                    and (layer_name not in normalized_supported_ops \
-                        and layer_name != 'UNKNOWN'):
-                    # Check for close matches or alternatives
-                    suggested_alternative = \
-                        self._find_operator_alternative(layer_name)
-                    
-                    # Ensure suggested alternative is actually supported
-                    if (suggested_alternative != "None" and 
-                        suggested_alternative.upper() \
-                            not in normalized_supported_ops):
-                        suggested_alternative = "None"
-
-                    # Update existing operator issue if there is one
-                    found = False
-                    for i in issues:
-                        if i.operator == layer_name:
-                            i.layers.append(layer_index)
-                            found = True
-                            break
-                    if not found:
-                        # Or create new issue
-                        issue = OperatorIssue(
-                            type="unsupported operator",
-                            operator=layer_name,
-                            layers=[layer_index],
-                            suggested_alternative=suggested_alternative,
-                            severity="critical"
-                        )
-                        issues.append(issue)
-                    
-            self.logger.debug(
-                f"Processed {processed_layers} layers, "
-                f"found {len(issues)} operator issues"
-            )
-            
-        except Exception as e:
-            raise CompatibilityAnalysisError(
-                f"Operator analysis failed: {e}",
-                error_code="OPERATOR_ANALYSIS_ERROR",
-                details={"processed_layers": processed_layers}
-            ) from e
-        
-        return issues if issues else None
+        normalized_supported_ops = self.normalized_supported_ops
+        layer_name = operator_name.upper()
+
+        # If we have a list of supported operators, verify that only those
+        # listed are used by the model. Empty list means all are supported.
+        if not normalized_supported_ops or layer_name in normalized_supported_ops \
+                or layer_name == 'UNKNOWN':
+            return
+
+        # Update existing operator issue if there is one
+        for issue in issues:
+            if issue.operator == layer_name:
+                issue.layers.append(layer_index)
+                return
+
+        # Check for close matches or alternatives
+        suggested_alternative = self._find_operator_alternative(layer_name)
+
+        # Ensure suggested alternative is actually supported
+        if (suggested_alternative != "None" and
+            suggested_alternative.upper() not in normalized_supported_ops):
+            suggested_alternative = "None"
+
+        # Or create new issue
+        issues.append(OperatorIssue(
+            type="unsupported operator",
+            operator=layer_name,
+            layers=[layer_index],
+            suggested_alternative=suggested_alternative,
+            severity="critical"
+        ))
 
     def _find_operator_alternative(self, operator_name: str) -> str:
         """
@@ -456,117 +931,66 @@ class CompatibilityAnalyzer:
         
         return alternatives.get(normalized_name, "None")
 
-    def _analyze_data_types(self, layer_details: list[LayerDetail], 
-                            parsed_model: ModelDetails) -> \
-                                Optional[list[UnsupportedTypeIssue]]:
+    def _check_layer_data_types(
+        self,
+        layer: LayerDetail,
+        layer_index: int,
+        layer_data_types: list[str],
+        parsed_model: Optional[ModelDetails],
+        issues: list[UnsupportedTypeIssue]
+    ) -> None:
         """
-        Analyze data type compatibility for each layer against hardware constraints.
-        
+        Record the data types of a layer that the hardware does not support.
+
         Args:
-            layer_details: List of layer detail objects to analyze
-            parsed_model: Parsed model containing metadata
-            
-        Returns:
-            List of data type compatibility issues, or None if no issues found
-            
-        Raises:
-            CompatibilityAnalysisError: If data type analysis encounters errors
+            layer: Layer to check
+            layer_index: Index of the layer
+            layer_data_types: Data types from `_get_layer_data_types`
+            parsed_model: Parsed model, for its model-level data type
+            issues: Type issues found so far, updated in place
         """
-        if not layer_details:
-            self.logger.debug("No layer details provided for data type analysis")
-            return None
-        
-        # Validate required attributes exist
-        if not hasattr(self, 'normalized_supported_data_types'):
-            raise CompatibilityAnalysisError(
-                "Normalized supported data types not available for analysis",
-                error_code="MISSING_SUPPORTED_TYPES"
-            )
-        
-        issues = []
-        processed_layers = 0
-        
-        try:
-            for layer in layer_details:
-                # Validate layer object has required attributes
-                if not hasattr(layer, 'index') or not hasattr(layer, 'name'):
-                    self.logger.warning(
-                        f"Skipping layer with missing attributes at index "
-                        f"{processed_layers}"
-                    )
-                    processed_layers += 1
-                    continue
-                
-                layer_index = getattr(layer, 'index', processed_layers)
-                operation_type = getattr(layer, 'name', 'UNKNOWN')
-                processed_layers += 1
-                
-                # Get layer-specific data types
-                try:
-                    layer_data_types = self._get_layer_data_types(layer)
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to get data types for layer {layer_index}: {e}"
-                    )
-                    layer_data_types = []
-                
-                # Fall back to model-level data type if no layer-specific info
-                if not layer_data_types and parsed_model:
-                    model_dtype = getattr(parsed_model, 'target_dtype', 'UNKNOWN')
-                    if model_dtype and model_dtype != 'UNKNOWN':
-                        layer_data_types = [model_dtype.upper()]
-                
-                # Check each unique data type found in this layer
-                unique_data_types = set(layer_data_types) if layer_data_types else set()
-                
-                # If we have a list of supported data types, verify that only those
-                # listed are used by the model. Empty list means all are supported.
-                if self.normalized_supported_data_types:
-                    for data_type in unique_data_types:
-                        # Skip empty, None, or unknown data types
-                        if not data_type or data_type == 'UNKNOWN' \
-                            or data_type == 'NONE':
-                            continue
-                    
-                        # Normalize data type for comparison
-                        normalized_dtype = data_type.upper().strip()
-                    
-                        # Check if data type is supported
-                        if normalized_dtype not in self.normalized_supported_data_types:
-                            # Determine severity based on data type
-                            severity = self._determine_dtype_severity(normalized_dtype)
-                        
-                            # Update existing operator issue if there is one
-                            found = False
-                            for i in issues:
-                                if i.data_type == normalized_dtype \
-                                    and i.operation_type == operation_type:
-                                    i.layers.append(layer_index)
-                                    found = True
-                                    break
-                            if not found:
-                                # Or create a new issue
-                                issue = UnsupportedTypeIssue(
-                                    layers=[layer_index],
-                                    operation_type=operation_type,
-                                    data_type=normalized_dtype,
-                                    severity=severity
-                                )
-                                issues.append(issue)
+        operation_type = getattr(layer, 'name', 'UNKNOWN')
+
+        # Fall back to model-level data type if no layer-specific info
+        if not layer_data_types and parsed_model:
+            model_dtype = getattr(parsed_model, 'target_dtype', 'UNKNOWN')
+            if model_dtype and model_dtype != 'UNKNOWN':
+                layer_data_types = [model_dtype.upper()]
+
+        # If we have a list of supported data types, verify that only those
+        # listed are used by the model. Empty list means all are supported.
+        if not self.normalized_supported_data_types:
+            return
+
+        # Check each unique data type found in this layer
+        for data_type in set(layer_data_types) if layer_data_types else set():
+            # Skip empty, None, or unknown data types
+            if not data_type or data_type == 'UNKNOWN' or data_type == 'NONE':
+                continue
 
-            self.logger.debug(
-                f"Processed {processed_layers} layers for data type analysis, "
-                f"found {len(issues)} type issues"
-            )
-            
-        except Exception as e:
-            raise CompatibilityAnalysisError(
-                f"Data type analysis failed: {e}",
-                error_code="DTYPE_ANALYSIS_ERROR",
-                details={"processed_layers": processed_layers}
-            ) from e
-        
-        return issues if issues else None
+            # Normalize data type for comparison
+            normalized_dtype = data_type.upper().strip()
+
+            # Check if data type is supported
+            if normalized_dtype in self.normalized_supported_data_types:
+                continue
+
+            # Update existing operator issue if there is one
+            found = False
+            for i in issues:
+                if i.data_type == normalized_dtype \
+                    and i.operation_type == operation_type:
+                    i.layers.append(layer_index)
+                    found = True
+                    break
+            if not found:
+                # Or create a new issue
+                issues.append(UnsupportedTypeIssue(
+                    layers=[layer_index],
+                    operation_type=operation_type,
+                    data_type=normalized_dtype,
+                    severity=self._determine_dtype_severity(normalized_dtype)
+                ))
     
     def _determine_dtype_severity(self, data_type: str) -> str:
         """
@@ -614,7 +1038,8 @@ class CompatibilityAnalyzer:
     def _analyze_memory(
         self,
         parsed_model: ModelDetails,
-        dataset_size_kb: float = 0.0
+        dataset_size_kb: float = 0.0,
+        optimization_opps: Optional[list[OptimizationOpportunity]] = None
     ) -> Optional[list[MemoryIssue]]:
         """
         Analyze memory constraint compliance against hardware limitations.
@@ -622,6 +1047,8 @@ class CompatibilityAnalyzer:
         Args:
             parsed_model: Parsed model containing size and memory information
             dataset_size_kb: Dataset size in KB to include in memory calculations
+            optimization_opps: Optimization opportunities of the layers, found
+                from the layers if not given
 
         Returns:
             List of memory compatibility issues, or None if no issues found
@@ -665,16 +1092,19 @@ class CompatibilityAnalyzer:
                 )
             
             # Get layer details for optimization opportunities
-            layer_details = getattr(parsed_model, 'layer_details', [])
-            optimization_opps = []
-            
-            try:
-                if layer_details:
-                    optimization_opps = self._get_optimization_opportunities(
-                        layer_details
+            if optimization_opps is None:
+                layer_details = getattr(parsed_model, 'layer_details', [])
+                optimization_opps = []
+
+                try:
+                    if layer_details:
+                        optimization_opps = self._get_optimization_opportunities(
+                            layer_details
+                        )
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to get optimization opportunities: {e}"
                     )
-            except Exception as e:
-                self.logger.warning(f"Failed to get optimization opportunities: {e}")
             
             # Analyze different memory constraint scenarios
             self._check_combined_memory_overflow(
@@ -800,6 +1230,45 @@ class CompatibilityAnalyzer:
                 )
             )
     
+    def _check_file_size_overflow(
+        self, model_size_kb: float, dataset_size_kb: float,
+        memory_issues: list[MemoryIssue]
+    ) -> None:
+        """
+        Check whether the model file alone overflows both flash and RAM.
+
+        A lower bound of the combined memory overflow that needs no runtime
+        RAM estimate.
+        """
+        hw_flash_kb = self.hw_metadata.flash_size
+        hw_ram_kb = self.hw_metadata.ram_size
+        total_disk_size_kb = model_size_kb + dataset_size_kb
+
+        if total_disk_size_kb > hw_ram_kb and total_disk_size_kb > hw_flash_kb:
+            if dataset_size_kb > 0:
+                required = (
+                    f"Model requires {model_size_kb:.1f} KB + "
+                    f"Dataset {dataset_size_kb:.1f} KB = "
+                    f"{total_disk_size_kb:.1f} KB total"
+                )
+            else:
+                required = f"Model requires {model_size_kb:.1f} KB"
+
+            memory_issues.append(
+                MemoryIssue(
+                    type="model_storage_memory_overflow",
+                    memory_type="flash_and_ram",
+                    detailed_info=(
+                        f"{required} before runtime RAM. "
+                        f"Hardware limits: Flash {hw_flash_kb:.1f} KB, "
+                        f"RAM {hw_ram_kb:.1f} KB"
+                    ),
+                    severity="critical",
+                    recommendations=self._determine_memory_recommendations([]),
+                    optimization_opportunities=[]
+                )
+            )
+
     def _check_flash_memory_overflow(self, model_size_kb: float, dataset_size_kb: float,
                                      hw_flash_kb: float, optimization_opps: list,
                                      memory_issues: list[MemoryIssue]) -> None:
@@ -1038,14 +1507,8 @@ class CompatibilityAnalyzer:
                     continue
                 
                 layer_index = getattr(layer, 'index', processed_layers)
-                operation_type = getattr(layer, 'name', 'UNKNOWN')
-                flash_kb = getattr(layer, 'flash_kb', 0)
                 processed_layers += 1
                 
-                # Skip layers with no memory footprint
-                if not isinstance(flash_kb, (int, float)) or flash_kb <= 0:
-                    continue
-                
                 # Get layer-specific data types safely
                 try:
                     layer_datatypes = self._get_layer_data_types(layer)
@@ -1055,35 +1518,72 @@ class CompatibilityAnalyzer:
                     )
                     continue
                 
-                # Analyze quantization opportunities
-                optimization_info = self._analyze_quantization_opportunity(
-                    layer_datatypes, flash_kb, operation_type
+                opportunity = self._layer_optimization_opportunity(
+                    layer, layer_index, layer_datatypes
                 )
-                
-                if optimization_info:
-                    opportunity = OptimizationOpportunity(
-                        layer_index=layer_index,
-                        operation_type=operation_type,
-                        current_flash_kb=flash_kb,
-                        potential_savings_kb=optimization_info['savings'],
-                        optimization_method=optimization_info['method'],
-                        priority=optimization_info['priority']
-                    )
+                if opportunity:
                     opportunities.append(opportunity)
             
-            # Sort by potential savings (highest first) and limit results
-            opportunities.sort(key=lambda x: x.potential_savings_kb, reverse=True)
-            
             self.logger.debug(
                 f"Found {len(opportunities)} optimization opportunities "
                 f"from {processed_layers} layers analyzed"
             )
             
-            return opportunities[:MAX_OPTIMIZATION_LAYERS]
+            return self._rank_optimization_opportunities(opportunities)
             
         except Exception as e:
             self.logger.warning(f"Error during optimization analysis: {e}")
             return []
+
+    def _layer_optimization_opportunity(
+        self,
+        layer: LayerDetail,
+        layer_index: int,
+        layer_datatypes: list[str]
+    ) -> Optional[OptimizationOpportunity]:
+        """
+        Get the quantization opportunity of one layer.
+
+        Args:
+            layer: Layer to analyze
+            layer_index: Index of the layer
+            layer_datatypes: Data types from `_get_layer_data_types`
+
+        Returns:
+            The layer's optimization opportunity, or None if it has none
+        """
+        operation_type = getattr(layer, 'name', 'UNKNOWN')
+        flash_kb = getattr(layer, 'flash_kb', 0)
+
+        # Skip layers with no memory footprint
+        if not isinstance(flash_kb, (int, float)) or flash_kb <= 0:
+            return None
+
+        # Analyze quantization opportunities
+        optimization_info = self._analyze_quantization_opportunity(
+            layer_datatypes, flash_kb, operation_type
+        )
+        if not optimization_info:
+            return None
+
+        return OptimizationOpportunity(
+            layer_index=layer_index,
+            operation_type=operation_type,
+            current_flash_kb=flash_kb,
+            potential_savings_kb=optimization_info['savings'],
+            optimization_method=optimization_info['method'],
+            priority=optimization_info['priority']
+        )
+
+    def _rank_optimization_opportunities(
+        self,
+        opportunities: list[OptimizationOpportunity]
+    ) -> list[OptimizationOpportunity]:
+        """Sort by potential savings (highest first) and limit results."""
+        ranked = sorted(
+            opportunities, key=lambda x: x.potential_savings_kb, reverse=True
+        )
+        return ranked[:MAX_OPTIMIZATION_LAYERS]
     
     def _analyze_quantization_opportunity(self, layer_datatypes: list[str], 
                                           flash_kb: float, 
@@ -1210,8 +1710,11 @@ class CompatibilityAnalyzer:
         else:
             return DEFAULT_COMPRESSION_EFFECTIVENESS  # 60% for unknown layer types
 
-    def _build_compatibility_report(self, analysis_results: dict[str, Any]) -> \
-         CompatibilityReport:
+    def _build_compatibility_report(
+        self,
+        analysis_results: dict[str, Any],
+        partial: bool = False
+    ) -> CompatibilityReport:
         """
         Build comprehensive compatibility report from analysis results.
         
@@ -1220,6 +1723,9 @@ class CompatibilityAnalyzer:
                 - 'memory_issues': Memory compatibility issues (list or None)
                 - 'operator_issues': Operator compatibility issues (list or None)  
                 - 'type_issues': Data type compatibility issues (list or None)
+                - 'dataset_issues': Dataset mismatches (list or None)
+                - 'dataset_summary': Dataset statistics (DatasetSummary or None)
+            partial: Whether the analysis stopped at the first critical issue
                 
         Returns:
             CompatibilityReport with normalized issue lists
@@ -1254,12 +1760,22 @@ class CompatibilityAnalyzer:
                 'type_issues',
                 UnsupportedTypeIssue
             )
+
+            # Normalize dataset issues to list format
+            dataset_issues = self._normalize_issue_list(
+                analysis_results.get('dataset_issues'),
+                'dataset_issues',
+                DatasetIssue
+            )
             
             # Create and return the compatibility report
             report = CompatibilityReport(
                 memory_issues=memory_issues,
                 operator_issues=operator_issues,
                 unsupported_types=type_issues,
+                dataset_issues=dataset_issues,
+                dataset_summary=analysis_results.get('dataset_summary'),
+                partial=partial,
                 model_summary=ModelSummary(
                     model_name=self._model_path.name,
                     model_path=str(self._model_path)
@@ -1356,3 +1872,47 @@ class CompatibilityAnalyzer:
             f"{metrics.memory_violations} memory violations, "
             f"{metrics.data_type_issues} type issues, "
         )
+
+
+def _matrix_row(
+    parsed_model: ModelDetails,
+    model: str,
+    targets: list[str],
+    hardware_profiles: list[HardwareProfile],
+    dataset_path: Optional[Union[str, Path]],
+    dataset_stats: Optional[DatasetStatistics]
+) -> list[MatrixCell]:
+    """
+    Evaluate the cells of one model and some targets of a compatibility matrix.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        parsed_model: Model details from the parser
+        model: Model file path as given
+        targets: Target names
+        hardware_profiles: HardwareProfile of each target
+        dataset_path: Optional path to dataset file for memory analysis
+        dataset_stats: Statistics of the dataset for the model, if any
+
+    Returns:
+        MatrixCell of each target summarizing the compatibility report, or
+        the error
+    """
+    cells = []
+    for target, hardware_profile in zip(targets, hardware_profiles, strict=True):
+        try:
+            report = CompatibilityAnalyzer().analyze_parsed_model(
+                parsed_model, hardware_profile, model, dataset_path,
+                dataset_stats=dataset_stats
+            )
+        except Exception as e:
+            cells.append(MatrixCell(
+                model=model,
+                target=target,
+                status=MatrixStatus.error,
+                dominating_issue=str(e) or e.__class__.__name__
+            ))
+            continue
+        cells.append(MatrixCell.from_report(model, target, report))
+    return cells
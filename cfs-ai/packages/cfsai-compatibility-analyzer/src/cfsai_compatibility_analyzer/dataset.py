@@ -0,0 +1,195 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Dataset Validation Helpers.
+
+Reads binary (.bin) datasets for `CompatibilityAnalyzer` without loading them
+into memory. A dataset is a flat little-endian buffer of samples, each laid
+out like the model input tensor without its batch dimension. The file is
+memory-mapped and reduced in fixed-size chunks, so datasets of several GB
+only need a few MB of RAM.
+"""
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+from cfsai_model_parser.schemas import InputTensorDetail
+
+# Elements reduced per chunk, 8 MB once widened to float64
+CHUNK_ELEMENTS = 1 << 20
+
+# Input tensor types a dataset can hold, little-endian
+DATASET_DTYPES: dict[str, np.dtype] = {
+    name: np.dtype(dtype).newbyteorder('<')
+    for name, dtype in {
+        'float64': np.float64,
+        'float32': np.float32,
+        'float16': np.float16,
+        'int64': np.int64,
+        'int32': np.int32,
+        'int16': np.int16,
+        'int8': np.int8,
+        'uint64': np.uint64,
+        'uint32': np.uint32,
+        'uint16': np.uint16,
+        'uint8': np.uint8,
+        'bool': np.bool_,
+    }.items()
+}
+
+
+@dataclass(frozen=True)
+class DatasetStatistics:
+    """
+    Per-channel statistics of a dataset for one model input.
+
+    Channels are the last dimension of the input tensor. Values that are not
+    finite are counted but left out of the statistics.
+
+    Attributes:
+        sample_count: Number of whole samples in the dataset
+        trailing_bytes: Bytes after the last whole sample
+        channel_min: Smallest value of each channel
+        channel_max: Largest value of each channel
+        channel_mean: Mean value of each channel
+        non_finite_count: Number of NaN or infinite values
+    """
+
+    sample_count: int
+    trailing_bytes: int
+    channel_min: list[float]
+    channel_max: list[float]
+    channel_mean: list[float]
+    non_finite_count: int = 0
+
+
+def sample_shape(input_detail: InputTensorDetail) -> list[int]:
+    """Shape of one dataset sample, the input shape without its batch."""
+    return input_detail.shape[1:] if len(input_detail.shape) > 1 else input_detail.shape
+
+
+def sample_bytes(input_details: list[InputTensorDetail]) -> int:
+    """
+    Bytes of one dataset sample, holding one value of each input in order.
+
+    Args:
+        input_details: Model inputs, all of a type in DATASET_DTYPES
+
+    Returns:
+        Size of one sample in bytes
+    """
+    return sum(
+        math.prod(sample_shape(detail)) * DATASET_DTYPES[detail.dtype].itemsize
+        for detail in input_details
+    )
+
+
+def dataset_statistics(
+    dataset_path: Union[str, Path],
+    input_detail: InputTensorDetail,
+    chunk_elements: int = CHUNK_ELEMENTS
+) -> DatasetStatistics:
+    """
+    Compute per-channel statistics of a dataset in chunks.
+
+    Args:
+        dataset_path: Path to the binary dataset file
+        input_detail: The model's only input, of a type in DATASET_DTYPES
+        chunk_elements: Number of values reduced at a time
+
+    Returns:
+        DatasetStatistics of the whole samples in the dataset
+    """
+    dtype = DATASET_DTYPES[input_detail.dtype]
+    shape = sample_shape(input_detail)
+    channels = shape[-1] if len(shape) > 1 and shape[-1] > 0 else 1
+    size_bytes = Path(dataset_path).stat().st_size
+    sample_size = math.prod(shape) * dtype.itemsize
+    sample_count = size_bytes // sample_size if sample_size else 0
+    trailing_bytes = size_bytes - sample_count * sample_size
+
+    channel_min = np.full(channels, np.inf)
+    channel_max = np.full(channels, -np.inf)
+    channel_sum = np.zeros(channels)
+    channel_count = np.zeros(channels, dtype=np.int64)
+    non_finite_count = 0
+
+    rows = sample_count * sample_size // (dtype.itemsize * channels)
+    if rows:
+        data = np.memmap(
+            dataset_path, dtype=dtype, mode='r', shape=(rows, channels)
+        )
+        chunk_rows = max(chunk_elements // channels, 1)
+        for start in range(0, rows, chunk_rows):
+            values = np.asarray(data[start:start + chunk_rows], dtype=np.float64)
+            finite = np.isfinite(values)
+            if not finite.all():
+                non_finite_count += int(values.size - np.count_nonzero(finite))
+                values = np.where(finite, values, np.nan)
+            channel_min = np.fmin(channel_min, np.fmin.reduce(values, axis=0))
+            channel_max = np.fmax(channel_max, np.fmax.reduce(values, axis=0))
+            channel_sum += np.nansum(values, axis=0)
+            channel_count += np.count_nonzero(finite, axis=0)
+        del data
+
+    counted = channel_count > 0
+    return DatasetStatistics(
+        sample_count=int(sample_count),
+        trailing_bytes=int(trailing_bytes),
+        channel_min=np.where(counted, channel_min, np.nan).tolist(),
+        channel_max=np.where(counted, channel_max, np.nan).tolist(),
+        channel_mean=np.divide(
+            channel_sum, channel_count,
+            out=np.full(channels, np.nan), where=counted
+        ).tolist(),
+        non_finite_count=non_finite_count
+    )
+
+
+def quantized_range_use(
+    statistics: DatasetStatistics, input_detail: InputTensorDetail
+) -> list[float]:
+    """
+    Fraction of the input type's range spanned by each channel of a dataset.
+
+    A quantized input whose data only spans a small part of its range was
+    likely quantized with other parameters than the input tensor's.
+
+    Args:
+        statistics: Statistics of a dataset of a quantized integer input
+        input_detail: The quantized input
+
+    Returns:
+        Span of each channel over the span of the input type, from 0 to 1
+    """
+    info = np.iinfo(DATASET_DTYPES[input_detail.dtype])
+    span = float(info.max) - float(info.min)
+    return [
+        (channel_max - channel_min) / span if channel_max >= channel_min else 0.0
+        for channel_min, channel_max in zip(
+            statistics.channel_min, statistics.channel_max, strict=True
+        )
+    ]
+
+
+def dequantize(
+    value: float, channel: int, input_detail: InputTensorDetail
+) -> float:
+    """Real value of a quantized value of one channel of an input."""
+    param_idx = channel if len(input_detail.scale) > 1 else 0
+    return (
+        (value - input_detail.zero_point[param_idx])
+        * input_detail.scale[param_idx]
+    )
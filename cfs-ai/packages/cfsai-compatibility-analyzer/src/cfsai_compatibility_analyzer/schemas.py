@@ -22,11 +22,14 @@ Schema Categories:
 - Optimization Opportunities: performance improvement suggestions
 - Compatibility Reporting: Comprehensive compatibility analysis results with
   visualization
+- Compatibility Matrix: Pass/warn/fail summary of many models on many targets
 
 Data Validation:
 All schemas include Pydantic validation to ensure data integrity and provide
 clear error messages for invalid compatibility analysis results.
 """
+import csv
+import io
 import json
 import logging
 from enum import StrEnum
@@ -238,6 +241,56 @@ class UnsupportedTypeIssue(BaseModel):
             'critical' or 'warning'"
     )
 
+class DatasetIssue(BaseModel):
+    """
+    Mismatch between the dataset and the model input it is meant for.
+
+    Attributes:
+        type: Issue classification (e.g., 'sample_size_mismatch',
+            'quantization_range_mismatch', 'non_finite_values')
+        detailed_info: Technical details of the mismatch
+        channels: Affected input channels, empty if the whole dataset
+        severity: Severity level, critical if the dataset cannot be used
+    """
+
+    type: str = Field(description="Dataset issue classification")
+    detailed_info: str = Field(description="Technical details of the mismatch")
+    channels: list[int] = Field(
+        default_factory=list, description="Affected input channels"
+    )
+    severity: SeverityLevel = Field(
+        description="Severity level of the mismatch, either 'critical' or "
+        "'warning'"
+    )
+
+
+class DatasetSummary(BaseModel):
+    """
+    Statistics of the dataset, computed by streaming over the file.
+
+    Attributes:
+        sample_count: Number of whole samples in the dataset
+        sample_shape: Shape of one sample, the model input without its batch
+        dtype: Data type of the samples, that of the model input
+        channel_min: Smallest value of each channel, the last input dimension
+        channel_max: Largest value of each channel
+        channel_mean: Mean value of each channel
+    """
+
+    sample_count: int = Field(ge=0, description="Number of whole samples")
+    sample_shape: list[int] = Field(description="Shape of one sample")
+    dtype: str = Field(description="Data type of the samples")
+    channel_min: list[Optional[float]] = Field(
+        default_factory=list, description="Smallest value of each channel"
+    )
+    channel_max: list[Optional[float]] = Field(
+        default_factory=list, description="Largest value of each channel"
+    )
+    channel_mean: list[Optional[float]] = Field(
+        default_factory=list, description="Mean value of each channel"
+    )
+
+
 class ModelSummary(BaseModel):
     """
     High-level model characteristics and metadata.
@@ -271,6 +324,10 @@ class CompatibilityReport(BaseModel):
         operator_issues: Unsupported operations requiring alternative
             implementations
         unsupported_types: Data type compatibility issues requiring conversion
+        dataset_issues: Mismatches between the dataset and the model input
+        dataset_summary: Statistics of the dataset, if one was given
+        partial: Whether a fail-fast analysis stopped at the first critical
+            issue, skipping the remaining checks
         model_summary: Metadata related to model
         info: Metadata related to the report file.
     """
@@ -289,6 +346,17 @@ class CompatibilityReport(BaseModel):
         description="Data type compatibility issues requiring quantization or " \
         "conversion"
     )
+    dataset_issues: Optional[list[DatasetIssue]] = Field(
+        default=None,
+        description="Mismatches between the dataset and the model input"
+    )
+    dataset_summary: Optional[DatasetSummary] = Field(
+        default=None, description="Dataset statistics"
+    )
+    partial: bool = Field(
+        default=False,
+        description="Analysis stopped at the first critical issue"
+    )
     model_summary: Optional[ModelSummary] = Field(
         default=None,
         description="Model metadata"
@@ -329,6 +397,14 @@ class CompatibilityReport(BaseModel):
         if self.unsupported_types:
             self._print_type_issues(verbose)
 
+        if self.dataset_issues:
+            self._print_dataset_issues()
+
+        if self.partial:
+            logger.info(
+                "Stopped at the first critical issue, other checks were skipped"
+            )
+
     def _print_operator_issues(self, verbose: bool = False) -> None:
         """
         Display operator compatibility issues with hardware-specific context.
@@ -416,6 +492,16 @@ class CompatibilityReport(BaseModel):
                         f"uses {issue.data_type}. "
                         f"Layer(s) {layers}.")
 
+    def _print_dataset_issues(self) -> None:
+        """Display mismatches between the dataset and the model input."""
+        dataset_count = len(self.dataset_issues) if self.dataset_issues else 0
+        logger.info(f"Dataset Issues ({dataset_count}):")
+        logger.info("   Dataset does not match the model input")
+
+        for issue in self.dataset_issues:
+            severity_indicator = issue.severity.value.upper()
+            logger.info(f"   [{severity_indicator}] {issue.detailed_info}")
+
     def show_table(self) -> None:
         """
         Display compatibility issues in structured table format using Rich.
@@ -485,6 +571,16 @@ class CompatibilityReport(BaseModel):
                 location = f"Layer(s) {layers}"
                 description = f"{issue.operation_type} ({issue.data_type})"
                 table.add_row("Data Type", location, description, severity_display)
+
+        # Add dataset mismatches
+        if self.dataset_issues:
+            for issue in self.dataset_issues:
+                severity_display = _get_severity_display(issue.severity)
+                location = (
+                    "Channel(s) " + ",".join(str(i) for i in issue.channels)
+                    if issue.channels else LOCATION_MODEL_WIDE
+                )
+                table.add_row("Dataset", location, issue.type, severity_display)
         
         # Display the table
         console.print(table)
@@ -504,9 +600,40 @@ class CompatibilityReport(BaseModel):
             total_count += len(self.operator_issues)
         if self.unsupported_types:
             total_count += len(self.unsupported_types)
+        if self.dataset_issues:
+            total_count += len(self.dataset_issues)
             
         return total_count
 
+    def dominating_issue(self) -> Optional[str]:
+        """
+        Describe the issue that most limits deployment.
+
+        The first critical issue is chosen over any warning, looking at
+        operators, then memory, data types and the dataset, as in
+        `has_critical_issues`.
+
+        Returns:
+            Short description of the issue, or None if there are no issues
+        """
+        issues = [
+            (issue.severity, f"Operator: {issue.operator}")
+            for issue in self.operator_issues or []
+        ] + [
+            (issue.severity, f"Memory: {issue.type} ({issue.memory_type})")
+            for issue in self.memory_issues or []
+        ] + [
+            (issue.severity, f"Data Type: {issue.operation_type} ({issue.data_type})")
+            for issue in self.unsupported_types or []
+        ] + [
+            (issue.severity, f"Dataset: {issue.type}")
+            for issue in self.dataset_issues or []
+        ]
+        for severity, description in issues:
+            if severity == SeverityLevel.critical:
+                return description
+        return issues[0][1] if issues else None
+
     def has_critical_issues(self) -> bool:
         """
         Determine if any issues would block successful deployment.
@@ -535,6 +662,12 @@ class CompatibilityReport(BaseModel):
                 if issue.severity == SeverityLevel.critical:
                     return True
 
+        # Check for datasets the model cannot read
+        if self.dataset_issues:
+            for issue in self.dataset_issues:
+                if issue.severity == SeverityLevel.critical:
+                    return True
+
         return False
 
     def get_quick_fixes(self) -> list[str]:
@@ -579,6 +712,13 @@ class CompatibilityReport(BaseModel):
             quick_fixes.append(
                 f"Convert unsupported data types: {', '.join(unsupported_types)}"
             )
+
+        # Dataset regeneration
+        if self.dataset_issues:
+            quick_fixes.append(
+                "Regenerate the dataset with the model input shape, type and "
+                "quantization"
+            )
         
         return quick_fixes
 
@@ -644,3 +784,172 @@ class CompatibilityReport(BaseModel):
             logger.info(f"Failed to save compatibility report to {filepath}: {e}")
             return False
 
+
+
+class MatrixStatus(StrEnum):
+    """
+    Outcome of one model on one target in a compatibility matrix.
+
+    Values:
+        passed: No compatibility issues
+        warn: Only warnings, the model can be deployed
+        fail: Critical issues prevent deployment
+        error: The analysis itself failed, e.g. the model could not be parsed
+    """
+    passed = "pass"
+    warn = "warn"
+    fail = "fail"
+    error = "error"
+
+
+class MatrixCell(BaseModel):
+    """
+    Compatibility of one model with one hardware target.
+
+    Attributes:
+        model: Model file path as given
+        target: Target name, SoC and core when the profile has a target
+        status: Overall outcome
+        issue_count: Number of compatibility issues found
+        dominating_issue: Issue that most limits deployment, or the analysis
+            error
+    """
+
+    model: str = Field(description="Model file path")
+    target: str = Field(description="Target name")
+    status: MatrixStatus = Field(description="Overall outcome")
+    issue_count: int = Field(default=0, ge=0, description="Number of issues")
+    dominating_issue: Optional[str] = Field(
+        default=None, description="Issue that most limits deployment"
+    )
+
+    @classmethod
+    def from_report(
+        cls, model: str, target: str, report: CompatibilityReport
+    ) -> "MatrixCell":
+        """
+        Summarize a compatibility report as a matrix cell.
+
+        Args:
+            model: Model file path as given
+            target: Target name
+            report: Compatibility report of the model on the target
+
+        Returns:
+            MatrixCell with the report's status and dominating issue
+        """
+        if report.has_critical_issues():
+            status = MatrixStatus.fail
+        elif report.count_issues():
+            status = MatrixStatus.warn
+        else:
+            status = MatrixStatus.passed
+        return cls(
+            model=model,
+            target=target,
+            status=status,
+            issue_count=report.count_issues(),
+            dominating_issue=report.dominating_issue()
+        )
+
+
+class CompatibilityMatrix(BaseModel):
+    """
+    Compatibility of several models across several hardware targets.
+
+    Attributes:
+        models: Model file paths, in the given order
+        targets: Target names, in the order of the given profiles
+        cells: One cell per model and target, model by model
+    """
+
+    models: list[str] = Field(default_factory=list, description="Model paths")
+    targets: list[str] = Field(default_factory=list, description="Target names")
+    cells: list[MatrixCell] = Field(
+        default_factory=list, description="Compatibility per model and target"
+    )
+
+    def cell(self, model: str, target: str) -> Optional[MatrixCell]:
+        """Get the cell of a model and target, if present."""
+        return next(
+            (cell for cell in self.cells
+             if cell.model == model and cell.target == target),
+            None
+        )
+
+    def to_csv(self) -> str:
+        """
+        Format the matrix as CSV, one row per model and one column per target.
+
+        Each cell holds the status, followed by the dominating issue if any,
+        e.g. "fail: Operator: MEAN".
+
+        Returns:
+            CSV text with a header row
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["model", *self.targets])
+        cells = {(cell.model, cell.target): cell for cell in self.cells}
+        for model in self.models:
+            row = [model]
+            for target in self.targets:
+                cell = cells.get((model, target))
+                if cell is None:
+                    row.append("")
+                elif cell.dominating_issue:
+                    row.append(f"{cell.status.value}: {cell.dominating_issue}")
+                else:
+                    row.append(cell.status.value)
+            writer.writerow(row)
+        return buffer.getvalue()
+
+    def print_matrix(self) -> None:
+        """Log the status and dominating issue of every cell."""
+        logger.info("Compatibility Matrix")
+        logger.info("=" * REPORT_SEPARATOR_LENGTH)
+        for cell in self.cells:
+            line = f"{cell.model} on {cell.target}: {cell.status.value.upper()}"
+            if cell.dominating_issue:
+                line += f" ({cell.dominating_issue})"
+            logger.info(line)
+
+    def save_as_json(self, filepath: str) -> bool:
+        """
+        Save the matrix as a JSON file.
+
+        Args:
+            filepath: Path where the JSON file should be saved
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.model_dump(mode="json"), f, indent=2)
+            logger.debug(f"Compatibility matrix saved to {filepath}")
+            return True
+        except Exception as e:
+            logger.info(f"Failed to save compatibility matrix to {filepath}: {e}")
+            return False
+
+    def save_as_csv(self, filepath: str) -> bool:
+        """
+        Save the matrix as a CSV file, see `to_csv`.
+
+        Args:
+            filepath: Path where the CSV file should be saved
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+            with open(filepath, 'w', encoding='utf-8', newline='') as f:
+                f.write(self.to_csv())
+            logger.debug(f"Compatibility matrix saved to {filepath}")
+            return True
+        except Exception as e:
+            logger.info(f"Failed to save compatibility matrix to {filepath}: {e}")
+            return False
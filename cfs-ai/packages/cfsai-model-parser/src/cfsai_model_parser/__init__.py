@@ -11,12 +11,18 @@ Key Features:
 - Layer-wise MAC (Multiply-Accumulate) operation counting
 - Memory footprint analysis for flash storage and runtime RAM
 - Tensor lifecycle tracking for memory optimization opportunities
+- Tensor arena planning with offsets, alignment and fragmentation
+- Operator order search for the lowest achievable peak memory
 - Hardware performance estimation and resource planning
 - Cross-platform compatibility with standard TFLite schema
 
 Primary Classes:
 - TFLiteParser: Main parser for TensorFlow Lite model analysis
 
+Functions:
+- parse_models: Parse many models in a process pool, streaming results
+- register_operator_cost: Add the MAC formula of a custom operator
+
 Usage:
     >>> from cfsai_model_parser import TFLiteParser
     >>> parser = TFLiteParser()
@@ -33,11 +39,14 @@ Copyright (c) 2025 Analog Devices, Inc. All Rights Reserved.
 Released under the terms of the "LICENSE.md" file in the root directory.
 """
 
-from cfsai_model_parser.parse_tflm import TFLiteParser
+from cfsai_model_parser.operator_costs import register_operator_cost
+from cfsai_model_parser.parse_tflm import TFLiteParser, parse_models
 
 # Public API surface
 __all__ = [
     "TFLiteParser",  # Primary TensorFlow Lite model parser
+    "parse_models",  # Batch parsing in a process pool
+    "register_operator_cost",  # MAC formulas for custom operators
 ]
 
 
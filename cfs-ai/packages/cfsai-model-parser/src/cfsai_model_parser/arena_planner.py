@@ -0,0 +1,250 @@
+"""
+Tensor Arena Planner.
+
+Assigns byte offsets within a single tensor arena to the activation tensors of
+one TensorFlow Lite subgraph, the way TFLM's greedy memory planner does.
+Buffers are placed largest first at the lowest aligned offset that does not
+overlap any already placed buffer with an overlapping lifetime. Outputs of
+reshape-like operators share the buffer of their input when that input is not
+needed afterwards, since the data does not change.
+
+The planned arena size, unlike the sum of live tensor sizes, includes the
+space lost to alignment and fragmentation.
+
+Copyright (c) 2025 Analog Devices, Inc. All Rights Reserved.
+Released under the terms of the "LICENSE.md" file in the root directory.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from cfsai_model_parser.tensor_table import TensorTable
+
+
+@dataclass(frozen=True)
+class ArenaPlan:
+    """
+    Offsets of the activation tensors of a subgraph within the tensor arena.
+
+    Attributes:
+        offsets: Byte offset of each planned tensor, by tensor index
+        sizes: Aligned size in bytes of each planned tensor's buffer
+        first_use: Operator index at which each planned tensor is allocated
+        last_use: Operator index after which each planned tensor is freed
+        arena_size: Total arena size in bytes
+        peak_live_bytes: Largest unaligned size of the buffers live at one step
+        alignment: Alignment of every offset in bytes
+    """
+
+    offsets: dict[int, int]
+    sizes: dict[int, int]
+    first_use: dict[int, int]
+    last_use: dict[int, int]
+    arena_size: int
+    peak_live_bytes: int
+    alignment: int
+
+    @property
+    def fragmentation(self) -> float:
+        """
+        Fraction of the arena not used by live tensors at the worst step.
+
+        Zero means the arena is exactly as large as the peak live data.
+        """
+        if self.arena_size == 0:
+            return 0.0
+        return 1.0 - self.peak_live_bytes / self.arena_size
+
+    def timeline(self, num_steps: int) -> list[tuple[int, list[list[int]]]]:
+        """
+        Get the arena usage and placements of every execution step at once.
+
+        Equivalent to calling `arena_usage_at_step` and `offsets_at_step` for
+        each step, in a single sweep over tensor allocations and frees.
+
+        Args:
+            num_steps: Number of execution steps
+
+        Returns:
+            List indexed by step of (arena usage in bytes, placements)
+        """
+        allocated: dict[int, list[int]] = {}
+        freed: dict[int, list[int]] = {}
+        for tensor_idx, first in self.first_use.items():
+            allocated.setdefault(first, []).append(tensor_idx)
+            freed.setdefault(self.last_use[tensor_idx], []).append(tensor_idx)
+
+        live: dict[int, int] = {}
+        steps = []
+        for op_idx in range(num_steps):
+            for tensor_idx in allocated.get(op_idx, []):
+                live[tensor_idx] = self.offsets[tensor_idx]
+            steps.append((
+                max((offset + self.sizes[tensor_idx]
+                     for tensor_idx, offset in live.items()), default=0),
+                sorted(([tensor_idx, offset] for tensor_idx, offset in live.items()),
+                       key=lambda pair: (pair[1], pair[0]))
+            ))
+            for tensor_idx in freed.get(op_idx, []):
+                live.pop(tensor_idx, None)
+        return steps
+
+    def offsets_at_step(self, op_idx: int) -> list[list[int]]:
+        """
+        Get the placement of the tensors live at one execution step.
+
+        Args:
+            op_idx: Operator index of the execution step
+
+        Returns:
+            List of [tensor_index, offset] pairs ordered by offset
+        """
+        return sorted(
+            ([tensor_idx, offset] for tensor_idx, offset in self.offsets.items()
+             if self.first_use[tensor_idx] <= op_idx <= self.last_use[tensor_idx]),
+            key=lambda pair: (pair[1], pair[0])
+        )
+
+    def arena_usage_at_step(self, op_idx: int) -> int:
+        """
+        Get the highest arena byte in use at one execution step.
+
+        Args:
+            op_idx: Operator index of the execution step
+
+        Returns:
+            End offset of the highest buffer live at the step, in bytes
+        """
+        return max(
+            (offset + self.sizes[tensor_idx]
+             for tensor_idx, offset in self.offsets.items()
+             if self.first_use[tensor_idx] <= op_idx <= self.last_use[tensor_idx]),
+            default=0
+        )
+
+
+def _align(size: int, alignment: int) -> int:
+    """Round a size up to a multiple of the alignment."""
+    return -(-size // alignment) * alignment
+
+
+def plan_arena(
+    table: TensorTable,
+    in_place_ops: set[int] | None = None,
+    alignment: int = 16
+) -> ArenaPlan:
+    """
+    Plan the tensor arena of a subgraph with the greedy-by-size strategy.
+
+    Every tensor that is neither a parameter nor empty gets a buffer. Graph
+    inputs are live from the first operator and graph outputs until the last.
+    The output of an in-place operator reuses the buffer of its first input
+    if that input is an activation of the same size that dies at the
+    operator.
+
+    Args:
+        table: Columnar tensor table of the subgraph
+        in_place_ops: Indices of operators that may run in place
+        alignment: Alignment of every buffer offset in bytes
+
+    Returns:
+        ArenaPlan with the offset of every planned tensor
+    """
+    in_place_ops = in_place_ops or set()
+    last_step = max(table.num_operators - 1, 0)
+
+    # Lifetimes of all activation tensors
+    first_use: dict[int, int] = {}
+    last_use: dict[int, int] = {}
+    for tensor_idx in range(table.num_tensors):
+        if table.is_parameter[tensor_idx] or table.nbytes[tensor_idx] <= 0:
+            continue
+        producer = int(table.producer[tensor_idx])
+        consumer = int(table.last_consumer[tensor_idx])
+        if producer < 0 and consumer < 0:
+            continue
+        first_use[tensor_idx] = max(producer, 0)
+        last_use[tensor_idx] = max(consumer, first_use[tensor_idx])
+    for tensor_idx in table.graph_inputs[table.graph_inputs >= 0].tolist():
+        if tensor_idx in first_use:
+            first_use[tensor_idx] = 0
+    for tensor_idx in table.graph_outputs[table.graph_outputs >= 0].tolist():
+        if tensor_idx in last_use:
+            last_use[tensor_idx] = last_step
+
+    # Group tensors sharing a buffer, keyed by the tensor that owns it
+    owner = {tensor_idx: tensor_idx for tensor_idx in first_use}
+    for op_idx in sorted(in_place_ops):
+        inputs = table.op_inputs[op_idx]
+        outputs = table.op_outputs[op_idx]
+        if len(inputs) == 0 or len(outputs) != 1:
+            continue
+        source, target = int(inputs[0]), int(outputs[0])
+        if (source in owner and target in owner
+                and table.last_consumer[source] == op_idx
+                and source not in table.graph_outputs
+                and table.nbytes[source] == table.nbytes[target]):
+            owner[target] = owner[source]
+
+    buffer_first: dict[int, int] = {}
+    buffer_last: dict[int, int] = {}
+    buffer_bytes: dict[int, int] = {}
+    for tensor_idx, buffer in owner.items():
+        buffer_first[buffer] = min(buffer_first.get(buffer, first_use[tensor_idx]),
+                                   first_use[tensor_idx])
+        buffer_last[buffer] = max(buffer_last.get(buffer, last_use[tensor_idx]),
+                                  last_use[tensor_idx])
+        buffer_bytes[buffer] = max(buffer_bytes.get(buffer, 0),
+                                   int(table.nbytes[tensor_idx]))
+
+    # Largest buffers first, earlier allocations break ties
+    buffer_offsets: dict[int, int] = {}
+    num_buffers = len(buffer_bytes)
+    placed_offset = np.zeros(num_buffers, dtype=np.int64)
+    placed_end = np.zeros(num_buffers, dtype=np.int64)
+    placed_first = np.zeros(num_buffers, dtype=np.int64)
+    placed_last = np.zeros(num_buffers, dtype=np.int64)
+    order = sorted(buffer_bytes, key=lambda b: (-buffer_bytes[b], buffer_first[b], b))
+    for count, buffer in enumerate(order):
+        size = _align(buffer_bytes[buffer], alignment)
+        first, last = buffer_first[buffer], buffer_last[buffer]
+
+        # Only buffers whose lifetimes overlap can conflict, lowest first
+        conflicts = np.flatnonzero((placed_last[:count] >= first)
+                                   & (placed_first[:count] <= last))
+        conflicts = conflicts[np.argsort(placed_offset[conflicts], kind='stable')]
+        offset = 0
+        for other_offset, other_end in zip(placed_offset[conflicts].tolist(),
+                                           placed_end[conflicts].tolist(),
+                                           strict=True):
+            if offset + size <= other_offset:
+                break
+            offset = max(offset, other_end)
+        buffer_offsets[buffer] = offset
+        placed_offset[count] = offset
+        placed_end[count] = offset + size
+        placed_first[count] = first
+        placed_last[count] = last
+
+    arena_size = int(placed_end.max(initial=0))
+
+    # Peak of the live data, counting shared buffers once
+    num_steps = last_step + 2
+    live_delta = np.zeros(num_steps, dtype=np.int64)
+    for buffer, size in buffer_bytes.items():
+        live_delta[buffer_first[buffer]] += size
+        live_delta[buffer_last[buffer] + 1] -= size
+    peak_live_bytes = int(np.cumsum(live_delta).max(initial=0))
+
+    return ArenaPlan(
+        offsets={tensor_idx: buffer_offsets[buffer]
+                 for tensor_idx, buffer in owner.items()},
+        sizes={tensor_idx: _align(buffer_bytes[buffer], alignment)
+               for tensor_idx, buffer in owner.items()},
+        first_use=first_use,
+        last_use=last_use,
+        arena_size=arena_size,
+        peak_live_bytes=peak_live_bytes,
+        alignment=alignment
+    )
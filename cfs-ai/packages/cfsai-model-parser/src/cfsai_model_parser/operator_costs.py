@@ -0,0 +1,246 @@
+"""
+Operator Cost Registry.
+
+Computes the cost of every operator of a TensorFlow Lite subgraph from the
+columnar tensor table: multiply-accumulate operations, bytes read and written,
+and parameter bytes. Operators of the same type are costed together with array
+arithmetic instead of one FlatBuffer lookup chain per operator.
+
+MAC formulas are registered per operator key, which is the builtin operator
+name (e.g. 'CONV_2D') or, for custom operators, their custom code. Formulas
+for further operators can be added without editing the parser, either by
+calling `register_operator_cost` or from an installed package through the
+`cfsai_model_parser.operator_costs` entry point group, where each entry point
+is named after the operator key and refers to a cost function.
+
+A cost function takes the tensor table and the indices of the operators to
+cost, and returns their MACs as an integer array. Operators without a
+registered formula are estimated at one MAC per output element.
+
+Copyright (c) 2025 Analog Devices, Inc. All Rights Reserved.
+Released under the terms of the "LICENSE.md" file in the root directory.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+
+import numpy as np
+
+from cfsai_model_parser.exceptions import ModelMACCalculationError
+from cfsai_model_parser.tensor_table import TensorTable
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'cfsai_model_parser.operator_costs'
+
+CostFunction = Callable[[TensorTable, np.ndarray], np.ndarray]
+
+
+@dataclass(frozen=True)
+class OperatorCosts:
+    """
+    Per-operator costs of a subgraph, indexed by operator index.
+
+    Attributes:
+        macs: Multiply-accumulate operations of each operator
+        read_bytes: Bytes of all input tensors, parameters included
+        write_bytes: Bytes of all output tensors
+        param_bytes: Bytes of the parameter tensors among the inputs
+    """
+
+    macs: np.ndarray
+    read_bytes: np.ndarray
+    write_bytes: np.ndarray
+    param_bytes: np.ndarray
+
+
+def _operand(table: TensorTable, op_indices: np.ndarray,
+             position: int, outputs: bool = False) -> np.ndarray:
+    """Tensor index at one input or output position, -1 where absent."""
+    columns = table.op_outputs if outputs else table.op_inputs
+    return np.array([
+        columns[op_idx][position] if len(columns[op_idx]) > position else -1
+        for op_idx in op_indices.tolist()
+    ], dtype=np.int64)
+
+
+def _require(valid: np.ndarray, op_name: str, message: str) -> None:
+    """Raise for the operator type if any operator fails a shape check."""
+    if not np.all(valid):
+        raise ModelMACCalculationError(op_name, message)
+
+
+def conv2d_macs(table: TensorTable, op_indices: np.ndarray) -> np.ndarray:
+    """
+    MACs of 2D convolutions.
+
+    Output is NHWC and weights are [out_channels, kernel_h, kernel_w,
+    in_channels], so MACs are output H x W x C times kernel H x W x input C.
+    Batch size is not included.
+    """
+    output = _operand(table, op_indices, 0, outputs=True)
+    weights = _operand(table, op_indices, 1)
+    _require((output >= 0) & (weights >= 0), 'CONV_2D',
+             "Insufficient operator inputs/outputs")
+    _require((table.ranks[output] >= 4) & (table.ranks[weights] >= 4), 'CONV_2D',
+             "Unexpected tensor shape dimensions")
+    out_dims = table.dims[output]
+    weight_dims = table.dims[weights]
+    return (out_dims[:, 1] * out_dims[:, 2] * out_dims[:, 3]
+            * weight_dims[:, 1] * weight_dims[:, 2] * weight_dims[:, 3])
+
+
+def depthwise_conv2d_macs(table: TensorTable, op_indices: np.ndarray) -> np.ndarray:
+    """
+    MACs of depthwise convolutions.
+
+    Every output element accumulates one kernel window of its own channel.
+    """
+    output = _operand(table, op_indices, 0, outputs=True)
+    weights = _operand(table, op_indices, 1)
+    _require((output >= 0) & (weights >= 0), 'DEPTHWISE_CONV_2D',
+             "Insufficient operator inputs/outputs")
+    _require((table.ranks[output] > 0) & (table.ranks[weights] >= 3),
+             'DEPTHWISE_CONV_2D', "Unexpected tensor shape dimensions")
+    weight_dims = table.dims[weights]
+    return table.elements[output] * weight_dims[:, 1] * weight_dims[:, 2]
+
+
+def fully_connected_macs(table: TensorTable, op_indices: np.ndarray) -> np.ndarray:
+    """
+    MACs of fully connected layers.
+
+    One MAC per weight, batch size is not included.
+    """
+    weights = _operand(table, op_indices, 1)
+    _require(weights >= 0, 'FULLY_CONNECTED', "Insufficient operator inputs")
+    _require(table.ranks[weights] > 0, 'FULLY_CONNECTED',
+             "Invalid weights tensor shape")
+    return table.elements[weights]
+
+
+def output_element_macs(table: TensorTable, op_indices: np.ndarray) -> np.ndarray:
+    """Fallback estimate of one MAC per element of the first output."""
+    output = _operand(table, op_indices, 0, outputs=True)
+    return np.where(output >= 0, table.elements[output], 0)
+
+
+_COST_FUNCTIONS: dict[str, CostFunction] = {
+    'CONV_2D': conv2d_macs,
+    'DEPTHWISE_CONV_2D': depthwise_conv2d_macs,
+    'FULLY_CONNECTED': fully_connected_macs,
+}
+_entry_points_loaded = False
+
+
+def register_operator_cost(op_key: str, cost_function: CostFunction) -> None:
+    """
+    Register the MAC formula of an operator, replacing any existing one.
+
+    Args:
+        op_key: Builtin operator name, or custom code of a custom operator
+        cost_function: Function of the tensor table and operator indices
+            returning the MACs of those operators
+    """
+    _COST_FUNCTIONS[op_key] = cost_function
+
+
+def _load_entry_points() -> None:
+    """Register the cost functions of installed packages once."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            # Formulas registered in code take precedence
+            _COST_FUNCTIONS.setdefault(entry_point.name, entry_point.load())
+        except Exception as e:
+            logger.warning(f"Failed to load operator cost '{entry_point.name}' "
+                           f"from {entry_point.value}: {e}")
+
+
+def get_operator_cost(op_key: str) -> CostFunction:
+    """
+    Get the MAC formula of an operator.
+
+    Args:
+        op_key: Builtin operator name, or custom code of a custom operator
+
+    Returns:
+        Registered cost function, or the output element estimate
+    """
+    _load_entry_points()
+    return _COST_FUNCTIONS.get(op_key, output_element_macs)
+
+
+def registry_signature() -> list[tuple[str, str]]:
+    """
+    Identify the registered cost functions, so cached results made with
+    other formulas are not reused.
+
+    Returns:
+        Sorted operator keys with the qualified name of their cost function
+    """
+    _load_entry_points()
+    return sorted(
+        (op_key, f"{getattr(cost_function, '__module__', '')}."
+                 f"{getattr(cost_function, '__qualname__', repr(cost_function))}")
+        for op_key, cost_function in _COST_FUNCTIONS.items()
+    )
+
+
+def compute_operator_costs(table: TensorTable, op_keys: list[str]) -> OperatorCosts:
+    """
+    Compute the costs of all operators of a subgraph.
+
+    Args:
+        table: Columnar tensor table of the subgraph
+        op_keys: Cost registry key of each operator in execution order
+
+    Returns:
+        OperatorCosts with one entry per operator
+
+    Raises:
+        ModelMACCalculationError: If an operator's tensors do not fit its
+            MAC formula
+    """
+    num_operators = table.num_operators
+    macs = np.zeros(num_operators, dtype=np.int64)
+
+    # One formula evaluation per operator type
+    keys = np.array(op_keys, dtype=object)
+    for op_key in dict.fromkeys(op_keys):
+        op_indices = np.flatnonzero(keys == op_key)
+        try:
+            macs[op_indices] = get_operator_cost(op_key)(table, op_indices)
+        except ModelMACCalculationError:
+            raise
+        except Exception as e:
+            raise ModelMACCalculationError(op_key, str(e))
+
+    # Tensor traffic summed per operator over the flattened operand lists
+    def per_operator_bytes(
+        columns: list[np.ndarray],
+        parameters_only: bool
+    ) -> np.ndarray:
+        counts = [len(column) for column in columns]
+        if not sum(counts):
+            return np.zeros(num_operators, dtype=np.int64)
+        tensors = np.concatenate(columns).astype(np.int64)
+        owners = np.repeat(np.arange(num_operators), counts)
+        present = tensors >= 0
+        if parameters_only:
+            present &= table.is_parameter[tensors]
+        weights = np.where(present, np.maximum(table.nbytes[tensors], 0), 0)
+        return np.bincount(owners, weights=weights,
+                           minlength=num_operators).astype(np.int64)
+
+    return OperatorCosts(
+        macs=macs,
+        read_bytes=per_operator_bytes(table.op_inputs, parameters_only=False),
+        write_bytes=per_operator_bytes(table.op_outputs, parameters_only=False),
+        param_bytes=per_operator_bytes(table.op_inputs, parameters_only=True)
+    )
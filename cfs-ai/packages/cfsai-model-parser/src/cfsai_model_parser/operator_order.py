@@ -0,0 +1,299 @@
+"""
+Operator Order Search.
+
+Finds an execution order of the operators of one TensorFlow Lite subgraph
+that lowers peak activation memory. Any topological order of the operator
+graph computes the same result, but the serialized order of multi-branch and
+residual graphs often keeps more tensors alive than necessary.
+
+The graph is split at operators that every other operator either precedes or
+follows, since all orders run those at the same point. Each segment between
+them is searched exhaustively when it is small enough, and otherwise ordered
+greedily by the memory each ready operator leaves allocated.
+
+Memory is measured as in the parser's execution schedule: the bytes of all
+operator outputs alive at a step, with tensors freed after their last use.
+
+Copyright (c) 2025 Analog Devices, Inc. All Rights Reserved.
+Released under the terms of the "LICENSE.md" file in the root directory.
+"""
+
+import contextlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from cfsai_model_parser.tensor_table import TensorTable
+
+
+@dataclass(frozen=True)
+class OperatorOrder:
+    """
+    Execution order of a subgraph's operators and its peak memory.
+
+    Attributes:
+        order: Operator indices in execution order
+        peak_bytes: Peak activation memory of the order in bytes
+        exhaustive: Whether every segment was searched exhaustively, in which
+            case no topological order has a lower peak
+    """
+
+    order: list[int]
+    peak_bytes: int
+    exhaustive: bool
+
+
+class _SearchBudgetExceeded(Exception):
+    """Raised when an exhaustive search visits too many states."""
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of the set bits of a mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _OrderSearch:
+    """
+    Search state shared by the segments of one subgraph.
+
+    Sets of operators are stored as integer bit masks.
+    """
+
+    def __init__(
+        self,
+        table: TensorTable,
+        dtype_size: int,
+        op_extra_bytes: list[int] | None
+    ) -> None:
+        num_operators = table.num_operators
+        self.num_operators = num_operators
+        self.extra = op_extra_bytes or [0] * num_operators
+
+        # Outputs of each operator and the operators consuming each of them
+        self.tensor_bytes: dict[int, int] = {}
+        self.consumers: dict[int, int] = {}
+        self.outputs: list[list[int]] = []
+        for op_idx in range(num_operators):
+            outputs = [
+                int(tensor_idx) for tensor_idx in table.op_outputs[op_idx]
+                if tensor_idx >= 0 and table.producer[tensor_idx] == op_idx
+            ]
+            self.outputs.append(outputs)
+            for tensor_idx in outputs:
+                self.tensor_bytes[tensor_idx] = (
+                    int(table.elements[tensor_idx]) * dtype_size
+                )
+                self.consumers[tensor_idx] = 0
+        self.inputs: list[list[int]] = []
+        for op_idx in range(num_operators):
+            inputs = sorted({
+                int(tensor_idx) for tensor_idx in table.op_inputs[op_idx]
+                if int(tensor_idx) in self.consumers
+            })
+            self.inputs.append(inputs)
+            for tensor_idx in inputs:
+                self.consumers[tensor_idx] |= 1 << op_idx
+
+        # Direct predecessors of each operator
+        self.predecessors = [
+            sum({1 << int(table.producer[tensor_idx])
+                 for tensor_idx in self.inputs[op_idx]
+                 if table.producer[tensor_idx] != op_idx})
+            for op_idx in range(num_operators)
+        ]
+
+    def step(self, op_idx: int, done: int, resident: int) -> tuple[int, int]:
+        """
+        Run one operator.
+
+        Returns:
+            Memory while the operator runs and resident bytes afterwards
+        """
+        produced = sum(self.tensor_bytes[t] for t in self.outputs[op_idx])
+        during = resident + produced + self.extra[op_idx]
+        after_done = done | 1 << op_idx
+        freed = sum(
+            self.tensor_bytes[t] for t in self.inputs[op_idx]
+            if not self.consumers[t] & ~after_done
+        ) + sum(
+            self.tensor_bytes[t] for t in self.outputs[op_idx]
+            if not self.consumers[t]
+        )
+        return during, resident + produced - freed
+
+    def ready(self, segment: int, done: int) -> list[int]:
+        """Operators of a segment whose predecessors have all run."""
+        return [
+            op_idx for op_idx in range(self.num_operators)
+            if segment >> op_idx & 1 and not done >> op_idx & 1
+            and self.predecessors[op_idx] & ~done == 0
+        ]
+
+    def segments(self) -> list[int]:
+        """
+        Split the operators at points that every topological order shares.
+
+        Returns:
+            Operator masks of the segments in execution order
+        """
+        everything = (1 << self.num_operators) - 1
+
+        # Producers precede their consumers in the serialized order, so one
+        # sweep in each direction over the tensor edges closes the relations
+        ancestors = [0] * self.num_operators
+        for op_idx in range(self.num_operators):
+            earlier = (1 << op_idx) - 1
+            for pred_idx in _bits(self.predecessors[op_idx] & earlier):
+                ancestors[op_idx] |= ancestors[pred_idx] | 1 << pred_idx
+        descendants = [0] * self.num_operators
+        for op_idx in reversed(range(self.num_operators)):
+            later = everything & ~((2 << op_idx) - 1)
+            successors = 0
+            for tensor_idx in self.outputs[op_idx]:
+                successors |= self.consumers[tensor_idx]
+            for succ_idx in _bits(successors & later):
+                descendants[op_idx] |= descendants[succ_idx] | 1 << succ_idx
+
+        segments = []
+        current = 0
+        for op_idx in range(self.num_operators):
+            current |= 1 << op_idx
+            related = ancestors[op_idx] | descendants[op_idx] | 1 << op_idx
+            if related == everything:
+                segments.append(current)
+                current = 0
+        if current:
+            segments.append(current)
+        return segments
+
+    def greedy(self, segment: int, done: int, resident: int) -> list[int]:
+        """Order a segment by the memory each choice leaves allocated."""
+        order = []
+        while True:
+            candidates = self.ready(segment, done)
+            if not candidates:
+                return order
+            op_idx = min(candidates, key=lambda idx: (
+                self.step(idx, done, resident)[1],
+                self.step(idx, done, resident)[0],
+                idx
+            ))
+            resident = self.step(op_idx, done, resident)[1]
+            done |= 1 << op_idx
+            order.append(op_idx)
+
+    def exhaustive(
+        self,
+        segment: int,
+        done: int,
+        resident: int,
+        max_states: int
+    ) -> list[int]:
+        """
+        Find the order of a segment with the lowest peak.
+
+        Raises:
+            _SearchBudgetExceeded: If more than max_states states are visited
+        """
+        best: dict[int, tuple[int, list[int]]] = {}
+        end = done | segment
+
+        def search(state: int, state_resident: int) -> tuple[int, list[int]]:
+            # Lowest peak and order of the remaining operators from a state
+            if state == end:
+                return 0, []
+            if state in best:
+                return best[state]
+            if len(best) >= max_states:
+                raise _SearchBudgetExceeded()
+            result = None
+            for op_idx in self.ready(segment, state):
+                during, after = self.step(op_idx, state, state_resident)
+                if result is not None and during >= result[0]:
+                    continue
+                rest_peak, rest = search(state | 1 << op_idx, after)
+                peak = max(during, rest_peak)
+                if result is None or peak < result[0]:
+                    result = (peak, [op_idx, *rest])
+            best[state] = result
+            return result
+
+        return search(done, resident)[1]
+
+
+def order_peak_bytes(
+    table: TensorTable,
+    order: list[int],
+    dtype_size: int,
+    op_extra_bytes: list[int] | None = None
+) -> int:
+    """
+    Calculate the peak activation memory of an operator order.
+
+    Args:
+        table: Columnar tensor table of the subgraph
+        order: Operator indices in execution order
+        dtype_size: Size in bytes of the model's primary data type
+        op_extra_bytes: Additional bytes needed while each operator runs,
+            by operator index
+
+    Returns:
+        Peak activation memory in bytes
+    """
+    search = _OrderSearch(table, dtype_size, op_extra_bytes)
+    done, resident, peak = 0, 0, 0
+    for op_idx in order:
+        during, resident = search.step(op_idx, done, resident)
+        done |= 1 << op_idx
+        peak = max(peak, during)
+    return peak
+
+
+def find_min_peak_order(
+    table: TensorTable,
+    dtype_size: int,
+    op_extra_bytes: list[int] | None = None,
+    max_exhaustive_ops: int = 24,
+    max_states: int = 50000
+) -> OperatorOrder:
+    """
+    Search for a topological operator order with low peak activation memory.
+
+    Args:
+        table: Columnar tensor table of the subgraph
+        dtype_size: Size in bytes of the model's primary data type
+        op_extra_bytes: Additional bytes needed while each operator runs,
+            such as the memory of subgraphs it calls, by operator index
+        max_exhaustive_ops: Largest segment searched exhaustively
+        max_states: Largest number of states visited per exhaustive search
+            before falling back to the greedy order
+
+    Returns:
+        OperatorOrder with the best order found. The serialized order is kept
+        unless the search finds a strictly lower peak.
+    """
+    search = _OrderSearch(table, dtype_size, op_extra_bytes)
+    order: list[int] = []
+    exhaustive = True
+    done, resident = 0, 0
+    for segment in search.segments():
+        segment_order = None
+        if bin(segment).count('1') <= max_exhaustive_ops:
+            with contextlib.suppress(_SearchBudgetExceeded):
+                segment_order = search.exhaustive(segment, done, resident, max_states)
+        if segment_order is None:
+            exhaustive = False
+            segment_order = search.greedy(segment, done, resident)
+        for op_idx in segment_order:
+            resident = search.step(op_idx, done, resident)[1]
+            done |= 1 << op_idx
+        order.extend(segment_order)
+
+    serialized = list(range(table.num_operators))
+    peak_bytes = order_peak_bytes(table, order, dtype_size, op_extra_bytes)
+    serialized_peak = order_peak_bytes(table, serialized, dtype_size, op_extra_bytes)
+    if serialized_peak <= peak_bytes:
+        return OperatorOrder(serialized, serialized_peak, exhaustive)
+    return OperatorOrder(order, peak_bytes, exhaustive)
@@ -8,8 +8,11 @@ to support AI model optimization workflows.
 
 Key Features:
 - Layer-wise MAC (Multiply-Accumulate) operation counting
+- Pluggable per-operator cost registry for custom operators
 - Memory usage analysis (flash storage and runtime RAM)
 - Tensor lifecycle tracking for memory optimization
+- Tensor arena planning with alignment and in-place buffer reuse
+- Operator reordering search for lower peak memory
 - Hardware performance estimation and profiling
 - Comprehensive model metadata extraction
 
@@ -17,14 +20,26 @@ Copyright (c) 2025 Analog Devices, Inc. All Rights Reserved.
 Released under the terms of the "LICENSE.md" file in the root directory.
 """
 
+import contextlib
 import logging
+import mmap
 import os
-from collections import defaultdict
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import ClassVar
 
 import numpy as np
 
+from cfsai_model_parser import (
+    arena_planner,
+    operator_costs,
+    operator_order,
+    schemas,
+    tensor_table,
+)
+from cfsai_model_parser.arena_planner import ArenaPlan, plan_arena
 from cfsai_model_parser.exceptions import (
     InvalidTensorType,
     ModelAnalysisError,
@@ -33,12 +48,23 @@ from cfsai_model_parser.exceptions import (
     ModelLoadError,
     ModelMACCalculationError,
     ModelMemoryCalculationError,
+    ModelParserError,
     ModelSubgraphError,
     SchemaError,
     TensorCalculationError,
 )
-from cfsai_model_parser.schemas import LayerDetail, ModelDetails, TensorLifecycle
+from cfsai_model_parser.operator_costs import OperatorCosts, compute_operator_costs
+from cfsai_model_parser.operator_order import OperatorOrder, find_min_peak_order
+from cfsai_model_parser.schemas import (
+    InputTensorDetail,
+    LayerColumns,
+    ModelDetails,
+    ModelParseResult,
+    ragged,
+)
+from cfsai_model_parser.tensor_table import TensorTable
 from cfsai_tflite import schema as schema_fb
+from cfsai_tflite.cache import ParseCache, source_version
 
 
 class TFLiteParser:
@@ -66,6 +92,21 @@ class TFLiteParser:
     _BYTES_TO_KB_DIVISOR: ClassVar[int] = 1024
     _DEFAULT_TENSOR_SIZE_BYTES: ClassVar[int] = 4  # FLOAT32 size fallback
     _SUPPORTED_FILE_EXTENSIONS: ClassVar[list[str]] = ['.tflite', '.lite']
+    _DEFAULT_LOOP_TRIP_COUNT: ClassVar[int] = 1  # WHILE iterations without hint
+    _ARENA_ALIGNMENT_BYTES: ClassVar[int] = 16  # TFLM tensor buffer alignment
+    
+    # Operators whose output can share the buffer of their first input
+    _IN_PLACE_OPERATORS: ClassVar[frozenset[str]] = frozenset({
+        'RESHAPE', 'SQUEEZE', 'EXPAND_DIMS',
+    })
+    
+    # Control flow operators: options table and its subgraph index accessors
+    _CONTROL_FLOW_OPTIONS: ClassVar[dict[str, tuple[str, tuple[str, ...]]]] = {
+        'WHILE': ('WhileOptions', ('CondSubgraphIndex', 'BodySubgraphIndex')),
+        'IF': ('IfOptions', ('ThenSubgraphIndex', 'ElseSubgraphIndex')),
+        'CALL_ONCE': ('CallOnceOptions', ('InitSubgraphIndex',)),
+        'CALL': ('CallOptions', ('Subgraph',)),
+    }
     
     # Magic byte patterns for TensorFlow Lite file validation
     _TFLITE_MAGIC_BYTES: ClassVar[list[bytes]] = [
@@ -111,7 +152,7 @@ class TFLiteParser:
         'INT4': 1         # Provided in schema but not used.
     }
     
-    def __init__(self) -> None:
+    def __init__(self, cache: ParseCache | None = None) -> None:
         """
         Initialize the TensorFlow Lite model parser with dynamic analysis capabilities.
         
@@ -120,8 +161,13 @@ class TFLiteParser:
         - Logging system for comprehensive analysis tracking
         - Operator code mapping for human-readable operation names
         - Tensor type mapping for memory footprint calculations
+        
+        Args:
+            cache: Optional on-disk cache of analysis results, shared by all
+                tools that parse the same model file
         """
         self.schema_fb = schema_fb
+        self.cache = cache
         self.logger = logging.getLogger(
             f"{__name__}.{self.__class__.__name__}"
         )
@@ -226,7 +272,13 @@ class TFLiteParser:
         
         return tensor_size_bytes
 
-    def parse_model(self, model_path: str) -> ModelDetails:
+    def parse_model(
+        self,
+        model_path: str,
+        loop_trip_counts: dict[int, int] | None = None,
+        jobs: int = 1,
+        reorder_operators: bool = False
+    ) -> ModelDetails:
         """
         Parse a TensorFlow Lite model and extract comprehensive analysis.
         
@@ -234,8 +286,20 @@ class TFLiteParser:
         metrics, memory requirements, and optimization opportunities. This is the
         primary entry point for model parsing workflows.
         
+        Models with control flow contain additional subgraphs. Every subgraph is
+        analyzed, and the cost of a subgraph run by a WHILE, IF or CALL_ONCE
+        operator is attributed to that operator in the primary subgraph.
+        
         Args:
             model_path: Path to the TensorFlow Lite model file
+            loop_trip_counts: Optional number of iterations of WHILE loops whose
+                trip count cannot be determined from the model, keyed by the
+                index of the loop body subgraph
+            jobs: Number of worker processes used to analyze the subgraphs of
+                models with control flow (1 analyzes them in this process)
+            reorder_operators: Also search for an operator order of the
+                primary subgraph with lower peak RAM, reported in
+                `reordered_peak_ram_kb` and `reordered_operators`
             
         Returns:
             ModelDetails object containing comprehensive model analysis
@@ -247,27 +311,225 @@ class TFLiteParser:
         """
         model_path = str(Path(model_path).resolve())
 
-        # Validate model file
-        self._validate_model(Path(model_path))
+        # Validate model file, the mapping is shared with the loader. It is
+        # closed once parsed, so the file can be replaced or deleted.
+        model_buffer = self._validate_model(Path(model_path))
+        try:
+            return self._parse_mapped_model(
+                model_path, model_buffer, loop_trip_counts, jobs, reorder_operators
+            )
+        finally:
+            _close_mapping(model_buffer)
+
+    def _parse_mapped_model(
+        self,
+        model_path: str,
+        model_buffer: mmap.mmap,
+        loop_trip_counts: dict[int, int] | None,
+        jobs: int,
+        reorder_operators: bool
+    ) -> ModelDetails:
+        """
+        Parse a validated, memory-mapped TensorFlow Lite model.
+
+        Args:
+            model_path: Resolved path to the model file
+            model_buffer: Mapping of the model file from `_validate_model`
+            loop_trip_counts: Optional WHILE iterations keyed by body subgraph
+            jobs: Number of worker processes used to analyze subgraphs
+            reorder_operators: Also search for a lower peak RAM operator order
 
+        Returns:
+            ModelDetails object containing comprehensive model analysis
+        """
         # Load and validate model structure
-        model = self.load_model(model_path)
+        model = self.load_model(model_path, model_buffer)
         if model.SubgraphsLength() == 0:
             raise ModelSubgraphError()
-        elif model.SubgraphsLength() > 1:
-            self.logger.warning("Model contains multiple subgraphs, only the first " \
-            "will be analyzed")
 
+        # Reuse the analysis of the unchanged model file
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(
+                model_path, self.__class__.__name__, _parser_version(),
+                sorted((loop_trip_counts or {}).items()), reorder_operators,
+                operator_costs.registry_signature()
+            )
+            payload = self.cache.get(cache_key)
+            if payload is not None:
+                self.logger.debug(f"Using cached analysis for {model_path}")
+                return ModelDetails.model_validate_json(payload).model_copy(update={
+                    'model_path': model_path,
+                    'model_name': self._extract_model_name(model, model_path)
+                })
+
+        model_details = self._analyze_model(
+            model_path, model, loop_trip_counts, jobs
+        )
+        if reorder_operators:
+            model_order = self.find_operator_order(model, model_details)
+            model_details = model_details.model_copy(update={
+                'reordered_peak_ram_kb': (
+                    model_order.peak_bytes / self._BYTES_TO_KB_DIVISOR
+                ),
+                'reordered_operators': model_order.order
+            })
+        if cache_key is not None:
+            self.cache.put(cache_key, model_details.model_dump_json())
+        return model_details
+
+    def _analyze_model(
+        self,
+        model_path: str,
+        model: object,
+        loop_trip_counts: dict[int, int] | None,
+        jobs: int
+    ) -> ModelDetails:
+        """
+        Analyze all subgraphs of a loaded model.
+        
+        Args:
+            model_path: Path to the original model file
+            model: Loaded TensorFlow Lite model object
+            loop_trip_counts: Optional WHILE iterations keyed by body subgraph
+            jobs: Number of worker processes used to analyze subgraphs
+            
+        Returns:
+            ModelDetails object for the primary subgraph
+        """
         # Analyze the primary computational graph (subgraph 0)
         subgraph = model.Subgraphs(0)
-        return self._analyze_subgraph(model_path, model, subgraph)
+        if model.SubgraphsLength() == 1:
+            return self._analyze_subgraph(model_path, model, subgraph)
+
+        # Subgraphs are independent until their costs are combined
+        model_dtype = self.determine_model_dtype(subgraph)
+        num_subgraphs = model.SubgraphsLength()
+        self.logger.debug(f"Analyzing {num_subgraphs} subgraphs with {jobs} job(s)")
+        if jobs == 1:
+            subgraph_details = [
+                self._analyze_subgraph(
+                    model_path, model, model.Subgraphs(subgraph_idx), model_dtype
+                )
+                for subgraph_idx in range(num_subgraphs)
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                subgraph_details = list(executor.map(
+                    _analyze_subgraph_in_process,
+                    [model_path] * num_subgraphs,
+                    range(num_subgraphs),
+                    [model_dtype] * num_subgraphs
+                ))
+
+        return self._attribute_called_subgraphs(
+            model, subgraph_details, loop_trip_counts or {}
+        )
+
+    def operator_names(self, model_path: str) -> list[str]:
+        """
+        Get the operator name of each layer without analyzing the model.
+
+        Only the operator codes of the primary subgraph are read from the
+        FlatBuffer, so this is much cheaper than `parse_model` for checks
+        that only need the operators.
+
+        Args:
+            model_path: Path to the TensorFlow Lite model file
+
+        Returns:
+            Operator name of each layer of the primary subgraph, in execution
+            order, as in the `name` of the layer details
+
+        Raises:
+            ModelFileNotFoundError: If the model file does not exist
+            ModelFormatNotSupportedError: If the file is not a TFLite model
+            ModelSubgraphError: If the model contains no computational graphs
+        """
+        model_path = str(Path(model_path).resolve())
+        model_buffer = self._validate_model(Path(model_path))
+        try:
+            model = self.load_model(model_path, model_buffer)
+            if model.SubgraphsLength() == 0:
+                raise ModelSubgraphError()
+
+            subgraph = model.Subgraphs(0)
+            return [
+                self._operator_name(model, subgraph.Operators(op_idx))
+                for op_idx in range(subgraph.OperatorsLength())
+            ]
+        finally:
+            _close_mapping(model_buffer)
+
+    def find_operator_order(
+        self,
+        model: object,
+        model_details: ModelDetails
+    ) -> OperatorOrder:
+        """
+        Search for an order of the primary subgraph with lower peak RAM.
+        
+        Operators may run in any order that respects their data dependencies.
+        Small independent branches are searched exhaustively, larger ones
+        greedily. Memory is counted as in the execution schedule, including
+        the memory of subgraphs run by control flow operators.
+        
+        Args:
+            model: Loaded TensorFlow Lite model object
+            model_details: Analysis of the model in its serialized order
+            
+        Returns:
+            OperatorOrder with the best order found and its peak in bytes
+            
+        Raises:
+            InvalidTensorType: If the model data type is not supported
+            ModelMemoryCalculationError: If the search fails
+        """
+        dtype_size = self._TENSOR_TYPE_SIZES.get(model_details.target_dtype.upper(), 0)
+        if dtype_size == 0:
+            raise InvalidTensorType(model_details.target_dtype)
+        try:
+            table = self.build_tensor_table(model.Subgraphs(0))
+            schedule = self._calculate_memory_schedule(table, dtype_size)
+            
+            # Memory of called subgraphs is what the analysis added to each step
+            op_extra_bytes = [
+                max(int(step['memory_b']) - own['current_ram'], 0)
+                for step, own in zip(
+                    model_details.execution_schedule, schedule, strict=True
+                )
+            ]
+            model_order = find_min_peak_order(table, dtype_size, op_extra_bytes)
+        except ModelMemoryCalculationError:
+            raise
+        except Exception as e:
+            raise ModelMemoryCalculationError("operator order", str(e))
+        
+        self.logger.debug(
+            f"Operator order peak: {model_order.peak_bytes} B "
+            f"({'exhaustive' if model_order.exhaustive else 'greedy'} search)"
+        )
+        return model_order
 
-    def load_model(self, model_path: str) -> object:
+    def load_model(
+        self,
+        model_path: str,
+        model_buffer: mmap.mmap | bytes | None = None
+    ) -> object:
         """
         Load and parse a TensorFlow Lite model file.
         
+        The file is memory-mapped rather than read, so only the pages holding
+        the accessed FlatBuffer tables are loaded. Constant buffer contents are
+        never touched by the analysis and stay on disk.
+        
         Args:
             model_path: Path to the .tflite model file
+            model_buffer: Optional contents of the model file, such as the
+                mapping returned by `_validate_model`, to parse instead of
+                mapping the file again. The caller closes it once the model
+                is no longer used. Without it, the file stays mapped until the
+                returned model is garbage collected.
             
         Returns:
             Parsed TensorFlow Lite model object
@@ -276,14 +538,32 @@ class TFLiteParser:
             ModelLoadError: If the model file cannot be read or parsed
         """
         try:
-            with open(model_path, 'rb') as f:
-                model_buffer = f.read()
-                model = self.schema_fb.Model.GetRootAsModel(model_buffer, 0)
-            return model
+            if model_buffer is None:
+                model_buffer = self._map_model_file(model_path)
+            # The model keeps a reference to the buffer, which keeps it mapped
+            return self.schema_fb.Model.GetRootAsModel(model_buffer, 0)
         except Exception as e:
             raise ModelLoadError(model_path, str(e))
 
-    def _validate_model(self, model_path: Path) -> None:
+    def _map_model_file(self, model_path: str | Path) -> mmap.mmap:
+        """
+        Memory-map a model file read-only.
+        
+        Args:
+            model_path: Path to the model file
+            
+        Returns:
+            Read-only memory map of the whole file
+            
+        Raises:
+            OSError: If the file cannot be opened or mapped
+            ValueError: If the file is empty
+        """
+        with open(model_path, 'rb') as f:
+            # The mapping stays valid after the file descriptor is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _validate_model(self, model_path: Path) -> mmap.mmap:
         """
         Perform comprehensive validation of TensorFlow Lite model file.
         
@@ -301,6 +581,10 @@ class TFLiteParser:
         Args:
             model_path: Path object pointing to the TensorFlow Lite model file
             
+        Returns:
+            Read-only memory map of the validated file, to be passed to
+            `load_model` so the file is opened only once. The caller closes it.
+            
         Raises:
             ModelFileNotFoundError: If the file doesn't exist or isn't a regular file
             ModelFormatNotSupportedError: If file size, extension, or format is invalid
@@ -341,10 +625,11 @@ class TFLiteParser:
                 f"{conversion_suggestion}"
             )
 
+        model_buffer = None
         try:
             # Check file magic bytes for TFLite flatbuffer (optional validation)
-            with open(model_path, "rb") as f:
-                magic_bytes = f.read(8)  # Read more bytes to be thorough
+            model_buffer = self._map_model_file(model_path)
+            magic_bytes = model_buffer[:8]  # Read more bytes to be thorough
 
             # More flexible check - look for any known pattern
             is_valid_magic = any(
@@ -361,7 +646,11 @@ class TFLiteParser:
                     f"Valid TFLite magic bytes detected: {magic_bytes[4:8]}"
                 )
         except Exception as e:
+            if model_buffer is not None:
+                _close_mapping(model_buffer)
             raise ModelLoadError(model_path, str(e))
+        
+        return model_buffer
 
     def _get_conversion_suggestion(self, file_extension: str) -> str:
         """
@@ -535,8 +824,13 @@ class TFLiteParser:
                 "   ONNX Ecosystem: https://onnx.ai/supported-tools.html"
             )
 
-    def _analyze_subgraph(self, model_path: str, model: object, subgraph: object) -> \
-        ModelDetails:
+    def _analyze_subgraph(
+        self,
+        model_path: str,
+        model: object,
+        subgraph: object,
+        model_dtype: str | None = None
+    ) -> ModelDetails:
         """
         Perform comprehensive analysis of a TensorFlow Lite subgraph.
         
@@ -547,6 +841,8 @@ class TFLiteParser:
             model_path: Path to the original model file
             model: Loaded TensorFlow Lite model object
             subgraph: Specific subgraph to analyze
+            model_dtype: Primary data type of the model, determined from the
+                subgraph inputs when not given
             
         Returns:
             ModelDetails object with complete analysis results
@@ -559,81 +855,58 @@ class TFLiteParser:
             SchemaError: If TensorFlow Lite schema access fails
         """
         try:
+            # Read every tensor and operator once, all analyses use the table
+            table = self.build_tensor_table(subgraph)
+            
             # Extract fundamental model characteristics
-            parameter_indices = self.extract_parameter_tensors(subgraph)
-            tensor_lifespans = self.analyze_tensor_lifespans(subgraph)
-            model_dtype = self.determine_model_dtype(subgraph)
+            parameter_indices = table.parameter_indices()
+            if model_dtype is None:
+                model_dtype = self.determine_model_dtype(subgraph)
             
             # Validate and get data type size for memory calculations
             dtype_size = self._TENSOR_TYPE_SIZES.get(model_dtype.upper(), 0)
             if dtype_size == 0:
                 raise InvalidTensorType(model_dtype)
             
-            # Initialize performance tracking variables
+            # Memory utilization for every execution step in a single sweep
+            memory_schedule = self._calculate_memory_schedule(table, dtype_size)
+            
+            # Tensor offsets as an arena planner would assign them
+            operators = [
+                subgraph.Operators(op_idx) for op_idx in range(table.num_operators)
+            ]
+            op_names = [self._operator_name(model, operator) for operator in operators]
+            arena_plan = self.plan_tensor_arena(table, op_names)
+            
+            # Costs of all operators, evaluated once per operator type
+            op_costs = compute_operator_costs(table, [
+                self._operator_cost_key(model, operator, op_name)
+                for operator, op_name in zip(operators, op_names, strict=True)
+            ])
+
+            # Memory utilization timeline and its peak
             peak_ram_usage_b = 0
             execution_schedule = []
-            layer_details = []
-            total_macs = np.int64(0)
-            
-            # Analyze each operator in the computational graph
-            for op_idx in range(subgraph.OperatorsLength()):
-                operator = subgraph.Operators(op_idx)
-                
-                # Extract operator identification and type information
-                opcode_index = operator.OpcodeIndex()
-                op_code = model.OperatorCodes(opcode_index)
-                builtin_code = op_code.BuiltinCode()
-                op_name = self._opcode_map.get(
-                    builtin_code, 
-                    f'UNKNOWN_{builtin_code}'
-                )
-                
-                # Calculate memory utilization at this execution step
-                memory_stats = self._calculate_memory_at_step(
-                    op_idx, tensor_lifespans, subgraph, dtype_size
-                )
-                
-                # Track peak memory usage for sizing requirements
+            arena_timeline = arena_plan.timeline(table.num_operators)
+            for memory_stats, (arena_b, arena_offsets) in zip(
+                memory_schedule, arena_timeline, strict=True
+            ):
                 peak_ram_usage_b = max(peak_ram_usage_b, memory_stats['current_ram'])
                 execution_schedule.append({
-                    'memory_b': memory_stats['current_ram']
+                    'memory_b': memory_stats['current_ram'],
+                    'arena_b': arena_b,
+                    'arena_offsets': arena_offsets
                 })
-                
-                # Calculate computational complexity metrics
-                op_macs = self._compute_macs_for_operator(op_name, operator, subgraph)
-                total_macs += op_macs
-                
-                # Calculate storage and runtime memory requirements
-                layer_flash_kb, kernel_shapes = self._calculate_layer_memory(
-                    operator, subgraph, parameter_indices
-                )
-                
-                layer_ram_kb = self._calculate_layer_ram(
-                    operator, subgraph, dtype_size
-                )
-                
-                # Compile comprehensive layer analysis           
-                layer_details.append(
-                    LayerDetail(
-                    index=op_idx,
-                    name=op_name,
-                    macs=op_macs,
-                    flash_kb=layer_flash_kb,
-                    kernel_tensors=kernel_shapes,
-                    ram_kb=layer_ram_kb,
-                    input_tensors=list(operator.InputsAsNumpy()),
-                    output_tensors=list(operator.OutputsAsNumpy()),
-                    lifecycle=TensorLifecycle(
-                        new=len(operator.OutputsAsNumpy()),
-                        live=memory_stats['live_tensors'],
-                        terminated=memory_stats['terminated_tensors']
-                        )
-                    )   
-                 )
+            
+            # Per-layer metrics are kept as columns, layers are built on access
+            columns = self._build_layer_columns(
+                table, op_names, op_costs, memory_schedule, dtype_size
+            )
+            total_macs = int(op_costs.macs.sum())
             
             # Calculate total model storage requirements
             total_flash_memory_b = self.calculate_total_param_size(
-                subgraph, parameter_indices
+                subgraph, parameter_indices, table
             )
             
             # Extract model metadata and file information
@@ -644,13 +917,17 @@ class TFLiteParser:
             return ModelDetails(
                 model_name=model_name,
                 model_path=model_path,
-                layer_details=layer_details,
+                layer_details=columns,
                 model_peak_ram_kb=peak_ram_usage_b / self._BYTES_TO_KB_DIVISOR,
+                arena_size_kb=arena_plan.arena_size / self._BYTES_TO_KB_DIVISOR,
+                arena_fragmentation=arena_plan.fragmentation,
                 execution_schedule=execution_schedule,
                 model_total_param_memory_b=total_flash_memory_b,
                 target_dtype=model_dtype,
                 total_macs=total_macs,
-                layer_count=len(layer_details),
+                layer_count=len(columns),
+                input_details=self.get_input_details(subgraph),
+                output_tensors=table.graph_outputs.tolist(),
                 model_size_on_disk_kb=file_size_kb,
                 errors='',
                 framework='TensorFlow Lite'
@@ -663,6 +940,351 @@ class TFLiteParser:
         except Exception as e:
             raise ModelAnalysisError("subgraph analysis", str(e))
 
+    def _operator_name(self, model: object, operator: object) -> str:
+        """
+        Get the readable name of an operator.
+        
+        Args:
+            model: Loaded TensorFlow Lite model object
+            operator: TensorFlow Lite operator object
+            
+        Returns:
+            Operator name (e.g., 'CONV_2D'), or 'UNKNOWN_<code>' for unknown codes
+        """
+        builtin_code = model.OperatorCodes(operator.OpcodeIndex()).BuiltinCode()
+        return self._opcode_map.get(builtin_code, f'UNKNOWN_{builtin_code}')
+
+    def _operator_cost_key(
+        self,
+        model: object,
+        operator: object,
+        op_name: str
+    ) -> str:
+        """
+        Get the key of an operator in the operator cost registry.
+        
+        Args:
+            model: Loaded TensorFlow Lite model object
+            operator: TensorFlow Lite operator object
+            op_name: Name of the operator from `_operator_name`
+            
+        Returns:
+            Custom code for custom operators, otherwise the operator name
+        """
+        if op_name != 'CUSTOM':
+            return op_name
+        custom_code = model.OperatorCodes(operator.OpcodeIndex()).CustomCode()
+        if custom_code:
+            return custom_code.decode('utf-8', errors='replace')
+        return op_name
+
+    def _find_called_subgraphs(
+        self,
+        model: object,
+        subgraph: object
+    ) -> dict[int, tuple[str, list[int]]]:
+        """
+        Find the control flow operators of a subgraph and the subgraphs they run.
+        
+        Args:
+            model: Loaded TensorFlow Lite model object
+            subgraph: TensorFlow Lite subgraph object
+            
+        Returns:
+            Dictionary mapping operator index to the operator name and the called
+            subgraph indices: [cond, body] for WHILE, [then, else] for IF, and
+            [init] for CALL_ONCE
+        """
+        called = {}
+        for op_idx in range(subgraph.OperatorsLength()):
+            operator = subgraph.Operators(op_idx)
+            op_name = self._operator_name(model, operator)
+            if op_name not in self._CONTROL_FLOW_OPTIONS:
+                continue
+            options_table = operator.BuiltinOptions()
+            if options_table is None:
+                self.logger.warning(f"{op_name} operator {op_idx} has no options")
+                continue
+            
+            options_name, accessors = self._CONTROL_FLOW_OPTIONS[op_name]
+            options = getattr(self.schema_fb, options_name)()
+            options.Init(options_table.Bytes, options_table.Pos)
+            called[op_idx] = (op_name, [getattr(options, name)() for name in accessors])
+        return called
+
+    def _read_constant_scalar(
+        self,
+        model: object,
+        subgraph: object,
+        tensor_idx: int
+    ) -> int | None:
+        """
+        Read the value of a constant integer scalar tensor.
+        
+        Args:
+            model: Loaded TensorFlow Lite model object
+            subgraph: TensorFlow Lite subgraph containing the tensor
+            tensor_idx: Index of the tensor
+            
+        Returns:
+            Tensor value, or None if the tensor is not a constant INT32 or INT64
+            scalar
+        """
+        if tensor_idx < 0:
+            return None
+        tensor = subgraph.Tensors(tensor_idx)
+        dtype = {
+            self.schema_fb.TensorType.INT32: np.dtype('<i4'),
+            self.schema_fb.TensorType.INT64: np.dtype('<i8'),
+        }.get(tensor.Type())
+        if dtype is None:
+            return None
+        
+        data = model.Buffers(tensor.Buffer()).DataAsNumpy()
+        if not isinstance(data, np.ndarray) or data.size != dtype.itemsize:
+            return None
+        return int(data.view(dtype)[0])
+
+    def _static_trip_count(
+        self,
+        model: object,
+        subgraph: object,
+        operator: object,
+        cond_idx: int,
+        body_idx: int
+    ) -> int | None:
+        """
+        Determine the trip count of a counter-controlled WHILE loop.
+        
+        Recognizes loops whose condition subgraph is a single `counter < limit`
+        and whose body adds a constant step to the counter, with constant initial
+        counter, limit and step values.
+        
+        Args:
+            model: Loaded TensorFlow Lite model object
+            subgraph: Subgraph containing the WHILE operator
+            operator: WHILE operator object
+            cond_idx: Index of the loop condition subgraph
+            body_idx: Index of the loop body subgraph
+            
+        Returns:
+            Number of loop iterations, or None if it cannot be determined
+        """
+        cond = model.Subgraphs(cond_idx)
+        body = model.Subgraphs(body_idx)
+        if cond.OperatorsLength() != 1:
+            return None
+        compare = cond.Operators(0)
+        if (
+            self._operator_name(model, compare) != 'LESS'
+            or compare.InputsLength() != 2
+        ):
+            return None
+        
+        # The counter is the loop variable compared against the limit
+        cond_inputs = cond.InputsAsNumpy().tolist() if cond.InputsLength() else []
+        if compare.Inputs(0) not in cond_inputs:
+            return None
+        counter = cond_inputs.index(compare.Inputs(0))
+        if counter >= min(operator.InputsLength(), body.InputsLength(),
+                          body.OutputsLength()):
+            return None
+        limit = self._read_constant_scalar(model, cond, compare.Inputs(1))
+        initial = self._read_constant_scalar(model, subgraph, operator.Inputs(counter))
+        
+        # The body must increment the counter by a constant step
+        step = None
+        for op_idx in range(body.OperatorsLength()):
+            increment = body.Operators(op_idx)
+            if (
+                self._operator_name(model, increment) == 'ADD'
+                and increment.InputsLength() == 2
+                and increment.OutputsLength() == 1
+                and increment.Outputs(0) == body.Outputs(counter)
+            ):
+                if increment.Inputs(0) == body.Inputs(counter):
+                    step = self._read_constant_scalar(model, body, increment.Inputs(1))
+                elif increment.Inputs(1) == body.Inputs(counter):
+                    step = self._read_constant_scalar(model, body, increment.Inputs(0))
+        
+        if limit is None or initial is None or step is None or step <= 0:
+            return None
+        return max(0, -(-(limit - initial) // step))
+
+    def _attribute_called_subgraphs(
+        self,
+        model: object,
+        subgraph_details: list[ModelDetails],
+        loop_trip_counts: dict[int, int]
+    ) -> ModelDetails:
+        """
+        Combine per-subgraph analyses into the analysis of the primary subgraph.
+        
+        The MACs of a called subgraph are added to its calling operator, times
+        the trip count for WHILE bodies and the costlier branch for IF. The peak
+        RAM of the called subgraph is added to the memory of the calling step,
+        since the caller's live tensors stay allocated while it runs. Parameters
+        of each subgraph are stored once and credited to its first caller.
+        The arenas of called subgraphs are planned on top of the caller's
+        arena, so the largest of them is added to the planned arena size.
+        
+        Args:
+            model: Loaded TensorFlow Lite model object
+            subgraph_details: Analysis of each subgraph on its own, by index
+            loop_trip_counts: WHILE iterations keyed by body subgraph index,
+                used when the trip count cannot be determined from the model
+            
+        Returns:
+            ModelDetails of the primary subgraph including called subgraphs
+            
+        Raises:
+            ModelSubgraphError: If an operator refers to a missing subgraph
+            ModelAnalysisError: If subgraphs call each other recursively
+        """
+        num_subgraphs = len(subgraph_details)
+        called = [
+            self._find_called_subgraphs(model, model.Subgraphs(subgraph_idx))
+            for subgraph_idx in range(num_subgraphs)
+        ]
+        subgraph_costs: dict[int, tuple[int, int]] = {}
+        in_progress: set[int] = set()
+        
+        def callee_cost(subgraph_idx: int, op_idx: int) -> tuple[int, int]:
+            # MACs and peak RAM in bytes of the subgraphs run by one operator
+            op_name, callees = called[subgraph_idx][op_idx]
+            for callee in callees:
+                if not 0 <= callee < num_subgraphs:
+                    raise ModelSubgraphError(
+                        f"{op_name} operator {op_idx} of subgraph {subgraph_idx} "
+                        f"refers to missing subgraph {callee}"
+                    )
+            costs = [subgraph_cost(callee) for callee in callees]
+            peak_b = max(cost[1] for cost in costs)
+            if op_name == 'WHILE':
+                trip_count = self._static_trip_count(
+                    model, model.Subgraphs(subgraph_idx),
+                    model.Subgraphs(subgraph_idx).Operators(op_idx), *callees
+                )
+                if trip_count is None:
+                    trip_count = loop_trip_counts.get(callees[1])
+                if trip_count is None:
+                    trip_count = self._DEFAULT_LOOP_TRIP_COUNT
+                    self.logger.warning(
+                        f"Trip count of WHILE loop body subgraph {callees[1]} is "
+                        f"unknown, assuming {trip_count} iteration(s)"
+                    )
+                self.logger.debug(f"WHILE loop body subgraph {callees[1]}: "
+                                  f"{trip_count} iteration(s)")
+                # The condition runs once more than the body
+                return (trip_count * (costs[0][0] + costs[1][0]) + costs[0][0],
+                        peak_b)
+            if op_name == 'IF':
+                return max(cost[0] for cost in costs), peak_b
+            return sum(cost[0] for cost in costs), peak_b
+        
+        def subgraph_cost(subgraph_idx: int) -> tuple[int, int]:
+            # Total MACs and peak RAM in bytes of one subgraph with its callees
+            if subgraph_idx in subgraph_costs:
+                return subgraph_costs[subgraph_idx]
+            if subgraph_idx in in_progress:
+                raise ModelAnalysisError(
+                    "control flow", f"subgraph {subgraph_idx} calls itself"
+                )
+            in_progress.add(subgraph_idx)
+            details = subgraph_details[subgraph_idx]
+            total_macs = 0
+            peak_b = 0
+            for layer, step in zip(details.layer_details,
+                                   details.execution_schedule, strict=True):
+                callee_macs, callee_peak_b = 0, 0
+                if layer.index in called[subgraph_idx]:
+                    callee_macs, callee_peak_b = callee_cost(subgraph_idx, layer.index)
+                total_macs += layer.macs + callee_macs
+                peak_b = max(peak_b, step['memory_b'] + callee_peak_b)
+            in_progress.discard(subgraph_idx)
+            subgraph_costs[subgraph_idx] = (total_macs, peak_b)
+            return subgraph_costs[subgraph_idx]
+        
+        def subgraph_arena(subgraph_idx: int) -> tuple[float, float]:
+            # Planned arena and peak live data in KB, including callees
+            details = subgraph_details[subgraph_idx]
+            callee_arenas = [
+                subgraph_arena(callee)
+                for _, callees in called[subgraph_idx].values()
+                for callee in callees
+            ]
+            return (
+                details.arena_size_kb
+                + max((arena[0] for arena in callee_arenas), default=0.0),
+                details.arena_size_kb * (1.0 - details.arena_fragmentation)
+                + max((arena[1] for arena in callee_arenas), default=0.0)
+            )
+        
+        def reachable(callees: list[int]) -> list[int]:
+            # Called subgraphs and everything they call in turn
+            found = []
+            pending = list(callees)
+            while pending:
+                subgraph_idx = pending.pop(0)
+                if subgraph_idx not in found:
+                    found.append(subgraph_idx)
+                    for _, nested in called[subgraph_idx].values():
+                        pending.extend(nested)
+            return found
+        
+        main = subgraph_details[0]
+        credited = {0}
+        total_param_memory_b = main.model_total_param_memory_b
+        layer_details = []
+        execution_schedule = []
+        for layer, step in zip(main.layer_details, main.execution_schedule,
+                               strict=True):
+            if layer.index not in called[0]:
+                layer_details.append(layer)
+                execution_schedule.append(step)
+                continue
+            
+            callee_macs, callee_peak_b = callee_cost(0, layer.index)
+            callees = called[0][layer.index][1]
+            new_subgraphs = [idx for idx in reachable(callees) if idx not in credited]
+            credited.update(new_subgraphs)
+            callee_param_b = sum(
+                subgraph_details[idx].model_total_param_memory_b
+                for idx in new_subgraphs
+            )
+            total_param_memory_b += callee_param_b
+            
+            layer_details.append(layer.model_copy(update={
+                'macs': layer.macs + callee_macs,
+                'flash_kb': layer.flash_kb + callee_param_b / self._BYTES_TO_KB_DIVISOR,
+                'called_subgraphs': callees
+            }))
+            execution_schedule.append({
+                **step, 'memory_b': step['memory_b'] + callee_peak_b
+            })
+        
+        unused = sorted(set(range(num_subgraphs)) - credited)
+        if unused:
+            self.logger.debug(f"Subgraphs not called from the primary subgraph: "
+                              f"{unused}")
+        
+        peak_ram_usage_b = max(
+            (step['memory_b'] for step in execution_schedule), default=0
+        )
+        arena_size_kb, arena_live_kb = subgraph_arena(0)
+        return main.model_copy(update={
+            'arena_size_kb': arena_size_kb,
+            'arena_fragmentation': (
+                max(0.0, 1.0 - arena_live_kb / arena_size_kb)
+                if arena_size_kb else 0.0
+            ),
+            'layer_details': LayerColumns.from_layers(layer_details),
+            'execution_schedule': execution_schedule,
+            'model_peak_ram_kb': peak_ram_usage_b / self._BYTES_TO_KB_DIVISOR,
+            'model_total_param_memory_b': total_param_memory_b,
+            'total_macs': sum(layer.macs for layer in layer_details)
+        })
+
     def _extract_model_name(self, model: object, model_path: str) -> str:
         """
         Extract model name from metadata or derive from filename.
@@ -759,504 +1381,279 @@ class TFLiteParser:
         except Exception as e:
             raise ModelMemoryCalculationError(f"step {op_idx}", str(e))
 
-    def _calculate_layer_memory(
+    def _calculate_memory_schedule(
         self,
-        operator: object,
-        subgraph: object,
-        parameter_indices: set[int]
-    ) -> tuple[float, list[list[int]]]:
+        table: TensorTable,
+        dtype_size: int
+    ) -> list[dict[str, int]]:
         """
-        Calculate flash memory requirements and kernel shapes for a layer.
+        Calculate memory utilization statistics for every execution step.
         
-        Analyzes the storage requirements for model parameters (weights, biases)
-        associated with the current layer.
+        Produces the same results as calling `_calculate_memory_at_step` for each
+        operator, but with a single sweep over tensor births and deaths. The
+        running byte total and live count are built from per-step deltas, so the
+        cost is linear in operators plus tensors.
         
         Args:
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
-            parameter_indices: Set of tensor indices containing model parameters
+            table: Columnar tensor table of the subgraph
+            dtype_size: Size in bytes of the model's primary data type
             
         Returns:
-            Tuple containing:
-            - Flash memory usage in kilobytes
-            - List of kernel tensor shapes
+            List indexed by operator with the statistics described in
+            `_calculate_memory_at_step`
             
         Raises:
             ModelMemoryCalculationError: If memory calculation fails
         """
         try:
-            layer_flash_bytes = 0
-            kernel_shapes = []
-            
-            # Analyze each input tensor to identify parameters
-            for tensor_idx in operator.InputsAsNumpy():
-                if tensor_idx in parameter_indices:
-                    try:
-                        tensor = subgraph.Tensors(tensor_idx)
-                        shape = tensor.ShapeAsNumpy()
-                        tensor_type = tensor.Type()
-                        type_size = self.get_tensor_size_bytes(tensor_type)
-                        
-                        # Accumulate parameter storage requirements
-                        layer_flash_bytes += int(np.prod(shape) * type_size)
-                        kernel_shapes.append(shape.tolist())
-                        
-                    except Exception as e:
-                        self.logger.debug(f"Failed to process parameter tensor \
-                                     {tensor_idx}: {e}")
+            num_operators = table.num_operators
+            produced = np.flatnonzero(table.producer >= 0)
+            births = table.producer[produced]
+            deaths = np.where(table.last_consumer[produced] >= 0,
+                              table.last_consumer[produced], births)
+            tensor_bytes = table.elements[produced] * dtype_size
+            
+            # Tensors that die before they are born are never live
+            live = births <= deaths
+            ends = deaths[live] + 1
+            
+            # Changes to the running totals, applied when entering each step
+            ram_delta = (
+                np.bincount(births[live], weights=tensor_bytes[live],
+                            minlength=num_operators + 1)
+                - np.bincount(ends, weights=tensor_bytes[live],
+                              minlength=num_operators + 1)
+            )
+            live_delta = (
+                np.bincount(births[live], minlength=num_operators + 1)
+                - np.bincount(ends, minlength=num_operators + 1)
+            )
+            terminated = np.bincount(deaths, minlength=num_operators)
             
-            return layer_flash_bytes / self._BYTES_TO_KB_DIVISOR, kernel_shapes
+            current_ram = np.cumsum(ram_delta[:num_operators]).astype(np.int64)
+            live_tensors = np.cumsum(live_delta[:num_operators])
             
+            return [
+                {
+                    'live_tensors': live_count,
+                    'current_ram': ram,
+                    'terminated_tensors': terminated_count
+                }
+                for live_count, ram, terminated_count in zip(
+                    live_tensors.tolist(), current_ram.tolist(),
+                    terminated[:num_operators].tolist(), strict=True
+                )
+            ]
         except Exception as e:
-            raise ModelMemoryCalculationError("layer memory", str(e))
+            raise ModelMemoryCalculationError("memory schedule", str(e))
 
-    def _calculate_layer_ram(
+    def plan_tensor_arena(
         self,
-        operator: object,
-        subgraph: object,
-        dtype_size: int
-    ) -> float:
+        table: TensorTable,
+        op_names: list[str]
+    ) -> ArenaPlan:
         """
-        Calculate runtime RAM requirements for layer outputs.
+        Assign arena offsets to the activation tensors of a subgraph.
         
-        Determines the memory footprint of tensors produced by this layer
-        during inference execution.
+        Uses greedy-by-size placement with TFLM's buffer alignment, letting
+        reshape-like operators reuse the buffer of their input. The planned
+        arena size accounts for alignment and fragmentation, which the sum of
+        live tensor sizes does not.
         
         Args:
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
-            dtype_size: Size in bytes of the model's primary data type
+            table: Columnar tensor table of the subgraph
+            op_names: Name of each operator in execution order
             
         Returns:
-            RAM usage in kilobytes for layer outputs
+            ArenaPlan with per-tensor offsets and the planned arena size
             
         Raises:
-            ModelMemoryCalculationError: If RAM calculation fails
+            ModelMemoryCalculationError: If arena planning fails
         """
         try:
-            layer_ram_bytes = 0
-            
-            # Calculate memory footprint of all output tensors
-            for tensor_idx in operator.OutputsAsNumpy():
-                try:
-                    tensor = subgraph.Tensors(tensor_idx)
-                    shape = tensor.ShapeAsNumpy()
-                    layer_ram_bytes += int(np.prod(shape) * dtype_size)
-                except Exception as e:
-                    self.logger.debug(f"Failed to calculate RAM for output tensor \
-                                 {tensor_idx}: {e}")
-            
-            return layer_ram_bytes / self._BYTES_TO_KB_DIVISOR
-            
+            in_place_ops = {
+                op_idx for op_idx, op_name in enumerate(op_names)
+                if op_name in self._IN_PLACE_OPERATORS
+            }
+            return plan_arena(table, in_place_ops, self._ARENA_ALIGNMENT_BYTES)
         except Exception as e:
-            raise ModelMemoryCalculationError("layer RAM", str(e))
+            raise ModelMemoryCalculationError("arena plan", str(e))
 
-    def estimate_operator_macs(
+    def _build_layer_columns(
         self,
-        opcode: str,
-        operator: object,
-        subgraph: object
-    ) -> int:
-        """
-        Calculate multiply-accumulate operations for a TensorFlow Lite operator.
-        
-        Estimates computational complexity by counting the number of MAC operations
-        required for the given operator type and tensor dimensions.
-        
-        Args:
-            opcode: Operator name (e.g., 'CONV_2D', 'FULLY_CONNECTED')
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
-            
-        Returns:
-            Estimated number of MAC operations
-        """
-        try:
-            # Get input/output tensor information
-            input_shapes = self._get_tensor_shapes(operator.InputsAsNumpy(), subgraph)
-            output_shapes = self._get_tensor_shapes(operator.OutputsAsNumpy(), subgraph)
-            
-            # Dynamic MAC calculation based on tensor analysis
-            if self._has_weight_tensors(operator, subgraph):
-                return self._calculate_weighted_operation_macs(operator, subgraph)
-            elif self._shapes_differ_in_values(input_shapes, output_shapes):
-                return self._calculate_transformation_macs(input_shapes, output_shapes)
-            elif self._is_pure_data_movement(input_shapes, output_shapes):
-                return 0  # No computation, just data reorganization
-            else:
-                # Default: fallback to output-based MAC estimation to avoid recursion
-                return self._estimate_macs_from_output(operator, subgraph)
-                
-        except Exception as e:
-            # Log warning but don't raise exception for estimation fallback
-            self.logger.warning(f"Dynamic MAC calculation failed for {opcode}: {e}")
-            return 0
-        
-    def _shapes_differ_in_values(self, input_shapes: list, output_shapes: list) -> bool:
+        table: TensorTable,
+        op_names: list[str],
+        op_costs: OperatorCosts,
+        memory_schedule: list[dict[str, int]],
+        dtype_size: int
+    ) -> LayerColumns:
         """
-        Check if operation changes tensor dimensions (indicates computation).
+        Assemble the per-layer metrics of a subgraph as columns.
         
-        Analyzes input and output tensor dimensions to determine if the operation
-        involves significant computation (size changes) or is primarily data movement.
+        Flash is the parameter storage read by each layer, and RAM the memory
+        of the tensors it outputs in the model's primary data type.
         
         Args:
-            input_shapes: List of input tensor shapes
-            output_shapes: List of output tensor shapes
+            table: Columnar tensor table of the subgraph
+            op_names: Name of each operator in execution order
+            op_costs: Costs of each operator
+            memory_schedule: Memory statistics of each execution step
+            dtype_size: Size in bytes of the model's primary data type
             
         Returns:
-            True if tensor sizes differ significantly, indicating computation
-        """
-        if not input_shapes or not output_shapes:
-            return False
-        
-        input_size = sum(np.prod(shape) for shape in input_shapes)
-        output_size = sum(np.prod(shape) for shape in output_shapes)
-        
-        # If sizes differ significantly, likely involves computation
-        return abs(input_size - output_size) > 0.1 * max(input_size, output_size)
-
-    def _compute_macs_for_operator(
-        self,
-        opcode: str,
-        operator: object,
-        subgraph: object
-    ) -> int:
-        """
-        Compute MAC operations for specific operator types.
-        
-        Implements operator-specific MAC calculation algorithms based on
-        tensor dimensions and operation characteristics.
-        
-        Args:
-            opcode: Normalized operator name
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
+            LayerColumns with one entry per operator
             
-        Returns:
-            Number of MAC operations for this operator
+        Raises:
+            ModelMemoryCalculationError: If the layer memory cannot be calculated
         """
         try:
-            # Route to specialized MAC calculation methods
-            if opcode == 'CONV_2D':
-                return self._calculate_conv2d_macs(operator, subgraph)
-            elif opcode == 'DEPTHWISE_CONV_2D':
-                return self._calculate_depthwise_conv_macs(operator, subgraph)
-            elif opcode == 'FULLY_CONNECTED':
-                return self._calculate_fc_macs(operator, subgraph)
-            else:
-                # Fallback estimation for other operators
-                return self._estimate_macs_from_output(operator, subgraph)
-                
+            num_operators = table.num_operators
+            output_offsets, output_tensors = ragged(table.op_outputs)
+            input_offsets, input_tensors = ragged(table.op_inputs)
+            
+            # Output elements summed per operator, absent outputs excluded
+            owners = np.repeat(np.arange(num_operators), np.diff(output_offsets))
+            present = output_tensors >= 0
+            output_elements = np.bincount(
+                owners[present], weights=table.elements[output_tensors[present]],
+                minlength=num_operators
+            ).astype(np.int64)
+            
+            # Shapes of the parameter tensors read by each layer
+            kernel_shapes = [
+                [table.shapes[tensor_idx].tolist() for tensor_idx in inputs.tolist()
+                 if tensor_idx >= 0 and table.is_parameter[tensor_idx]
+                 and isinstance(table.shapes[tensor_idx], np.ndarray)]
+                for inputs in table.op_inputs
+            ]
+            kernel_offsets = np.zeros(num_operators + 1, dtype=np.int64)
+            np.cumsum([len(shapes) for shapes in kernel_shapes],
+                      out=kernel_offsets[1:])
+            kernel_dim_offsets, kernel_dims = ragged(
+                shape for shapes in kernel_shapes for shape in shapes
+            )
+            called_offsets, called_subgraphs = ragged([[]] * num_operators)
+            
+            return LayerColumns(
+                names=list(op_names),
+                macs=op_costs.macs,
+                flash_kb=op_costs.param_bytes / self._BYTES_TO_KB_DIVISOR,
+                ram_kb=output_elements * dtype_size / self._BYTES_TO_KB_DIVISOR,
+                read_bytes=op_costs.read_bytes,
+                write_bytes=op_costs.write_bytes,
+                lifecycle=np.array([
+                    (len(table.op_outputs[op_idx]), stats['live_tensors'],
+                     stats['terminated_tensors'])
+                    for op_idx, stats in enumerate(memory_schedule)
+                ], dtype=np.int64).reshape(-1, 3),
+                input_offsets=input_offsets,
+                input_tensors=input_tensors,
+                output_offsets=output_offsets,
+                output_tensors=output_tensors,
+                kernel_offsets=kernel_offsets,
+                kernel_dim_offsets=kernel_dim_offsets,
+                kernel_dims=kernel_dims,
+                called_offsets=called_offsets,
+                called_subgraphs=called_subgraphs
+            )
         except Exception as e:
-            raise ModelMACCalculationError(opcode, str(e))
+            raise ModelMemoryCalculationError("layer columns", str(e))
 
-    def _calculate_conv2d_macs(self, operator: object, subgraph: object) -> int:
-        """
-        Calculate MAC operations for 2D convolution layers.
-        
-        Computes multiply-accumulate operations for standard 2D convolution
-        based on output spatial dimensions, channel counts, and kernel size.
-        
-        Args:
-            operator: TensorFlow Lite operator object for the convolution
-            subgraph: TensorFlow Lite subgraph containing the operator
-            
-        Returns:
-            Number of MAC operations for the convolution layer
-            
-        Note:
-            This implementation assumes NHWC format for tensors and does not include
-            batch size considerations.
-        """
-        # Validate operator has required inputs and outputs
-        if operator.InputsLength() < 2 or operator.OutputsLength() < 1:
-            raise ModelAnalysisError("conv2d_macs",
-                                      "Insufficient operator inputs/outputs")
-            
-        weights_tensor = subgraph.Tensors(operator.Inputs(1))
-        output_tensor = subgraph.Tensors(operator.Outputs(0))
-        
-        output_shape = output_tensor.ShapeAsNumpy()
-        weights_shape = weights_tensor.ShapeAsNumpy()
-        
-        # Validate shapes have expected dimensions for NHWC format
-        if len(output_shape) < 4 or len(weights_shape) < 4:
-            raise ModelAnalysisError("conv2d_macs",
-                                      "Unexpected tensor shape dimensions")
-        
-        # For 2D convolution in tflite format: weights shape = [output_channels, 
-        # kernel_height, kernel_width, input_channels]
-        # output tensor shape = [batch, out height, out width, out channels]
-        # MACs = output height * output width * output channels *
-        #        kernel height * kernel width * input channels
-        output_spatial_size = int(np.prod(output_shape[1:3]))  # height * width
-        output_channels = output_shape[3]
-        kernel_volume = int(np.prod(weights_shape[1:3]))  # kernel height * kernel width
-        input_channels = weights_shape[3]
-    
-        return output_spatial_size * output_channels * kernel_volume * input_channels
-    
-    def _calculate_depthwise_conv_macs(self, operator: object, subgraph: object) -> int:
-        """
-        Calculate MAC operations for depthwise convolution layers.
-        
-        Computes multiply-accumulate operations for depthwise separable convolution
-        where each input channel is processed independently with its own kernel.
-        
-        Args:
-            operator: TensorFlow Lite operator object for the depthwise convolution
-            subgraph: TensorFlow Lite subgraph containing the operator
-            
-        Returns:
-            Number of MAC operations for the depthwise convolution layer
-            
-        Note:
-            Assuming TFLM uses NHWC data format for depthwise conv layers.
-            Output tensor shape: [batch, out height, out width, out channels]
-            This code does not account for batch size in MAC calculation.
-        """
-        # Validate operator has required inputs and outputs
-        if operator.InputsLength() < 2 or operator.OutputsLength() < 1:
-            raise ModelAnalysisError("depthwise_conv_macs",
-                                      "Insufficient operator inputs/outputs")
-            
-        weights_tensor = subgraph.Tensors(operator.Inputs(1))
-        output_tensor = subgraph.Tensors(operator.Outputs(0))
-        
-        output_shape = output_tensor.ShapeAsNumpy()
-        weights_shape = weights_tensor.ShapeAsNumpy()
-        
-        # Validate shapes have expected dimensions
-        if len(output_shape) == 0 or len(weights_shape) < 3:
-            raise ModelAnalysisError("depthwise_conv_macs",
-                                      "Unexpected tensor shape dimensions")
-            
-        # For 2D convolution in tflite format: weights shape = [output_channels, 
-        # kernel_height, kernel_width, input_channels]
-        # MACs = output elements * spatial kernel size (no cross-channel mixing)
-        return int(np.prod(output_shape) * np.prod(weights_shape[1:3]))
-    
-    def _calculate_fc_macs(self, operator: object, subgraph: object) -> int:
-        """
-        Calculate MAC operations for fully connected layers.
-        
-        Computes multiply-accumulate operations for dense/fully connected layers
-        based on the weight matrix dimensions.
-        
-        Args:
-            operator: TensorFlow Lite operator object for the fully connected layer
-            subgraph: TensorFlow Lite subgraph containing the operator
-            
-        Returns:
-            Number of MAC operations for the fully connected layer
-            
-        Note:
-            This code assumes a standard dense layer without batching.
+    def build_tensor_table(self, subgraph: object) -> TensorTable:
         """
-        # Validate operator has required inputs
-        if operator.InputsLength() < 2:
-            raise ModelAnalysisError("fc_macs", "Insufficient operator inputs")
-            
-        weights_tensor = subgraph.Tensors(operator.Inputs(1))
-        weights_shape = weights_tensor.ShapeAsNumpy()
+        Build a columnar table of tensor properties for a subgraph.
         
-        # Validate shape is valid
-        if len(weights_shape) == 0:
-            raise ModelAnalysisError("fc_macs", "Invalid weights tensor shape")
-            
-        # MACs = input size * output size
-        return int(np.prod(weights_shape))
-    
-    def _calculate_elementwise_macs(self, operator: object, subgraph: object) -> int:
-        """
-        Calculate MAC operations for element-wise operations.
-        
-        Estimates computational complexity for operations that process tensors
-        element-by-element (e.g., activations, element-wise math operations).
+        Reads every tensor and operator of the subgraph exactly once so that
+        subsequent analyses work on NumPy arrays instead of repeatedly decoding
+        FlatBuffer fields.
         
         Args:
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
+            subgraph: TensorFlow Lite subgraph object
             
         Returns:
-            Number of MAC operations (one per output element)
-        """
-        # Validate operator has outputs
-        if operator.OutputsLength() < 1:
-            raise ModelAnalysisError("elementwise_macs", "No operator outputs")
-            
-        output_tensor = subgraph.Tensors(operator.Outputs(0))
-        output_shape = output_tensor.ShapeAsNumpy()
-        
-        # Validate shape is valid
-        if len(output_shape) == 0:
-           raise ModelAnalysisError("elementwise_macs", "Invalid output tensor shape")
+            TensorTable with per-tensor and per-operator columns
             
-        # One operation per output element
-        return int(np.prod(output_shape))
-    
-    def _get_tensor_shapes(self, tensor_indices: list, subgraph: object) -> list:
+        Raises:
+            TensorCalculationError: If a tensor cannot be read from the subgraph
         """
-        Get tensor shapes for a list of tensor indices.
+        num_tensors = subgraph.TensorsLength()
+        num_operators = subgraph.OperatorsLength()
+        empty = np.empty(0, dtype=np.int32)
         
-        Args:
-            tensor_indices: List of tensor indices
-            subgraph: TensorFlow Lite subgraph containing the tensors
-            
-        Returns:
-            List of tensor shapes as numpy arrays
-        """
+        # Tensor columns
         shapes = []
-        for tensor_idx in tensor_indices:
+        elements = np.zeros(num_tensors, dtype=np.int64)
+        type_codes = np.zeros(num_tensors, dtype=np.int32)
+        for tensor_idx in range(num_tensors):
             try:
                 tensor = subgraph.Tensors(tensor_idx)
                 shape = tensor.ShapeAsNumpy()
                 shapes.append(shape)
+                elements[tensor_idx] = int(np.prod(shape))
+                type_codes[tensor_idx] = tensor.Type()
             except Exception as e:
-                self.logger.debug(f"Failed to get shape for tensor {tensor_idx}: {e}")
-        return shapes
-    
-    def _has_weight_tensors(self, operator: object, subgraph: object) -> bool:
-        """
-        Check if operator has weight tensors (indicates computational operation).
-        
-        Args:
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
-            
-        Returns:
-            True if operator has weight tensors, False otherwise
-        """
-        try:
-            # Parameter tensors are those not produced by other operators
-            operator_outputs = set()
-            for i in range(subgraph.OperatorsLength()):
-                op = subgraph.Operators(i)
-                operator_outputs.update(op.OutputsAsNumpy())
-            
-            model_inputs = set(subgraph.InputsAsNumpy())
-            
-            # Check if any input tensor is a parameter (weight/bias)
-            for tensor_idx in operator.InputsAsNumpy():
-                if (tensor_idx not in operator_outputs and 
-                    tensor_idx not in model_inputs):
-                    return True
-            return False
-        
-        except Exception as e:
-            self.logger.debug(f"Failed to check weight tensors: {e}")
-            return False
-    
-    def _calculate_weighted_operation_macs(
-        self, operator: object, subgraph: object
-    ) -> int:
-        """
-        Calculate MAC operations for operations with weight tensors.
-        
-        Args:
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
-            
-        Returns:
-            Estimated MAC operations based on weight tensor dimensions
-        """
-        try:
-            # Find weight tensors (parameters)
-            operator_outputs = set()
-            for i in range(subgraph.OperatorsLength()):
-                op = subgraph.Operators(i)
-                operator_outputs.update(op.OutputsAsNumpy())
-            
-            model_inputs = set(subgraph.InputsAsNumpy())
-            total_weight_elements = 0
-            
-            for tensor_idx in operator.InputsAsNumpy():
-                if (tensor_idx not in operator_outputs and 
-                    tensor_idx not in model_inputs):
-                    # This is a weight tensor
-                    tensor = subgraph.Tensors(tensor_idx)
-                    shape = tensor.ShapeAsNumpy()
-                    total_weight_elements += int(np.prod(shape))
-            
-            # For weighted operations, MACs are typically proportional to weight size
-            return total_weight_elements
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to calculate weighted operation MACs: {e}")
-            return self._estimate_macs_from_output(operator, subgraph)
-    
-    def _calculate_transformation_macs(
-        self, input_shapes: list, output_shapes: list
-    ) -> int:
-        """
-        Calculate MAC operations for tensor transformation operations.
-        
-        Args:
-            input_shapes: List of input tensor shapes
-            output_shapes: List of output tensor shapes
-            
-        Returns:
-            Estimated MAC operations based on tensor size differences
-        """
-        try:
-            if not input_shapes or not output_shapes:
-                return 0
-            
-            input_size = sum(np.prod(shape) for shape in input_shapes)
-            output_size = sum(np.prod(shape) for shape in output_shapes)
-            
-            # Estimate MACs based on the larger tensor size
-            # This handles operations like pooling, upsampling, etc.
-            return int(max(input_size, output_size))
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to calculate transformation MACs: {e}")
-            return 0
-    
-    def _is_pure_data_movement(self, input_shapes: list, output_shapes: list) -> bool:
-        """
-        Check if operation is pure data movement (no computation).
-        
-        Args:
-            input_shapes: List of input tensor shapes
-            output_shapes: List of output tensor shapes
-            
-        Returns:
-            True if operation only moves/reshapes data, False otherwise
-        """
-        try:
-            if not input_shapes or not output_shapes:
-                return True
-            
-            # Calculate total elements in input and output tensors
-            input_elements = sum(np.prod(shape) for shape in input_shapes)
-            output_elements = sum(np.prod(shape) for shape in output_shapes)
-            
-            # If element count is exactly the same, likely just reshaping/moving data
-            return input_elements == output_elements
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to check data movement: {e}")
-            return False
-    
-    def _estimate_macs_from_output(self, operator: object, subgraph: object) -> int:
-        """
-        Fallback MAC estimation based on output tensor dimensions.
+                raise TensorCalculationError(tensor_idx, "tensor_table", str(e))
+        
+        # Shapes as a padded matrix for arithmetic across tensors
+        ranks = np.array([
+            len(shape) if isinstance(shape, np.ndarray) else 0 for shape in shapes
+        ], dtype=np.int64)
+        dims = np.ones((num_tensors, max(4, int(ranks.max(initial=0)))),
+                       dtype=np.int64)
+        for tensor_idx, shape in enumerate(shapes):
+            if ranks[tensor_idx]:
+                dims[tensor_idx, :ranks[tensor_idx]] = shape
+        
+        # Element sizes are looked up once per distinct tensor type
+        type_sizes = np.zeros(num_tensors, dtype=np.int64)
+        for type_code in np.unique(type_codes).tolist():
+            type_sizes[type_codes == type_code] = self.get_tensor_size_bytes(type_code)
+        
+        # Operator columns, -1 marks an absent optional input
+        op_inputs = []
+        op_outputs = []
+        for op_idx in range(num_operators):
+            operator = subgraph.Operators(op_idx)
+            op_inputs.append(
+                operator.InputsAsNumpy() if operator.InputsLength() else empty
+            )
+            op_outputs.append(
+                operator.OutputsAsNumpy() if operator.OutputsLength() else empty
+            )
+        graph_inputs = subgraph.InputsAsNumpy() if subgraph.InputsLength() else empty
+        graph_outputs = (
+            subgraph.OutputsAsNumpy() if subgraph.OutputsLength() else empty
+        )
         
-        Args:
-            operator: TensorFlow Lite operator object
-            subgraph: TensorFlow Lite subgraph containing the operator
-            
-        Returns:
-            Estimated MAC operations (one per output element)
-        """
-        try:
-            output_tensor = subgraph.Tensors(operator.Outputs(0))
-            output_shape = output_tensor.ShapeAsNumpy()
-            return int(np.prod(output_shape))
-        except Exception as e:
-            self.logger.debug(f"Failed to estimate MACs from output: {e}")
-            return 0
+        # Producer and last consumer of each tensor, later operators win
+        producer = np.full(num_tensors, -1, dtype=np.int32)
+        last_consumer = np.full(num_tensors, -1, dtype=np.int32)
+        for op_idx in range(num_operators):
+            outputs = op_outputs[op_idx]
+            producer[outputs[outputs >= 0]] = op_idx
+            inputs = op_inputs[op_idx]
+            last_consumer[inputs[inputs >= 0]] = op_idx
+        
+        # Parameters are consumed tensors that are neither computed nor external
+        is_parameter = (last_consumer >= 0) & (producer < 0)
+        is_parameter[graph_inputs[graph_inputs >= 0]] = False
+        
+        return TensorTable(
+            shapes=shapes,
+            ranks=ranks,
+            dims=dims,
+            elements=elements,
+            type_codes=type_codes,
+            type_sizes=type_sizes,
+            nbytes=elements * type_sizes,
+            is_parameter=is_parameter,
+            producer=producer,
+            last_consumer=last_consumer,
+            op_inputs=op_inputs,
+            op_outputs=op_outputs,
+            graph_inputs=graph_inputs,
+            graph_outputs=graph_outputs
+        )
     
     def extract_parameter_tensors(self, subgraph: object) -> set[int]:
         """
@@ -1274,27 +1671,7 @@ class TFLiteParser:
         Returns:
             Set of tensor indices that contain model parameters
         """
-        # Collect all tensors that are produced by operators
-        operator_outputs = set()
-        for i in range(subgraph.OperatorsLength()):
-            operator = subgraph.Operators(i)
-            operator_outputs.update(operator.OutputsAsNumpy())
-        
-        # Identify model input tensors (provided at inference time)
-        model_inputs = set(subgraph.InputsAsNumpy())
-        
-        # Parameter tensors are operator inputs that are neither computed nor external
-        parameter_indices = set()
-        for i in range(subgraph.OperatorsLength()):
-            operator = subgraph.Operators(i)
-            for input_idx in operator.InputsAsNumpy():
-                # Filter out invalid tensor indices (-1 = "no tensor")
-                if (input_idx >= 0 and 
-                    input_idx not in operator_outputs and 
-                    input_idx not in model_inputs):
-                    parameter_indices.add(input_idx)
-        
-        return parameter_indices
+        return self.build_tensor_table(subgraph).parameter_indices()
     
     def analyze_tensor_lifespans(self, subgraph: object) -> dict[int, dict[str, int]]:
         """
@@ -1310,30 +1687,13 @@ class TFLiteParser:
             Dictionary mapping tensor_id to lifecycle information:
             {'birth': operator_index, 'death': operator_index}
         """
-        tensor_lifespans = {}
-        tensor_last_use = defaultdict(lambda: -1)
-        
-        # Track the last operator that uses each tensor
-        for op_idx in range(subgraph.OperatorsLength()):
-            operator = subgraph.Operators(op_idx)
-            for tensor_idx in operator.InputsAsNumpy():
-                tensor_last_use[tensor_idx] = op_idx
-        
-        # Map tensor creation and final usage points
-        for op_idx in range(subgraph.OperatorsLength()):
-            operator = subgraph.Operators(op_idx)
-            for tensor_idx in operator.OutputsAsNumpy():
-                tensor_lifespans[tensor_idx] = {
-                    'birth': op_idx,  # Created by this operator
-                    'death': tensor_last_use.get(tensor_idx, op_idx)  # Last used here
-                }
-        
-        return tensor_lifespans
+        return self.build_tensor_table(subgraph).lifespans()
     
     def calculate_total_param_size(
         self,
         subgraph: object,
-        parameter_indices: set[int]
+        parameter_indices: set[int],
+        table: TensorTable | None = None
     ) -> int:
         """
         Calculate total flash memory required for model parameters.
@@ -1345,27 +1705,72 @@ class TFLiteParser:
         Args:
             subgraph: TensorFlow Lite subgraph object
             parameter_indices: Set of tensor indices containing parameters
+            table: Optional tensor table to read sizes from instead of the subgraph
             
         Returns:
             Total flash memory requirement in bytes
         """
-        total_bytes = 0
-        for tensor_idx in parameter_indices:
-            try:
-                tensor = subgraph.Tensors(tensor_idx)
-                shape = tensor.ShapeAsNumpy()
-                tensor_type = tensor.Type()
-                type_size = self.get_tensor_size_bytes(tensor_type)
-                
-                total_bytes += int(np.prod(shape) * type_size)
-
-            except Exception as e:
-                # Log tensor calculation errors but continue with partial results
-                self.logger.debug(f"Failed to calculate parameter tensor "
-                                  f"{tensor_idx} size: {e}")
-                
-        return total_bytes
+        if table is None:
+            table = self.build_tensor_table(subgraph)
+        indices = np.fromiter(parameter_indices, dtype=np.int64,
+                              count=len(parameter_indices))
+        return int(table.nbytes[indices].sum())
+    
+    def get_input_details(self, subgraph: object) -> list[InputTensorDetail]:
+        """
+        Get the shape, type and quantization of each subgraph input.
+        
+        Args:
+            subgraph: TensorFlow Lite subgraph object
+            
+        Returns:
+            InputTensorDetail of each input tensor, in input order
+        """
+        input_details = []
+        for input_idx in range(subgraph.InputsLength()):
+            tensor_idx = int(subgraph.Inputs(input_idx))
+            tensor = subgraph.Tensors(tensor_idx)
+            quantization = tensor.Quantization()
+            scale: list[float] = []
+            zero_point: list[int] = []
+            quantized_dimension = 0
+            if quantization is not None and quantization.ScaleLength():
+                scale = quantization.ScaleAsNumpy().tolist()
+                if quantization.ZeroPointLength():
+                    zero_point = quantization.ZeroPointAsNumpy().tolist()
+                else:
+                    zero_point = [0] * len(scale)
+                quantized_dimension = quantization.QuantizedDimension()
+            input_details.append(InputTensorDetail(
+                index=tensor_idx,
+                name=(tensor.Name() or b'').decode('utf-8', errors='replace'),
+                shape=tensor.ShapeAsNumpy().tolist() if tensor.ShapeLength() else [],
+                dtype=self._tensor_type_name(tensor.Type()),
+                scale=scale,
+                zero_point=zero_point,
+                quantized_dimension=quantized_dimension
+            ))
+        return input_details
     
+    def _tensor_type_name(self, tensor_type: int) -> str:
+        """
+        Map a TensorFlow Lite tensor type enum value to its string name.
+        
+        Args:
+            tensor_type: TensorFlow Lite tensor type enum value
+            
+        Returns:
+            Data type string (e.g., 'int8', 'float32'), or 'unknown'
+        """
+        if self.schema_fb:
+            for attr_name in dir(self.schema_fb.TensorType):
+                if (
+                    not attr_name.startswith("__")
+                    and getattr(self.schema_fb.TensorType, attr_name) == tensor_type
+                ):
+                    return attr_name.lower()
+        return 'unknown'
+
     def determine_model_dtype(self, subgraph: object) -> str:
         """
         Determine the primary data type used by the model.
@@ -1385,15 +1790,7 @@ class TFLiteParser:
         try:
             # Examine the first model input tensor
             input_tensor = subgraph.Tensors(subgraph.Inputs(0))
-            input_type = input_tensor.Type()
-            
-            # Map TensorFlow Lite type enum back to string representation
-            for attr_name in dir(self.schema_fb.TensorType):
-                if (
-                    not attr_name.startswith("__")
-                    and getattr(self.schema_fb.TensorType, attr_name) == input_type
-                ):
-                    return attr_name.lower()
+            return self._tensor_type_name(input_tensor.Type())
                         
         except AttributeError as e:
             raise SchemaError("tensor_type_determination", str(e))
@@ -1403,6 +1800,67 @@ class TFLiteParser:
         return 'unknown'
 
 
+def _parser_version() -> str:
+    """
+    Get the version of the parser code, used to invalidate cached analyses.
+    
+    Returns:
+        Version string that changes with the parser and schema sources
+    """
+    return source_version(
+        sys.modules[__name__], arena_planner, operator_costs, operator_order,
+        schemas, tensor_table
+    )
+
+
+def _close_mapping(model_buffer: mmap.mmap) -> None:
+    """
+    Close a model file mapping so the file can be replaced or deleted.
+    
+    Args:
+        model_buffer: Mapping from `TFLiteParser._map_model_file`
+    """
+    # Arrays viewing the mapping may still be referenced, for example by the
+    # traceback of an error. The mapping is closed once they are released.
+    with contextlib.suppress(BufferError):
+        model_buffer.close()
+
+
+def _analyze_subgraph_in_process(
+    model_path: str,
+    subgraph_idx: int,
+    model_dtype: str
+) -> ModelDetails:
+    """
+    Analyze one subgraph of a TensorFlow Lite model in a worker process.
+    
+    Args:
+        model_path: Path to TensorFlow Lite model file
+        subgraph_idx: Index of the subgraph to analyze
+        model_dtype: Primary data type of the model
+        
+    Returns:
+        ModelDetails object for the subgraph on its own
+        
+    Raises:
+        ModelAnalysisError: If the subgraph analysis fails
+    """
+    parser = TFLiteParser()
+    model_buffer = None
+    try:
+        model_buffer = parser._map_model_file(model_path)
+        model = parser.load_model(model_path, model_buffer)
+        return parser._analyze_subgraph(
+            model_path, model, model.Subgraphs(subgraph_idx), model_dtype
+        )
+    except Exception as e:
+        # Parser exceptions with custom arguments do not survive pickling
+        raise ModelAnalysisError(f"subgraph {subgraph_idx}", str(e))
+    finally:
+        if model_buffer is not None:
+            _close_mapping(model_buffer)
+
+
 def parse_tflite_model(model_path: str) -> ModelDetails:
     """
     Parse TensorFlow Lite model using default parser configuration.
@@ -1418,3 +1876,79 @@ def parse_tflite_model(model_path: str) -> ModelDetails:
     """
     parser = TFLiteParser()
     return parser.parse_model(model_path)
+
+
+def _parse_model_isolated(
+    model_path: str,
+    cache: ParseCache | None
+) -> ModelParseResult:
+    """
+    Parse one model of a batch, capturing any failure in the result.
+    
+    Args:
+        model_path: Path to TensorFlow Lite model file
+        cache: Optional on-disk cache of analysis results
+        
+    Returns:
+        ModelParseResult with either the analysis or the error
+    """
+    try:
+        details = TFLiteParser(cache=cache).parse_model(model_path)
+        return ModelParseResult(model_path=model_path, model_details=details)
+    except ModelParserError as e:
+        return ModelParseResult(
+            model_path=model_path, error=str(e), error_code=e.error_code
+        )
+    except Exception as e:
+        return ModelParseResult(
+            model_path=model_path, error=str(e) or e.__class__.__name__,
+            error_code="UNEXPECTED_ERROR"
+        )
+
+
+def parse_models(
+    model_paths: Iterable[str],
+    jobs: int | None = None,
+    cache: ParseCache | None = None
+) -> Iterator[ModelParseResult]:
+    """
+    Parse many TensorFlow Lite models in a process pool.
+    
+    Results are yielded as soon as each model is done, so they arrive in
+    completion order rather than input order. A model that fails to parse
+    yields a result carrying its error instead of stopping the batch.
+    
+    Args:
+        model_paths: Paths to TensorFlow Lite model files
+        jobs: Number of worker processes (default: one per CPU), 1 parses the
+            models in this process
+        cache: Optional on-disk cache of analysis results
+        
+    Returns:
+        Iterator over one ModelParseResult per model path
+        
+    Usage:
+        >>> for result in parse_models(Path("zoo").glob("*.tflite"), jobs=8):
+        ...     if result.ok:
+        ...         print(result.model_path, result.model_details.total_macs)
+    """
+    model_paths = [str(model_path) for model_path in model_paths]
+    if jobs == 1 or len(model_paths) <= 1:
+        for model_path in model_paths:
+            yield _parse_model_isolated(model_path, cache)
+        return
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(_parse_model_isolated, model_path, cache): model_path
+            for model_path in model_paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker process itself failed, e.g. it ran out of memory
+                yield ModelParseResult(
+                    model_path=futures[future], error=str(e) or e.__class__.__name__,
+                    error_code="WORKER_FAILED"
+                )
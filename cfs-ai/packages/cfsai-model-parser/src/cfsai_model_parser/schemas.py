@@ -9,7 +9,13 @@ decisions and optimization workflows.
 Data Structures:
 - TensorLifecycle: Tracks tensor creation, usage, and destruction patterns
 - LayerDetail: Comprehensive layer analysis including MACs, memory, and tensors
+- LayerColumns: Layer details stored as columns, built one layer at a time
 - ModelDetails: Complete model analysis with validation and visualization
+- ModelParseResult: Outcome of parsing one model in a batch
+
+Functions:
+- ragged: Pack variable-length integer lists into offsets and one flat array
+- write_analysis_json: Stream a model analysis to a JSON file record by record
 
 Usage Examples:
     >>> # Display model summary
@@ -23,10 +29,20 @@ Released under the terms of the "LICENSE.md" file in the root directory.
 """
 
 import json
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Union, overload
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidatorFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+)
 
 # Optional dependency for enhanced table formatting
 try:
@@ -87,9 +103,13 @@ class LayerDetail(BaseModel):
         flash_kb: Non-volatile storage requirements for layer parameters
         kernel_tensors: Dimensional specifications for weight tensors
         ram_kb: Runtime memory requirements for layer outputs
+        read_bytes: Bytes of all input tensors, parameters included
+        write_bytes: Bytes of all output tensors
         input_tensors: Indices of input tensors consumed by this layer
         output_tensors: Indices of output tensors produced by this layer
         lifecycle: Tensor memory management statistics for this execution step
+        called_subgraphs: Subgraphs run by this layer (WHILE, IF, CALL_ONCE),
+            whose costs are included in the layer's MACs, flash and peak RAM
     """
     
     model_config = ConfigDict(
@@ -122,6 +142,16 @@ class LayerDetail(BaseModel):
         ge=0.0, 
         description="Runtime memory requirements for layer outputs (KB)"
     )
+    read_bytes: int = Field(
+        default=0,
+        ge=0,
+        description="Bytes of all input tensors read, parameters included"
+    )
+    write_bytes: int = Field(
+        default=0,
+        ge=0,
+        description="Bytes of all output tensors written"
+    )
     input_tensors: list[int] = Field(
         default_factory=list, 
         description="Indices of input tensors consumed by this layer"
@@ -133,6 +163,238 @@ class LayerDetail(BaseModel):
     lifecycle: TensorLifecycle = Field(
         description="Tensor memory management statistics at this execution step"
     )
+    called_subgraphs: list[int] = Field(
+        default_factory=list,
+        description="Indices of subgraphs run by this layer (control flow)"
+    )
+
+
+def ragged(lists: Iterable[Iterable[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack variable-length integer lists into offsets and one flat array.
+
+    Args:
+        lists: Integer lists to pack
+
+    Returns:
+        Tuple of the offsets, with the items of list i in
+        flat[offsets[i]:offsets[i + 1]], and the flat array
+    """
+    arrays = [np.asarray(items, dtype=np.int64).reshape(-1) for items in lists]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    if arrays:
+        np.cumsum([len(array) for array in arrays], out=offsets[1:])
+        flat = np.concatenate(arrays)
+    else:
+        flat = np.empty(0, dtype=np.int64)
+    return offsets, flat
+
+
+@dataclass(frozen=True, eq=False)
+class LayerColumns(Sequence):
+    """
+    Layer details of a model stored as parallel columns.
+
+    A read-only sequence of LayerDetail, each built when it is accessed, so
+    the layers of a parsed model never all exist as objects at once.
+
+    Attributes:
+        names: Operation type of each layer
+        macs: Multiply-accumulate operations of each layer
+        flash_kb: Parameter storage of each layer in KB
+        ram_kb: Output memory of each layer in KB
+        read_bytes: Bytes of all input tensors of each layer
+        write_bytes: Bytes of all output tensors of each layer
+        lifecycle: New, live and terminated tensor counts, one row per layer
+        input_offsets: Offsets of each layer's inputs in input_tensors
+        input_tensors: Input tensor indices of all layers
+        output_offsets: Offsets of each layer's outputs in output_tensors
+        output_tensors: Output tensor indices of all layers
+        kernel_offsets: Offsets of each layer's kernels in kernel_dim_offsets
+        kernel_dim_offsets: Offsets of each kernel shape in kernel_dims
+        kernel_dims: Dimensions of all kernel tensor shapes
+        called_offsets: Offsets of each layer's callees in called_subgraphs
+        called_subgraphs: Subgraph indices called by all layers
+    """
+
+    names: list[str]
+    macs: np.ndarray
+    flash_kb: np.ndarray
+    ram_kb: np.ndarray
+    read_bytes: np.ndarray
+    write_bytes: np.ndarray
+    lifecycle: np.ndarray
+    input_offsets: np.ndarray
+    input_tensors: np.ndarray
+    output_offsets: np.ndarray
+    output_tensors: np.ndarray
+    kernel_offsets: np.ndarray
+    kernel_dim_offsets: np.ndarray
+    kernel_dims: np.ndarray
+    called_offsets: np.ndarray
+    called_subgraphs: np.ndarray
+
+    def __len__(self) -> int:
+        """Number of layers."""
+        return len(self.names)
+
+    @overload
+    def __getitem__(self, layer_idx: int) -> LayerDetail: ...
+
+    @overload
+    def __getitem__(self, layer_idx: slice) -> list[LayerDetail]: ...
+
+    def __getitem__(
+        self, layer_idx: Union[int, slice]
+    ) -> Union[LayerDetail, list[LayerDetail]]:
+        """Build the layer details at an index, or a list of them for a slice."""
+        if isinstance(layer_idx, slice):
+            return [self[idx] for idx in range(*layer_idx.indices(len(self)))]
+        if not -len(self) <= layer_idx < len(self):
+            raise IndexError(f"Layer index {layer_idx} out of range")
+        return LayerDetail.model_validate(self.record(layer_idx % len(self)))
+
+    def __iter__(self) -> Iterator[LayerDetail]:
+        """Build the layer details one at a time in index order."""
+        for record in self.records():
+            yield LayerDetail.model_validate(record)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare layer by layer with any sequence of layer details."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            layer == other_layer
+            for layer, other_layer in zip(self, other, strict=True)
+        )
+
+    @classmethod
+    def from_layers(cls, layers: list[LayerDetail]) -> 'LayerColumns':
+        """
+        Pack layer details into columns.
+
+        Args:
+            layers: Layer details in index order
+
+        Returns:
+            LayerColumns holding the same data
+        """
+        kernels = [layer.kernel_tensors for layer in layers]
+        kernel_offsets = np.zeros(len(layers) + 1, dtype=np.int64)
+        np.cumsum([len(shapes) for shapes in kernels], out=kernel_offsets[1:])
+        kernel_dim_offsets, kernel_dims = ragged(
+            shape for shapes in kernels for shape in shapes
+        )
+        input_offsets, input_tensors = ragged(layer.input_tensors for layer in layers)
+        output_offsets, output_tensors = ragged(
+            layer.output_tensors for layer in layers
+        )
+        called_offsets, called_subgraphs = ragged(
+            layer.called_subgraphs for layer in layers
+        )
+        return cls(
+            names=[layer.name for layer in layers],
+            macs=np.array([layer.macs for layer in layers], dtype=np.int64),
+            flash_kb=np.array([layer.flash_kb for layer in layers], dtype=np.float64),
+            ram_kb=np.array([layer.ram_kb for layer in layers], dtype=np.float64),
+            read_bytes=np.array([layer.read_bytes for layer in layers], dtype=np.int64),
+            write_bytes=np.array([layer.write_bytes for layer in layers],
+                                 dtype=np.int64),
+            lifecycle=np.array([
+                (layer.lifecycle.new, layer.lifecycle.live, layer.lifecycle.terminated)
+                for layer in layers
+            ], dtype=np.int64).reshape(-1, 3),
+            input_offsets=input_offsets,
+            input_tensors=input_tensors,
+            output_offsets=output_offsets,
+            output_tensors=output_tensors,
+            kernel_offsets=kernel_offsets,
+            kernel_dim_offsets=kernel_dim_offsets,
+            kernel_dims=kernel_dims,
+            called_offsets=called_offsets,
+            called_subgraphs=called_subgraphs
+        )
+
+    def record(self, layer_idx: int) -> dict[str, Any]:
+        """
+        Get one layer as plain data.
+
+        Args:
+            layer_idx: Index of the layer
+
+        Returns:
+            Dictionary with the fields of `LayerDetail.model_dump()`
+        """
+        def items(offsets: np.ndarray, flat: np.ndarray, idx: int) -> list[int]:
+            return flat[offsets[idx]:offsets[idx + 1]].tolist()
+
+        new, live, terminated = self.lifecycle[layer_idx].tolist()
+        return {
+            'index': layer_idx,
+            'name': self.names[layer_idx],
+            'macs': int(self.macs[layer_idx]),
+            'flash_kb': float(self.flash_kb[layer_idx]),
+            'kernel_tensors': [
+                items(self.kernel_dim_offsets, self.kernel_dims, kernel_idx)
+                for kernel_idx in range(self.kernel_offsets[layer_idx],
+                                        self.kernel_offsets[layer_idx + 1])
+            ],
+            'ram_kb': float(self.ram_kb[layer_idx]),
+            'read_bytes': int(self.read_bytes[layer_idx]),
+            'write_bytes': int(self.write_bytes[layer_idx]),
+            'input_tensors': items(self.input_offsets, self.input_tensors, layer_idx),
+            'output_tensors': items(self.output_offsets, self.output_tensors,
+                                    layer_idx),
+            'lifecycle': {'new': new, 'live': live, 'terminated': terminated},
+            'called_subgraphs': items(self.called_offsets, self.called_subgraphs,
+                                      layer_idx),
+        }
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all layers as plain data without building them at once.
+
+        Yields:
+            Layer records in index order, see `record`
+        """
+        for layer_idx in range(len(self)):
+            yield self.record(layer_idx)
+
+
+class InputTensorDetail(BaseModel):
+    """
+    Shape, type and quantization of one model input tensor.
+    
+    Attributes:
+        index: Tensor index in the primary subgraph
+        name: Tensor name
+        shape: Tensor dimensions, batch first
+        dtype: Data type string (e.g., 'int8', 'float32')
+        scale: Quantization scales, one per tensor or per channel, empty
+            if the tensor is not quantized
+        zero_point: Quantization zero points, one per scale
+        quantized_dimension: Dimension the scales apply to if per channel
+    """
+    
+    model_config = ConfigDict(
+        validate_assignment=True,
+        extra='forbid',
+        str_strip_whitespace=True
+    )
+    
+    index: int = Field(ge=0, description="Tensor index in the primary subgraph")
+    name: str = Field(default="", description="Tensor name")
+    shape: list[int] = Field(description="Tensor dimensions, batch first")
+    dtype: str = Field(min_length=1, description="Tensor data type")
+    scale: list[float] = Field(
+        default_factory=list, description="Quantization scales"
+    )
+    zero_point: list[int] = Field(
+        default_factory=list, description="Quantization zero points"
+    )
+    quantized_dimension: int = Field(
+        default=0, ge=0, description="Dimension of per-channel quantization"
+    )
 
 
 class ModelDetails(BaseModel):
@@ -187,6 +449,30 @@ class ModelDetails(BaseModel):
         ge=0.0, 
         description="Total parameter storage requirements (bytes, precise)"
     )
+    arena_size_kb: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Planned tensor arena size including alignment and "
+                    "fragmentation (KB)"
+    )
+    arena_fragmentation: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of the planned arena not used by live tensors "
+                    "at the worst execution step"
+    )
+    reordered_peak_ram_kb: float | None = Field(
+        default=None,
+        ge=0.0,
+        description="Peak runtime memory with the operators in "
+                    "`reordered_operators` order (KB), if searched"
+    )
+    reordered_operators: list[int] = Field(
+        default_factory=list,
+        description="Operator execution order with the lowest peak memory "
+                    "found, if searched"
+    )
     
     # === Performance and Computational Characteristics ===
     total_macs: int = Field(
@@ -197,8 +483,17 @@ class ModelDetails(BaseModel):
         ge=0, 
         description="Number of computational layers in the model"
     )
-    layer_details: list[LayerDetail] = Field(
-        description="Detailed analysis for each layer in execution order"
+    layer_details: Sequence[LayerDetail] = Field(
+        description="Detailed analysis for each layer in execution order, "
+                    "kept as LayerColumns by the parser"
+    )
+    input_details: list[InputTensorDetail] = Field(
+        default_factory=list,
+        description="Shape, type and quantization of each model input"
+    )
+    output_tensors: list[int] = Field(
+        default_factory=list,
+        description="Indices of the model's output tensors"
     )
     execution_schedule: list[dict[str, Any]] = Field(
         default_factory=list,
@@ -211,28 +506,33 @@ class ModelDetails(BaseModel):
         description="Any parsing errors or analysis warnings encountered"
     )
 
-    @field_validator('layer_details')
+    @field_validator('layer_details', mode='wrap')
     @classmethod
     def validate_layer_details_consistency(
-        cls, v: list[LayerDetail]
-    ) -> list[LayerDetail]:
+        cls, v: Any, handler: ValidatorFunctionWrapHandler
+    ) -> Sequence[LayerDetail]:
         """
         Validate layer details for structural consistency and completeness.
         
         Ensures that layer indices are sequential starting from 0 and that
         no duplicate indices exist. This validation prevents analysis errors
         and ensures predictable layer ordering for visualization and 
-        optimization.
+        optimization. LayerColumns are indexed by position and kept as they
+        are, so their layers are not built here.
         
         Args:
-            v: List of layer detail objects to validate
+            v: Layer detail objects or LayerColumns to validate
+            handler: Pydantic validation of the layer detail sequence
             
         Returns:
-            Validated list of layer details
+            Validated list of layer details, or the LayerColumns
             
         Raises:
             ValueError: If layer indices are duplicated or non-sequential
         """
+        if isinstance(v, LayerColumns):
+            return v
+        v = handler(v)
         if not v:
             return v
         
@@ -253,6 +553,21 @@ class ModelDetails(BaseModel):
         
         return v
 
+    @field_serializer('layer_details')
+    def serialize_layer_details(
+        self, layer_details: Sequence[LayerDetail]
+    ) -> list[dict[str, Any]]:
+        """
+        Serialize the layer details as plain records.
+        
+        Args:
+            layer_details: Layer detail objects or LayerColumns
+            
+        Returns:
+            One dictionary per layer in index order
+        """
+        return list(self._layer_records())
+
     def model_post_init(self, context: Any, /) -> None:
         """
         Perform comprehensive validation after model initialization.
@@ -368,6 +683,11 @@ class ModelDetails(BaseModel):
         size_mb = self.model_size_on_disk_kb / self._BYTES_TO_KB_DIVISOR
         print(f"File size: {size_mb:.1f} MB")
         print(f"Peak RAM usage: {self.model_peak_ram_kb:.0f} KB")
+        if self.reordered_peak_ram_kb is not None:
+            print(f"Peak RAM with reordering: {self.reordered_peak_ram_kb:.0f} KB")
+        if self.arena_size_kb:
+            print(f"Planned arena: {self.arena_size_kb:.0f} KB "
+                  f"({self.arena_fragmentation:.0%} fragmentation)")
         print(f"Computational load: {self.total_macs/1e6:.1f}M MACs")
         print(f"Architecture: {self.layer_count} layers")
         print(f"Data precision: {self.target_dtype}")
@@ -823,6 +1143,8 @@ class ModelDetails(BaseModel):
             'memory_requirements': {
                 'flash_kb': round(self.model_total_param_memory_b/1024, 1),
                 'model_peak_ram_kb': round(self.model_peak_ram_kb, 1),
+                'arena_kb': round(self.arena_size_kb, 1),
+                'arena_fragmentation': round(self.arena_fragmentation, 3),
                 'largest_layer_kb': round(largest_layer_memory, 1),
             },
             'computational_profile': {
@@ -866,27 +1188,27 @@ class ModelDetails(BaseModel):
             validation_issues.append("Invalid negative RAM usage value")
         
         # Layer sequence validation
-        for i, layer in enumerate(self.layer_details):
-            if layer.index != i:
+        calculated_total_flash = 0.0
+        for i, (index, macs, flash_kb, ram_kb) in enumerate(self._layer_metrics()):
+            if index != i:
                 validation_issues.append(
                     f"Layer sequence error at position {i}: "
-                    f"expected index {i}, found {layer.index}"
+                    f"expected index {i}, found {index}"
                 )
             
             # Individual layer validation
-            if layer.macs < 0:
+            if macs < 0:
                 validation_issues.append(f"Layer {i}: negative MAC count")
             
-            if layer.flash_kb < 0:
+            if flash_kb < 0:
                 validation_issues.append(f"Layer {i}: negative flash usage")
             
-            if layer.ram_kb < 0:
+            if ram_kb < 0:
                 validation_issues.append(f"Layer {i}: negative RAM usage")
+            
+            calculated_total_flash += flash_kb
         
         # Cross-validation checks
-        calculated_total_flash = sum(
-            layer.flash_kb for layer in self.layer_details
-        )
         flash_discrepancy = abs(
             calculated_total_flash - (self.model_total_param_memory_b/1024)
         )
@@ -936,6 +1258,9 @@ class ModelDetails(BaseModel):
         """
         Save complete analysis to JSON file for persistence.
         
+        The file is written incrementally, one layer record at a time, so
+        the memory needed does not grow with a serialized copy of the model.
+        
         Args:
             file_path: Destination file path for saved analysis
             
@@ -944,8 +1269,13 @@ class ModelDetails(BaseModel):
         """
         file_path = Path(file_path)
         try:
-            with file_path.open('w', encoding='utf-8') as f:
-                json.dump(self.export_to_dict(), f, indent=2, default=str)
+            # Layers are serialized one at a time, never as one document
+            write_analysis_json(
+                file_path,
+                self.model_dump(exclude={'layer_details', 'execution_schedule'}),
+                self._layer_records(),
+                self.execution_schedule
+            )
         except Exception as e:
             raise OSError(
                 f"Failed to save analysis to {file_path}: {e}"
@@ -977,6 +1307,25 @@ class ModelDetails(BaseModel):
 
     # === Utility Methods for Data Processing ===
 
+    def _layer_records(self) -> Iterator[dict[str, Any]]:
+        """Layer details as plain records, one at a time."""
+        if isinstance(self.layer_details, LayerColumns):
+            return self.layer_details.records()
+        return (layer.model_dump() for layer in self.layer_details)
+
+    def _layer_metrics(self) -> Iterator[tuple[int, int, float, float]]:
+        """Index, MACs, flash KB and RAM KB of each layer, without building it."""
+        if isinstance(self.layer_details, LayerColumns):
+            columns = self.layer_details
+            return zip(
+                range(len(columns)), columns.macs.tolist(),
+                columns.flash_kb.tolist(), columns.ram_kb.tolist(), strict=True
+            )
+        return (
+            (layer.index, layer.macs, layer.flash_kb, layer.ram_kb)
+            for layer in self.layer_details
+        )
+
     @staticmethod
     def _format_large_numbers(value: int, unit: str = "") -> str:
         """
@@ -1065,6 +1414,93 @@ class ModelDetails(BaseModel):
         }
 
 
+class ModelParseResult(BaseModel):
+    """
+    Outcome of parsing one model as part of a batch.
+    
+    Batch parsing isolates failures per model, so each result carries either
+    the model analysis or the error that prevented it.
+    
+    Attributes:
+        model_path: Path of the parsed model file as given
+        model_details: Complete model analysis, or None if parsing failed
+        error: Error message if parsing failed
+        error_code: Machine-readable error classification if parsing failed
+    """
+    
+    model_config = ConfigDict(
+        validate_assignment=True,
+        extra='forbid',
+        str_strip_whitespace=True
+    )
+    
+    model_path: str = Field(
+        min_length=1,
+        description="Path of the parsed model file as given"
+    )
+    model_details: ModelDetails | None = Field(
+        default=None,
+        description="Complete model analysis, or None if parsing failed"
+    )
+    error: str = Field(
+        default="",
+        description="Error message if parsing failed"
+    )
+    error_code: str | None = Field(
+        default=None,
+        description="Machine-readable error classification if parsing failed"
+    )
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the model was parsed successfully."""
+        return self.model_details is not None
+
+
+def write_analysis_json(
+    file_path: Union[str, Path],
+    header: dict[str, Any],
+    layer_records: Iterable[dict[str, Any]],
+    schedule_records: Iterable[dict[str, Any]]
+) -> None:
+    """
+    Write a model analysis to a JSON file one record at a time.
+    
+    Produces the same document as `ModelDetails.model_dump()`, readable with
+    `ModelDetails.load_analysis`, but only one layer or execution step is
+    serialized at any time. Records can come from a generator, such as
+    `LayerColumns.records()`, so the complete analysis never has to exist
+    as Python objects.
+    
+    Args:
+        file_path: Destination file path
+        header: Model-level fields, without layer details and schedule
+        layer_records: Layer records in index order
+        schedule_records: Execution schedule entries in step order
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    def write_array(f: Any, name: str, records: Iterable[dict[str, Any]]) -> None:
+        f.write(f',\n  {json.dumps(name)}: [')
+        separator = '\n    '
+        for record in records:
+            f.write(separator)
+            f.write(json.dumps(record, default=str))
+            separator = ',\n    '
+        f.write('\n  ]' if separator != '\n    ' else ']')
+    
+    with Path(file_path).open('w', encoding='utf-8') as f:
+        fields = [
+            f'  {json.dumps(name)}: {json.dumps(value, default=str)}'
+            for name, value in header.items()
+        ]
+        f.write('{\n' + ',\n'.join(fields))
+        write_array(f, 'layer_details', layer_records)
+        write_array(f, 'execution_schedule', schedule_records)
+        f.write('\n}\n')
+
+
 def display_model_analysis(
     model_details: Union[ModelDetails, Any], 
     format_type: str = "summary", 
@@ -0,0 +1,100 @@
+"""
+Columnar Tensor Table.
+
+Flat, array-based view of the tensors and operators of one TensorFlow Lite
+subgraph. FlatBuffer accessors decode a field on every call, so reading the
+same shapes and types from several analyses dominates parse time on large
+models. The table reads every tensor and operator exactly once and exposes the
+results as NumPy columns indexed by tensor or operator position.
+
+Copyright (c) 2025 Analog Devices, Inc. All Rights Reserved.
+Released under the terms of the "LICENSE.md" file in the root directory.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class TensorTable:
+    """
+    Per-subgraph tensor properties stored as parallel columns.
+
+    Tensor columns are indexed by tensor index and operator columns by
+    operator index. Producer and consumer entries are -1 where no operator
+    produces or consumes the tensor.
+
+    Attributes:
+        shapes: Tensor shapes exactly as stored in the model
+        ranks: Number of dimensions of each tensor, 0 for a missing shape
+        dims: Shape of each tensor as one row, padded with ones on the
+            right to at least four columns
+        elements: Number of elements in each tensor
+        type_codes: TensorFlow Lite TensorType enum value of each tensor
+        type_sizes: Size in bytes of one element of each tensor
+        nbytes: Storage size of each tensor in bytes
+        is_parameter: Whether the tensor holds model parameters
+        producer: Index of the last operator that outputs each tensor
+        last_consumer: Index of the last operator that reads each tensor
+        op_inputs: Input tensor indices of each operator
+        op_outputs: Output tensor indices of each operator
+        graph_inputs: Indices of the subgraph input tensors
+        graph_outputs: Indices of the subgraph output tensors
+    """
+
+    shapes: list[np.ndarray]
+    ranks: np.ndarray
+    dims: np.ndarray
+    elements: np.ndarray
+    type_codes: np.ndarray
+    type_sizes: np.ndarray
+    nbytes: np.ndarray
+    is_parameter: np.ndarray
+    producer: np.ndarray
+    last_consumer: np.ndarray
+    op_inputs: list[np.ndarray]
+    op_outputs: list[np.ndarray]
+    graph_inputs: np.ndarray
+    graph_outputs: np.ndarray
+
+    @property
+    def num_tensors(self) -> int:
+        """Number of tensors in the subgraph."""
+        return len(self.elements)
+
+    @property
+    def num_operators(self) -> int:
+        """Number of operators in the subgraph."""
+        return len(self.op_inputs)
+
+    def parameter_indices(self) -> set[int]:
+        """
+        Get indices of parameter tensors (weights, biases, constants).
+
+        Returns:
+            Set of tensor indices that contain model parameters
+        """
+        return set(np.flatnonzero(self.is_parameter).tolist())
+
+    def lifespans(self) -> dict[int, dict[str, int]]:
+        """
+        Get creation and last-use points of all operator outputs.
+
+        Tensors that are never read after being produced die at their
+        producing operator.
+
+        Returns:
+            Dictionary mapping tensor_id to lifecycle information:
+            {'birth': operator_index, 'death': operator_index}
+        """
+        produced = np.flatnonzero(self.producer >= 0)
+        births = self.producer[produced]
+        deaths = np.where(self.last_consumer[produced] >= 0,
+                          self.last_consumer[produced], births)
+        return {
+            tensor_idx: {'birth': birth, 'death': death}
+            for tensor_idx, birth, death in zip(
+                produced.tolist(), births.tolist(), deaths.tolist(), strict=True
+            )
+        }
@@ -15,8 +15,10 @@ import logging
 import sys
 
 from cfsai_resource_profiler import TFLiteResourceProfiler
+from cfsai_tflite.cache import ParseCache
 from cfsai_types.hardware_profile import HardwareProfile
 from cfsai_types.logging import setup_logger
+from cfsai_types.worker import load_config, serve
 
 logger = logging.getLogger("cfsai_resource_profiler")
 
@@ -25,17 +27,31 @@ def _run_profile(
     model_path: str, 
     profile: HardwareProfile, 
     json_file: str, 
-    text_file: str
+    text_file: str,
+    compat_json_file: str | None = None,
+    dataset_path: str | None = None
 ) -> None:
-    """Run resource profiler."""
+    """Run resource profiler, and compatibility analyzer in the same pass."""
     # Initialize resource profiler with performance characteristics
     profiler = TFLiteResourceProfiler()
 
     # Perform comprehensive resource analysis with hardware context
-    profiling_report = profiler.analyze_model(
-        model_path,
-        hardware_profile=profile
-    )
+    compatibility_report = None
+    if compat_json_file:
+        analysis_report = profiler.analyze_model_with_compatibility(
+            model_path,
+            hardware_profile=profile,
+            dataset_path=dataset_path
+        )
+        compatibility_report = analysis_report.compatibility_report
+        profiling_report = analysis_report.profile_report
+        compatibility_report.save_as_json(compat_json_file)
+        compatibility_report.print_report()
+    else:
+        profiling_report = profiler.analyze_model(
+            model_path,
+            hardware_profile=profile
+        )
 
     if json_file:
         profiling_report.save_as_json(json_file)
@@ -44,29 +60,113 @@ def _run_profile(
     if not json_file and not text_file:
         profiling_report.visualize_resource_profile()
 
+    if compatibility_report and compatibility_report.has_critical_issues():
+        # Same exit code as the compatibility analyzer
+        sys.exit(10)
+
+
+def _run_calibration(
+    model_path: str,
+    profile: HardwareProfile,
+    timings_file: str,
+    profile_out: str
+) -> None:
+    """Fit the hardware profile to measured timings and write it out."""
+    profiler = TFLiteResourceProfiler()
+    result = profiler.calibrate_hardware_profile(model_path, profile, timings_file)
+
+    logger.info(
+        f"Calibrated on {result.measured_layers} layers: mean error "
+        f"{result.error_before_percent:.1f}% -> {result.error_after_percent:.1f}%"
+    )
+    profile_json = json.dumps(
+        result.hardware_profile.model_dump(mode="json"), indent=2
+    )
+    if profile_out:
+        with open(profile_out, "w", encoding="utf-8") as f:
+            f.write(profile_json + "\n")
+    else:
+        print(profile_json)
+
+
+def _handle_request(params: dict) -> None:
+    """Run resource profiler or calibration for one worker request."""
+    profile = HardwareProfile(**load_config(params))
+    if params.get('calibrate'):
+        _run_calibration(
+            params['model'], profile, params['calibrate'], params.get('profile_out')
+        )
+    else:
+        _run_profile(
+            params['model'],
+            profile,
+            params.get('json_file'),
+            params.get('text_file'),
+            params.get('compat_json_file'),
+            params.get('dataset')
+        )
+
 
 if __name__ == "__main__":
     """
     If invoked directly, construct input from params.
     """
     parser = argparse.ArgumentParser()
-    parser.add_argument('--file', required=True, help='Config file')
-    parser.add_argument('--model', required=True, help='Model file')
+    parser.add_argument('--file', help='Config file')
+    parser.add_argument('--model', help='Model file')
     parser.add_argument('--json-file', help='Output json file')
     parser.add_argument('--text-file', help='Output text file')
+    parser.add_argument(
+        '--compat-json-file',
+        help='Also run the compatibility analyzer in the same pass and write its '
+             'json report here'
+    )
+    parser.add_argument(
+        '--dataset', help='Dataset file for the compatibility analysis (optional)'
+    )
+    parser.add_argument(
+        '--calibrate',
+        metavar='TIMINGS',
+        help='Fit the hardware profile to measured layer timings instead of profiling'
+    )
+    parser.add_argument(
+        '--profile-out', help='Output file for the calibrated hardware profile'
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Serve JSON-RPC requests from stdin until it closes'
+    )
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
     args = parser.parse_args()
+    if not args.serve and not (args.file and args.model):
+        parser.error('--file and --model are required unless --serve is given')
 
     setup_logger(debug_level=args.verbose)
 
     logger.debug(f"Invoking resource profiler with: \n{args}")
 
+    if args.serve:
+        ParseCache.share_in_memory()
+        serve(_handle_request)
+        sys.exit(0)
+
     try:
         # Read JSON and parse into Pydantic model
         with open(args.file) as f:
             data = json.load(f)
             profile = HardwareProfile(**data)
-            _run_profile(args.model, profile, args.json_file, args.text_file)
+        if args.calibrate:
+            _run_calibration(args.model, profile, args.calibrate, args.profile_out)
+        else:
+            _run_profile(
+                args.model,
+                profile,
+                args.json_file,
+                args.text_file,
+                args.compat_json_file,
+                args.dataset
+            )
     except Exception as e:
         logger.error(f'{e.__class__.__name__}{e}')
         sys.exit(1)
@@ -0,0 +1,228 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cost Model Calibration Helpers.
+
+Reads measured on-target timings and fits cost coefficients to them, for
+`TFLiteResourceProfiler.calibrate_hardware_profile`.
+
+Supported timing logs:
+- TFLM MicroProfiler text output ("CONV_2D took 1234 ticks (1 ms).")
+- TFLM MicroProfiler CSV output ("Event","Tag","Ticks")
+- CSV files with a cycles or ticks column, and optionally a layer index and
+  an operator column
+- The "Approximate inference time: N us" line printed by izer-generated
+  firmware built with CNN_INFERENCE_TIMER, which only gives whole-inference
+  timings
+
+Per-layer timings are matched to the parser's layers in execution order, so
+logs of several inferences are averaged per layer.
+"""
+
+import csv
+import io
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from cfsai_resource_profiler.exceptions import CalibrationError
+
+_TFLM_LOG_LINE = re.compile(r"^\s*(?P<tag>\S+) took (?P<ticks>\d+) ticks")
+_INFERENCE_TIME_LINE = re.compile(
+    r"Approximate inference time:\s*(?P<us>\d+(?:\.\d+)?)\s*us"
+)
+_CYCLE_COLUMNS = ("cycles", "ticks")
+_INDEX_COLUMNS = ("layer", "layer_idx", "index")
+_TAG_COLUMNS = ("tag", "operator", "op", "name")
+
+
+@dataclass(frozen=True)
+class LayerTiming:
+    """
+    One measured layer execution.
+
+    Attributes:
+        cycles: Measured cycles (or profiler ticks) of the execution
+        tag: Operator name logged with the measurement, if any
+        layer_idx: Layer index logged with the measurement, if any
+    """
+
+    cycles: float
+    tag: Optional[str] = None
+    layer_idx: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class TimingLog:
+    """
+    Measurements read from a timing log.
+
+    Attributes:
+        layers: Per-layer measurements in logged order
+        inference_us: Whole-inference times in microseconds
+    """
+
+    layers: list[LayerTiming] = field(default_factory=list)
+    inference_us: list[float] = field(default_factory=list)
+
+
+def _read_csv_timings(text: str) -> list[LayerTiming]:
+    """Read per-layer timings from CSV text with a header row."""
+    reader = csv.reader(io.StringIO(text))
+    header = [column.strip().strip('"').lower() for column in next(reader, [])]
+
+    def column(names: tuple[str, ...]) -> Optional[int]:
+        return next((header.index(name) for name in names if name in header), None)
+
+    cycles_col = column(_CYCLE_COLUMNS)
+    if cycles_col is None:
+        raise CalibrationError(
+            f"Timing CSV has no {' or '.join(_CYCLE_COLUMNS)} column",
+            error_code="INVALID_TIMINGS",
+        )
+    index_col = column(_INDEX_COLUMNS)
+    tag_col = column(_TAG_COLUMNS)
+
+    timings = []
+    for row in reader:
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        try:
+            timings.append(LayerTiming(
+                cycles=float(row[cycles_col]),
+                tag=row[tag_col].strip() if tag_col is not None else None,
+                layer_idx=int(row[index_col]) if index_col is not None else None,
+            ))
+        except (IndexError, ValueError) as e:
+            raise CalibrationError(
+                f"Invalid timing CSV row {row}: {e}", error_code="INVALID_TIMINGS"
+            ) from e
+    return timings
+
+
+def read_timing_log(path: Union[str, Path]) -> TimingLog:
+    """
+    Read measured timings from a log file.
+
+    Args:
+        path: Path to the timing log
+
+    Returns:
+        TimingLog with the per-layer and whole-inference measurements
+
+    Raises:
+        CalibrationError: If the file has no measurements in a known format
+    """
+    text = Path(path).read_text(encoding="utf-8", errors="replace")
+
+    layers = []
+    inference_us = []
+    for line in text.splitlines():
+        if match := _TFLM_LOG_LINE.match(line):
+            layers.append(LayerTiming(
+                cycles=float(match["ticks"]), tag=match["tag"]
+            ))
+        elif match := _INFERENCE_TIME_LINE.search(line):
+            inference_us.append(float(match["us"]))
+
+    if not layers and not inference_us:
+        # "Event","Tag","Ticks" is the header of MicroProfiler::LogCsv
+        layers = _read_csv_timings(text)
+
+    if not layers and not inference_us:
+        raise CalibrationError(
+            f"No timings found in {path}", error_code="INVALID_TIMINGS"
+        )
+    return TimingLog(layers=layers, inference_us=inference_us)
+
+
+def measured_layer_cycles(
+    timing_log: TimingLog, layer_names: list[str]
+) -> list[Optional[float]]:
+    """
+    Average the measured cycles of each layer.
+
+    Measurements without a layer index are assigned to layers in execution
+    order, wrapping around for logs of several inferences.
+
+    Args:
+        timing_log: Measurements read from a timing log
+        layer_names: Operator name of each layer of the model
+
+    Returns:
+        Mean measured cycles of each layer, None for unmeasured layers
+
+    Raises:
+        CalibrationError: If a measurement does not match its layer
+    """
+    num_layers = len(layer_names)
+    totals = np.zeros(num_layers)
+    counts = np.zeros(num_layers, dtype=np.int64)
+    for event_idx, timing in enumerate(timing_log.layers):
+        layer_idx = (
+            timing.layer_idx if timing.layer_idx is not None
+            else event_idx % max(num_layers, 1)
+        )
+        if not 0 <= layer_idx < num_layers:
+            raise CalibrationError(
+                f"Timing for layer {layer_idx} but the model has {num_layers} layers",
+                error_code="TIMINGS_MISMATCH",
+            )
+        if timing.tag and timing.tag.upper() != layer_names[layer_idx].upper():
+            raise CalibrationError(
+                f"Timing {event_idx} is for {timing.tag} but layer {layer_idx} "
+                f"is {layer_names[layer_idx]}",
+                error_code="TIMINGS_MISMATCH",
+                details={"event": event_idx, "layer_index": layer_idx},
+            )
+        totals[layer_idx] += timing.cycles
+        counts[layer_idx] += 1
+
+    return [
+        float(total / count) if count else None
+        for total, count in zip(totals.tolist(), counts.tolist(), strict=True)
+    ]
+
+
+def fit_coefficients(features: np.ndarray, measured: np.ndarray) -> np.ndarray:
+    """
+    Fit positive cost coefficients by least squares on relative error.
+
+    Each row is divided by its measurement, so small and large layers are
+    fitted equally well. Columns whose coefficient comes out non-positive are
+    dropped and the rest refitted, since a cost cannot be negative.
+
+    Args:
+        features: (measurements x coefficients) feature matrix
+        measured: Measured cycles of each row
+
+    Returns:
+        Coefficient of each column, zero for dropped or unused columns
+    """
+    weights = 1.0 / np.maximum(measured, 1.0)
+    weighted_features = features * weights[:, None]
+    weighted_measured = measured * weights
+
+    active = np.flatnonzero(np.any(features > 0, axis=0))
+    coefficients = np.zeros(features.shape[1])
+    while active.size:
+        solution, *_ = np.linalg.lstsq(
+            weighted_features[:, active], weighted_measured, rcond=None
+        )
+        if np.all(solution > 0):
+            coefficients[active] = solution
+            break
+        active = active[solution > 0]
+    return coefficients
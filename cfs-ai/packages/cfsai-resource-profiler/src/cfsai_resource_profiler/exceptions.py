@@ -34,3 +34,6 @@ class ModelAnalysisError(ResourceProfilerError):
 
 class HardwareProfileError(ResourceProfilerError):
     """Raised when hardware profile is invalid."""
+
+class CalibrationError(ResourceProfilerError):
+    """Raised when measured timings cannot be used for calibration."""
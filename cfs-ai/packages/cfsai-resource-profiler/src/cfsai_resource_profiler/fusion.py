@@ -0,0 +1,157 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Layer Fusion Pass.
+
+Groups chains of parser layers that a target runs as one fused layer, such as
+a convolution followed by its activation or pooling. Within a fused group the
+intermediate tensors are never written to memory, so they add neither memory
+traffic nor RAM.
+
+A fusion rule is a list of steps, each listing the operators allowed at that
+position of the chain. A rule fuses the longest run of at least two
+consecutive layers that matches a prefix of its steps, provided each layer's
+single output is only consumed by the next layer of the run and is not a
+model output.
+"""
+
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from cfsai_model_parser.schemas import LayerDetail
+
+# Used for hardware profiles without their own fusion rules
+DEFAULT_FUSION_RULES: list[list[list[str]]] = [
+    [
+        ["CONV_2D", "DEPTHWISE_CONV_2D", "TRANSPOSE_CONV", "FULLY_CONNECTED"],
+        ["RELU", "RELU6", "RELU_N1_TO_1", "LEAKY_RELU", "LOGISTIC", "TANH",
+         "HARD_SWISH"],
+    ],
+]
+
+
+@dataclass(frozen=True)
+class FusedLayer:
+    """
+    One layer of the fused model.
+
+    Attributes:
+        layer_indices: Indices of the parser layers in the group, in order
+        intermediate_tensors: Tensors passed between the group's layers,
+            which are not stored in memory
+    """
+
+    layer_indices: list[int]
+    intermediate_tensors: list[int]
+
+
+def fused_layer_name(fused_layer: FusedLayer, layers: list[LayerDetail]) -> str:
+    """Name a fused layer after its operators, e.g. 'CONV_2D+RELU'."""
+    return "+".join(layers[idx].name for idx in fused_layer.layer_indices)
+
+
+def fuse_layers(
+    layers: list[LayerDetail],
+    fusion_rules: list[list[list[str]]],
+    graph_outputs: Collection[int] = (),
+) -> list[FusedLayer]:
+    """
+    Group layers into fused layers.
+
+    Args:
+        layers: Layer details in execution order
+        fusion_rules: Operator chains to fuse, see module docstring
+        graph_outputs: Model output tensors, which must stay in memory
+
+    Returns:
+        Fused layers covering every layer exactly once, in execution order
+    """
+    consumers: dict[int, int] = {}
+    for layer in layers:
+        for tensor_idx in set(layer.input_tensors):
+            consumers[tensor_idx] = consumers.get(tensor_idx, 0) + 1
+
+    graph_outputs = set(graph_outputs)
+
+    def passes_to_next(layer_idx: int) -> bool:
+        # Single output read only by the next layer
+        outputs = [t for t in layers[layer_idx].output_tensors if t >= 0]
+        return (
+            len(outputs) == 1
+            and outputs[0] not in graph_outputs
+            and consumers.get(outputs[0], 0) == 1
+            and outputs[0] in layers[layer_idx + 1].input_tensors
+        )
+
+    steps_of_rules = [
+        [{name.upper() for name in step} for step in rule] for rule in fusion_rules
+    ]
+
+    fused_layers = []
+    layer_idx = 0
+    while layer_idx < len(layers):
+        length = 1
+        for steps in steps_of_rules:
+            matched = 0
+            while (
+                matched < len(steps)
+                and layer_idx + matched < len(layers)
+                and layers[layer_idx + matched].name.upper() in steps[matched]
+                and (matched == 0 or passes_to_next(layer_idx + matched - 1))
+            ):
+                matched += 1
+            if matched >= 2:
+                length = max(length, matched)
+
+        indices = list(range(layer_idx, layer_idx + length))
+        fused_layers.append(FusedLayer(
+            layer_indices=indices,
+            intermediate_tensors=[
+                next(t for t in layers[idx].output_tensors if t >= 0)
+                for idx in indices[:-1]
+            ],
+        ))
+        layer_idx += length
+    return fused_layers
+
+
+def fused_memory_schedule(
+    layers: list[LayerDetail],
+    fused_layers: list[FusedLayer],
+    memory_b: list[float],
+    bytes_per_kb: int,
+) -> list[float]:
+    """
+    Memory in use at each fused layer.
+
+    Each intermediate tensor is live from its producer through its consumer
+    in the unfused schedule, and is removed from both steps.
+
+    Args:
+        layers: Layer details in execution order
+        fused_layers: Fused layers from `fuse_layers`
+        memory_b: Memory in use at each unfused step in bytes
+        bytes_per_kb: Bytes per KB of the layers' RAM
+
+    Returns:
+        Memory in use at each fused layer in bytes
+    """
+    schedule = []
+    for fused_layer in fused_layers:
+        step_memory = [memory_b[idx] for idx in fused_layer.layer_indices]
+        for position, producer_idx in enumerate(fused_layer.layer_indices[:-1]):
+            # Producer's output memory is the single intermediate tensor
+            tensor_b = layers[producer_idx].ram_kb * bytes_per_kb
+            step_memory[position] -= tensor_b
+            step_memory[position + 1] -= tensor_b
+        schedule.append(max(max(step_memory), 0.0))
+    return schedule
@@ -29,6 +29,9 @@ import time
 from pathlib import Path
 from typing import Any, Optional, Union
 
+import numpy as np
+from cfsai_compatibility_analyzer import CompatibilityAnalyzer
+from cfsai_compatibility_analyzer.exceptions import CompatibilityAnalysisError
 from cfsai_model_parser.exceptions import (
     ModelFileNotFoundError,
     ModelFormatNotSupportedError,
@@ -36,24 +39,42 @@ from cfsai_model_parser.exceptions import (
 from cfsai_model_parser.parse_tflm import TFLiteParser
 from cfsai_model_parser.schemas import LayerDetail, ModelDetails
 
+from cfsai_resource_profiler.calibration import (
+    TimingLog,
+    fit_coefficients,
+    measured_layer_cycles,
+    read_timing_log,
+)
 from cfsai_resource_profiler.exceptions import (
+    CalibrationError,
     HardwareProfileError,
     ModelAnalysisError,
     ResourceProfilerError,
 )
+from cfsai_resource_profiler.fusion import (
+    DEFAULT_FUSION_RULES,
+    fuse_layers,
+    fused_layer_name,
+    fused_memory_schedule,
+)
 from cfsai_resource_profiler.schemas import (
     PROFILE_REPORT_VERSION,
+    CalibrationResult,
     ErrorNote,
     HardwareMetrics,
     LayerPerformance,
     LayerwiseOptimizationOpportunity,
     MemoryAnalysis,
+    ModelAnalysisReport,
     ModelSummary,
     OptimizationOpportunities,
     OptimizationSuggestion,
+    ProfileComparison,
     ResourceProfileReport,
+    TargetComparison,
 )
-from cfsai_types.hardware_profile import HardwareProfile
+from cfsai_tflite.cache import ParseCache
+from cfsai_types.hardware_profile import HardwareProfile, OperatorInfo
 from cfsai_types.report import ReportInfo, ReportType
 
 # Default Configuration
@@ -114,6 +135,41 @@ HIGH_MAC_LAYER_THRESHOLD_PERCENT = 20.0  # Layers contributing >20% of total MAC
 LOW_POWER_CPU_FREQUENCY_MHZ = 100  # Low power embedded processors
 EMBEDDED_CPU_FREQUENCY_MHZ = 500  # Typical embedded performance
 
+# Operator classes, used to price operators without their own OperatorInfo
+OPERATOR_CLASSES = {
+    **dict.fromkeys(
+        ["CONV_2D", "DEPTHWISE_CONV_2D", "TRANSPOSE_CONV", "CONV_3D"], "CONV"
+    ),
+    **dict.fromkeys(["FULLY_CONNECTED", "BATCH_MATMUL"], "FC"),
+    **dict.fromkeys(
+        ["AVERAGE_POOL_2D", "MAX_POOL_2D", "L2_POOL_2D", "MEAN", "SUM",
+         "REDUCE_MAX", "REDUCE_MIN", "REDUCE_PROD"],
+        "POOL",
+    ),
+    **dict.fromkeys(
+        ["ADD", "SUB", "MUL", "DIV", "MAXIMUM", "MINIMUM", "SQUARED_DIFFERENCE",
+         "ADD_N", "POW", "SQRT", "RSQRT", "ABS", "NEG", "FLOOR", "EXP", "LOG"],
+        "ELEMENTWISE",
+    ),
+    **dict.fromkeys(
+        ["RELU", "RELU6", "RELU_N1_TO_1", "LEAKY_RELU", "PRELU", "LOGISTIC",
+         "TANH", "HARD_SWISH", "SOFTMAX", "LOG_SOFTMAX"],
+        "ACTIVATION",
+    ),
+    **dict.fromkeys(
+        ["RESHAPE", "SQUEEZE", "EXPAND_DIMS", "CONCATENATION", "PAD", "PADV2",
+         "TRANSPOSE", "SLICE", "STRIDED_SLICE", "GATHER", "PACK", "UNPACK",
+         "SPLIT", "SPLIT_V", "RESIZE_BILINEAR", "RESIZE_NEAREST_NEIGHBOR"],
+        "DATA_MOVEMENT",
+    ),
+    **dict.fromkeys(["QUANTIZE", "DEQUANTIZE"], "QUANTIZATION"),
+}
+
+# OperatorInfo names with a special meaning
+MAC_OPERATOR_INFO = "MAC"  # Fallback cost of one operation
+MEMORY_OPERATOR_INFO = "MEMORY"  # Cost of one byte of tensor traffic
+ACCELERATOR_INFO_PREFIX = "ACCEL:"  # Prefix of entries for accelerated operators
+
 # Memory Variance Analysis Multipliers
 HIGH_VARIANCE_MULTIPLIER = 1.0  # 100% variance threshold
 CRITICAL_FALLBACK_OVERAGE_PERCENT = 100.0  # Fallback for missing RAM info
@@ -200,6 +256,489 @@ class TFLiteResourceProfiler:
             duration = time.time() - start_time
             self._handle_unexpected_error(e, duration)
 
+    def analyze_model_with_compatibility(
+        self,
+        model_path: Union[str, Path],
+        hardware_profile: HardwareProfile,
+        dataset_path: Optional[Union[str, Path]] = None,
+    ) -> ModelAnalysisReport:
+        """
+        Check a model's compatibility and profile its resources in one pass.
+
+        The model is parsed once, and each layer is checked for compatibility
+        and costed in the same traversal of the layers. The reports are the
+        same as those of `CompatibilityAnalyzer.analyze_model` and
+        `analyze_model`.
+
+        Args:
+            model_path: Path to the TFLite model file
+            hardware_profile: Hardware specifications of the target
+            dataset_path: Optional path to a dataset file for the compatibility
+                memory analysis
+
+        Returns:
+            ModelAnalysisReport with the compatibility and profile reports
+
+        Raises:
+            ModelAnalysisError: If model analysis fails
+            HardwareProfileError: If hardware profile is invalid
+            FileNotFoundError: If model file doesn't exist
+            CompatibilityAnalysisError: If compatibility analysis fails
+        """
+        start_time = time.time()
+        model_path = Path(model_path)
+        errors: list[ErrorNote] = []
+
+        try:
+            self.logger.debug(f"Starting combined analysis of model: {model_path}")
+
+            self._validate_hardware_profile(hardware_profile)
+            parsed_model = self._parse_model(model_path)
+
+            analyzer = CompatibilityAnalyzer()
+            layer_scan = analyzer.start_layer_scan(hardware_profile)
+            for layer in parsed_model.layer_details:
+                analyzer.scan_layer(layer, parsed_model, layer_scan)
+            layer_performance = self._layers_performance(
+                parsed_model.layer_details, hardware_profile, errors
+            )
+
+            compatibility_report = analyzer.analyze_parsed_model(
+                parsed_model, hardware_profile, model_path, dataset_path,
+                layer_scan=layer_scan
+            )
+            profile_report = self._perform_analysis(
+                model_path, parsed_model, hardware_profile, errors,
+                layer_performance=layer_performance
+            )
+
+            analysis_duration = time.time() - start_time
+            self.logger.debug(
+                f"Combined analysis completed successfully in {analysis_duration:.2f}s"
+            )
+            return ModelAnalysisReport(
+                compatibility_report=compatibility_report,
+                profile_report=profile_report,
+            )
+
+        except (HardwareProfileError, ModelAnalysisError, CompatibilityAnalysisError):
+            raise
+        except (FileNotFoundError, ModelFormatNotSupportedError):
+            raise
+        except Exception as e:
+            duration = time.time() - start_time
+            self._handle_unexpected_error(e, duration)
+
+    def analyze_model_across(
+        self,
+        model_path: Union[str, Path],
+        hardware_profiles: list[HardwareProfile],
+    ) -> ProfileComparison:
+        """
+        Compare latency, energy and memory fit of a model across hardware targets.
+
+        The model is parsed once, and the per-layer costs of all targets are
+        computed together as (targets x layers) arrays, with the same cost
+        model as `analyze_model`.
+
+        Args:
+            model_path: Path to the TFLite model file
+            hardware_profiles: Hardware specifications of the targets to compare
+
+        Returns:
+            ProfileComparison with one entry per hardware profile, in order
+
+        Raises:
+            HardwareProfileError: If no profile is given or a profile is invalid
+            ModelAnalysisError: If model analysis fails
+            FileNotFoundError: If model file doesn't exist
+        """
+        model_path = Path(model_path)
+        if not hardware_profiles:
+            raise HardwareProfileError(
+                "No hardware profiles to compare", error_code="MISSING_HW_FIELDS"
+            )
+        for hardware_profile in hardware_profiles:
+            self._validate_hardware_profile(hardware_profile)
+
+        parsed_model = self._parse_model(model_path)
+        layers = getattr(parsed_model, "layer_details", [])
+
+        try:
+            layer_costs = self._estimate_layer_costs(layers, hardware_profiles)
+            model_peak_ram_kb = getattr(parsed_model, "model_peak_ram_kb", 0)
+            model_flash_kb = (
+                getattr(parsed_model, "model_total_param_memory_b", 0)
+                / KILOBYTES_TO_BYTES
+            )
+
+            targets = []
+            for profile_idx, hardware_profile in enumerate(hardware_profiles):
+                available_ram_kb = hardware_profile.ram_size or None
+                ram_utilization_percent, ram_status = self._calculate_memory_status(
+                    model_peak_ram_kb=model_peak_ram_kb,
+                    available_ram_kb=available_ram_kb,
+                    critical_threshold=CRITICAL_MEMORY_THRESHOLD_PERCENT,
+                    warning_threshold=WARNING_MEMORY_THRESHOLD_PERCENT,
+                )
+                has_bandwidth = bool(
+                    hardware_profile.sram_bandwidth or hardware_profile.flash_bandwidth
+                )
+                targets.append(TargetComparison(
+                    target=hardware_profile.target_name(profile_idx),
+                    total_cycles=int(layer_costs["cycles"][profile_idx].sum()),
+                    estimated_latency_ms=float(
+                        layer_costs["latency_ms"][profile_idx].sum()
+                    ),
+                    estimated_energy_uj=float(
+                        layer_costs["energy_uj"][profile_idx].sum()
+                    ),
+                    peak_memory_kb=model_peak_ram_kb,
+                    available_ram_kb=available_ram_kb,
+                    ram_utilization_percent=ram_utilization_percent,
+                    ram_status=ram_status,
+                    fits_flash=(
+                        model_flash_kb <= hardware_profile.flash_size
+                        if hardware_profile.flash_size else None
+                    ),
+                    accelerated_layers=int(
+                        layer_costs["is_accelerated"][profile_idx].sum()
+                    ),
+                    memory_bound_layers=(
+                        int(layer_costs["memory_bound"][profile_idx].sum())
+                        if has_bandwidth else None
+                    ),
+                ))
+        except Exception as e:
+            self.logger.error(f"Target comparison failed: {e}")
+            raise ModelAnalysisError(
+                f"Target comparison failed: {e!s}", error_code="ANALYSIS_FAILED"
+            ) from e
+
+        return ProfileComparison(
+            model_name=model_path.name,
+            model_path=str(model_path),
+            targets=targets,
+        )
+
+    def calibrate_hardware_profile(
+        self,
+        model_path: Union[str, Path],
+        hardware_profile: HardwareProfile,
+        timing_log: Union[str, Path, TimingLog],
+        fit_memory: bool = True,
+    ) -> CalibrationResult:
+        """
+        Fit the cost model of a hardware profile to measured timings.
+
+        With per-layer timings, the cycles per operation of every measured
+        operator type (ACCEL: prefixed for accelerated layers) and, if
+        fit_memory is set, the cycles per byte of tensor traffic are fitted by
+        least squares against the parser's layer features. If the memory cost
+        cannot be fitted with all costs positive, the profile's memory cost is
+        kept and only the operator costs are fitted. With only
+        whole-inference timings, all operator costs are scaled by one factor.
+        Energy per operation is scaled with the cycles, keeping the energy per
+        cycle of the original entries.
+
+        Args:
+            model_path: Path to the TFLite model the timings were measured on
+            hardware_profile: Hardware profile of the measured target
+            timing_log: Timing log path (see `calibration.read_timing_log`)
+                or timings already read
+            fit_memory: Fit the MEMORY cost per byte, otherwise keep the
+                profile's memory cost and fit the operator costs to the rest
+
+        Returns:
+            CalibrationResult with the calibrated profile and fit quality
+
+        Raises:
+            CalibrationError: If the timings are unusable for the model
+            HardwareProfileError: If the hardware profile is invalid
+        """
+        self._validate_hardware_profile(hardware_profile)
+        if not isinstance(timing_log, TimingLog):
+            timing_log = read_timing_log(timing_log)
+        parsed_model = self._parse_model(Path(model_path))
+        layers = getattr(parsed_model, "layer_details", [])
+
+        if timing_log.layers:
+            measured = measured_layer_cycles(
+                timing_log, [layer.name for layer in layers]
+            )
+            coefficients = self._fit_layer_coefficients(
+                layers, measured, hardware_profile, fit_memory
+            )
+        else:
+            # Whole-inference timings in us, at the core clock in MHz
+            measured = None
+            inference_cycles = (
+                float(np.mean(timing_log.inference_us)) * hardware_profile.core_clock
+            )
+            predicted_cycles = float(
+                self._estimate_layer_costs(layers, [hardware_profile])["cycles"].sum()
+            )
+            if predicted_cycles <= 0:
+                raise CalibrationError(
+                    "Model has no predicted cycles to scale",
+                    error_code="TIMINGS_MISMATCH",
+                )
+            scale = inference_cycles / predicted_cycles
+            coefficients = {
+                op_info.name: op_info.cycles * scale
+                for op_info in hardware_profile.operator_infos
+            }
+
+        # Energy per cycle of the entry each fitted coefficient replaces
+        operator_infos = {
+            op_info.name: op_info for op_info in hardware_profile.operator_infos
+        }
+        for name, cycles in coefficients.items():
+            accelerated = name.startswith(ACCELERATOR_INFO_PREFIX)
+            base_name = name.removeprefix(ACCELERATOR_INFO_PREFIX)
+            previous = self._resolve_operator_info(
+                hardware_profile,
+                [base_name, OPERATOR_CLASSES.get(base_name), MAC_OPERATOR_INFO],
+                accelerated,
+            )
+            operator_infos[name] = OperatorInfo(
+                name=name,
+                cycles=cycles,
+                energy=previous.energy * cycles / previous.cycles,
+            )
+        calibrated_profile = hardware_profile.model_copy(
+            update={"operator_infos": list(operator_infos.values())}
+        )
+
+        # Prediction error of both profiles on the measurements
+        cycles = self._estimate_layer_costs(
+            layers, [hardware_profile, calibrated_profile]
+        )["cycles"]
+        if measured is not None:
+            measured_idx = [
+                idx for idx, value in enumerate(measured) if value is not None
+            ]
+            actual = np.array([measured[idx] for idx in measured_idx])
+            predicted = cycles[:, measured_idx]
+        else:
+            actual = np.array([inference_cycles])
+            predicted = cycles.sum(axis=1, keepdims=True)
+        errors = np.mean(
+            np.abs(predicted - actual) / np.maximum(actual, 1.0), axis=1
+        ) * PERCENTAGE_CONVERSION
+
+        return CalibrationResult(
+            hardware_profile=calibrated_profile,
+            coefficients=coefficients,
+            measured_layers=len(actual) if measured is not None else 0,
+            error_before_percent=float(errors[0]),
+            error_after_percent=float(errors[1]),
+        )
+
+    def _fit_layer_coefficients(
+        self,
+        layers: list[LayerDetail],
+        measured: list[Optional[float]],
+        hardware_profile: HardwareProfile,
+        fit_memory: bool,
+    ) -> dict[str, float]:
+        """
+        Fit operator info cycles to measured per-layer cycles.
+
+        Args:
+            layers: Layer details from the parser
+            measured: Mean measured cycles of each layer, None if unmeasured
+            hardware_profile: Hardware profile of the measured target
+            fit_memory: Whether to fit the MEMORY cost per byte
+
+        Returns:
+            Fitted cycles by operator info name
+
+        Raises:
+            CalibrationError: If no layer has a usable measurement
+        """
+        rows = [
+            idx for idx, cycles in enumerate(measured)
+            if cycles is not None and cycles > 0
+        ]
+        if not rows:
+            raise CalibrationError(
+                "No layer timings to calibrate with", error_code="INVALID_TIMINGS"
+            )
+
+        accelerator_ops = hardware_profile.accel_ops
+        names: dict[str, int] = {}
+        entries: list[dict[int, float]] = []
+        targets = []
+        for layer_idx in rows:
+            layer = layers[layer_idx]
+            accelerated = layer.name in accelerator_ops
+            prefix = ACCELERATOR_INFO_PREFIX if accelerated else ""
+            traffic_bytes = layer.read_bytes + layer.write_bytes
+            target = measured[layer_idx]
+
+            entry = {
+                names.setdefault(f"{prefix}{layer.name}", len(names)):
+                    float(layer.macs if layer.macs > 0 else 1)
+            }
+            if fit_memory:
+                memory_name = f"{prefix}{MEMORY_OPERATOR_INFO}"
+                entry[names.setdefault(memory_name, len(names))] = float(traffic_bytes)
+            else:
+                # Fit the operator cost to what the known memory cost leaves
+                memory_info = self._resolve_operator_info(
+                    hardware_profile, [MEMORY_OPERATOR_INFO], accelerated
+                )
+                if memory_info:
+                    target -= int(traffic_bytes * memory_info.cycles)
+            entries.append(entry)
+            targets.append(max(target, 0.0))
+
+        features = np.zeros((len(rows), len(names)))
+        for row, entry in enumerate(entries):
+            for column, value in entry.items():
+                features[row, column] = value
+        solution = fit_coefficients(features, np.array(targets))
+
+        if fit_memory and np.any(solution <= 0):
+            return self._fit_layer_coefficients(
+                layers, measured, hardware_profile, fit_memory=False
+            )
+        return {
+            name: float(solution[column])
+            for name, column in names.items() if solution[column] > 0
+        }
+
+    def _estimate_layer_costs(
+        self,
+        layers: list[LayerDetail],
+        hardware_profiles: list[HardwareProfile],
+        is_accelerated: Optional[list[bool]] = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Estimate the cost of every layer on every hardware target at once.
+
+        This is the profiler's cost model. Each layer is priced by its own
+        operator, its operator class (see OPERATOR_CLASSES), then per MAC,
+        with the 'ACCEL:' prefixed entries for accelerated layers, plus the
+        'MEMORY' cost per byte of tensor traffic. With memory bandwidths in a
+        profile, the compute cycles are bounded from below by the cycles the
+        layer's data takes to stream through memory (roofline), and the
+        per-byte memory cost is added once on top. Operator infos are resolved
+        once per target, operator type and acceleration, and the costs are
+        computed on (targets x layers) arrays.
+
+        Args:
+            layers: Layer details from the parser
+            hardware_profiles: Hardware specifications of the targets
+            is_accelerated: Whether each layer runs on the accelerator, for
+                layers fused into an accelerated layer (default: accel_ops)
+
+        Returns:
+            Dictionary of (targets x layers) arrays:
+                - cycles: Hardware execution cycles
+                - memory_cycles: Cycles spent on tensor traffic
+                - bandwidth_cycles: Memory bandwidth bound in cycles
+                - latency_ms: Execution time in milliseconds
+                - energy_uj: Energy consumption in microjoules
+                - is_accelerated: Hardware acceleration flags
+                - memory_bound: Memory bandwidth bound flags
+            and has_bandwidth, whether each target has a memory bandwidth
+        """
+        num_profiles, num_layers = len(hardware_profiles), len(layers)
+        layer_operators: list[str] = []
+        layer_values = np.zeros((num_layers, 3))
+        for layer_idx, layer in enumerate(layers):
+            layer_operators.append(
+                getattr(layer, "operator_name", None) or layer.name
+            )
+            layer_values[layer_idx] = (
+                layer.macs,
+                layer.read_bytes + layer.write_bytes,
+                layer.flash_kb * KILOBYTES_TO_BYTES,
+            )
+        macs, traffic_bytes, weight_bytes = layer_values.T
+        operations = np.where(macs > 0, macs, 1.0)
+        # Parser read bytes include the parameters, which live in flash
+        activation_bytes = np.maximum(traffic_bytes - weight_bytes, 0)
+
+        shape = (num_profiles, num_layers)
+        cycles_per_op = np.zeros(shape)
+        energy_per_op = np.zeros(shape)
+        memory_cycles_per_byte = np.zeros(shape)
+        memory_energy_per_byte = np.zeros(shape)
+        accelerated = np.zeros(shape, dtype=bool)
+
+        # Operator infos per target, operator type and acceleration
+        for profile_idx, hardware_profile in enumerate(hardware_profiles):
+            accelerator_ops = hardware_profile.accel_ops
+            layer_indices: dict[tuple[str, bool], list[int]] = {}
+            for layer_idx, layer_operator in enumerate(layer_operators):
+                layer_accelerated = (
+                    is_accelerated[layer_idx] if is_accelerated is not None
+                    else layer_operator in accelerator_ops
+                )
+                layer_indices.setdefault(
+                    (layer_operator, layer_accelerated), []
+                ).append(layer_idx)
+            for (layer_operator, layer_accelerated), indices in layer_indices.items():
+                op_info = self._resolve_operator_info(
+                    hardware_profile,
+                    [layer_operator, OPERATOR_CLASSES.get(layer_operator),
+                     MAC_OPERATOR_INFO],
+                    layer_accelerated,
+                )
+                memory_info = self._resolve_operator_info(
+                    hardware_profile, [MEMORY_OPERATOR_INFO], layer_accelerated
+                )
+                accelerated[profile_idx, indices] = layer_accelerated
+                cycles_per_op[profile_idx, indices] = op_info.cycles
+                energy_per_op[profile_idx, indices] = op_info.energy
+                if memory_info:
+                    memory_cycles_per_byte[profile_idx, indices] = memory_info.cycles
+                    memory_energy_per_byte[profile_idx, indices] = memory_info.energy
+
+        memory_cycles = np.floor(traffic_bytes * memory_cycles_per_byte)
+        compute_cycles = np.floor(operations * cycles_per_op)
+
+        # Roofline bound of the targets with memory bandwidths
+        sram_bandwidth = np.array(
+            [[profile.sram_bandwidth or 0.0] for profile in hardware_profiles]
+        )
+        flash_bandwidth = np.array(
+            [[profile.flash_bandwidth or 0.0] for profile in hardware_profiles]
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bandwidth_cycles = np.ceil(
+                np.where(sram_bandwidth > 0, activation_bytes / sram_bandwidth, 0.0)
+                + np.where(flash_bandwidth > 0, weight_bytes / flash_bandwidth, 0.0)
+            )
+        has_bandwidth = (sram_bandwidth > 0) | (flash_bandwidth > 0)
+        memory_bound = has_bandwidth & (bandwidth_cycles > compute_cycles)
+
+        # Per-byte memory access cost does not overlap the computation
+        cycles = np.where(
+            has_bandwidth, np.maximum(compute_cycles, bandwidth_cycles), compute_cycles
+        ) + memory_cycles
+
+        clock_hz = np.array(
+            [[profile.core_clock * MHZ_TO_HZ_CONVERSION]
+             for profile in hardware_profiles]
+        )
+        energy_nj = (
+            operations * energy_per_op + traffic_bytes * memory_energy_per_byte
+        )
+        return {
+            "cycles": cycles.astype(np.int64),
+            "memory_cycles": memory_cycles.astype(np.int64),
+            "bandwidth_cycles": bandwidth_cycles.astype(np.int64),
+            "latency_ms": cycles / clock_hz * MILLISECONDS_PER_SECOND,
+            "energy_uj": energy_nj / NANOJOULES_TO_MICROJOULES,
+            "is_accelerated": accelerated,
+            "memory_bound": memory_bound,
+            "has_bandwidth": has_bandwidth[:, 0],
+        }
+
     def _validate_hardware_profile(self, hardware_profile: HardwareProfile) -> None:
         """
         Validate that the hardware profile contains required fields with appropriate
@@ -222,7 +761,7 @@ class TFLiteResourceProfiler:
             raise HardwareProfileError("Missing hardware profile")
 
         # Check we have the required operator info
-        required_operators = ["MAC"]
+        required_operators = [MAC_OPERATOR_INFO]
         missing_operators = [
             op for op in required_operators \
                 if not hardware_profile.get_operator_info(op)
@@ -253,7 +792,7 @@ class TFLiteResourceProfiler:
             FileNotFoundError: If the model file doesn't exist
         """
         self.logger.debug(f"Parsing TFLite model: {model_path}")
-        parser = TFLiteParser()
+        parser = TFLiteParser(cache=ParseCache.default())
 
         try:
             parsed_model = parser.parse_model(str(model_path))
@@ -279,6 +818,7 @@ class TFLiteResourceProfiler:
         parsed_model: ModelDetails,
         hardware_profile: HardwareProfile,
         errors: list[ErrorNote],
+        layer_performance: Optional[list[LayerPerformance]] = None,
     ) -> ResourceProfileReport:
         """
         Perform comprehensive model analysis including performance, memory, and
@@ -296,6 +836,8 @@ class TFLiteResourceProfiler:
             parsed_model: Structured model data from parser
             hardware_profile: Hardware specifications for performance estimation
             errors: List to collect analysis errors
+            layer_performance: Performance of every layer from
+                `_layers_performance`, if the caller already analyzed the layers
 
         Returns:
             ResourceProfileReport: Complete analysis results with all metrics
@@ -309,53 +851,20 @@ class TFLiteResourceProfiler:
             # Store hardware profile for layer-wise optimization suggestions
             self._current_hardware_profile = hardware_profile
 
-            # Initialize tracking variables
-            total_cycles = 0
-            total_energy_uj = 0.0
-            total_latency_ms = 0.0
-            layer_performance: list[LayerPerformance] = []
-
-            # Analyze each layer
-            for i, layer in enumerate(getattr(parsed_model, "layer_details", [])):
-                try:
-                    layer_performance_metrics = self._analyze_layer_performance(
-                        layer, hardware_profile
-                    )
+            # Analyze all layers
+            if layer_performance is None:
+                layer_performance = self._layers_performance(
+                    getattr(parsed_model, "layer_details", []),
+                    hardware_profile,
+                    errors,
+                )
 
-                    # Create LayerPerformance object
-                    layer_perf = LayerPerformance(
-                        layer_idx=i,
-                        layer_name=getattr(layer, "name", None),
-                        operator_type=getattr(layer, "operator_name", None),
-                        cycles=layer_performance_metrics.get("cycles"),
-                        latency_ms=layer_performance_metrics.get("latency_ms"),
-                        energy_uj=layer_performance_metrics.get("energy_uj"),
-                        power_mw=layer_performance_metrics.get("power_mw"),
-                        is_accelerated=layer_performance_metrics.get(
-                            "is_accelerated", False
-                        ),
-                        macs=getattr(layer, "macs", None),
-                        memory_kb=getattr(layer, "flash_kb", None),
-                    )
-                    layer_performance.append(layer_perf)
-
-                    # Accumulate totals
-                    total_cycles += layer_performance_metrics.get("cycles", 0)
-                    total_energy_uj += layer_performance_metrics.get("energy_uj", 0)
-                    total_latency_ms += layer_performance_metrics.get("latency_ms", 0)
-
-                except Exception as e:
-                    error_msg = f"Error analyzing layer {i}: {e!s}"
-                    self.logger.warning(error_msg)
-                    errors.append(
-                        ErrorNote(
-                            message=error_msg,
-                            code="LAYER_ANALYSIS_ERROR",
-                            details={"layer_index": i},
-                        )
-                    )
-                    # Add empty performance for failed layer
-                    layer_performance.append(LayerPerformance(layer_idx=i))
+            # Accumulate totals
+            total_cycles = sum(layer.cycles or 0 for layer in layer_performance)
+            total_energy_uj = sum(layer.energy_uj or 0 for layer in layer_performance)
+            total_latency_ms = sum(
+                layer.latency_ms or 0 for layer in layer_performance
+            )
 
             # Calculate overall hardware performance
             hardware_metrics = self._calculate_overall_performance(
@@ -367,6 +876,22 @@ class TFLiteResourceProfiler:
                 layer_performance,
             )
 
+            # Estimate the fused model alongside the per-operator numbers
+            fused_layer_performance, fused_peak_memory_kb = (
+                self._analyze_fused_performance(parsed_model, hardware_profile)
+            )
+            if hardware_metrics is not None and fused_layer_performance:
+                hardware_metrics = hardware_metrics.model_copy(update={
+                    "fused_layers": len(fused_layer_performance),
+                    "fused_total_cycles": sum(
+                        layer.cycles or 0 for layer in fused_layer_performance
+                    ),
+                    "fused_latency_ms": sum(
+                        layer.latency_ms or 0.0 for layer in fused_layer_performance
+                    ),
+                    "fused_peak_memory_kb": fused_peak_memory_kb,
+                })
+
             # Analyze memory requirements
             memory_analysis = self._analyze_memory_requirements(
                 parsed_model, hardware_profile
@@ -402,6 +927,7 @@ class TFLiteResourceProfiler:
                 hardware_metrics=hardware_metrics,
                 memory_analysis=memory_analysis,
                 layer_performance=layer_performance,
+                fused_layer_performance=fused_layer_performance or None,
                 optimization_suggestions=optimization_suggestions,
                 optimization_opportunities=optimization_opportunities,
                 errors=errors,
@@ -418,109 +944,306 @@ class TFLiteResourceProfiler:
                 f"Analysis failed: {e!s}", error_code="ANALYSIS_FAILED"
             ) from e
 
+    def _layers_performance(
+        self,
+        layers: list[LayerDetail],
+        hardware_profile: HardwareProfile,
+        errors: list[ErrorNote],
+    ) -> list[LayerPerformance]:
+        """
+        Estimate the performance of all layers for the report.
+
+        Args:
+            layers: Layer details from the parser
+            hardware_profile: Hardware specifications for performance estimation
+            errors: List to collect analysis errors
+
+        Returns:
+            LayerPerformance of each layer, empty if the analysis failed
+        """
+        try:
+            layer_metrics = self._layers_metrics(layers, hardware_profile)
+        except Exception as e:
+            error_msg = f"Error analyzing layers: {e!s}"
+            self.logger.warning(error_msg)
+            errors.append(
+                ErrorNote(
+                    message=error_msg,
+                    code="LAYER_ANALYSIS_ERROR",
+                    details={"layer_count": len(layers)},
+                )
+            )
+            # Empty performance for the failed layers
+            return [LayerPerformance(layer_idx=idx) for idx in range(len(layers))]
+
+        return [
+            LayerPerformance(
+                layer_idx=layer_idx,
+                layer_name=getattr(layer, "name", None),
+                operator_type=getattr(layer, "operator_name", None),
+                cycles=metrics["cycles"],
+                latency_ms=metrics["latency_ms"],
+                energy_uj=metrics["energy_uj"],
+                power_mw=metrics["power_mw"],
+                is_accelerated=metrics["is_accelerated"],
+                memory_cycles=metrics["memory_cycles"],
+                bandwidth_cycles=metrics["bandwidth_cycles"],
+                bound=metrics["bound"],
+                macs=getattr(layer, "macs", None),
+                memory_kb=getattr(layer, "flash_kb", None),
+            )
+            for layer_idx, (layer, metrics) in enumerate(
+                zip(layers, layer_metrics, strict=True)
+            )
+        ]
+
     def _analyze_layer_performance(
-        self, layer: LayerDetail, hardware_profile: Optional[HardwareProfile]
+        self,
+        layer: LayerDetail,
+        hardware_profile: Optional[HardwareProfile],
+        is_accelerated: Optional[bool] = None,
     ) -> dict[str, Any]:
         """
         Analyze performance metrics for a single neural network layer.
 
+        Args:
+            layer: Layer details containing computational and structural information
+            hardware_profile: Hardware specifications for performance estimation
+            is_accelerated: Whether the layer runs on the accelerator, for
+                layers fused into an accelerated layer (default: accel_ops)
+
+        Returns:
+            Performance metrics of the layer, see `_layers_metrics`
+        """
+        return self._layers_metrics(
+            [layer], hardware_profile,
+            None if is_accelerated is None else [is_accelerated],
+        )[0]
+
+    def _layers_metrics(
+        self,
+        layers: list[LayerDetail],
+        hardware_profile: Optional[HardwareProfile],
+        is_accelerated: Optional[list[bool]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Analyze performance metrics of layers on one hardware target.
+
         Calculates hardware-specific performance characteristics including timing,
-        power consumption, and acceleration detection for individual layers.
+        power consumption, and acceleration detection with the cost model of
+        `_estimate_layer_costs`.
 
         Args:
-            layer: Layer details containing computational and structural information
+            layers: Layer details containing computational and structural information
             hardware_profile: Hardware specifications including:
-                - cpi_mac: Cycles per multiply-accumulate operation
-                - cpu_clock_mhz: CPU clock frequency in MHz
-                - energy_nj_per_mac: Energy consumption per MAC in nanojoules
-                - accelerator_ops: Optional list of accelerated operation types
+                - operator_infos: Cycles and energy per operation of operators,
+                  operator classes (see OPERATOR_CLASSES) and 'MAC', and per
+                  byte of tensor traffic under 'MEMORY'
+                - core_clock: CPU clock frequency in MHz
+                - sram_bandwidth, flash_bandwidth: Optional memory bandwidths
+                  in bytes per cycle, bounding the compute cycles from below
+                - accel_ops: Operation types run by the accelerator, priced by
+                  the 'ACCEL:' prefixed entries where present
+            is_accelerated: Whether each layer runs on the accelerator, for
+                layers fused into an accelerated layer (default: accel_ops)
 
         Returns:
-            Dictionary containing calculated performance metrics:
+            Dictionary of calculated performance metrics per layer:
                 - cycles: Hardware execution cycles (int)
+                - memory_cycles: Cycles spent on tensor traffic (int)
+                - bandwidth_cycles: Memory bandwidth bound in cycles (int)
+                - bound: 'compute' or 'memory', None without bandwidths
                 - latency_ms: Execution time in milliseconds (float)
                 - energy_uj: Energy consumption in microjoules (float)
                 - power_mw: Power consumption in milliwatts (float)
                 - is_accelerated: Hardware acceleration flag (bool)
+        """
+        if not hardware_profile:
+            return [
+                {
+                    "cycles": 0,
+                    "memory_cycles": 0,
+                    "bandwidth_cycles": None,
+                    "bound": None,
+                    "latency_ms": 0.0,
+                    "energy_uj": 0.0,
+                    "power_mw": 0.0,
+                    "is_accelerated": False,
+                }
+                for _ in layers
+            ]
 
-        Raises:
-            ModelAnalysisError: If critical calculation errors occur
+        costs = self._estimate_layer_costs(layers, [hardware_profile], is_accelerated)
+        has_bandwidth = bool(costs["has_bandwidth"][0])
+        return [
+            {
+                "cycles": cycles,
+                "memory_cycles": memory_cycles,
+                "bandwidth_cycles": bandwidth_cycles if has_bandwidth else None,
+                "bound": (
+                    ("memory" if memory_bound else "compute") if has_bandwidth
+                    else None
+                ),
+                "latency_ms": latency_ms,
+                "energy_uj": energy_uj,
+                # TODO: Power calculations are currently inaccurate
+                # Return 0 for this release to avoid confusion over
+                # validity of bad numbers
+                "power_mw": 0.0,
+                "is_accelerated": accelerated,
+            }
+            for (cycles, memory_cycles, bandwidth_cycles, latency_ms, energy_uj,
+                 accelerated, memory_bound) in zip(
+                costs["cycles"][0].tolist(),
+                costs["memory_cycles"][0].tolist(),
+                costs["bandwidth_cycles"][0].tolist(),
+                costs["latency_ms"][0].tolist(),
+                costs["energy_uj"][0].tolist(),
+                costs["is_accelerated"][0].tolist(),
+                costs["memory_bound"][0].tolist(),
+                strict=True,
+            )
+        ]
+
+    def _analyze_fused_performance(
+        self, parsed_model: ModelDetails, hardware_profile: HardwareProfile
+    ) -> tuple[list[LayerPerformance], Optional[float]]:
         """
-        performance_metrics: dict[str, Any] = {
-            "cycles": 0,
-            "latency_ms": 0.0,
-            "energy_uj": 0.0,
-            "power_mw": 0.0,
-            "is_accelerated": False,
-        }
+        Estimate the performance of the model with operator chains fused.
 
-        if not hardware_profile:
-            return performance_metrics
+        Layers are grouped by the profile's fusion rules (see the fusion
+        module). Each layer of a group is costed as usual, except that the
+        intermediate tensors are neither written nor read back, and runs on
+        the accelerator if any layer of the group does.
 
-        # Initialize layer attributes early for error handling
-        layer_name = getattr(layer, "name", "unknown_layer")
-        layer_operator = getattr(layer, "operator_name", "unknown_operator")
-        layer_macs = getattr(layer, "macs", 0)
+        Args:
+            parsed_model: Structured model data from parser
+            hardware_profile: Hardware specifications with optional fusion rules
 
+        Returns:
+            Tuple of the fused layer performance, and the peak memory of the
+            fused model in KB (None if the execution schedule is unavailable).
+            The list is empty if the fused estimate fails.
+        """
         try:
-            # Check if layer can be accelerated based on operation type
+            layers = getattr(parsed_model, "layer_details", [])
+            fusion_rules = (
+                hardware_profile.fusion_rules
+                if hardware_profile.fusion_rules is not None
+                else DEFAULT_FUSION_RULES
+            )
+            fused_layers = fuse_layers(
+                layers, fusion_rules, getattr(parsed_model, "output_tensors", [])
+            )
             accelerator_ops = hardware_profile.accel_ops
-            is_accelerated = (
-                layer_operator in accelerator_ops or layer_name in accelerator_ops
+
+            # Members of all fused layers are costed together
+            groups = []
+            fused_members: list[LayerDetail] = []
+            fused_accelerated: list[bool] = []
+            for fused_layer in fused_layers:
+                members = [layers[idx] for idx in fused_layer.layer_indices]
+                is_accelerated = any(
+                    layer.name in accelerator_ops for layer in members
+                )
+                groups.append((fused_layer, members, is_accelerated))
+                for position, layer in enumerate(members):
+                    update: dict[str, int] = {}
+                    if position < len(members) - 1:
+                        update["write_bytes"] = 0
+                    if position > 0:
+                        update["read_bytes"] = max(
+                            layer.read_bytes - members[position - 1].write_bytes, 0
+                        )
+                    fused_members.append(layer.model_copy(update=update))
+                    fused_accelerated.append(is_accelerated)
+            fused_metrics = self._layers_metrics(
+                fused_members, hardware_profile, fused_accelerated
             )
-            performance_metrics["is_accelerated"] = is_accelerated
-
-            # Calculate cycles - include base overhead even for zero MAC operations
-            mac_info = hardware_profile.get_operator_info("MAC")
-            cpi = mac_info.cycles
-            if cpi is not None:
-                # Use layer MACs or base overhead for non-MAC operations
-                cycles = int(layer_macs * cpi) if layer_macs > 0 else int(cpi)
-                performance_metrics["cycles"] = cycles
-
-                # Calculate latency from cycles and clock frequency
-                clock_mhz = getattr(hardware_profile, "core_clock", 0)
-                if clock_mhz > 0:
-                    # Convert MHz to Hz, then calculate latency in milliseconds
-                    clock_hz = clock_mhz * MHZ_TO_HZ_CONVERSION
-                    latency_ms = (cycles / clock_hz) * MILLISECONDS_PER_SECOND
-                    performance_metrics["latency_ms"] = latency_ms
-
-            # Calculate energy and power consumption
-            energy_nj_per_mac = mac_info.energy
-            if energy_nj_per_mac is not None:
-                # Energy for MAC operations or base overhead (convert nJ to µJ)
-                layer_energy_uj = (
-                    (layer_macs * energy_nj_per_mac) / NANOJOULES_TO_MICROJOULES
-                    if layer_macs > 0
-                    else energy_nj_per_mac / NANOJOULES_TO_MICROJOULES
+
+            fused_layer_performance = []
+            start = 0
+            for fused_idx, (fused_layer, members, is_accelerated) in enumerate(groups):
+                member_metrics = fused_metrics[start:start + len(members)]
+                start += len(members)
+
+                bandwidth_cycles = [
+                    metrics["bandwidth_cycles"] for metrics in member_metrics
+                    if metrics["bandwidth_cycles"] is not None
+                ]
+                name = fused_layer_name(fused_layer, layers)
+                fused_layer_performance.append(LayerPerformance(
+                    layer_idx=fused_idx,
+                    layer_name=name,
+                    operator_type=name,
+                    cycles=sum(metrics["cycles"] for metrics in member_metrics),
+                    latency_ms=sum(
+                        metrics["latency_ms"] for metrics in member_metrics
+                    ),
+                    energy_uj=sum(metrics["energy_uj"] for metrics in member_metrics),
+                    power_mw=0.0,
+                    is_accelerated=is_accelerated,
+                    memory_cycles=sum(
+                        metrics["memory_cycles"] for metrics in member_metrics
+                    ),
+                    bandwidth_cycles=(
+                        sum(bandwidth_cycles) if bandwidth_cycles else None
+                    ),
+                    bound=max(
+                        member_metrics, key=lambda metrics: metrics["cycles"]
+                    )["bound"],
+                    macs=sum(layer.macs for layer in members),
+                    memory_kb=sum(layer.flash_kb for layer in members),
+                ))
+
+            # Intermediate tensors leave the memory timeline
+            fused_peak_memory_kb = None
+            schedule = getattr(parsed_model, "execution_schedule", [])
+            if len(schedule) == len(layers) and layers:
+                fused_memory_b = fused_memory_schedule(
+                    layers,
+                    fused_layers,
+                    [step["memory_b"] for step in schedule],
+                    KILOBYTES_TO_BYTES,
                 )
-                performance_metrics["energy_uj"] = layer_energy_uj
+                fused_peak_memory_kb = max(fused_memory_b) / KILOBYTES_TO_BYTES
 
-                # TODO: Power calculations are currently inaccurate
-                # Return 0 for this release to avoid confusion over
-                # validity of bad numbers
-                performance_metrics["power_mw"] = 0.0
+            return fused_layer_performance, fused_peak_memory_kb
 
-        except (KeyError, ValueError, ZeroDivisionError) as e:
-            error_msg = f"Error calculating layer '{layer_name}' performance: {e}"
-            self.logger.error(error_msg)
-            raise ModelAnalysisError(
-                error_msg,
-                error_code="LAYER_PERFORMANCE_CALC_ERROR",
-                details={
-                    "layer_name": layer_name,
-                    "layer_macs": getattr(layer, "macs", 0),
-                    "error": str(e),
-                },
-            ) from e
         except Exception as e:
-            # Log unexpected errors but don't fail the entire analysis
-            self.logger.warning(
-                f"Unexpected error calculating layer '{layer_name}' performance: {e}"
-            )
+            self.logger.warning(f"Fused performance estimate failed: {e}")
+            return [], None
 
-        return performance_metrics
+    def _resolve_operator_info(
+        self,
+        hardware_profile: HardwareProfile,
+        names: list[Optional[str]],
+        is_accelerated: bool,
+    ) -> Optional[OperatorInfo]:
+        """
+        Find the most specific OperatorInfo for a layer.
+
+        Accelerated layers use the 'ACCEL:' prefixed entries first, and fall
+        back to the CPU entries when the profile has none of them.
+
+        Args:
+            hardware_profile: Hardware specifications with operator infos
+            names: Candidate entry names, most specific first (None skipped)
+            is_accelerated: Whether the layer runs on the accelerator
+
+        Returns:
+            First matching OperatorInfo, or None if no candidate is present
+        """
+        candidates = [name for name in names if name]
+        if is_accelerated:
+            candidates = [
+                f"{ACCELERATOR_INFO_PREFIX}{name}" for name in candidates
+            ] + candidates
+        for name in candidates:
+            op_info = hardware_profile.get_operator_info(name)
+            if op_info is not None:
+                return op_info
+        return None
 
     def generate_optimization_opportunities(
         self, parsed_model: ModelDetails, model_path: Path
@@ -1590,6 +2313,11 @@ class TFLiteResourceProfiler:
                 1 for layer in layer_performance if layer.is_accelerated
             )
             cpu_only_layers = len(layer_performance) - accelerated_layers
+            memory_bound_layers = (
+                sum(1 for layer in layer_performance if layer.bound == "memory")
+                if hardware_profile.sram_bandwidth or hardware_profile.flash_bandwidth
+                else None
+            )
 
             # Extract memory information
             model_peak_ram_kb = getattr(parsed_model, "model_peak_ram_kb", None)
@@ -1615,6 +2343,7 @@ class TFLiteResourceProfiler:
                 available_ram_kb=available_ram_kb,
                 accelerated_layers=accelerated_layers,
                 cpu_only_layers=cpu_only_layers,
+                memory_bound_layers=memory_bound_layers,
             )
 
         except (ZeroDivisionError, ValueError) as e:
@@ -36,10 +36,12 @@ import io
 import json
 import logging
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
+from cfsai_compatibility_analyzer.schemas import CompatibilityReport
 from pydantic import BaseModel, Field
 
+from cfsai_types.hardware_profile import HardwareProfile
 from cfsai_types.report import ReportInfo
 
 PROFILE_REPORT_VERSION = "2.2.0"
@@ -76,6 +78,11 @@ class LayerPerformance(BaseModel):
         operator_type: Neural network operation type (e.g., 'CONV_2D',
             'FULLY_CONNECTED')
         cycles: Hardware execution cycles required for this layer
+        memory_cycles: Part of the cycles spent moving tensor data
+        bandwidth_cycles: Cycles needed to stream the layer's activations and
+            weights at the profile's memory bandwidths
+        bound: Whether the layer is 'compute' or 'memory' bound, if the
+            hardware profile has memory bandwidths
         latency_ms: Execution time in milliseconds
         energy_uj: Energy consumption in microjoules
         power_mw: Power consumption in milliwatts
@@ -96,6 +103,15 @@ class LayerPerformance(BaseModel):
     cycles: Optional[int] = Field(
         default=None, ge=0, description="Hardware execution cycles"
     )
+    memory_cycles: Optional[int] = Field(
+        default=None, ge=0, description="Cycles spent moving tensor data"
+    )
+    bandwidth_cycles: Optional[int] = Field(
+        default=None, ge=0, description="Memory bandwidth bound in cycles"
+    )
+    bound: Optional[Literal["compute", "memory"]] = Field(
+        default=None, description="Roofline bound of the layer"
+    )
     latency_ms: Optional[float] = Field(
         default=None, ge=0, description="Execution time in milliseconds"
     )
@@ -175,6 +191,11 @@ class HardwareMetrics(BaseModel):
         available_ram_kb: Total available system RAM (kilobytes)
         accelerated_layers: Number of layers using hardware acceleration
         cpu_only_layers: Number of layers executed on CPU without acceleration
+        memory_bound_layers: Number of layers limited by memory bandwidth
+        fused_layers: Number of layers after fusing operator chains
+        fused_total_cycles: Total execution cycles of the fused model
+        fused_latency_ms: End-to-end latency of the fused model
+        fused_peak_memory_kb: Peak memory of the fused model (kilobytes)
     """
 
     total_cycles: Optional[int] = Field(
@@ -201,6 +222,68 @@ class HardwareMetrics(BaseModel):
     cpu_only_layers: Optional[int] = Field(
         default=None, ge=0, description="Count of CPU-only layers"
     )
+    memory_bound_layers: Optional[int] = Field(
+        default=None, ge=0, description="Count of memory-bandwidth-bound layers"
+    )
+    fused_layers: Optional[int] = Field(
+        default=None, ge=0, description="Count of layers after fusion"
+    )
+    fused_total_cycles: Optional[int] = Field(
+        default=None, ge=0, description="Total execution cycles after fusion"
+    )
+    fused_latency_ms: Optional[float] = Field(
+        default=None, ge=0, description="End-to-end latency after fusion"
+    )
+    fused_peak_memory_kb: Optional[float] = Field(
+        default=None, ge=0, description="Peak memory usage after fusion"
+    )
+
+
+class TargetComparison(BaseModel):
+    """
+    Whole-model estimates of one hardware target in a profile comparison.
+
+    Attributes:
+        target: Target name, SoC and core when the profile has a target
+        total_cycles: Total hardware execution cycles for model inference
+        estimated_latency_ms: End-to-end inference latency in milliseconds
+        estimated_energy_uj: Inference energy consumption in microjoules
+        peak_memory_kb: Peak RAM usage of the model (kilobytes)
+        available_ram_kb: RAM of the target, if specified (kilobytes)
+        ram_utilization_percent: Peak RAM as a percentage of the target's RAM
+        ram_status: Memory status ('OK', 'WARNING', 'CRITICAL')
+        fits_flash: Whether the model parameters fit in flash, if specified
+        accelerated_layers: Number of layers using hardware acceleration
+        memory_bound_layers: Number of layers limited by memory bandwidth
+    """
+
+    target: str = Field(description="Target name")
+    total_cycles: int = Field(ge=0, description="Total execution cycles")
+    estimated_latency_ms: float = Field(
+        ge=0, description="End-to-end latency in milliseconds"
+    )
+    estimated_energy_uj: float = Field(
+        ge=0, description="Inference energy in microjoules"
+    )
+    peak_memory_kb: Optional[float] = Field(
+        default=None, ge=0, description="Peak memory usage in kilobytes"
+    )
+    available_ram_kb: Optional[float] = Field(
+        default=None, ge=0, description="Available system RAM in kilobytes"
+    )
+    ram_utilization_percent: Optional[float] = Field(
+        default=None, ge=0, description="Peak RAM as percentage of available RAM"
+    )
+    ram_status: str = Field(description="Memory status level")
+    fits_flash: Optional[bool] = Field(
+        default=None, description="Whether the model parameters fit in flash"
+    )
+    accelerated_layers: int = Field(
+        ge=0, description="Count of hardware-accelerated layers"
+    )
+    memory_bound_layers: Optional[int] = Field(
+        default=None, ge=0, description="Count of memory-bandwidth-bound layers"
+    )
 
 
 class OptimizationSuggestion(BaseModel):
@@ -392,6 +475,8 @@ class ResourceProfileReport(BaseModel):
         hardware_metrics: Platform-specific performance measurements
         memory_analysis: Memory usage analysis and constraint validation
         layer_performance: Per-layer performance metrics
+        fused_layer_performance: Performance metrics of the fused layers,
+            where layer_idx is the fused layer index
         optimization_suggestions: High-level optimization recommendations
         optimization_opportunities: Detailed layer-specific optimization analysis
         errors: Error details encountered during analysis
@@ -410,6 +495,9 @@ class ResourceProfileReport(BaseModel):
     layer_performance: Optional[list[LayerPerformance]] = Field(
         default=None, description="Per-layer performance data"
     )
+    fused_layer_performance: Optional[list[LayerPerformance]] = Field(
+        default=None, description="Per-layer performance data after fusion"
+    )
     optimization_suggestions: Optional[list[OptimizationSuggestion]] = Field(
         default=None, description="High-level optimization recommendations"
     )
@@ -556,6 +644,18 @@ class ResourceProfileReport(BaseModel):
                 table.add_row("Accelerated Layers", str(hw.accelerated_layers))
             if hw.cpu_only_layers is not None:
                 table.add_row("CPU-Only Layers", str(hw.cpu_only_layers))
+            if hw.memory_bound_layers is not None:
+                table.add_row("Memory-Bound Layers", str(hw.memory_bound_layers))
+            if hw.fused_layers is not None:
+                table.add_row("Fused Layers", str(hw.fused_layers))
+            if hw.fused_total_cycles:
+                table.add_row("Fused Cycles", f"{hw.fused_total_cycles:,}")
+            if hw.fused_latency_ms:
+                table.add_row("Fused Latency", f"{hw.fused_latency_ms:.2f} ms")
+            if hw.fused_peak_memory_kb:
+                table.add_row(
+                    "Fused Peak Memory", f"{hw.fused_peak_memory_kb:.2f} KB"
+                )
 
             console.print(table)
 
@@ -734,3 +834,132 @@ class ResourceProfileReport(BaseModel):
                 f"{e}"
             )
             return False
+
+
+class CalibrationResult(BaseModel):
+    """
+    Hardware profile fitted to measured on-target timings.
+
+    Attributes:
+        hardware_profile: Profile with the fitted operator infos
+        coefficients: Fitted cycles per operation (or per byte for MEMORY
+            entries), by operator info name
+        measured_layers: Number of model layers with measured timings
+        error_before_percent: Mean absolute prediction error of the original
+            profile, per layer or for the whole inference
+        error_after_percent: Mean absolute prediction error of the fitted
+            profile on the same measurements
+    """
+
+    hardware_profile: HardwareProfile = Field(
+        description="Calibrated hardware profile"
+    )
+    coefficients: dict[str, float] = Field(
+        default_factory=dict, description="Fitted cycles by operator info name"
+    )
+    measured_layers: int = Field(
+        ge=0, description="Count of layers with measured timings"
+    )
+    error_before_percent: Optional[float] = Field(
+        default=None, ge=0, description="Prediction error before calibration"
+    )
+    error_after_percent: Optional[float] = Field(
+        default=None, ge=0, description="Prediction error after calibration"
+    )
+
+
+class ModelAnalysisReport(BaseModel):
+    """
+    Compatibility and resource profile of one model from a single pass.
+
+    Attributes:
+        compatibility_report: Compatibility of the model with the target
+        profile_report: Resource profile of the model on the target
+    """
+
+    compatibility_report: CompatibilityReport = Field(
+        description="Compatibility analysis report"
+    )
+    profile_report: ResourceProfileReport = Field(
+        description="Resource profiling report"
+    )
+
+
+class ProfileComparison(BaseModel):
+    """
+    Comparison of one model's estimates across hardware targets.
+
+    Attributes:
+        model_name: Name of the model file
+        model_path: Path to the model file
+        targets: Estimates of each target, in the order of the given profiles
+    """
+
+    model_name: str = Field(description="Model file name")
+    model_path: str = Field(description="Model file path")
+    targets: list[TargetComparison] = Field(
+        default_factory=list, description="Estimates per hardware target"
+    )
+
+    def visualize_comparison(self, to_buffer: bool = False) -> str | None:
+        """
+        Generate a table comparing latency, energy and memory fit per target.
+
+        Args:
+            to_buffer: Return the table as text instead of printing it
+
+        Returns:
+            Table text if to_buffer is set, otherwise None
+        """
+        if not HAS_RICH:
+            print("Please install 'rich' to visualize results: pip install rich")
+            return None
+
+        if to_buffer:
+            buffer = io.StringIO()
+            console = Console(
+                file=buffer, force_terminal=False, no_color=True, width=320
+            )
+        else:
+            console = Console()
+
+        console.print(f"=== TARGET COMPARISON: {self.model_name} ===")
+
+        table = Table(show_header=True, box=box.ASCII)
+        table.add_column("Target")
+        table.add_column("Cycles", justify="right")
+        table.add_column("Latency (ms)", justify="right")
+        table.add_column("Energy (uJ)", justify="right")
+        table.add_column("Peak RAM (KB)", justify="right")
+        table.add_column("RAM (KB)", justify="right")
+        table.add_column("RAM Use", justify="right")
+        table.add_column("RAM Status", justify="center")
+        table.add_column("Fits Flash", justify="center")
+        table.add_column("Accel Layers", justify="right")
+        table.add_column("Memory-Bound", justify="right")
+
+        for target in self.targets:
+            table.add_row(
+                target.target,
+                f"{target.total_cycles:,}",
+                f"{target.estimated_latency_ms:.2f}",
+                f"{target.estimated_energy_uj:.2f}",
+                f"{target.peak_memory_kb:.2f}"
+                if target.peak_memory_kb is not None else "-",
+                f"{target.available_ram_kb:.2f}"
+                if target.available_ram_kb is not None else "-",
+                f"{target.ram_utilization_percent:.1f}%"
+                if target.ram_utilization_percent is not None else "-",
+                target.ram_status,
+                "-" if target.fits_flash is None
+                else ("Yes" if target.fits_flash else "No"),
+                str(target.accelerated_layers),
+                str(target.memory_bound_layers)
+                if target.memory_bound_layers is not None else "-",
+            )
+
+        console.print(table)
+
+        if to_buffer:
+            return buffer.getvalue()
+        return None
@@ -9,10 +9,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import sys
 from pathlib import Path
 from typing import ClassVar
 
+from cfsai_tflite.cache import ParseCache, source_version
 from cfsai_tflite.schema.Model import Model
+from cfsai_tflite.schema.OperatorCode import OperatorCode
 from cfsai_tflite.schema.SubGraph import SubGraph
 from cfsai_tflite.schema.Tensor import Tensor
 from cfsai_tflite.schema.TensorType import TensorType
@@ -47,6 +51,21 @@ def _tensor_const_length(model:Model, tensor:Tensor) -> int:
                 return buf.DataLength()
     return 0
 
+def _load_model(fname: Path) -> Model:
+    # Open, parse and validate file
+    with open(fname, 'rb') as f:
+        b = f.read()
+
+    # Check that file appears to be a valid model before parsing
+    if b[4:8] != b'TFL3':
+        raise ValueError(f'{fname} is not a valid TFLite file')
+
+    return Model.GetRootAsModel(b, 0)
+
+def _operator_codes(model: Model) -> list[OperatorCode]:
+    # Index of all operators used in model
+    return [model.OperatorCodes(o) for o in range(model.OperatorCodesLength())]
+
 def _align_up(x: int, alignment: int = 16) -> int:
     return (x + (alignment - 1)) & ~(alignment - 1)
 
@@ -217,12 +236,13 @@ class OperatorInfo:
 
 class TfliteInfo:
     """Class to manage tensorflow lite information."""
-    def __init__(self, fname: Path) -> None:
+    def __init__(self, fname: Path, cache: ParseCache | None = None) -> None:
         """
         Instializes a TfliteInfo.
 
         Args:
             fname: Path to the `tflite` file.
+            cache: Optional cache of previously gathered model information.
         """
         self.__ops: set[str] = set()
         self.__summary: str = ''
@@ -236,22 +256,25 @@ class TfliteInfo:
         self.__input_len: list[int] = []
         self.__output_width: list[int] = []
         self.__output_len: list[int] = []
-
-        # Open, parse and validate file
-        with open(fname, 'rb') as f:
-            b = f.read()
-
-        # Check that file appears to be a valid model before parsing
-        if b[4:8] != b'TFL3':
-            raise ValueError(f'{fname} is not a valid TFLite file')
-        model = Model.GetRootAsModel(b, 0)
+        self.__fname = Path(fname)
+        self.__op_codes: list[OperatorCode] | None = None
+
+        # Reuse the information gathered for the same model file
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key(fname, type(self).__name__,
+                                  source_version(sys.modules[__name__]))
+            payload = cache.get(cache_key)
+            if payload is not None:
+                self.__dict__.update(json.loads(payload))
+                self.__ops = set(self.__ops)
+                return
+
+        model = _load_model(self.__fname)
 
         # Index of all operators used in model
-        op_codes_length = model.OperatorCodesLength()
-        self.op_codes = []
-        for o in range(op_codes_length):
-            code = model.OperatorCodes(o)
-            self.op_codes.append(code)
+        self.__op_codes = _operator_codes(model)
+        for code in self.__op_codes:
             # Use DeprecatedBuiltinCode() instead of BuiltinCode() for 
             # compatibility with older models. We only have enumerations for the
             # first 119 codes so a byte is sufficient. 
@@ -341,6 +364,29 @@ class TfliteInfo:
         for op in self.operators:
             self.add_to_summary(f'  {op}')
 
+        if cache is not None and cache_key is not None:
+            # The operator codes and path are not serializable, they are set up
+            # again when the entry is used
+            state = {k: v for k, v in self.__dict__.items()
+                     if k not in ('_TfliteInfo__op_codes', '_TfliteInfo__fname')}
+            state['_TfliteInfo__ops'] = self.operators
+            cache.put(cache_key, json.dumps(state))
+
+    @property
+    def op_codes(self) -> list[OperatorCode]:
+        """
+        Operator codes of the model.
+
+        Read from the model file on first use when the information came
+        from the cache.
+
+        Returns:
+            Operator codes, indexed by operator code index.
+        """
+        if self.__op_codes is None:
+            self.__op_codes = _operator_codes(_load_model(self.__fname))
+        return self.__op_codes
+
 
     def add_op(self, key: str) -> None:
         """
@@ -0,0 +1,246 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+# Environment variables controlling the default cache
+CACHE_DIR_ENV = 'CFSAI_CACHE_DIR'
+CACHE_MAX_BYTES_ENV = 'CFSAI_CACHE_MAX_BYTES'
+CACHE_DISABLE_ENV = 'CFSAI_NO_CACHE'
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MEMORY_ENTRIES = 32
+_ENTRY_SUFFIX = '.json'
+
+
+@functools.cache
+def source_version(*modules: ModuleType) -> str:
+    """
+    Version string that changes whenever the source of any module changes.
+
+    The sources are read once per process.
+
+    Args:
+        modules: Modules whose results are cached.
+
+    Returns:
+        Hex digest of the module sources.
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        if module.__file__ is None:
+            # Modules without a source file only change with the interpreter
+            digest.update(module.__name__.encode('utf-8'))
+        else:
+            digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class ParseCache:
+    """
+    On-disk cache of model analysis results.
+
+    Entries are keyed by the path, size and modification time of the model
+    file, the kind of result and the version of the code that produced it,
+    so a cached result is reused by every tool that analyzes the same file
+    without reading the model again. The contents are not hashed: replacing
+    or touching the file invalidates its entries, but a file rewritten in
+    place with the same size and modification time is not detected. When
+    the total size of the entries exceeds the limit, the least recently
+    used entries are removed. Cache failures are logged and otherwise
+    ignored, so a broken cache never breaks an analysis.
+
+    Long-lived processes can also keep the most recently used entries in
+    memory, which skips the disk for repeated analyses of the same model.
+    """
+    # Cache returned by `default`, set by `share_in_memory`
+    _shared: 'ParseCache | None' = None
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        max_bytes: int | None = None,
+        memory_entries: int = 0,
+    ) -> None:
+        """
+        Initializes a ParseCache.
+
+        Args:
+            directory: Cache directory. Defaults to `$CFSAI_CACHE_DIR`, or
+                `~/.cache/cfsai` if that is not set.
+            max_bytes: Size limit of all entries. Defaults to
+                `$CFSAI_CACHE_MAX_BYTES`, or 64 MiB if that is not set.
+            memory_entries: Number of recently used entries also kept in
+                memory. Zero keeps none.
+        """
+        if directory is None:
+            directory = Path(os.environ.get(
+                CACHE_DIR_ENV, Path.home() / '.cache' / 'cfsai'
+            ))
+        if max_bytes is None:
+            max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, str] = OrderedDict()
+
+    @classmethod
+    def default(cls) -> 'ParseCache | None':
+        """
+        Get the cache configured by the environment.
+
+        Returns:
+            The default cache, or None if `$CFSAI_NO_CACHE` is set.
+        """
+        if os.environ.get(CACHE_DISABLE_ENV):
+            return None
+        if cls._shared is not None:
+            return cls._shared
+        return cls()
+
+    @classmethod
+    def share_in_memory(
+        cls,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES
+    ) -> 'ParseCache | None':
+        """
+        Make `default` return one cache that also keeps entries in memory.
+
+        Used by worker processes that serve many requests, so every request
+        shares the entries loaded by the previous ones.
+
+        Args:
+            memory_entries: Number of recently used entries kept in memory.
+
+        Returns:
+            The shared cache, or None if `$CFSAI_NO_CACHE` is set.
+        """
+        if os.environ.get(CACHE_DISABLE_ENV):
+            return None
+        cls._shared = cls(memory_entries=memory_entries)
+        return cls._shared
+
+    @staticmethod
+    def key(
+        model_path: str | Path,
+        kind: str,
+        version: str,
+        *options: object,
+    ) -> str:
+        """
+        Build the key of a cache entry.
+
+        Args:
+            model_path: Path to the model file.
+            kind: Kind of cached result, e.g. the producing class.
+            version: Version of the code producing the result.
+            options: Any other arguments that affect the result.
+
+        Returns:
+            Cache key.
+
+        Raises:
+            OSError: If the model file cannot be accessed.
+        """
+        model_path = Path(model_path).resolve()
+        stat = model_path.stat()
+        identity = (str(model_path), stat.st_size, stat.st_mtime_ns)
+        return hashlib.sha256(
+            repr((*identity, kind, version, *options)).encode('utf-8')
+        ).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cache entry.
+
+        Args:
+            key: Key from `ParseCache.key`.
+
+        Returns:
+            The cached payload, or None on a miss.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        path = self.directory / (key + _ENTRY_SUFFIX)
+        try:
+            payload = path.read_text(encoding='utf-8')
+            # Mark as recently used for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f'Parse cache read failed for {path}: {e}')
+            return None
+        self._remember(key, payload)
+        return payload
+
+    def _remember(self, key: str, payload: str) -> None:
+        """Keep an entry in memory, dropping the least recently used."""
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def put(self, key: str, payload: str) -> None:
+        """
+        Store a cache entry and evict old entries beyond the size limit.
+
+        Args:
+            key: Key from `ParseCache.key`.
+            payload: Serialized result.
+        """
+        self._remember(key, payload)
+        path = self.directory / (key + _ENTRY_SUFFIX)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.debug(f'Parse cache write failed for {path}: {e}')
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the size limit is met."""
+        try:
+            entries = []
+            for path in self.directory.glob('*' + _ENTRY_SUFFIX):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError as e:
+            logger.debug(f'Parse cache scan failed for {self.directory}: {e}')
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError as e:
+                logger.debug(f'Parse cache eviction failed for {path}: {e}')
@@ -24,7 +24,11 @@ class OperatorInfo(BaseModel):
     """
     name: str = Field(
         alias='Name',
-        description='The name of the operator or operator class'
+        description=(
+            'The name of the operator or operator class, MAC for any '
+            'operation, or MEMORY for one byte of tensor traffic. An ACCEL: '
+            'prefix marks the cost on the accelerator'
+        )
     )
     cycles: float = Field(
         alias='Cycles', gt=0,
@@ -66,6 +70,25 @@ class HardwareProfile(BaseModel):
         alias='OperatorInfos',
         description='List of Operator descriptions'
     )
+    sram_bandwidth: Optional[float] = Field(
+        default=None,
+        alias='SramBandwidth', gt=0,
+        description='Sustained SRAM bandwidth for activations (bytes/cycle, optional)'
+    )
+    flash_bandwidth: Optional[float] = Field(
+        default=None,
+        alias='FlashBandwidth', gt=0,
+        description='Sustained flash bandwidth for weights (bytes/cycle, optional)'
+    )
+    fusion_rules: Optional[list[list[list[str]]]] = Field(
+        default=None,
+        alias='FusionRules',
+        description=(
+            'Operator chains run as one fused layer, each a list of steps '
+            'listing the operators allowed at that step (default: conv/FC '
+            'followed by an activation)'
+        )
+    )
     target: Optional[UserTarget] = Field(
         default=None,
         alias='Target',
@@ -80,4 +103,13 @@ class HardwareProfile(BaseModel):
             if op_info.name == name:
                 return op_info
         return None
+
+    def target_name(self, profile_idx: int) -> str:
+        """Name the profile by its SoC and core, or by its position."""
+        if self.target is None:
+            return f"Profile {profile_idx}"
+        name = f"{self.target.soc}/{self.target.core}"
+        if self.target.accelerator:
+            name += f"/{self.target.accelerator}"
+        return name
    
@@ -0,0 +1,175 @@
+# Copyright (c) 2026 Analog Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Long-lived worker mode for the CFSAI tool entry points.
+
+A worker reads newline-delimited JSON-RPC 2.0 requests on stdin and handles
+them one at a time in the same process, so the interpreter start-up and
+imports are paid once rather than per request. While a request runs, its JSON
+log messages are written to stdout as usual, followed by one JSON-RPC response
+line with the request's id. Anything the tool prints outside the logger is
+returned in the response instead, so stdout only ever carries JSON lines.
+
+Methods:
+    run: Run the tool. The params hold the tool's command line arguments,
+        with dashes replaced by underscores, and the contents of the `--file`
+        config either inline under "config" or as a path under "file".
+        Result: {"exit_code": int, "output": str}
+    shutdown: Stop the worker after responding.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import sys
+from collections.abc import Callable
+from typing import Any, Optional, TextIO
+
+logger = logging.getLogger("cfsai_types.worker")
+
+JSONRPC_VERSION = '2.0'
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+TOOL_ERROR = -32000
+
+
+def load_config(params: dict[str, Any]) -> Any:
+    """
+    Get the `--file` config of a worker request.
+
+    Args:
+        params: Request params
+
+    Returns:
+        The inline "config" payload, or the JSON contents of the "file" path
+
+    Raises:
+        ValueError: If the params have neither
+    """
+    if 'config' in params:
+        return params['config']
+    if 'file' in params:
+        with open(params['file']) as f:
+            return json.load(f)
+    raise ValueError('Request params need a "config" or a "file"')
+
+
+def _response(
+    request_id: Any,
+    result: Optional[dict[str, Any]] = None,
+    error: Optional[dict[str, Any]] = None
+) -> str:
+    """Serialize a JSON-RPC response."""
+    message: dict[str, Any] = {'jsonrpc': JSONRPC_VERSION, 'id': request_id}
+    if error is not None:
+        message['error'] = error
+    else:
+        message['result'] = result
+    return json.dumps(message)
+
+
+def _handle_line(
+    line: str,
+    handler: Callable[[dict[str, Any]], None]
+) -> tuple[Optional[str], bool]:
+    """
+    Handle one request line.
+
+    Args:
+        line: Request line
+        handler: Function running the tool for one request's params
+
+    Returns:
+        Tuple of the response line, None for notifications, and whether the
+        worker should stop
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return _response(None, error={
+            'code': PARSE_ERROR, 'message': f'Invalid JSON: {e}'
+        }), False
+
+    if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+        return _response(None, error={
+            'code': INVALID_REQUEST, 'message': 'Request must have a method'
+        }), False
+
+    request_id = request.get('id')
+    is_notification = 'id' not in request
+    method = request['method']
+    params = request.get('params', {})
+
+    if method == 'shutdown':
+        return (None if is_notification else _response(request_id, {})), True
+    if method != 'run':
+        response = _response(request_id, error={
+            'code': METHOD_NOT_FOUND, 'message': f'Unknown method "{method}"'
+        })
+    elif not isinstance(params, dict):
+        response = _response(request_id, error={
+            'code': INVALID_PARAMS, 'message': 'Params must be an object'
+        })
+    else:
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                try:
+                    handler(params)
+                    exit_code = 0
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else 1
+            response = _response(request_id, {
+                'exit_code': exit_code, 'output': output.getvalue()
+            })
+        except Exception as e:
+            logger.error(f'{e.__class__.__name__}{e}')
+            response = _response(request_id, error={
+                'code': TOOL_ERROR,
+                'message': f'{e.__class__.__name__}{e}',
+                'data': {'exit_code': 1, 'output': output.getvalue()}
+            })
+
+    return (None if is_notification else response), False
+
+
+def serve(
+    handler: Callable[[dict[str, Any]], None],
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None
+) -> None:
+    """
+    Handle requests until stdin closes or a shutdown request arrives.
+
+    Args:
+        handler: Function running the tool for one request's params. It may
+            call `sys.exit` to set the exit code, and any exception it raises
+            is returned as an error response.
+        stdin: Request stream, defaults to `sys.stdin`
+        stdout: Response stream, defaults to `sys.stdout`
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    for line in stdin:
+        if not line.strip():
+            continue
+        response, stop = _handle_line(line, handler)
+        if response is not None:
+            stdout.write(response + '\n')
+            stdout.flush()
+        if stop:
+            break
@@ -332,3 +332,85 @@ def test_dataset_unsupported_format():
         # Clean up temporary dataset file
         if os.path.exists(dataset_path):
             os.remove(dataset_path)
+
+
+def test_serve_requests():
+    """Test several requests are answered by one --serve worker."""
+    supported = create_hardware_profile(1024, 1024, 100, [], [])
+    int16_only = create_hardware_profile(1024, 1024, 100, [], ["INT16"])
+    model = "tests/data/models/hello_world_f32.tflite"
+
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "run",
+         "params": {"config": supported.model_dump(), "model": model}},
+        {"jsonrpc": "2.0", "id": 2, "method": "run",
+         "params": {"config": int16_only.model_dump(), "model": model}},
+        {"jsonrpc": "2.0", "id": 3, "method": "run",
+         "params": {"config": supported.model_dump(),
+                    "model": "tests/missing.tflite"}},
+        {"jsonrpc": "2.0", "id": 4, "method": "unknown"},
+        {"jsonrpc": "2.0", "id": 5, "method": "shutdown"},
+    ]
+    result = subprocess.run(
+        [sys.executable, "-m", "cfsai_compatibility_analyzer", "--serve"],
+        input="".join(json.dumps(r) + "\n" for r in requests),
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0
+
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    responses = {line["id"]: line for line in lines if "jsonrpc" in line}
+    assert responses[1]["result"]["exit_code"] == 0
+    assert responses[2]["result"]["exit_code"] == 10
+    assert "Model file not found" in responses[3]["error"]["message"]
+    assert responses[4]["error"]["code"] == -32601
+    assert responses[5]["result"] == {}
+
+    # Log messages of a request come before its response
+    messages = [
+        line["msg"] for line in lines[:lines.index(responses[2])] if "msg" in line
+    ]
+    assert any("FULLY_CONNECTED operation uses FLOAT32." in msg for msg in messages)
+
+
+def test_compat_matrix(tmp_path):
+    """Test --matrix checks every model against every profile."""
+    profiles = [
+        create_hardware_profile(1024, 1024, 100, [], []),
+        create_hardware_profile(1024, 1024, 100, [], ["INT16"]),
+        create_hardware_profile(1024, 1024, 100, ["DUMMY"], []),
+    ]
+    config_file = tmp_path / "profiles.json"
+    config_file.write_text(json.dumps([p.model_dump() for p in profiles]))
+    models = [
+        "tests/data/models/hello_world_f32.tflite",
+        "tests/data/models/hello_world_int8.tflite",
+        "tests/missing.tflite",
+    ]
+    json_file = tmp_path / "matrix.json"
+    csv_file = tmp_path / "matrix.csv"
+
+    result = subprocess.run(
+        [sys.executable, "-m", "cfsai_compatibility_analyzer", "--matrix",
+         "--file", str(config_file), "--model", *models, "--jobs", "2",
+         "--json-file", str(json_file), "--csv-file", str(csv_file)],
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0
+
+    matrix = json.loads(json_file.read_text())
+    assert matrix["models"] == models
+    assert len(matrix["targets"]) == len(set(matrix["targets"])) == 3
+    statuses = [cell["status"] for cell in matrix["cells"]]
+    assert statuses == [
+        "pass", "fail", "fail",
+        "pass", "fail", "fail",
+        "error", "error", "error",
+    ]
+    assert matrix["cells"][2]["dominating_issue"] == "Operator: FULLY_CONNECTED"
+    assert "Model file not found" in matrix["cells"][6]["dominating_issue"]
+
+    rows = csv_file.read_text().splitlines()
+    assert rows[0] == "model," + ",".join(matrix["targets"])
+    assert rows[1].startswith(models[0] + ",pass,fail: Data Type: ")
+
@@ -19,6 +19,8 @@ import os
 import tempfile
 import json
 
+import numpy as np
+
 from cfsai_types.config.aiconfig import ConfigBackend
 from cfsai_types.config.targets import UserTarget
 from cfsai_types.config.verified import ProjectInfo, VerifiedConfig, VerifiedBackendConfig
@@ -185,3 +187,303 @@ def test_bad_models():
     assert result.returncode == expected_exit_code
     assert "valid" in result.stderr
 
+
+
+@pytest.fixture
+def izer():
+    """The izer package, which needs the PyTorch checkpoint loader to import."""
+    return pytest.importorskip("cfsai_backend_izer.izer")
+
+
+@pytest.mark.parametrize("groups", [1, 4])
+def test_conv2d_sparse_matches_dense(izer, groups):
+    from cfsai_backend_izer.izer import compute
+
+    rng = np.random.default_rng(0)
+    in_chan, out_chan = 4, 4 if groups > 1 else 6
+    data = rng.integers(-128, 128, size=(in_chan, 8, 8)).astype(np.int64)
+    weight = rng.integers(-128, 128, size=(out_chan, in_chan // groups, 3, 3)).astype(np.int64)
+    bias = rng.integers(-1000, 1000, size=out_chan).astype(np.int64)
+    # Prune most kernels, and all kernels of the first input channel
+    weight[rng.random((out_chan, in_chan // groups)) < 0.7] = 0
+    if groups == 1:
+        weight[:, 0] = 0
+
+    def conv(w, mask=None):
+        return compute.conv2d(
+            data, w, bias, (in_chan, 8, 8), (out_chan, 8, 8), (3, 3), (1, 1), (1, 1),
+            (1, 1), (1, 1), (0, 0), groups=groups, mask=mask,
+        )
+
+    mask = compute.kernel_mask(weight)
+    assert mask.any() and not mask.all()
+    np.testing.assert_array_equal(conv(weight, mask), conv(weight))
+
+    # A dense mask takes the dense path
+    dense = rng.integers(1, 128, size=weight.shape).astype(np.int64)
+    np.testing.assert_array_equal(conv(dense, compute.kernel_mask(dense)), conv(dense))
+
+
+def test_range_stats_collect_save_load(izer, tmp_path, monkeypatch):
+    from cfsai_backend_izer.exceptions import IzerError
+    from cfsai_backend_izer.izer import rangestats, state
+
+    monkeypatch.setattr(state, 'layer_name', [None])
+    rng = np.random.default_rng(0)
+    batch = rng.integers(-300, 300, size=(5, 3, 16))  # Conv1d outputs, (N, C, L)
+    rangestats.reset()
+    rangestats.collect(0, batch, 8, batch=True)
+    batched = {k: v.copy() for k, v in rangestats.rangedict[0].items()}
+    assert batched['count'].tolist() == [5 * 16] * 3
+    assert batched['min'].tolist() == batch.min(axis=(0, 2)).tolist()
+    assert batched['max'].tolist() == batch.max(axis=(0, 2)).tolist()
+    assert batched['clip_low'].tolist() == (batch < -128).sum(axis=(0, 2)).tolist()
+    assert batched['clip_high'].tolist() == (batch > 127).sum(axis=(0, 2)).tolist()
+    assert rangestats.clipped(0) == int(((batch < -128) | (batch > 127)).sum())
+
+    # One sample per simulator run, merged through the archive
+    filename = str(tmp_path / 'range.npz')
+    for sample in batch:
+        rangestats.reset()
+        rangestats.collect(0, sample, 8)
+        rangestats.save(filename, append=True)
+    rangestats.reset()
+    rangestats.load(filename)
+    for key, val in batched.items():
+        np.testing.assert_array_equal(rangestats.rangedict[0][key], val)
+
+    # Without appending, an existing archive is replaced
+    rangestats.reset()
+    rangestats.collect(0, batch[0], 8)
+    rangestats.save(filename)
+    rangestats.reset()
+    rangestats.load(filename)
+    assert rangestats.rangedict[0]['count'].tolist() == [16] * 3
+
+    # Statistics of another network are not merged
+    with pytest.raises(IzerError):
+        rangestats.collect(0, batch[0, :2], 8)
+    rangestats.reset()
+    rangestats.collect(0, batch[0, :2], 8)
+    with pytest.raises(IzerError):
+        rangestats.load(filename)
+    rangestats.reset()
+
+
+def test_range_stats_inflight_eltwise(izer, monkeypatch):
+    from cfsai_backend_izer.izer import op, rangestats, simulate, state
+
+    # Layer 0 adds two 4-channel operands in flight, then convolves them to 6 channels
+    for name, val in {
+        'layer_name': [None],
+        'operator': [op.CONV2D],
+        'output_layer': [False],
+        'verbose': False,
+        'verbose_all': False,
+        'range_stats': 'range.npz',
+    }.items():
+        monkeypatch.setattr(state, name, val)
+    rng = np.random.default_rng(0)
+    operands = rng.integers(-128, 128, size=(2, 4, 4, 4)).astype(np.int64)
+    kernel = rng.integers(-128, 128, size=(6, 4, 3, 3)).astype(np.int64)
+
+    rangestats.reset()
+    data, _ = simulate.eltwise_layer(op.ELTWISE_ADD, 0, operands[0].shape, 1, operands,
+                                     output_width=8, operands=2)
+    simulate.conv2d_layer(0, data.shape, (3, 3), 1, 6, (1, 1), (1, 1), (1, 1), None,
+                          kernel, None, data)
+
+    # Only the convolution output is collected, with its output shift
+    acc = rangestats.rangedict[0]
+    assert acc['min'].shape == (6,)
+    assert acc['count'].tolist() == [16] * 6
+    assert int(acc['output_shift']) == 1
+    rangestats.reset()
+
+
+def test_stats_estimate_matches_simulated(izer, monkeypatch):
+    from cfsai_backend_izer.izer import op, simulate, state, stats
+
+    # Layer 0: 3x3 conv2d 3->8 on 16x16 with ReLU and 2x2 max pooling first
+    # Layer 1: depthwise 3x3 conv2d on 8x8 with two-operand element-wise add
+    # Layer 2: flattening linear layer 8x8x8 -> 10
+    for name, val in {
+        'layers': 3,
+        'start_layer': 0,
+        'layer_name': [None] * 3,
+        'operator': [op.CONV2D, op.CONV2D, op.CONV2D],
+        'input_channels': [3, 8, 8],
+        'output_channels': [8, 8, 10],
+        'input_dim': [[16, 16], [8, 8], [8, 8]],
+        'input_crop': [[0, 0], [0, 0], [0, 0]],
+        'pooled_dim': [[8, 8], [8, 8], [8, 8]],
+        'output_dim': [[8, 8], [8, 8], [1, 1]],
+        'kernel_size': [[3, 3], [3, 3], [1, 1]],
+        'conv_groups': [1, 8, 1],
+        'pool': [[2, 2], [1, 1], [1, 1]],
+        'pool_average': [False, False, False],
+        'pool_first': [True, True, True],
+        'operands': [1, 2, 1],
+        'eltwise': [op.NONE, op.ELTWISE_ADD, op.NONE],
+        'activation': [op.ACT_RELU, None, None],
+        'flatten': [False, False, True],
+        'output_layer': [False] * 3,
+        'verbose': False,
+        'verbose_all': False,
+        'range_stats': None,
+    }.items():
+        monkeypatch.setattr(state, name, val)
+
+    estimated = stats.estimate()
+    assert estimated['macc'] == [27 * 8 * 64, 9 * 8 * 64, 8 * 64 * 10]
+    assert estimated['comp'] == [4 * 3 * 64 + 8 * 64, 0, 0]
+    assert estimated['add'] == [0, 8 * 64, 0]
+    assert 'true_macc' not in estimated
+
+    # Simulate the network layer by layer the way the backend does
+    rng = np.random.default_rng(0)
+
+    def kernel(out_chan, in_chan):
+        return rng.integers(-128, 128, size=(out_chan, in_chan, 3, 3)).astype(np.int64)
+
+    stats.reset()
+    try:
+        data = rng.integers(-128, 128, size=(1, 3, 16, 16)).astype(np.int64)
+        data, size = simulate.pooling_layer(0, data[0].shape, (2, 2), (2, 2), False, data)
+        data, _ = simulate.conv2d_layer(0, size, (3, 3), 0, 8, (1, 1), (1, 1), (1, 1),
+                                        op.ACT_RELU, kernel(8, 3), None, data[0])
+
+        data = np.stack((data, data))
+        data, size = simulate.pooling_layer(1, data[0].shape, (1, 1), (1, 1), False, data,
+                                            operands=2)
+        data, size = simulate.eltwise_layer(op.ELTWISE_ADD, 1, size, 0, data, operands=2)
+        data, _ = simulate.conv2d_layer(1, size, (3, 3), 0, 8, (1, 1), (1, 1), (1, 1),
+                                        None, kernel(8, 1), None, data, groups=8)
+
+        data = data.reshape(8 * 8 * 8, 1, 1)
+        weight = rng.integers(-128, 128, size=(10, 8 * 8 * 8, 1, 1)).astype(np.int64)
+        simulate.conv2d_layer(2, data.shape, (1, 1), 0, 10, (0, 0), (1, 1), (1, 1),
+                              None, weight, None, data)
+
+        assert stats.mismatches(estimated) == []
+
+        stats.account(1, 'macc', 1)
+        assert stats.mismatches(estimated) == [
+            f'Layer 1: Estimated macc {9 * 8 * 64:,} does not match simulated '
+            f'{9 * 8 * 64 + 1:,}'
+        ]
+    finally:
+        stats.reset()
+
+
+def test_explore_variants_and_ranking(izer):
+    from cfsai_backend_izer.izer import explore
+
+    todo = explore.variants({'fifo': [False, True], 'layers.0.processors': [1, 3, 7]})
+    assert len(todo) == 6
+    assert todo[0] == {'fifo': False, 'layers.0.processors': 1}
+    assert todo[-1] == {'fifo': True, 'layers.0.processors': 7}
+
+    def result(variant, cycles, kmem, dmem, error=None):
+        return {'variant': {'v': variant}, 'error': error, 'cycles': cycles,
+                'inference_ns': cycles * 20, 'kmem_used': kmem, 'bmem_used': 0,
+                'dmem_used': dmem}
+
+    results = [
+        result('fast', 100, 50, 10),
+        result('small', 200, 20, 10),
+        result('dominated', 150, 60, 10),
+        result('duplicate', 100, 50, 10),
+        {'variant': {'v': 'broken'}, 'error': 'Too many processors'},
+    ]
+    explore.mark_pareto(results)
+    assert [r['pareto'] for r in results] == [True, True, False, True, False]
+
+    table = explore.summary(results).splitlines()
+    assert [line.split()[-1] for line in table[1:4]] == ['v=fast', 'v=duplicate', 'v=small']
+    assert 'v=dominated' not in '\n'.join(table)
+    assert '1 variant(s) failed:' in table
+    assert '  v=broken: Too many processors' in table
+    assert table[1].split()[:2] == ['100', '2.0']
+    assert 'v=dominated' in explore.summary(results, pareto_only=False)
+
+
+def test_explore_records_failed_variants(izer, monkeypatch):
+    from cfsai_backend_izer.izer import explore, state
+    from cfsai_backend_izer.izer.args_dataclass import CNNGeneratorArgs
+
+    calls = []
+
+    def codegen(args):
+        calls.append(state.stats_only)
+        if args.fifo:
+            raise RuntimeError('Unexpected failure')
+        raise KeyError('processors')
+
+    monkeypatch.setattr(explore, 'codegen', codegen)
+    args = CNNGeneratorArgs(device='MAX78000', config_file='network.yaml')
+    results = explore.explore(args, {'fifo': [True, False]}, jobs=1)
+
+    assert calls == [True, True]
+    assert state.stats_only is False
+    assert [r['error'] for r in results] == ['Unexpected failure', "'processors'"]
+    assert not any(r['pareto'] for r in results)
+
+
+def test_explore_evaluate_reports_inference_time(izer, monkeypatch):
+    from cfsai_backend_izer.izer import explore, state, stats
+    from cfsai_backend_izer.izer.args_dataclass import CNNGeneratorArgs
+
+    def codegen(args):  # pylint: disable=unused-argument
+        # Only the statistics pass runs, which must still estimate the network latency
+        assert state.stats_only
+        stats.resourcedict.update(latency=1000, inference_ns=45_000, kmem_used=3,
+                                  bmem_used=2, dmem_used=1)
+
+    monkeypatch.setattr(explore, 'codegen', codegen)
+    args = CNNGeneratorArgs(device='MAX78000', config_file='network.yaml')
+    try:
+        rv = explore.evaluate(args, {'fifo': True})
+    finally:
+        stats.reset()
+
+    assert rv['error'] is None
+    assert rv['cycles'] == 1000
+    assert rv['inference_ns'] == 45_000
+
+
+def test_network_latency_estimate(izer, monkeypatch):
+    from cfsai_backend_izer.izer import latency, state
+    from cfsai_backend_izer.izer.rtlsim import (ARM_APB_ACCESS, NS_PER_CNN_CYCLE,
+                                                RISCV_APB_ACCESS, RISCV_FASTFIFO_ACCESS)
+
+    monkeypatch.setattr(state, 'layer_name', [None] * 3)
+    assert latency.access_ns((1, 2, 3, 4, 0, 0)) == 10 * ARM_APB_ACCESS
+    assert latency.access_ns((1, 2, 0, 0, 3, 4), riscv=True) \
+        == 3 * RISCV_APB_ACCESS + 7 * RISCV_FASTFIFO_ACCESS
+
+    none = (0,) * 6
+    input_access = (0, 100, 0, 0, 0, 0)
+    unload_access = [none, none, (25, 0, 0, 0, 0, 0)]
+    estimate = latency.network_estimate(
+        [1000, -500, 200], [64, 0, 32], [8, 0, 0], input_access, unload_access,
+    )
+    assert estimate['cycles'] == 1700
+    assert estimate['estimated']
+    assert estimate['compute_ns'] == 1700 * NS_PER_CNN_CYCLE
+    assert estimate['weight_load_ns'] == (18 + 8) * ARM_APB_ACCESS
+    assert estimate['input_load_ns'] == 100 * ARM_APB_ACCESS
+    assert estimate['unload_ns'] == 25 * ARM_APB_ACCESS
+    assert estimate['inference_ns'] == estimate['input_load_ns'] + estimate['compute_ns'] \
+        + estimate['unload_ns']
+    assert estimate['total_ns'] == estimate['inference_ns'] + estimate['weight_load_ns']
+    assert 'Layer 2: 200 cycles' in latency.summary(estimate)
+
+    # Loading through the FIFO overlaps with the first layer
+    fifo = latency.network_estimate(
+        [1000, -500, 200], [64, 0, 32], [8, 0, 0], (0, 0, 10, 100, 0, 0), unload_access,
+        fifo=True,
+    )
+    assert fifo['input_load_ns'] == 110 * ARM_APB_ACCESS
+    assert fifo['inference_ns'] == max(110 * ARM_APB_ACCESS, 1000 * NS_PER_CNN_CYCLE) \
+        + 700 * NS_PER_CNN_CYCLE + 25 * ARM_APB_ACCESS
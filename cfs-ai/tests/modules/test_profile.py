@@ -178,3 +178,57 @@ def test_invalid_models():
     )
     assert result.returncode == expected_exit_code
     assert "File does not have correct magic bytes" in result.stderr
+
+
+def test_serve_requests():
+    """Test a --serve worker profiles the same model repeatedly."""
+    opinfos = [OperatorInfo(name="MAC", cycles=2, energy=0.1)]
+    p = create_hardware_profile(1024, 1024, 100, [], [], opinfos)
+    request = {
+        "jsonrpc": "2.0", "method": "run",
+        "params": {"config": p.model_dump(), "model": _good_models["HELLO"]}
+    }
+    requests = [dict(request, id=request_id) for request_id in (1, 2)]
+
+    result = subprocess.run(
+        [sys.executable, "-m", "cfsai_resource_profiler", "--serve"],
+        input="".join(json.dumps(r) + "\n" for r in requests),
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0
+
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    responses = [line for line in lines if "jsonrpc" in line]
+    assert [response["id"] for response in responses] == [1, 2]
+    for response in responses:
+        assert response["result"]["exit_code"] == 0
+        # Printed report is returned in the response
+        assert "Total MACs" in response["result"]["output"]
+
+
+def test_profile_with_compat_report():
+    """Test --compat-json-file writes both reports from one run."""
+    opinfos = [OperatorInfo(name="MAC", cycles=2, energy=0.1)]
+    p = create_hardware_profile(1024, 1024, 100, [], ["INT16"], opinfos)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = os.path.join(tmp_dir, "config.json")
+        profile_path = os.path.join(tmp_dir, "profile.json")
+        compat_path = os.path.join(tmp_dir, "compat.json")
+        with open(config_path, "w") as f:
+            json.dump(p.model_dump(), f)
+
+        result = subprocess.run(
+            [sys.executable, "-m", "cfsai_resource_profiler",
+             "--file", config_path, "--model", _good_models["HELLO"],
+             "--json-file", profile_path, "--compat-json-file", compat_path],
+            capture_output=True, text=True
+        )
+
+        # FLOAT32 layers are critical issues on an INT16 only target
+        assert result.returncode == 10
+        assert "FULLY_CONNECTED operation uses FLOAT32." in result.stdout
+        with open(profile_path) as f:
+            assert json.load(f)["hardware_metrics"]["total_cycles"] > 0
+        with open(compat_path) as f:
+            assert json.load(f)["unsupported_types"]
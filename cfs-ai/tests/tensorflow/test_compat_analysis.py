@@ -15,10 +15,13 @@ import tempfile
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+
+import numpy as np
 from utils import get_tf, has_tf
 
 
 from cfsai_compatibility_analyzer.analyze_compatibility import CompatibilityAnalyzer
+from cfsai_compatibility_analyzer.dataset import dataset_statistics
 from cfsai_compatibility_analyzer.exceptions import (
     CompatibilityAnalysisError,
     InvalidHardwareMetadataError,
@@ -26,11 +29,14 @@ from cfsai_compatibility_analyzer.exceptions import (
 )
 from cfsai_compatibility_analyzer.schemas import (
     CompatibilityReport,
+    MatrixCell,
+    MatrixStatus,
     MemoryIssue,
     OperatorIssue,
     UnsupportedTypeIssue,
 )
-from cfsai_model_parser.schemas import LayerDetail, ModelDetails
+from cfsai_model_parser import TFLiteParser
+from cfsai_model_parser.schemas import InputTensorDetail, LayerDetail, ModelDetails
 
 from cfsai_types.hardware_profile import HardwareProfile
 
@@ -513,6 +519,200 @@ class TestCompatibilityAnalyzer(unittest.TestCase):
         if report.operator_issues:
             self.assertTrue(all(issue.severity == "critical" 
                               for issue in report.operator_issues))
+
+    @unittest.skipIf(not has_tf(), "TensorFlow not available")
+    def test_analyze_model_fail_fast(self):
+        """Test fail-fast analysis stops at the first critical issue."""
+        model_path = self.create_real_tflite_model("simple_conv")
+        unsupported_ops_meta = self.valid_hw_meta.model_copy(
+            update={"supported_ops": ["ADD"]}
+        )
+        tiny_memory_meta = self.valid_hw_meta.model_copy(
+            update={"flash_size": 1.0, "ram_size": 1.0}
+        )
+
+        with patch.object(TFLiteParser, "parse_model") as mock_parse:
+            report = self.analyzer.analyze_model(
+                model_path, unsupported_ops_meta, fail_fast=True
+            )
+            mock_parse.assert_not_called()
+        self.assertTrue(report.partial)
+        self.assertIsNone(report.memory_issues)
+        full_report = self.analyzer.analyze_model(model_path, unsupported_ops_meta)
+        self.assertFalse(full_report.partial)
+        self.assertEqual(
+            [issue.operator for issue in report.operator_issues],
+            [issue.operator for issue in full_report.operator_issues]
+        )
+
+        # The file size check comes first, and needs no operators
+        report = self.analyzer.analyze_model(
+            model_path, tiny_memory_meta, fail_fast=True
+        )
+        self.assertTrue(report.partial)
+        self.assertIsNone(report.operator_issues)
+        self.assertEqual(report.memory_issues[0].memory_type, "flash_and_ram")
+
+        # Without critical issues the full analysis runs
+        supported_meta = self.valid_hw_meta.model_copy(update={
+            "supported_ops": self.valid_hw_meta.supported_ops + ["MEAN"]
+        })
+        report = self.analyzer.analyze_model(
+            model_path, supported_meta, fail_fast=True
+        )
+        self.assertFalse(report.partial)
+        full_report = self.analyzer.analyze_model(model_path, supported_meta)
+        self.assertEqual(
+            report.model_dump(exclude={"info"}),
+            full_report.model_dump(exclude={"info"})
+        )
+
+    @unittest.skipIf(not has_tf(), "TensorFlow not available")
+    def test_analyze_matrix(self):
+        """Test the matrix matches analyzing each model on each target."""
+        model_paths = [
+            self.create_real_tflite_model("simple_conv"),
+            self.create_quantized_tflite_model(),
+        ]
+        profiles = [self.valid_hw_meta, self.restrictive_hw_meta]
+
+        # Worker processes cannot be forked once TensorFlow is loaded, the
+        # parallel evaluation is covered by the module tests
+        matrix = self.analyzer.analyze_matrix(model_paths, profiles, jobs=1)
+
+        self.assertEqual(matrix.models, model_paths)
+        self.assertEqual(matrix.targets, ["Profile 0", "Profile 1"])
+        for model_path in model_paths:
+            for target, profile in zip(matrix.targets, profiles):
+                expected = MatrixCell.from_report(
+                    model_path, target,
+                    self.analyzer.analyze_model(model_path, profile)
+                )
+                self.assertEqual(matrix.cell(model_path, target), expected)
+        self.assertEqual(
+            matrix.cell(model_paths[0], "Profile 1").status, MatrixStatus.fail
+        )
+
+    def test_dataset_statistics_in_chunks(self):
+        """Test streamed dataset statistics match the whole dataset's."""
+        data = np.random.default_rng(0).normal(size=(37, 4, 4, 3))
+        data = data.astype('<f4')
+        dataset_path = os.path.join(self.temp_dir, "dataset.bin")
+        data.tofile(dataset_path)
+        input_detail = InputTensorDetail(
+            index=0, shape=[1, 4, 4, 3], dtype="float32"
+        )
+
+        statistics = dataset_statistics(
+            dataset_path, input_detail, chunk_elements=10
+        )
+
+        channels = data.reshape(-1, 3).astype(np.float64)
+        self.assertEqual(statistics.sample_count, 37)
+        self.assertEqual(statistics.trailing_bytes, 0)
+        np.testing.assert_allclose(statistics.channel_min, channels.min(axis=0))
+        np.testing.assert_allclose(statistics.channel_max, channels.max(axis=0))
+        np.testing.assert_allclose(statistics.channel_mean, channels.mean(axis=0))
+
+    def test_analyze_model_dataset_validation(self):
+        """Test the dataset is checked against the model input."""
+        models = Path(__file__).parent.parent / "data" / "models"
+        x = np.linspace(0, 2 * np.pi, 1000)
+
+        # Whole float32 samples, one of them NaN
+        dataset_path = os.path.join(self.temp_dir, "dataset.bin")
+        values = x.astype('<f4')
+        values[3] = np.nan
+        values.tofile(dataset_path)
+        report = self.analyzer.analyze_model(
+            models / "hello_world_f32.tflite", self.valid_hw_meta, dataset_path
+        )
+        self.assertEqual(report.dataset_summary.sample_count, 1000)
+        self.assertAlmostEqual(report.dataset_summary.channel_max[0], 2 * np.pi, 5)
+        self.assertEqual(
+            [issue.type for issue in report.dataset_issues], ["non_finite_values"]
+        )
+
+        # Partial sample
+        with open(dataset_path, 'wb') as f:
+            f.write(values.tobytes()[:-1])
+        report = self.analyzer.analyze_model(
+            models / "hello_world_f32.tflite", self.valid_hw_meta, dataset_path
+        )
+        self.assertEqual(report.dataset_issues[0].type, "sample_size_mismatch")
+        self.assertTrue(report.has_critical_issues())
+
+        # Quantized with the input's parameters, or not quantized at all
+        int8_model = models / "hello_world_int8.tflite"
+        input_detail = TFLiteParser().parse_model(str(int8_model)).input_details[0]
+        quantized = np.round(x / input_detail.scale[0]) + input_detail.zero_point[0]
+        np.clip(quantized, -128, 127).astype('<i1').tofile(dataset_path)
+        report = self.analyzer.analyze_model(
+            int8_model, self.valid_hw_meta, dataset_path
+        )
+        self.assertIsNone(report.dataset_issues)
+
+        np.round(x).astype('<i1').tofile(dataset_path)
+        report = self.analyzer.analyze_model(
+            int8_model, self.valid_hw_meta, dataset_path
+        )
+        self.assertEqual(
+            report.dataset_issues[0].type, "quantization_range_mismatch"
+        )
+        self.assertFalse(report.has_critical_issues())
+
+    def test_analyze_matrix_reads_dataset_once(self):
+        """Test the matrix computes dataset statistics once per model."""
+        model_path = str(
+            Path(__file__).parent.parent / "data" / "models" / "hello_world_f32.tflite"
+        )
+        dataset_path = os.path.join(self.temp_dir, "dataset.bin")
+        np.linspace(0, 1, 100).astype('<f4').tofile(dataset_path)
+        profiles = [self.valid_hw_meta, self.restrictive_hw_meta]
+
+        with patch(
+            "cfsai_compatibility_analyzer.analyze_compatibility.dataset_statistics",
+            wraps=dataset_statistics
+        ) as statistics:
+            matrix = self.analyzer.analyze_matrix(
+                [model_path], profiles, dataset_path, jobs=1
+            )
+
+        statistics.assert_called_once()
+        for target, profile in zip(matrix.targets, profiles):
+            expected = MatrixCell.from_report(
+                model_path, target,
+                self.analyzer.analyze_model(model_path, profile, dataset_path)
+            )
+            self.assertEqual(matrix.cell(model_path, target), expected)
+
+    def test_analyze_matrix_splits_targets_across_workers(self):
+        """Test a single model is evaluated in chunks of targets in parallel."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from cfsai_compatibility_analyzer import analyze_compatibility
+
+        model_path = str(
+            Path(__file__).parent.parent / "data" / "models" / "hello_world_f32.tflite"
+        )
+        profiles = [self.valid_hw_meta, self.restrictive_hw_meta] * 2
+
+        # Threads stand in for worker processes, which cannot be forked once
+        # TensorFlow may have been loaded
+        with patch.object(
+            analyze_compatibility, "ProcessPoolExecutor", ThreadPoolExecutor
+        ), patch.object(
+            analyze_compatibility, "_matrix_row",
+            wraps=analyze_compatibility._matrix_row
+        ) as matrix_row:
+            matrix = self.analyzer.analyze_matrix([model_path], profiles, jobs=2)
+
+        self.assertEqual(
+            [call.args[2] for call in matrix_row.call_args_list],
+            [["Profile 0", "Profile 1"], ["Profile 2", "Profile 3"]]
+        )
+        expected = self.analyzer.analyze_matrix([model_path], profiles, jobs=1)
+        self.assertEqual(matrix, expected)
     
 class TestCompatibilityAnalyzerIntegration(unittest.TestCase):
     """Integration tests for CompatibilityAnalyzer with real workflows."""
@@ -13,6 +13,7 @@
 import unittest
 from utils import has_np, get_np
 from unittest.mock import Mock, MagicMock
+from cfsai_model_parser.operator_costs import compute_operator_costs
 from cfsai_model_parser.parse_tflm import TFLiteParser
 
 class TestMACCalculationMethods(unittest.TestCase):
@@ -40,6 +41,8 @@ class TestMACCalculationMethods(unittest.TestCase):
         mock_operator.Outputs.side_effect = lambda idx: 2  # output=2
         mock_operator.InputsLength.return_value = 2  # Has input and weights tensors
         mock_operator.OutputsLength.return_value = 1  # Has one output tensor
+        mock_operator.InputsAsNumpy.return_value = np.array([0, 1], dtype=np.int32)
+        mock_operator.OutputsAsNumpy.return_value = np.array([2], dtype=np.int32)
         
         # Create mock tensors with shapes
         mock_input_tensor = Mock()
@@ -54,10 +57,24 @@ class TestMACCalculationMethods(unittest.TestCase):
         # Create mock subgraph
         mock_subgraph = Mock()
         tensors = [mock_input_tensor, mock_weights_tensor, mock_output_tensor]
+        for tensor in tensors:
+            tensor.Type.return_value = 9  # INT8
         mock_subgraph.Tensors.side_effect = lambda idx: tensors[idx]
+        mock_subgraph.TensorsLength.return_value = len(tensors)
+        mock_subgraph.Operators.side_effect = lambda idx: mock_operator
+        mock_subgraph.OperatorsLength.return_value = 1
+        mock_subgraph.InputsLength.return_value = 1
+        mock_subgraph.InputsAsNumpy.return_value = np.array([0], dtype=np.int32)
+        mock_subgraph.OutputsLength.return_value = 1
+        mock_subgraph.OutputsAsNumpy.return_value = np.array([2], dtype=np.int32)
         
         return mock_operator, mock_subgraph
     
+    def operator_macs(self, op_key, mock_subgraph):
+        """MACs of the only operator of a mock subgraph from the cost registry."""
+        table = self.parser.build_tensor_table(mock_subgraph)
+        return int(compute_operator_costs(table, [op_key]).macs[0])
+    
     def test_calculate_conv2d_macs_3x3_tflite_format(self):
         """Test Conv2D MAC calculation with 3x3 kernel using TFLite format."""
         # Test parameters
@@ -70,7 +87,7 @@ class TestMACCalculationMethods(unittest.TestCase):
         )
         
         # Calculate MACs
-        result = self.parser._calculate_conv2d_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('CONV_2D', mock_subgraph)
         
         # Expected calculation with TFLite format:
         # output_spatial_size = 30 * 30 = 900
@@ -93,7 +110,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_conv2d_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('CONV_2D', mock_subgraph)
         
         # Expected: 56 * 56 * 256 * 1 * 1 * 128 = 102,760,448
         expected = 56 * 56 * 256 * 1 * 1 * 128
@@ -112,7 +129,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_conv2d_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('CONV_2D', mock_subgraph)
         
         # Expected: 24 * 24 * 128 * 5 * 5 * 64 = 117,964,800
         expected = 24 * 24 * 128 * 5 * 5 * 64
@@ -132,7 +149,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_depthwise_conv_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('DEPTHWISE_CONV_2D', mock_subgraph)
         
         # Expected calculation for DepthwiseConv2D:
         # MACs = output_elements * spatial_kernel_size
@@ -157,7 +174,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_depthwise_conv_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('DEPTHWISE_CONV_2D', mock_subgraph)
         
         # Expected: (1 * 54 * 54 * 128) * (3 * 3) = 3,359,232
         expected = (1 * 54 * 54 * 128) * (3 * 3)
@@ -176,7 +193,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_depthwise_conv_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('DEPTHWISE_CONV_2D', mock_subgraph)
         
         # Expected: (1 * 24 * 24 * 32) * (5 * 5) = 460,800
         expected = (1 * 24 * 24 * 32) * (5 * 5)
@@ -196,7 +213,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_conv2d_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('CONV_2D', mock_subgraph)
         expected = 30 * 30 * 1 * 3 * 3 * 1  # 8,100
         self.assertEqual(result, expected)
         
@@ -206,7 +223,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, dw_weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_depthwise_conv_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('DEPTHWISE_CONV_2D', mock_subgraph)
         expected = (1 * 30 * 30 * 1) * (3 * 3)  # 8,100
         self.assertEqual(result, expected)
         
@@ -223,7 +240,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_conv2d_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('CONV_2D', mock_subgraph)
         self.assertEqual(result, 0)
         
         # Zero output channels
@@ -235,7 +252,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             input_shape, weights_shape_tflite, output_shape
         )
         
-        result = self.parser._calculate_conv2d_macs(mock_operator, mock_subgraph)
+        result = self.operator_macs('CONV_2D', mock_subgraph)
         self.assertEqual(result, 0)
         
         print("Zero dimension edge cases (TFLite format) passed")
@@ -255,7 +272,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             conv2d_input, conv2d_weights, conv2d_output
         )
         
-        conv2d_macs = self.parser._calculate_conv2d_macs(mock_operator, mock_subgraph)
+        conv2d_macs = self.operator_macs('CONV_2D', mock_subgraph)
         
         # Equivalent depthwise separable: DepthwiseConv2D + 1x1 Conv2D
         
@@ -268,7 +285,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             dw_input, dw_weights, dw_output
         )
         
-        depthwise_macs = self.parser._calculate_depthwise_conv_macs(mock_operator_dw, mock_subgraph_dw)
+        depthwise_macs = self.operator_macs('DEPTHWISE_CONV_2D', mock_subgraph_dw)
         
         # 2. Pointwise 1x1 Conv2D
         pw_input = [1, spatial_size, spatial_size, channels]
@@ -279,7 +296,7 @@ class TestMACCalculationMethods(unittest.TestCase):
             pw_input, pw_weights, pw_output
         )
         
-        pointwise_macs = self.parser._calculate_conv2d_macs(mock_operator_pw, mock_subgraph_pw)
+        pointwise_macs = self.operator_macs('CONV_2D', mock_subgraph_pw)
         
         # Total for depthwise separable
         separable_total = depthwise_macs + pointwise_macs
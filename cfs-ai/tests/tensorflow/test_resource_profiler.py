@@ -19,7 +19,9 @@ from pathlib import Path
 from utils import has_tf, get_tf
 
 from cfsai_resource_profiler.profile_resources import TFLiteResourceProfiler
+from cfsai_resource_profiler.fusion import fuse_layers
 from cfsai_resource_profiler.exceptions import (
+    CalibrationError,
     HardwareProfileError,
     ModelAnalysisError,
 )
@@ -30,10 +32,15 @@ from cfsai_resource_profiler.schemas import (
     HardwareMetrics,
     LayerPerformance,
     OptimizationSuggestion,
+    ProfileComparison,
+    ModelAnalysisReport,
 )
+from cfsai_compatibility_analyzer import CompatibilityAnalyzer
 from cfsai_model_parser.exceptions import ModelFormatNotSupportedError
+from cfsai_model_parser.schemas import LayerDetail, TensorLifecycle
 
-from cfsai_types.hardware_profile import HardwareProfile
+from cfsai_types.config.targets import UserTarget
+from cfsai_types.hardware_profile import HardwareProfile, OperatorInfo
 
 
 
@@ -603,6 +610,338 @@ class TestTFLiteResourceProfilerWithRealModels(unittest.TestCase):
             self.assertIsInstance(e, ModelAnalysisError)
             print(f"Expected analysis error: {e}")
 
+    def test_operator_specific_layer_costs(self):
+        """Test layers are priced by operator, operator class, then MAC."""
+        hardware_profile = HardwareProfile(
+            SupportedOps=[],
+            AccelOps=["CONV_2D"],
+            SupportedDataTypes=[],
+            FlashSize=0,
+            RamSize=512.0,
+            CoreClock=100.0,
+            OperatorInfos=[
+                {"Name": "MAC", "Cycles": 2.0, "Energy": 1.0},
+                {"Name": "DEPTHWISE_CONV_2D", "Cycles": 3.0, "Energy": 1.5},
+                {"Name": "POOL", "Cycles": 0.5, "Energy": 0.25},
+                {"Name": "MEMORY", "Cycles": 0.25, "Energy": 0.1},
+                {"Name": "ACCEL:CONV", "Cycles": 0.1, "Energy": 0.05},
+            ]
+        )
+
+        def layer(name, macs):
+            return LayerDetail(
+                index=0, name=name, macs=macs, flash_kb=0.0, kernel_tensors=[],
+                ram_kb=0.0, read_bytes=300, write_bytes=100, input_tensors=[],
+                output_tensors=[], lifecycle=TensorLifecycle(new=1, live=1, terminated=0)
+            )
+
+        memory_cycles = int(400 * 0.25)
+        expected_cycles = {
+            "DEPTHWISE_CONV_2D": int(1000 * 3.0) + memory_cycles,  # Operator
+            "MAX_POOL_2D": int(1000 * 0.5) + memory_cycles,  # Operator class
+            "ADD": int(1000 * 2.0) + memory_cycles,  # MAC fallback
+            "CONV_2D": int(1000 * 0.1) + memory_cycles,  # Accelerated class
+        }
+        for name, cycles in expected_cycles.items():
+            metrics = self.profiler._analyze_layer_performance(
+                layer(name, 1000), hardware_profile
+            )
+            self.assertEqual(metrics["cycles"], cycles, name)
+            self.assertEqual(metrics["memory_cycles"], memory_cycles, name)
+            self.assertEqual(metrics["is_accelerated"], name == "CONV_2D", name)
+
+        # Zero-MAC layers cost one operation plus their memory traffic
+        metrics = self.profiler._analyze_layer_performance(
+            layer("RESHAPE", 0), hardware_profile
+        )
+        self.assertEqual(metrics["cycles"], 2 + memory_cycles)
+        self.assertAlmostEqual(metrics["energy_uj"], (1.0 + 400 * 0.1) / 1000)
+
+        # A MAC-only profile keeps the per-MAC estimate
+        metrics = self.profiler._analyze_layer_performance(
+            layer("MAX_POOL_2D", 1000), self.basic_hardware_profile
+        )
+        self.assertEqual(metrics["cycles"], 1000)
+        self.assertEqual(metrics["memory_cycles"], 0)
+
+    def test_roofline_memory_bound_layers(self):
+        """Test layer latency is bounded by SRAM and flash bandwidth."""
+        hardware_profile = self.basic_hardware_profile.model_copy(
+            update={"sram_bandwidth": 4.0, "flash_bandwidth": 1.0}
+        )
+
+        def layer(name, macs, flash_kb, read_bytes, write_bytes):
+            return LayerDetail(
+                index=0, name=name, macs=macs, flash_kb=flash_kb, kernel_tensors=[],
+                ram_kb=0.0, read_bytes=read_bytes, write_bytes=write_bytes,
+                input_tensors=[], output_tensors=[],
+                lifecycle=TensorLifecycle(new=1, live=1, terminated=0)
+            )
+
+        # Elementwise add: 4000 activation bytes at 4 bytes/cycle
+        metrics = self.profiler._analyze_layer_performance(
+            layer("ADD", 500, 0.0, 2000, 2000), hardware_profile
+        )
+        self.assertEqual(metrics["bandwidth_cycles"], 1000)
+        self.assertEqual(metrics["bound"], "memory")
+        self.assertEqual(metrics["cycles"], 1000)
+        self.assertAlmostEqual(metrics["latency_ms"], 1000 / 100e6 * 1000)
+
+        # Dense layer: 2 KB of weights at 1 byte/cycle plus 40 activation bytes
+        metrics = self.profiler._analyze_layer_performance(
+            layer("FULLY_CONNECTED", 2048, 2.0, 2048 + 32, 8), hardware_profile
+        )
+        self.assertEqual(metrics["bandwidth_cycles"], 2048 + 10)
+        self.assertEqual(metrics["bound"], "memory")
+
+        # Convolution with weight reuse stays compute bound
+        metrics = self.profiler._analyze_layer_performance(
+            layer("CONV_2D", 100000, 1.0, 1024 + 4000, 4000), hardware_profile
+        )
+        self.assertEqual(metrics["bound"], "compute")
+        self.assertEqual(metrics["cycles"], 100000)
+
+        # Per-byte memory cost is added once, outside the compute bound
+        memory_profile = hardware_profile.model_copy(update={
+            "operator_infos": [
+                *hardware_profile.operator_infos,
+                OperatorInfo(Name="MEMORY", Cycles=0.25, Energy=0.0),
+            ]
+        })
+        metrics = self.profiler._analyze_layer_performance(
+            layer("ADD", 500, 0.0, 2000, 2000), memory_profile
+        )
+        self.assertEqual(metrics["memory_cycles"], 1000)
+        self.assertEqual(metrics["bound"], "memory")
+        self.assertEqual(metrics["cycles"], 1000 + 1000)
+        metrics = self.profiler._analyze_layer_performance(
+            layer("CONV_2D", 100000, 1.0, 1024 + 4000, 4000), memory_profile
+        )
+        self.assertEqual(metrics["bound"], "compute")
+        self.assertEqual(metrics["cycles"], 100000 + (1024 + 8000) // 4)
+
+        # Without bandwidths the layer is not classified
+        metrics = self.profiler._analyze_layer_performance(
+            layer("ADD", 500, 0.0, 2000, 2000), self.basic_hardware_profile
+        )
+        self.assertIsNone(metrics["bound"])
+        self.assertEqual(metrics["cycles"], 500)
+
+        model_path, _ = self.create_simple_cnn_model()
+        result = self.profiler.analyze_model(model_path, hardware_profile)
+        self.assertEqual(
+            result.hardware_metrics.memory_bound_layers,
+            sum(1 for perf in result.layer_performance if perf.bound == "memory")
+        )
+        self.assertTrue(all(perf.bound for perf in result.layer_performance))
+
+    def test_analyze_model_across_profiles(self):
+        """Test a multi-profile sweep matches analyzing each profile alone."""
+        model_path, _ = self.create_mobilenet_style_model()
+        bandwidth_profile = self.basic_hardware_profile.model_copy(update={
+            "operator_infos": [
+                *self.basic_hardware_profile.operator_infos,
+                OperatorInfo(Name="MEMORY", Cycles=0.25, Energy=0.1),
+            ],
+            "sram_bandwidth": 4.0,
+            "flash_bandwidth": 1.0,
+            "flash_size": 64.0,
+            "target": UserTarget(Soc="MAX78002", Core="CM4"),
+        })
+        profiles = [
+            self.basic_hardware_profile,
+            self.high_perf_hardware_profile,
+            self.constrained_hardware_profile,
+            bandwidth_profile,
+        ]
+
+        comparison = self.profiler.analyze_model_across(model_path, profiles)
+
+        self.assertIsInstance(comparison, ProfileComparison)
+        self.assertEqual(len(comparison.targets), len(profiles))
+        self.assertEqual(comparison.targets[0].target, "Profile 0")
+        self.assertEqual(comparison.targets[3].target, "MAX78002/CM4")
+        for target, profile in zip(comparison.targets, profiles):
+            report = self.profiler.analyze_model(model_path, profile)
+            metrics = report.hardware_metrics
+            self.assertEqual(target.total_cycles, metrics.total_cycles)
+            self.assertAlmostEqual(
+                target.estimated_latency_ms, metrics.estimated_latency_ms
+            )
+            self.assertAlmostEqual(
+                target.estimated_energy_uj,
+                sum(perf.energy_uj for perf in report.layer_performance)
+            )
+            self.assertEqual(target.accelerated_layers, metrics.accelerated_layers)
+            self.assertEqual(target.memory_bound_layers, metrics.memory_bound_layers)
+            self.assertEqual(target.ram_status, report.memory_analysis.ram_status)
+
+        self.assertIsNone(comparison.targets[0].fits_flash)
+        self.assertFalse(comparison.targets[3].fits_flash)
+        table = comparison.visualize_comparison(to_buffer=True)
+        self.assertIn("MAX78002/CM4", table)
+
+    def test_analyze_model_with_compatibility(self):
+        """Test the single-pass analysis matches running both analyses."""
+        model_path, _ = self.create_simple_cnn_model()
+        profile = self.basic_hardware_profile.model_copy(update={
+            "supported_ops": ["CONV_2D", "MAX_POOL_2D", "FULLY_CONNECTED"],
+            "supported_data_types": ["INT8"],
+        })
+
+        result = self.profiler.analyze_model_with_compatibility(model_path, profile)
+
+        self.assertIsInstance(result, ModelAnalysisReport)
+        compatibility = CompatibilityAnalyzer().analyze_model(model_path, profile)
+        self.assertEqual(
+            result.compatibility_report.model_dump(exclude={"info"}),
+            compatibility.model_dump(exclude={"info"})
+        )
+        self.assertTrue(result.compatibility_report.has_critical_issues())
+        self.assertEqual(
+            {issue.operator for issue in result.compatibility_report.operator_issues},
+            {"MEAN", "SOFTMAX"}
+        )
+
+        profile_report = self.profiler.analyze_model(model_path, profile)
+        self.assertEqual(
+            result.profile_report.model_dump(exclude={"info"}),
+            profile_report.model_dump(exclude={"info"})
+        )
+
+        with self.assertRaises(HardwareProfileError):
+            self.profiler.analyze_model_across(model_path, [])
+
+    def test_calibrate_hardware_profile_from_layer_timings(self):
+        """Test fitting operator costs to measured per-layer cycles."""
+        model_path, _ = self.create_simple_cnn_model()
+        measured_profile = HardwareProfile(
+            SupportedOps=[], AccelOps=[], SupportedDataTypes=[],
+            FlashSize=0, RamSize=512.0, CoreClock=100.0,
+            OperatorInfos=[
+                {"Name": "MAC", "Cycles": 3.0, "Energy": 1.0},
+                {"Name": "CONV_2D", "Cycles": 0.75, "Energy": 0.5},
+                {"Name": "FULLY_CONNECTED", "Cycles": 1.5, "Energy": 0.5},
+            ]
+        )
+
+        # MicroProfiler log of two inferences on the "measured" hardware
+        report = self.profiler.analyze_model(model_path, measured_profile)
+        log_path = os.path.join(self.temp_dir, 'timings.log')
+        with open(log_path, 'w') as f:
+            for _ in range(2):
+                for perf in report.layer_performance:
+                    f.write(f"{perf.layer_name} took {perf.cycles} ticks (0 ms).\n")
+
+        result = self.profiler.calibrate_hardware_profile(
+            model_path, self.basic_hardware_profile, log_path
+        )
+        self.assertEqual(result.measured_layers, len(report.layer_performance))
+        self.assertGreater(result.error_before_percent, 10.0)
+        self.assertLess(result.error_after_percent, 1.0)
+        # CONV_2D is accelerated in the starting profile
+        self.assertAlmostEqual(result.coefficients["ACCEL:CONV_2D"], 0.75, places=2)
+        self.assertAlmostEqual(
+            result.hardware_profile.get_operator_info("ACCEL:CONV_2D").energy,
+            2.5 * result.coefficients["ACCEL:CONV_2D"]
+        )
+
+        calibrated = self.profiler.analyze_model(model_path, result.hardware_profile)
+        for expected, actual in zip(report.layer_performance,
+                                    calibrated.layer_performance):
+            self.assertAlmostEqual(actual.cycles, expected.cycles,
+                                   delta=expected.cycles * 0.01 + 1)
+
+        # MicroProfiler CSV output with an operator that does not match
+        csv_path = os.path.join(self.temp_dir, 'timings.csv')
+        with open(csv_path, 'w') as f:
+            f.write('"Event","Tag","Ticks"\n0,SOFTMAX,100\n')
+        with self.assertRaises(CalibrationError):
+            self.profiler.calibrate_hardware_profile(
+                model_path, self.basic_hardware_profile, csv_path
+            )
+
+        # Whole-inference timings scale every operator cost
+        inference_path = os.path.join(self.temp_dir, 'inference.log')
+        total_us = report.hardware_metrics.estimated_latency_ms * 1000
+        with open(inference_path, 'w') as f:
+            f.write(f"Approximate inference time: {total_us:.0f} us\n")
+        result = self.profiler.calibrate_hardware_profile(
+            model_path, self.basic_hardware_profile, inference_path
+        )
+        self.assertEqual(result.measured_layers, 0)
+        self.assertLess(result.error_after_percent, 1.0)
+        self.assertEqual(list(result.coefficients), ["MAC"])
+
+    def test_fused_layer_estimates(self):
+        """Test fused estimates drop intermediate tensors of fused chains."""
+        model_path, _ = self.create_simple_cnn_model()
+        hardware_profile = self.basic_hardware_profile.model_copy(update={
+            "operator_infos": self.basic_hardware_profile.operator_infos + [
+                OperatorInfo(Name="MEMORY", Cycles=0.25, Energy=0.1)
+            ],
+            "fusion_rules": [
+                [["CONV_2D"], ["MAX_POOL_2D"]],
+                [["MEAN"], ["FULLY_CONNECTED"], ["SOFTMAX"]],
+            ],
+        })
+
+        result = self.profiler.analyze_model(model_path, hardware_profile)
+        metrics = result.hardware_metrics
+
+        fused_names = [layer.layer_name for layer in result.fused_layer_performance]
+        self.assertEqual(
+            fused_names,
+            ["CONV_2D+MAX_POOL_2D", "CONV_2D", "MEAN+FULLY_CONNECTED+SOFTMAX"]
+        )
+        self.assertEqual(metrics.fused_layers, 3)
+        self.assertEqual(
+            sum(layer.macs for layer in result.fused_layer_performance),
+            sum(layer.macs for layer in result.layer_performance)
+        )
+
+        # The first convolution's output is never stored or read back
+        conv_output_b = 28 * 28 * 16 * 4
+        self.assertEqual(
+            metrics.total_cycles - metrics.fused_total_cycles,
+            int(2 * conv_output_b * 0.25)
+            + sum(perf.memory_cycles for perf in result.layer_performance[3:])
+            - result.fused_layer_performance[2].memory_cycles
+        )
+        self.assertLess(metrics.fused_peak_memory_kb, metrics.peak_memory_kb)
+        self.assertTrue(result.fused_layer_performance[0].is_accelerated)
+        self.assertTrue(result.fused_layer_performance[2].memory_cycles > 0)
+
+        # Without fusion rules the fused model matches the operators
+        no_fusion = self.profiler.analyze_model(
+            model_path,
+            hardware_profile.model_copy(update={"fusion_rules": []})
+        )
+        self.assertEqual(no_fusion.hardware_metrics.fused_layers,
+                         len(no_fusion.layer_performance))
+        self.assertEqual(no_fusion.hardware_metrics.fused_total_cycles,
+                         no_fusion.hardware_metrics.total_cycles)
+
+    def test_fusion_keeps_model_outputs(self):
+        """Test a layer whose output is a model output is not fused."""
+        def layer(idx, name, inputs, outputs):
+            return LayerDetail(
+                index=idx, name=name, macs=100, flash_kb=0.0, kernel_tensors=[],
+                ram_kb=1.0, read_bytes=100, write_bytes=100, input_tensors=inputs,
+                output_tensors=outputs,
+                lifecycle=TensorLifecycle(new=1, live=1, terminated=0)
+            )
+
+        layers = [layer(0, "CONV_2D", [0], [1]), layer(1, "RELU", [1], [2])]
+        rules = [[["CONV_2D"], ["RELU"]]]
+        self.assertEqual(
+            [fused.layer_indices for fused in fuse_layers(layers, rules)], [[0, 1]]
+        )
+        self.assertEqual(
+            [fused.layer_indices for fused in fuse_layers(layers, rules, [1, 2])],
+            [[0], [1]]
+        )
+
 
 if __name__ == '__main__':
     # Configure TensorFlow
@@ -14,10 +14,13 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
 
 from utils import has_tf, get_tf
 
-from cfsai_model_parser.parse_tflm import TFLiteParser, parse_tflite_model
+from cfsai_model_parser.parse_tflm import TFLiteParser, parse_models, parse_tflite_model
 from cfsai_model_parser.exceptions import (
     InvalidTensorType,
     ModelAnalysisError,
@@ -28,7 +31,21 @@ from cfsai_model_parser.exceptions import (
     ModelSubgraphError,
     ModelFormatNotSupportedError,
 )
-from cfsai_model_parser.schemas import LayerDetail, ModelDetails, TensorLifecycle
+from cfsai_model_parser.operator_costs import (
+    compute_operator_costs,
+    register_operator_cost,
+)
+from cfsai_model_parser.operator_order import find_min_peak_order, order_peak_bytes
+from cfsai_model_parser.schemas import (
+    LayerColumns,
+    LayerDetail,
+    ModelDetails,
+    TensorLifecycle,
+    write_analysis_json,
+)
+from cfsai_model_parser.tensor_table import TensorTable
+from cfsai_tflite import TfliteInfo
+from cfsai_tflite.cache import ParseCache
 
 
 @unittest.skipIf(not has_tf(), "TensorFlow not available")
@@ -203,6 +220,41 @@ class TestTFLiteParserWithRealModels(unittest.TestCase):
         
         return model_path, model
     
+    def create_while_loop_model(self, static_trip_count=True):
+        """Create a model with a WHILE loop around a fully connected layer."""
+        tf = get_tf()
+        
+        class LoopModule(tf.Module):
+            def __init__(self):
+                super().__init__()
+                self.w = tf.Variable(tf.random.normal((16, 16)))
+            
+            @tf.function(input_signature=[
+                tf.TensorSpec((1, 16), tf.float32),
+                tf.TensorSpec((), tf.int32)
+            ])
+            def __call__(self, x, n):
+                limit = tf.constant(10) if static_trip_count else n
+                _, y = tf.while_loop(
+                    lambda i, x: tf.less(i, limit),
+                    lambda i, x: (i + 1, tf.nn.relu(tf.matmul(x, self.w))),
+                    [tf.constant(0), x]
+                )
+                return y
+        
+        module = LoopModule()
+        converter = tf.lite.TFLiteConverter.from_concrete_functions(
+            [module.__call__.get_concrete_function()], module
+        )
+        tflite_model = converter.convert()
+        
+        # Save to file
+        model_path = os.path.join(self.temp_dir, 'while_loop_model.tflite')
+        with open(model_path, 'wb') as f:
+            f.write(tflite_model)
+        
+        return model_path, module
+    
     def test_parser_initialization(self):
         """Test that TFLiteParser initializes correctly."""
         parser = TFLiteParser()
@@ -315,6 +367,13 @@ class TestTFLiteParserWithRealModels(unittest.TestCase):
         
         # Check data type - should be quantized
         self.assertIn(result.target_dtype.lower(), ['int8', 'uint8'])
+
+        # Input quantization is read for dataset validation
+        input_detail = result.input_details[0]
+        self.assertEqual(input_detail.dtype, result.target_dtype)
+        self.assertEqual(input_detail.shape[1:], list(keras_model.input_shape[1:]))
+        self.assertEqual(len(input_detail.scale), 1)
+        self.assertEqual(len(input_detail.zero_point), 1)
         
         # Quantized models should be smaller
         self.assertGreater(result.model_size_on_disk_kb, 0)
@@ -444,6 +503,372 @@ class TestTFLiteParserWithRealModels(unittest.TestCase):
         print(f"  Peak RAM usage: {result.model_peak_ram_kb:.2f} KB")
         print(f"  Parameter memory: {result.model_total_param_memory_b:,} bytes")
     
+    def test_memory_schedule_matches_per_step(self):
+        """Test that the memory sweep matches the per-step memory calculation."""
+        model_path, keras_model = self.create_complex_model()
+        
+        model = self.parser.load_model(model_path)
+        subgraph = model.Subgraphs(0)
+        table = self.parser.build_tensor_table(subgraph)
+        lifespans = table.lifespans()
+        num_ops = subgraph.OperatorsLength()
+        
+        schedule = self.parser._calculate_memory_schedule(table, 4)
+        
+        self.assertEqual(len(schedule), num_ops)
+        for op_idx in range(num_ops):
+            with self.subTest(op_idx=op_idx):
+                expected = self.parser._calculate_memory_at_step(
+                    op_idx, lifespans, subgraph, 4)
+                self.assertEqual(schedule[op_idx], expected)
+    
+    def test_tensor_table_matches_subgraph(self):
+        """Test that the tensor table matches the FlatBuffer tensor accessors."""
+        model_path, keras_model = self.create_complex_model()
+        
+        model = self.parser.load_model(model_path)
+        subgraph = model.Subgraphs(0)
+        table = self.parser.build_tensor_table(subgraph)
+        
+        self.assertEqual(table.num_tensors, subgraph.TensorsLength())
+        self.assertEqual(table.num_operators, subgraph.OperatorsLength())
+        for tensor_idx in range(subgraph.TensorsLength()):
+            with self.subTest(tensor_idx=tensor_idx):
+                tensor = subgraph.Tensors(tensor_idx)
+                type_size = self.parser.get_tensor_size_bytes(tensor.Type())
+                elements = int(np.prod(tensor.ShapeAsNumpy()))
+                self.assertEqual(table.elements[tensor_idx], elements)
+                self.assertEqual(table.nbytes[tensor_idx], elements * type_size)
+        
+        parameter_indices = table.parameter_indices()
+        self.assertTrue(parameter_indices)
+        self.assertFalse(parameter_indices & set(subgraph.InputsAsNumpy().tolist()))
+        for op_idx in range(subgraph.OperatorsLength()):
+            outputs = set(subgraph.Operators(op_idx).OutputsAsNumpy().tolist())
+            self.assertFalse(parameter_indices & outputs)
+    
+    def test_arena_plan_without_overlaps(self):
+        """Test that planned buffers never overlap while both are live."""
+        tf = get_tf()
+        keras_model = tf.keras.Sequential([
+            tf.keras.layers.Input(shape=(16, 16, 3)),
+            tf.keras.layers.Conv2D(8, 3, activation='relu'),
+            tf.keras.layers.Flatten(),
+            tf.keras.layers.Dense(10)
+        ])
+        tflite_model = tf.lite.TFLiteConverter.from_keras_model(keras_model).convert()
+        model_path = os.path.join(self.temp_dir, 'reshape_model.tflite')
+        with open(model_path, 'wb') as f:
+            f.write(tflite_model)
+
+        model = self.parser.load_model(model_path)
+        subgraph = model.Subgraphs(0)
+        table = self.parser.build_tensor_table(subgraph)
+        op_names = [
+            self.parser._operator_name(model, subgraph.Operators(op_idx))
+            for op_idx in range(table.num_operators)
+        ]
+        plan = self.parser.plan_tensor_arena(table, op_names)
+
+        # The flattened output reuses the convolution output buffer
+        reshape_idx = op_names.index('RESHAPE')
+        source = int(table.op_inputs[reshape_idx][0])
+        target = int(table.op_outputs[reshape_idx][0])
+        self.assertEqual(plan.offsets[source], plan.offsets[target])
+
+        buffers = {
+            (plan.offsets[t], plan.sizes[t], plan.first_use[t], plan.last_use[t])
+            for t in plan.offsets if t != target
+        }
+        for offset, size, first, last in buffers:
+            self.assertEqual(offset % 16, 0)
+            self.assertLessEqual(offset + size, plan.arena_size)
+            for other in buffers:
+                other_offset, other_size, other_first, other_last = other
+                if other == (offset, size, first, last):
+                    continue
+                if last < other_first or other_last < first:
+                    continue
+                self.assertTrue(offset + size <= other_offset
+                                or other_offset + other_size <= offset)
+
+        self.assertGreaterEqual(plan.arena_size, plan.peak_live_bytes)
+        self.assertEqual(
+            plan.timeline(table.num_operators),
+            [(plan.arena_usage_at_step(op_idx), plan.offsets_at_step(op_idx))
+             for op_idx in range(table.num_operators)]
+        )
+        details = self.parser.parse_model(model_path)
+        self.assertAlmostEqual(details.arena_size_kb * 1024, plan.arena_size)
+        self.assertAlmostEqual(details.arena_fragmentation, plan.fragmentation)
+        self.assertEqual(
+            max(step['arena_b'] for step in details.execution_schedule),
+            plan.arena_size
+        )
+
+    def test_operator_costs_match_shape_formulas(self):
+        """Test that vectorized costs match the MAC formulas of each operator."""
+        model_path, keras_model = self.create_complex_model()
+        
+        model = self.parser.load_model(model_path)
+        subgraph = model.Subgraphs(0)
+        table = self.parser.build_tensor_table(subgraph)
+        op_names = [
+            self.parser._operator_name(model, subgraph.Operators(op_idx))
+            for op_idx in range(table.num_operators)
+        ]
+        costs = compute_operator_costs(table, op_names)
+        
+        def expected_macs(op_name, operator):
+            output = subgraph.Tensors(operator.Outputs(0)).ShapeAsNumpy()
+            if op_name not in ('CONV_2D', 'DEPTHWISE_CONV_2D', 'FULLY_CONNECTED'):
+                return int(np.prod(output))
+            weights = subgraph.Tensors(operator.Inputs(1)).ShapeAsNumpy()
+            if op_name == 'CONV_2D':
+                return int(np.prod(output[1:4]) * np.prod(weights[1:4]))
+            if op_name == 'DEPTHWISE_CONV_2D':
+                return int(np.prod(output) * np.prod(weights[1:3]))
+            return int(np.prod(weights))
+        
+        for op_idx, op_name in enumerate(op_names):
+            with self.subTest(op_idx=op_idx, op_name=op_name):
+                operator = subgraph.Operators(op_idx)
+                self.assertEqual(costs.macs[op_idx], expected_macs(op_name, operator))
+                inputs = [t for t in operator.InputsAsNumpy() if t >= 0]
+                self.assertEqual(costs.read_bytes[op_idx], table.nbytes[inputs].sum())
+                self.assertEqual(costs.param_bytes[op_idx],
+                                 table.nbytes[[t for t in inputs
+                                               if table.is_parameter[t]]].sum())
+                self.assertEqual(costs.write_bytes[op_idx],
+                                 table.nbytes[operator.OutputsAsNumpy()].sum())
+    
+    def test_registered_operator_cost_is_used(self):
+        """Test that a registered MAC formula replaces the fallback estimate."""
+        model_path, keras_model = self.create_simple_conv2d_model()
+        baseline = self.parser.parse_model(model_path)
+        mean_layers = [layer.index for layer in baseline.layer_details
+                       if layer.name == 'MEAN']
+        self.assertTrue(mean_layers)
+        
+        def mean_macs(table, op_indices):
+            return np.full(len(op_indices), 7)
+        
+        # Restore the registry afterwards
+        with patch.dict('cfsai_model_parser.operator_costs._COST_FUNCTIONS'):
+            register_operator_cost('MEAN', mean_macs)
+            details = self.parser.parse_model(model_path)
+        
+        for layer in details.layer_details:
+            if layer.index in mean_layers:
+                self.assertEqual(layer.macs, 7)
+            else:
+                self.assertEqual(layer.macs, baseline.layer_details[layer.index].macs)
+    
+    def test_operator_order_lowers_peak(self):
+        """Test that finishing one branch before starting the other lowers peak."""
+        # Two branches with large intermediates joined by a final operator
+        edges = [([0], [1]), ([0], [2]), ([1], [3]), ([2], [4]), ([3, 4], [5])]
+        elements = np.array([100, 100, 100, 1, 1, 1], dtype=np.int64)
+        producer = np.array([-1, 0, 1, 2, 3, 4], dtype=np.int32)
+        last_consumer = np.array([1, 2, 3, 4, 4, -1], dtype=np.int32)
+        table = TensorTable(
+            shapes=[np.array([n]) for n in elements],
+            ranks=np.ones(6, dtype=np.int64),
+            dims=np.column_stack([elements, np.ones((6, 3), dtype=np.int64)]),
+            elements=elements,
+            type_codes=np.zeros(6, dtype=np.int32),
+            type_sizes=np.ones(6, dtype=np.int64),
+            nbytes=elements,
+            is_parameter=np.zeros(6, dtype=bool),
+            producer=producer,
+            last_consumer=last_consumer,
+            op_inputs=[np.array(inputs, dtype=np.int32) for inputs, _ in edges],
+            op_outputs=[np.array(outputs, dtype=np.int32) for _, outputs in edges],
+            graph_inputs=np.array([0], dtype=np.int32),
+            graph_outputs=np.array([5], dtype=np.int32)
+        )
+        
+        serialized_peak = order_peak_bytes(table, list(range(5)), 1)
+        self.assertEqual(serialized_peak, max(
+            step['current_ram']
+            for step in self.parser._calculate_memory_schedule(table, 1)
+        ))
+        
+        result = find_min_peak_order(table, 1)
+        self.assertTrue(result.exhaustive)
+        self.assertEqual(result.order, [0, 2, 1, 3, 4])
+        self.assertEqual(result.peak_bytes, 102)
+        self.assertLess(result.peak_bytes, serialized_peak)
+    
+    def test_parse_model_with_operator_reordering(self):
+        """Test that reordering reports a valid order no worse than serialized."""
+        model_path, keras_model = self.create_complex_model()
+        
+        details = self.parser.parse_model(model_path, reorder_operators=True)
+        
+        self.assertEqual(sorted(details.reordered_operators),
+                         list(range(details.layer_count)))
+        self.assertLessEqual(details.reordered_peak_ram_kb, details.model_peak_ram_kb)
+        position = {op_idx: pos for pos, op_idx in enumerate(details.reordered_operators)}
+        producers = {
+            tensor_idx: layer.index
+            for layer in details.layer_details for tensor_idx in layer.output_tensors
+        }
+        for layer in details.layer_details:
+            for tensor_idx in layer.input_tensors:
+                if tensor_idx in producers:
+                    self.assertLess(position[producers[tensor_idx]],
+                                    position[layer.index])
+        self.assertIsNone(self.parser.parse_model(model_path).reordered_peak_ram_kb)
+    
+    def test_while_loop_attributed_to_caller(self):
+        """Test that loop body costs are attributed to the WHILE operator."""
+        model_path, module = self.create_while_loop_model()
+        
+        result = self.parser.parse_model(model_path)
+        
+        while_layers = [l for l in result.layer_details if l.name == 'WHILE']
+        self.assertEqual(len(while_layers), 1)
+        self.assertEqual(len(while_layers[0].called_subgraphs), 2)
+        # Ten iterations of a 16x16 fully connected layer
+        self.assertGreaterEqual(while_layers[0].macs, 10 * 16 * 16)
+        self.assertEqual(result.total_macs, sum(l.macs for l in result.layer_details))
+        # The loop weights are stored once
+        self.assertGreaterEqual(result.model_total_param_memory_b, 16 * 16 * 4)
+        self.assertLess(result.model_total_param_memory_b, 2 * 16 * 16 * 4)
+        
+        # Subgraphs analyzed in worker processes give the same result
+        self.assertEqual(self.parser.parse_model(model_path, jobs=2), result)
+    
+    def test_while_loop_trip_count_hint(self):
+        """Test that a trip count hint is used for loops with dynamic bounds."""
+        model_path, module = self.create_while_loop_model(static_trip_count=False)
+        
+        single = self.parser.parse_model(model_path)
+        model = self.parser.load_model(model_path)
+        body_idx = next(
+            l.called_subgraphs[1] for l in single.layer_details if l.name == 'WHILE'
+        )
+        hinted = self.parser.parse_model(model_path, loop_trip_counts={body_idx: 25})
+        
+        self.assertGreater(model.SubgraphsLength(), 1)
+        self.assertGreaterEqual(hinted.total_macs - single.total_macs, 24 * 16 * 16)
+    
+    def test_parse_cache_reuses_analysis(self):
+        """Test that a cached analysis is reused until the model file changes."""
+        model_path, keras_model = self.create_simple_conv2d_model()
+        cache = ParseCache(Path(self.temp_dir) / 'cache')
+        
+        first = TFLiteParser(cache=cache).parse_model(model_path)
+        
+        parser = TFLiteParser(cache=cache)
+        with patch.object(parser, '_analyze_model',
+                          side_effect=AssertionError("cache miss")):
+            cached = parser.parse_model(model_path)
+        
+        self.assertEqual(cached.model_path, str(Path(model_path).resolve()))
+        self.assertEqual(cached.model_name, first.model_name)
+        self.assertEqual(cached.layer_details, first.layer_details)
+        self.assertEqual(cached.total_macs, first.total_macs)
+        self.assertEqual(len(list(cache.directory.glob('*.json'))), 1)
+        
+        # A modified model file is analyzed again
+        stat = os.stat(model_path)
+        os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with patch.object(parser, '_analyze_model',
+                          side_effect=AssertionError("cache miss")):
+            with self.assertRaises(AssertionError):
+                parser.parse_model(model_path)
+    
+    def test_tflite_info_cache_keeps_operator_codes(self):
+        """Test that model information loaded from the cache lists operators."""
+        model_path, keras_model = self.create_simple_conv2d_model()
+        cache = ParseCache(Path(self.temp_dir) / 'cache')
+        
+        first = TfliteInfo(Path(model_path), cache=cache)
+        cached = TfliteInfo(Path(model_path), cache=cache)
+        
+        subgraph = TFLiteParser().load_model(model_path).Subgraphs(0)
+        self.assertEqual(cached.summary, first.summary)
+        self.assertEqual(cached.operators, first.operators)
+        self.assertEqual(cached.get_subgraph_operators(subgraph),
+                         first.get_subgraph_operators(subgraph))
+    
+    def test_parse_model_closes_mapping(self):
+        """Test that the model file is unmapped once parsed."""
+        model_path, keras_model = self.create_simple_conv2d_model()
+        parser = TFLiteParser()
+        mappings = []
+        map_model_file = parser._map_model_file
+        
+        def record_mapping(path):
+            mappings.append(map_model_file(path))
+            return mappings[-1]
+        
+        with patch.object(parser, '_map_model_file', side_effect=record_mapping):
+            parser.parse_model(model_path)
+            parser.operator_names(model_path)
+        
+        self.assertEqual(len(mappings), 2)
+        self.assertTrue(all(mapping.closed for mapping in mappings))
+    
+    def test_parse_cache_eviction(self):
+        """Test that the parse cache stays within its size limit."""
+        cache = ParseCache(Path(self.temp_dir) / 'cache', max_bytes=1000)
+        for i in range(5):
+            cache.put(f'entry{i}', 'x' * 400)
+            os.utime(cache.directory / f'entry{i}.json', (i, i))
+        
+        self.assertIsNone(cache.get('entry0'))
+        self.assertEqual(cache.get('entry4'), 'x' * 400)
+        total = sum(p.stat().st_size for p in cache.directory.glob('*.json'))
+        self.assertLessEqual(total, 1000)
+    
+    def test_parse_models_isolates_failures(self):
+        """Test batch parsing with a mix of valid and invalid models."""
+        model_path, keras_model = self.create_simple_conv2d_model()
+        missing_path = os.path.join(self.temp_dir, 'missing.tflite')
+        paths = [model_path, missing_path, model_path]
+        
+        results = list(parse_models(paths, jobs=2))
+        
+        self.assertEqual(sorted(r.model_path for r in results), sorted(paths))
+        failed = [r for r in results if not r.ok]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].model_path, missing_path)
+        self.assertEqual(failed[0].error_code, "FILE_NOT_FOUND")
+        for result in results:
+            if result.ok:
+                self.assertGreater(result.model_details.total_macs, 0)
+    
+    def test_streamed_analysis_round_trip(self):
+        """Test that streamed analysis files load back to the same analysis."""
+        model_path, keras_model = self.create_complex_model()
+        details = self.parser.parse_model(model_path)
+        
+        saved_path = os.path.join(self.temp_dir, 'analysis.json')
+        details.save_analysis(saved_path)
+        self.assertEqual(ModelDetails.load_analysis(saved_path), details)
+        
+        # Parsed layers stay columns, built one at a time when accessed
+        columns = details.layer_details
+        self.assertIsInstance(columns, LayerColumns)
+        self.assertEqual(len(columns), details.layer_count)
+        self.assertEqual(LayerColumns.from_layers(list(columns)), columns)
+        self.assertEqual(columns[-1].index, details.layer_count - 1)
+        self.assertEqual([layer.index for layer in columns[1:3]], [1, 2])
+        self.assertEqual(
+            ModelDetails.model_validate_json(details.model_dump_json()), details
+        )
+        streamed_path = os.path.join(self.temp_dir, 'streamed.json')
+        write_analysis_json(
+            streamed_path,
+            details.model_dump(exclude={'layer_details', 'execution_schedule'}),
+            columns.records(),
+            iter(details.execution_schedule)
+        )
+        self.assertEqual(ModelDetails.load_analysis(streamed_path), details)
+    
     def test_layer_detail_completeness(self):
         """Test that layer details are complete and accurate."""
         model_path, keras_model = self.create_complex_model()
@@ -495,6 +920,20 @@ class TestTFLiteParserWithRealModels(unittest.TestCase):
         
         self.assertEqual(context.exception.error_code, "FILE_NOT_FOUND")
 
+    def test_load_model_from_validated_mapping(self):
+        """Test that the mapping returned by validation can be parsed directly."""
+        model_path, keras_model = self.create_simple_conv2d_model()
+        
+        model_buffer = self.parser._validate_model(Path(model_path))
+        with open(model_path, 'rb') as f:
+            self.assertEqual(model_buffer[:], f.read())
+        
+        mapped = self.parser.load_model(model_path, model_buffer)
+        loaded = self.parser.load_model(model_path)
+        self.assertEqual(mapped.SubgraphsLength(), loaded.SubgraphsLength())
+        self.assertEqual(mapped.Subgraphs(0).OperatorsLength(),
+                         loaded.Subgraphs(0).OperatorsLength())
+    
     def test_model_comparison_efficiency(self):
         """Test comparing efficiency between different model architectures."""
         tf = get_tf()